@@ -0,0 +1,71 @@
+"""finance_clue.openkis import 시간과 메모리(RSS) benchmark
+
+새 interpreter에서 finance_clue.openkis를 import하는 데 걸리는 시간과 늘어난 최대 RSS를 잰다.
+--max-import-ms, --max-rss-mb를 지정하면 기준을 넘을 때 exit code 1로 끝나서 CI에서 회귀를 막을 수 있다.
+
+    python -m benchmarks.bench_openkis_import --repeat 5 --max-import-ms 500 --max-rss-mb 40
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# import 전후의 시간과 ru_maxrss(KB, Linux 기준)를 json으로 출력하는 script
+_MEASURE = """
+import json, resource, time
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+import finance_clue.openkis
+import finance_clue.openkis.aio
+elapsed = time.perf_counter() - t0
+if {touch}:
+    for client in (finance_clue.openkis.OpenKisClient, finance_clue.openkis.aio.OpenKisClient):
+        for name in dir(client):
+            getattr(client, name)
+elapsed_all = time.perf_counter() - t0
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss0
+print(json.dumps({{"import_ms": elapsed * 1000, "total_ms": elapsed_all * 1000, "rss_mb": rss / 1024}}))
+"""
+
+
+def measure(touch: bool) -> dict:
+    out = subprocess.check_output(
+        [sys.executable, "-c", _MEASURE.format(touch=touch)], text=True
+    )
+    return json.loads(out)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-rss-mb", type=float, default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for label, touch in [("import", False), ("import + all operations", True)]:
+        runs = [measure(touch) for _ in range(args.repeat)]
+        results[label] = {
+            key: statistics.median(run[key] for run in runs) for key in runs[0]
+        }
+        print(
+            f"{label:<26} import {results[label]['import_ms']:8.1f} ms"
+            f"  total {results[label]['total_ms']:8.1f} ms"
+            f"  rss {results[label]['rss_mb']:6.1f} MB"
+        )
+
+    baseline = results["import"]
+    failed = False
+    if args.max_import_ms is not None and baseline["import_ms"] > args.max_import_ms:
+        print(f"import time {baseline['import_ms']:.1f} ms > {args.max_import_ms} ms")
+        failed = True
+    if args.max_rss_mb is not None and baseline["rss_mb"] > args.max_rss_mb:
+        print(f"rss {baseline['rss_mb']:.1f} MB > {args.max_rss_mb} MB")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""client pipeline profile별 호출당 overhead micro benchmark
+
+responses로 transport를 mock해서 network 없이 default, fast profile의 호출당 시간을 비교한다.
+mock transport 자체 비용도 포함되므로 절대값보다 profile 사이의 차이를 본다.
+
+    python -m benchmarks.bench_pipeline_overhead --calls 2000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import responses
+
+from finance_clue.opendart import OpenDartClient
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import TokenBucket
+
+ENDPOINT = "https://bench.local"
+
+
+def kis_call(profile: str):
+    client = OpenKisClient(
+        "key",
+        "secret",
+        endpoint=ENDPOINT,
+        rate_limiter=TokenBucket(1e9),
+        profile=profile,
+    )
+    return lambda: client.get_domestic_stock_price(fid_input_iscd="005930")
+
+
+def dart_call(profile: str):
+    client = OpenDartClient("token", endpoint=ENDPOINT, profile=profile)
+    return lambda: client.list_disclosure_info(corp_code="00126380")
+
+
+def measure(call, calls: int, rounds: int) -> float:
+    """호출당 시간(µs)의 중앙값"""
+    call()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            call()
+        samples.append((time.perf_counter() - start) / calls * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add(
+            responses.GET,
+            f"{ENDPOINT}/uapi/domestic-stock/v1/quotations/inquire-price",
+            json={"output": {"stck_prpr": "75700"}, "rt_cd": "0"},
+        )
+        mock.add(responses.GET, f"{ENDPOINT}/list.json", json={"status": "000"})
+
+        for name, factory in [("openkis", kis_call), ("opendart", dart_call)]:
+            default = measure(factory("default"), args.calls, args.rounds)
+            fast = measure(factory("fast"), args.calls, args.rounds)
+            print(
+                f"{name:<10} default {default:8.1f} µs/call"
+                f"  fast {fast:8.1f} µs/call  ({(1 - fast / default) * 100:5.1f}% less)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
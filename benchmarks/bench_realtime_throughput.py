@@ -0,0 +1,77 @@
+"""KIS 실시간 시세 처리량 benchmark
+
+synthetic_frames()로 만든 체결가/호가 frame을 두 가지로 측정한다.
+
+- parse: frame을 나누고 RealtimeBuffer에 쓰는 비용만
+- replay: 로컬 RealtimeReplayServer에서 WebSocket으로 받아 buffer에 쓰기까지
+
+    python -m benchmarks.bench_realtime_throughput --frames 50000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from finance_clue.openkis import RealtimeBuffer
+from finance_clue.openkis import RealtimeSubscriber
+from finance_clue.openkis import parse_frame
+from finance_clue.openkis._realtime import ORDERBOOK
+from finance_clue.openkis._realtime import TRADE
+from finance_clue.openkis._realtime_replay import RealtimeReplayServer
+from finance_clue.openkis._realtime_replay import synthetic_frames
+
+SYMBOLS = ["005930"]
+
+
+def bench_parse(frames, tr_id: str) -> float:
+    """초당 record 수"""
+    buffer = RealtimeBuffer(tr_id, capacity=1 << 16)
+    start = time.perf_counter()
+    for message in frames:
+        frame = parse_frame(message)
+        if frame is None:
+            continue
+        buffer.append(frame.payload, frame.count)
+    return buffer.total / (time.perf_counter() - start)
+
+
+async def bench_replay(frames, tr_id: str) -> float:
+    """초당 record 수"""
+    parsed = [parse_frame(frame) for frame in frames]
+    expected = sum(frame.count for frame in parsed if frame is not None)
+    async with RealtimeReplayServer(frames) as server:
+        subscriber = RealtimeSubscriber("approval", url=server.url)
+        await subscriber.subscribe(tr_id, SYMBOLS[0])
+        task = asyncio.ensure_future(subscriber.run())
+        await subscriber.wait_connected()
+        start = time.perf_counter()
+        while subscriber.metrics.records < expected:
+            await asyncio.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        await subscriber.stop()
+        await task
+    return expected / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--records-per-frame", type=int, default=1)
+    args = parser.parse_args()
+
+    for tr_id in (TRADE, ORDERBOOK):
+        frames = list(
+            synthetic_frames(tr_id, SYMBOLS, args.frames, args.records_per_frame)
+        )
+        parse = bench_parse(frames, tr_id)
+        replay = asyncio.run(bench_replay(frames, tr_id))
+        print(
+            f"{tr_id}  parse {parse:>10,.0f} records/s"
+            f"  replay {replay:>10,.0f} records/s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""transport별 동시 요청 수에 따른 처리량 benchmark
+
+로컬 HTTP server가 KIS 현재가 응답을 흉내 내고, 응답마다 --latency ms를 기다린다.
+같은 수의 요청을 동시 요청 수를 바꿔 가며 보내고 초당 요청 수를 비교한다.
+
+- sync default: azure-core 기본 RequestsTransport (host당 connection 10개)
+- sync pooled: TransportConfig로 만든 PooledRequestsTransport
+- async pooled: PooledAsyncioRequestsTransport
+- async aiohttp: aiohttp_transport(). aiohttp가 설치되어 있을 때만
+
+    python -m benchmarks.bench_transport_concurrency --requests 2000 --concurrency 1 8 32 64
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import importlib.util
+import json
+import logging
+import sys
+import threading
+import time
+
+from finance_clue._transport import PooledAsyncioRequestsTransport
+from finance_clue._transport import TransportConfig
+from finance_clue._transport import aiohttp_transport
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+
+BODY = json.dumps({"output": {"stck_prpr": "75700"}, "rt_cd": "0"}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.005
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _kwargs(endpoint: str):
+    return {"endpoint": endpoint, "rate_limiter": TokenBucket(1e9)}
+
+
+def bench_sync(endpoint: str, config, requests: int, concurrency: int) -> float:
+    """초당 요청 수"""
+    client = OpenKisClient(
+        "key", "secret", transport_config=config, **_kwargs(endpoint)
+    )
+
+    def call(_):
+        return client.get_domestic_stock_price(fid_input_iscd="005930")
+
+    with client, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(call, range(concurrency)))
+        start = time.perf_counter()
+        list(executor.map(call, range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+async def bench_async(
+    endpoint: str, make_transport, requests: int, concurrency: int
+) -> float:
+    """초당 요청 수. aiohttp session은 event loop 안에서 만들어야 하므로 transport를 여기서 만든다."""
+    client = AioOpenKisClient(
+        "key", "secret", transport=make_transport(), **_kwargs(endpoint)
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call():
+        async with semaphore:
+            await client.get_domestic_stock_price(fid_input_iscd="005930")
+
+    async with client:
+        await asyncio.gather(*[call() for _ in range(concurrency)])
+        start = time.perf_counter()
+        await asyncio.gather(*[call() for _ in range(requests)])
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--latency", type=float, default=5.0, help="응답 지연(ms)")
+    args = parser.parse_args()
+
+    # 기본 pool이 가득 차서 connection을 버릴 때마다 남는 warning을 숨긴다.
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
+    Handler.latency = args.latency / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+
+    has_aiohttp = importlib.util.find_spec("aiohttp") is not None
+
+    print(f"{'concurrency':>11}  {'transport':<14} {'requests/s':>12}")
+    for concurrency in args.concurrency:
+        config = TransportConfig(
+            pool_size=max(100, concurrency), per_host_limit=max(10, concurrency)
+        )
+        results = [
+            ("sync default", bench_sync(endpoint, None, args.requests, concurrency)),
+            ("sync pooled", bench_sync(endpoint, config, args.requests, concurrency)),
+            (
+                "async pooled",
+                asyncio.run(
+                    bench_async(
+                        endpoint,
+                        lambda config=config: PooledAsyncioRequestsTransport(config),
+                        args.requests,
+                        concurrency,
+                    )
+                ),
+            ),
+        ]
+        if has_aiohttp:
+            results.append(
+                (
+                    "async aiohttp",
+                    asyncio.run(
+                        bench_async(
+                            endpoint,
+                            lambda config=config: aiohttp_transport(config),
+                            args.requests,
+                            concurrency,
+                        )
+                    ),
+                )
+            )
+        for name, throughput in results:
+            print(f"{concurrency:>11}  {name:<14} {throughput:>12,.0f}")
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""client pipeline profile
+
+생성된 client는 요청마다 request id, user agent, tracing, logging, header 정리 등
+13개 policy를 거치고, send_request()는 요청을 deepcopy한다.
+"fast" profile은 proxy, 재시도, 인증 policy와 client가 추가한 policy(rate limit, cache)만 남긴다.
+send_request()는 body를 복사하지 않고 URL과 header만 새로 만든 얕은 복사본을 보낸다.
+응답 body는 생성된 operation 코드가 직접 json으로 변환하므로 ContentDecodePolicy도 뺀다.
+"""
+
+import copy
+from typing import Any, Dict, Optional
+
+from azure.core.pipeline.policies import AsyncRetryPolicy
+from azure.core.pipeline.policies import RetryPolicy
+from azure.core.utils import case_insensitive_dict
+
+PROFILE_DEFAULT = "default"
+PROFILE_FAST = "fast"
+PROFILES = (PROFILE_DEFAULT, PROFILE_FAST)
+
+
+def apply_profile(
+    kwargs: Dict[str, Any],
+    profile: str,
+    authentication_policy: Optional[Any] = None,
+    is_async: bool = False,
+) -> None:
+    """
+    profile에 맞게 client 생성 kwargs의 policy 목록을 바꾼다.
+
+    Args:
+        kwargs (Dict[str, Any]): 생성된 client에 넘길 kwargs. 직접 수정한다.
+        profile (str): "default" 또는 "fast"
+        authentication_policy (Optional[Any]): kwargs에 authentication_policy가 없을 때 쓸 인증 policy
+        is_async (bool): async client 여부
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile}. Use one of {PROFILES}")
+    if profile == PROFILE_DEFAULT or "policies" in kwargs:
+        return
+
+    retry_policy = kwargs.get("retry_policy") or (
+        AsyncRetryPolicy(**kwargs) if is_async else RetryPolicy(**kwargs)
+    )
+    kwargs["retry_policy"] = retry_policy
+    if kwargs.get("authentication_policy") is None:
+        kwargs["authentication_policy"] = authentication_policy
+    kwargs["policies"] = [
+        policy
+        for policy in (
+            kwargs.get("proxy_policy"),
+            retry_policy,
+            kwargs["authentication_policy"],
+        )
+        if policy is not None
+    ]
+
+
+class FastSendRequestMixin:
+    """fast profile에서 send_request()가 요청을 deepcopy하지 않고 얕은 복사본을 보내도록 하는 mixin"""
+
+    _profile: str = PROFILE_DEFAULT
+
+    def send_request(self, request: Any, *, stream: bool = False, **kwargs: Any):
+        if self._profile != PROFILE_FAST:
+            return super().send_request(  # type: ignore[misc]
+                request, stream=stream, **kwargs
+            )
+        # policy가 URL과 header를 고치므로 이 둘만 새로 만들고 body는 넘겨받은 요청과 공유한다.
+        request_copy = copy.copy(request)
+        request_copy.headers = case_insensitive_dict(request.headers)
+        request_copy.url = self._client.format_url(  # type: ignore[attr-defined]
+            request.url
+        )
+        return self._client.send_request(  # type: ignore[attr-defined]
+            request_copy, stream=stream, **kwargs
+        )
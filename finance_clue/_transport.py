@@ -0,0 +1,176 @@
+"""client HTTP transport 설정
+
+azure-core 기본 RequestsTransport는 requests의 기본 connection pool(host당 10개)을 쓴다.
+동시에 10개보다 많은 요청을 보내면 남는 connection은 pool에 돌아가지 못하고 버려져서,
+요청마다 TCP/TLS 연결을 새로 맺게 된다.
+TransportConfig로 pool 크기, host당 connection 수, keep-alive, timeout을 정하고
+sync client는 requests, async client는 aiohttp transport를 그 설정으로 만든다.
+
+aiohttp_transport()는 aiohttp extra(pip install "finance-clue[aiohttp]")가 설치되어 있어야 하고,
+aiohttp session은 event loop 안에서만 만들 수 있으므로 실행 중인 event loop 안에서 호출해야 한다.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import importlib.util
+from typing import Any, Dict, Optional
+
+from azure.core.pipeline.transport import AsyncioRequestsTransport
+from azure.core.pipeline.transport import RequestsTransport
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@dataclass
+class TransportConfig:
+    """
+    HTTP connection pool과 timeout 설정
+
+    Attributes:
+        pool_size (int): 모든 host를 합친 최대 connection 수. requests는 전체 수를 제한하지 않으므로
+            pool_size // per_host_limit개 host의 pool을 유지한다.
+        per_host_limit (int): host당 유지하는 최대 connection 수
+        keep_alive (bool): 응답을 받은 connection을 다음 요청에 재사용할지 여부
+        keepalive_timeout (float): 쉬고 있는 connection을 닫기까지의 시간(초). aiohttp에만 적용된다.
+        connection_timeout (float): 연결 timeout(초)
+        read_timeout (float): 응답 읽기 timeout(초)
+        block (bool): host의 connection이 모두 사용 중일 때 새 connection을 만들지 않고 기다릴지 여부.
+            aiohttp는 항상 기다린다.
+
+    Example:
+        .. code-block:: python
+
+            config = TransportConfig(per_host_limit=64)
+            client = OpenKisClient(app_key, app_secret, transport_config=config)
+    """
+
+    pool_size: int = 100
+    per_host_limit: int = 32
+    keep_alive: bool = True
+    keepalive_timeout: float = 15.0
+    connection_timeout: float = 10.0
+    read_timeout: float = 60.0
+    block: bool = False
+
+    def timeouts(self) -> Dict[str, Any]:
+        """azure-core transport의 timeout kwargs"""
+        return {
+            "connection_timeout": self.connection_timeout,
+            "read_timeout": self.read_timeout,
+        }
+
+
+class _PooledSessionMixin:
+    config: TransportConfig
+
+    def _init_session(self, session: Any) -> None:
+        super()._init_session(session)  # type: ignore[misc]
+        # azure-core와 같이 urllib3 재시도는 끄고 retry policy에 맡긴다.
+        adapter = HTTPAdapter(
+            pool_connections=max(
+                1, self.config.pool_size // self.config.per_host_limit
+            ),
+            pool_maxsize=self.config.per_host_limit,
+            pool_block=self.config.block,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+        )
+        for protocol in ("http://", "https://"):
+            session.mount(protocol, adapter)
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+
+
+class PooledRequestsTransport(_PooledSessionMixin, RequestsTransport):
+    """
+    TransportConfig의 connection pool을 쓰는 RequestsTransport
+
+    Args:
+        config (Optional[TransportConfig]): 설정. 없으면 기본값
+        **kwargs: RequestsTransport 인자
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None, **kwargs):
+        self.config = config or TransportConfig()
+        super().__init__(**{**self.config.timeouts(), **kwargs})
+
+
+class PooledAsyncioRequestsTransport(_PooledSessionMixin, AsyncioRequestsTransport):
+    """PooledRequestsTransport의 async 버전. requests 요청을 thread pool에서 보낸다."""
+
+    def __init__(self, config: Optional[TransportConfig] = None, **kwargs):
+        self.config = config or TransportConfig()
+        super().__init__(**{**self.config.timeouts(), **kwargs})
+
+
+def aiohttp_transport(config: Optional[TransportConfig] = None, **kwargs) -> Any:
+    """
+    TransportConfig의 connection pool을 쓰는 aiohttp session으로 AioHttpTransport를 만든다.
+
+    실행 중인 event loop 안에서 호출해야 한다. session은 transport가 닫을 때 함께 닫는다.
+
+    Args:
+        config (Optional[TransportConfig]): 설정. 없으면 기본값
+        **kwargs: AioHttpTransport 인자
+
+    Returns:
+        AioHttpTransport: async client의 transport 인자로 넘긴다.
+
+    Raises:
+        ImportError: aiohttp가 설치되어 있지 않을 때
+        RuntimeError: 실행 중인 event loop가 없을 때
+    """
+    import aiohttp
+    from azure.core.pipeline.transport import AioHttpTransport
+
+    config = config or TransportConfig()
+    connector_kwargs: Dict[str, Any] = {"force_close": True}
+    if config.keep_alive:
+        connector_kwargs = {"keepalive_timeout": config.keepalive_timeout}
+    # AioHttpTransport가 session을 직접 만들 때와 같은 설정을 쓴다.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=config.pool_size,
+            limit_per_host=config.per_host_limit,
+            **connector_kwargs,
+        ),
+        trust_env=kwargs.get("use_env_settings", True),
+        cookie_jar=aiohttp.DummyCookieJar(),
+        auto_decompress=False,
+    )
+    return AioHttpTransport(
+        session=session, session_owner=True, **{**config.timeouts(), **kwargs}
+    )
+
+
+def _can_use_aiohttp() -> bool:
+    if importlib.util.find_spec("aiohttp") is None:
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def apply_transport(
+    kwargs: Dict[str, Any],
+    config: Optional[TransportConfig],
+    is_async: bool = False,
+) -> None:
+    """
+    transport가 지정되지 않았으면 config로 만든 transport를 client 생성 kwargs에 넣는다.
+
+    Args:
+        kwargs (Dict[str, Any]): 생성된 client에 넘길 kwargs. 직접 수정한다.
+        config (Optional[TransportConfig]): 설정. 없으면 azure-core 기본 transport를 쓴다.
+        is_async (bool): async client 여부. async client는 aiohttp transport를 쓰고,
+            aiohttp가 없거나 event loop 밖에서 client를 만들면 PooledAsyncioRequestsTransport를 쓴다.
+    """
+    if config is None or "transport" in kwargs:
+        return
+    if not is_async:
+        kwargs["transport"] = PooledRequestsTransport(config)
+    elif _can_use_aiohttp():
+        kwargs["transport"] = aiohttp_transport(config)
+    else:
+        kwargs["transport"] = PooledAsyncioRequestsTransport(config)
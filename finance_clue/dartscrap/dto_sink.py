@@ -0,0 +1,283 @@
+"""공시 파싱 결과(dto)를 SQLite, Parquet에 일괄 저장하는 모듈
+
+dto를 모아뒀다가 batch_size 단위로 한 번의 transaction(또는 row group)으로 저장한다.
+rcpNo를 key로 upsert 하므로 같은 공시를 여러 번 저장해도 결과는 같다.
+테이블 schema는 dto dataclass의 field에서 만든다.
+"""
+
+from abc import ABC
+from abc import abstractmethod
+from dataclasses import fields
+from dataclasses import is_dataclass
+import json
+import os
+import re
+import sqlite3
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+T = TypeVar("T")
+
+RCP_NO_COLUMN = "rcp_no"
+
+_SQLITE_TYPES = {int: "INTEGER", float: "REAL", bool: "INTEGER", str: "TEXT"}
+
+
+def _unwrap_optional(tp: Any) -> Any:
+    if get_origin(tp) is Union:
+        args = [x for x in get_args(tp) if x is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return tp
+
+
+def dto_columns(dto_type: type) -> List[Tuple[str, type]]:
+    """
+    dto dataclass의 field로 column 목록을 만든다.
+
+    int, float, bool, str 이외의 타입(List 등)은 json 문자열로 저장하기 위해 str로 취급한다.
+
+    Returns:
+        List[Tuple[str, type]]: (column 이름, python 타입) 목록
+    """
+    if not is_dataclass(dto_type):
+        raise TypeError(f"{dto_type} is not a dataclass")
+
+    hints = get_type_hints(dto_type)
+    columns: List[Tuple[str, type]] = []
+    for f in fields(dto_type):
+        tp = _unwrap_optional(hints[f.name])
+        if f.name == RCP_NO_COLUMN:
+            raise ValueError(f"{dto_type.__name__} has reserved field: {f.name}")
+        columns.append((f.name, tp if tp in _SQLITE_TYPES else str))
+    return columns
+
+
+def _to_column_value(value: Any, tp: type) -> Any:
+    if value is None:
+        return None
+    if tp is str and not isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class DtoSink(ABC, Generic[T]):
+    """
+    dto 일괄 저장 base class
+
+    add()로 넘긴 dto는 rcpNo별로 buffer에 모였다가 batch_size를 넘으면 flush() 된다.
+    같은 rcpNo가 다시 들어오면 나중 값으로 덮어쓴다. 하위 class는 _write()를 구현한다.
+    """
+
+    def __init__(self, dto_type: Type[T], batch_size: int = 1000):
+        self.dto_type = dto_type
+        self.columns = dto_columns(dto_type)
+        self.batch_size = batch_size
+        self._buffer: Dict[str, T] = {}
+
+    def __enter__(self) -> "DtoSink[T]":
+        return self
+
+    def __exit__(self, *exc_details: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def add(self, rcp_no: str, dto: T) -> None:
+        if not isinstance(dto, self.dto_type):
+            raise TypeError(f"expected {self.dto_type.__name__}, got {type(dto)}")
+        self._buffer[rcp_no] = dto
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def add_all(self, items: Iterable[Tuple[str, T]]) -> None:
+        for rcp_no, dto in items:
+            self.add(rcp_no, dto)
+
+    def rows(self) -> List[Tuple[Any, ...]]:
+        """buffer의 dto를 (rcp_no, column 값...) tuple 목록으로 변환한다."""
+        return [
+            (rcp_no,)
+            + tuple(
+                _to_column_value(getattr(dto, name), tp) for name, tp in self.columns
+            )
+            for rcp_no, dto in self._buffer.items()
+        ]
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        self._write(self.rows())
+        self._buffer.clear()
+
+    def close(self) -> None:
+        self.flush()
+
+    @abstractmethod
+    def _write(self, rows: List[Tuple[Any, ...]]) -> None:
+        """(rcp_no, column 값...) tuple 목록을 저장한다."""
+
+
+class SQLiteDtoSink(DtoSink[T]):
+    """
+    SQLite 테이블에 dto를 저장한다.
+
+    Args:
+        database (Union[str, sqlite3.Connection]): db 파일 경로 또는 connection
+        dto_type (Type[T]): 저장할 dto 클래스
+        table_name (Optional[str]): 테이블 이름. 없으면 dto 클래스 이름을 snake_case로 바꿔서 사용
+        batch_size (int): 한 transaction에 저장할 건수
+    """
+
+    def __init__(
+        self,
+        database: Union[str, sqlite3.Connection],
+        dto_type: Type[T],
+        table_name: Optional[str] = None,
+        batch_size: int = 1000,
+    ):
+        super().__init__(dto_type, batch_size)
+        self._owns_connection = not isinstance(database, sqlite3.Connection)
+        self.connection = (
+            sqlite3.connect(database)
+            if not isinstance(database, sqlite3.Connection)
+            else database
+        )
+        self.table_name = table_name or _snake_case(dto_type.__name__)
+        self._create_table()
+
+        column_names = ", ".join([RCP_NO_COLUMN] + [name for name, _ in self.columns])
+        placeholders = ", ".join(["?"] * (len(self.columns) + 1))
+        self._upsert_sql = (
+            f'INSERT OR REPLACE INTO "{self.table_name}" ({column_names}) '
+            f"VALUES ({placeholders})"
+        )
+
+    def _create_table(self) -> None:
+        column_defs = ", ".join(
+            [f"{RCP_NO_COLUMN} TEXT PRIMARY KEY"]
+            + [f"{name} {_SQLITE_TYPES[tp]}" for name, tp in self.columns]
+        )
+        with self.connection:
+            self.connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.table_name}" ({column_defs})'
+            )
+
+    def _write(self, rows: List[Tuple[Any, ...]]) -> None:
+        with self.connection:
+            self.connection.executemany(self._upsert_sql, rows)
+
+    def close(self) -> None:
+        super().close()
+        if self._owns_connection:
+            self.connection.close()
+
+
+class ParquetDtoSink(DtoSink[T]):
+    """
+    Parquet 파일에 dto를 저장한다. pyarrow가 설치되어 있어야 한다.
+
+    flush() 할 때마다 "{path}.tmp" 파일에 row group 하나를 이어서 쓴다.
+    Parquet 파일은 수정할 수 없으므로 close() 할 때 한 번만 기존 파일과 합쳐 같은 rcpNo는 나중 값만 남기고
+    path를 교체한다. close() 전에는 path의 파일이 바뀌지 않는다.
+
+    Args:
+        path (str): parquet 파일 경로
+        dto_type (Type[T]): 저장할 dto 클래스
+        batch_size (int): 한 번에 저장할 건수
+        row_group_size (Optional[int]): parquet row group 크기
+    """
+
+    def __init__(
+        self,
+        path: str,
+        dto_type: Type[T],
+        batch_size: int = 10000,
+        row_group_size: Optional[int] = None,
+    ):
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("ParquetDtoSink requires pyarrow") from e
+
+        super().__init__(dto_type, batch_size)
+        self.path = path
+        self.row_group_size = row_group_size
+        self._tmp_path = f"{path}.tmp"
+        self._writer: Optional[Any] = None
+
+        arrow_types = {
+            int: pa.int64(),
+            float: pa.float64(),
+            bool: pa.bool_(),
+            str: pa.string(),
+        }
+        self.schema = pa.schema(
+            [pa.field(RCP_NO_COLUMN, pa.string(), nullable=False)]
+            + [pa.field(name, arrow_types[tp]) for name, tp in self.columns]
+        )
+
+    def _write(self, rows: List[Tuple[Any, ...]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        names = self.schema.names
+        table = pa.Table.from_pydict(
+            {name: [row[i] for row in rows] for i, name in enumerate(names)},
+            schema=self.schema,
+        )
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._tmp_path, self.schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+
+    def close(self) -> None:
+        super().close()
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        self._compact()
+
+    def _compact(self) -> None:
+        """기존 파일과 이번에 쓴 row를 합쳐 rcpNo마다 마지막 row만 남긴다."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(self._tmp_path, schema=self.schema)
+        if os.path.exists(self.path):
+            existing = pq.read_table(self.path, schema=self.schema)
+            table = pa.concat_tables([existing, table])
+        elif pc.count_distinct(table[RCP_NO_COLUMN]).as_py() == len(table):
+            # 새 파일이고 겹치는 rcpNo가 없으면 다시 쓰지 않는다.
+            os.replace(self._tmp_path, self.path)
+            return
+
+        index = "__index"
+        last = (
+            table.append_column(index, pa.array(range(len(table)), pa.int64()))
+            .group_by(RCP_NO_COLUMN)
+            .aggregate([(index, "max")])
+        )
+        rows = last[f"{index}_max"]
+        table = table.take(pc.take(rows, pc.sort_indices(rows)))
+        pq.write_table(table, self._tmp_path, row_group_size=self.row_group_size)
+        os.replace(self._tmp_path, self.path)
@@ -0,0 +1,261 @@
+"""정정공시 이력(lineage) 관리 모듈
+
+원본 공시와 정정 공시의 rcpNo를 회사, 보고서 종류 단위로 연결한다.
+배치 작업에서 이미 정정된(superseded) 공시는 건너뛰고 최종 공시만 파싱할 수 있다.
+"""
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from finance_clue.dartscrap.dart_scrap_dto import DisclosureInfoDto
+
+T = TypeVar("T")
+
+_REPORT_TAG_PATTERN = re.compile(r"^\s*\[([^\]]*)\]\s*")
+_RCP_NO_PATTERN = re.compile(r"rcpNo=(\d{14})")
+
+
+def split_report_name(report_name: str) -> Tuple[str, bool]:
+    """
+    보고서명에서 [기재정정], [첨부정정] 등의 머리말을 제거한다.
+
+    Args:
+        report_name (str): 보고서명 (예: "[기재정정]단일판매ㆍ공급계약체결")
+
+    Returns:
+        Tuple[str, bool]: (머리말을 제거한 보고서 종류, 정정공시 여부)
+    """
+    is_correction = False
+    name = report_name
+    while True:
+        matched = _REPORT_TAG_PATTERN.match(name)
+        if matched is None:
+            break
+        if "정정" in matched.group(1):
+            is_correction = True
+        name = name[matched.end() :]
+    return name.strip(), is_correction
+
+
+def extract_rcp_no(report_url: str) -> str:
+    """
+    공시 url에서 rcpNo를 추출한다.
+
+    Raises:
+        ValueError: url에 rcpNo가 없는 경우
+    """
+    matched = _RCP_NO_PATTERN.search(report_url)
+    if matched is None:
+        raise ValueError(f"Can't find rcpNo in url: {report_url}")
+    return matched.group(1)
+
+
+def _to_yyyymmdd(date: Optional[str]) -> Optional[str]:
+    """2023-11-01, 2023.11.01, 2023년 11월 01일 형식의 일자를 20231101로 변환"""
+    if not date:
+        return None
+    digits = re.sub(r"\D", "", date)
+    return digits[:8] if len(digits) >= 8 else None
+
+
+@dataclass
+class ReportLineage:
+    """
+    원본 공시와 정정 공시 이력을 담는 dto 클래스
+
+    Attributes:
+        company_name (str): 회사명
+        report_type (str): 정정 머리말을 제거한 보고서명
+        original_rcp_no (str): 원본 공시 rcpNo
+        amended_rcp_nos (List[str]): 정정 공시 rcpNo (접수 순)
+    """
+
+    company_name: str
+    report_type: str
+    original_rcp_no: str
+    amended_rcp_nos: List[str] = field(default_factory=list)
+
+    @property
+    def latest_rcp_no(self) -> str:
+        """현재 유효한(가장 최근) 공시 rcpNo"""
+        return (
+            self.amended_rcp_nos[-1] if self.amended_rcp_nos else self.original_rcp_no
+        )
+
+    @property
+    def rcp_nos(self) -> List[str]:
+        return [self.original_rcp_no, *self.amended_rcp_nos]
+
+
+class ReportLineageIndex:
+    """
+    회사, 보고서 종류별로 원본 공시와 정정 공시를 연결하는 index
+
+    rcpNo는 접수일자(YYYYMMDD)로 시작하므로 문자열 정렬이 접수 순서와 같다.
+    """
+
+    def __init__(self) -> None:
+        self._lineages: Dict[Tuple[str, str], List[ReportLineage]] = {}
+        self._by_rcp_no: Dict[str, ReportLineage] = {}
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._lineages.values())
+
+    def __contains__(self, rcp_no: str) -> bool:
+        return rcp_no in self._by_rcp_no
+
+    @property
+    def lineages(self) -> List[ReportLineage]:
+        return [lineage for v in self._lineages.values() for lineage in v]
+
+    def add_original(
+        self, company_name: str, report_type: str, rcp_no: str
+    ) -> ReportLineage:
+        """원본 공시를 등록한다. 이미 등록된 rcpNo면 기존 이력을 반환한다."""
+        if rcp_no in self._by_rcp_no:
+            return self._by_rcp_no[rcp_no]
+
+        lineage = ReportLineage(company_name, report_type, rcp_no)
+        chains = self._lineages.setdefault((company_name, report_type), [])
+        chains.append(lineage)
+        chains.sort(key=lambda x: x.original_rcp_no)
+        self._by_rcp_no[rcp_no] = lineage
+        return lineage
+
+    def add_correction(
+        self,
+        company_name: str,
+        report_type: str,
+        rcp_no: str,
+        original_submit_date: Optional[str] = None,
+    ) -> ReportLineage:
+        """
+        정정 공시를 원본 공시 이력에 연결한다.
+
+        Args:
+            company_name (str): 회사명
+            report_type (str): 정정 머리말을 제거한 보고서명
+            rcp_no (str): 정정 공시 rcpNo
+            original_submit_date (Optional[str]): 정정관련 공시서류 제출일.
+                파싱 결과의 correction_submit_date 값을 넘기면 같은 날 접수된 원본 공시와 연결한다.
+                없으면 정정 공시보다 먼저 접수된 가장 최근 원본 공시와 연결한다.
+
+        Returns:
+            ReportLineage: 연결된 공시 이력. 원본 공시를 찾지 못하면 정정 공시를 원본으로 하는 이력
+        """
+        if rcp_no in self._by_rcp_no:
+            return self._by_rcp_no[rcp_no]
+
+        chains = self._lineages.get((company_name, report_type), [])
+        candidates = [x for x in chains if x.original_rcp_no < rcp_no]
+        submit_date = _to_yyyymmdd(original_submit_date)
+        if submit_date is not None:
+            candidates = [
+                x for x in candidates if x.original_rcp_no.startswith(submit_date)
+            ] or candidates
+
+        if not candidates:
+            return self.add_original(company_name, report_type, rcp_no)
+
+        lineage = candidates[-1]
+        lineage.amended_rcp_nos.append(rcp_no)
+        lineage.amended_rcp_nos.sort()
+        self._by_rcp_no[rcp_no] = lineage
+        return lineage
+
+    def add_disclosure(self, disclosure: DisclosureInfoDto) -> ReportLineage:
+        """공시 목록 조회 결과 한 건을 등록한다."""
+        report_type, is_correction = split_report_name(disclosure.report_name)
+        rcp_no = extract_rcp_no(disclosure.report_url)
+        if is_correction:
+            return self.add_correction(disclosure.company_name, report_type, rcp_no)
+        return self.add_original(disclosure.company_name, report_type, rcp_no)
+
+    def add_disclosures(
+        self, disclosures: Iterable[Optional[DisclosureInfoDto]]
+    ) -> None:
+        """
+        공시 목록 조회 결과를 등록한다.
+
+        정정 공시가 원본 공시보다 먼저 나와도 연결되도록 rcpNo 순으로 정렬해서 등록한다.
+        """
+        items = [
+            (extract_rcp_no(x.report_url), x) for x in disclosures if x is not None
+        ]
+        for _, disclosure in sorted(items, key=lambda x: x[0]):
+            self.add_disclosure(disclosure)
+
+    def get_lineage(self, rcp_no: str) -> Optional[ReportLineage]:
+        return self._by_rcp_no.get(rcp_no)
+
+    def latest(self, rcp_no: str) -> str:
+        """rcp_no가 속한 이력의 최종 공시 rcpNo. 등록되지 않은 rcpNo는 그대로 반환한다."""
+        lineage = self._by_rcp_no.get(rcp_no)
+        return lineage.latest_rcp_no if lineage is not None else rcp_no
+
+    def is_superseded(self, rcp_no: str) -> bool:
+        """이후 정정 공시로 대체된 공시인지 여부"""
+        return self.latest(rcp_no) != rcp_no
+
+    def effective_rcp_nos(self) -> List[str]:
+        """이력별 최종 공시 rcpNo 목록"""
+        return sorted(lineage.latest_rcp_no for lineage in self.lineages)
+
+    def effective_disclosures(
+        self, disclosures: Iterable[Optional[DisclosureInfoDto]]
+    ) -> List[DisclosureInfoDto]:
+        """공시 목록에서 정정으로 대체된 공시를 제외한다."""
+        return [
+            x
+            for x in disclosures
+            if x is not None and not self.is_superseded(extract_rcp_no(x.report_url))
+        ]
+
+    def keep_latest(self, parsed: Dict[str, T]) -> Dict[str, T]:
+        """
+        rcpNo별 파싱 결과에서 이력마다 가장 최근 결과만 남긴다.
+
+        Args:
+            parsed (Dict[str, T]): rcpNo를 key로 하는 파싱 결과
+
+        Returns:
+            Dict[str, T]: 원본 공시 rcpNo를 key로 하는 최종 파싱 결과
+        """
+        results: Dict[str, Tuple[str, T]] = {}
+        for rcp_no, dto in parsed.items():
+            lineage = self._by_rcp_no.get(rcp_no)
+            key = lineage.original_rcp_no if lineage is not None else rcp_no
+            if key not in results or results[key][0] < rcp_no:
+                results[key] = (rcp_no, dto)
+        return {k: v[1] for k, v in results.items()}
+
+    def save(self, path: str) -> None:
+        """이력을 json 파일로 저장한다."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                [asdict(x) for x in self.lineages], f, ensure_ascii=False, indent=2
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ReportLineageIndex":
+        """save()로 저장한 json 파일에서 이력을 읽는다. 파일이 없으면 빈 index를 반환한다."""
+        index = cls()
+        if not os.path.exists(path):
+            return index
+
+        with open(path, "r", encoding="utf-8") as f:
+            for item in json.load(f):
+                lineage = index.add_original(
+                    item["company_name"], item["report_type"], item["original_rcp_no"]
+                )
+                for rcp_no in item["amended_rcp_nos"]:
+                    lineage.amended_rcp_nos.append(rcp_no)
+                    index._by_rcp_no[rcp_no] = lineage
+        return index
@@ -15,3 +15,20 @@ class HttpError(FinanceClueError):
     """
     HTTP 요청이 실패할 때 사용
     """
+
+
+class KisApiError(FinanceClueError):
+    """
+    KIS OpenAPI가 rt_cd에 오류를 담아 응답할 때 사용
+
+    Attributes:
+        rt_cd (Optional[str]): 성공 실패 여부. 0이면 성공
+        msg_cd (Optional[str]): 응답 코드
+        msg1 (Optional[str]): 응답 메시지
+    """
+
+    def __init__(self, rt_cd=None, msg_cd=None, msg1=None):
+        super().__init__(f"[{msg_cd}] {msg1}")
+        self.rt_cd = rt_cd
+        self.msg_cd = msg_cd
+        self.msg1 = msg1
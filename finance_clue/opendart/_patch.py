@@ -7,13 +7,18 @@
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
 import os
-from typing import Awaitable, List, Union
+from typing import Awaitable, List, Optional, Union
 
 from azure.core.credentials import AccessToken
 from azure.core.pipeline import PipelineRequest
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from azure.core.pipeline.policies._base import HTTPRequestType
 
+from finance_clue._pipeline import FastSendRequestMixin
+from finance_clue._pipeline import PROFILE_DEFAULT
+from finance_clue._pipeline import apply_profile
+from finance_clue._transport import TransportConfig
+from finance_clue._transport import apply_transport
 from finance_clue.opendart import GenOpenDartClient
 
 
@@ -41,12 +46,24 @@ class CustomAuthenticationPolicy(SansIOHTTPPolicy):
         return super().on_request(request)
 
 
-class OpenDartClient(GenOpenDartClient):
+class OpenDartClient(FastSendRequestMixin, GenOpenDartClient):
 
-    def __init__(self, token: str, *, timeout: int = 120, **kwargs):
+    def __init__(
+        self,
+        token: str,
+        *,
+        timeout: int = 120,
+        profile: str = PROFILE_DEFAULT,
+        transport_config: Optional[TransportConfig] = None,
+        **kwargs,
+    ):
         credential = CustomCredentials(token)
         kwargs["authentication_policy"] = CustomAuthenticationPolicy(credential)
-        super().__init__(credential=credential, timeout=timeout, **kwargs)
+        kwargs["timeout"] = timeout
+        self._profile = profile
+        apply_profile(kwargs, profile)
+        apply_transport(kwargs, transport_config)
+        super().__init__(credential=credential, **kwargs)
 
 
 def patch_sdk():
@@ -59,5 +76,6 @@ def patch_sdk():
 
 
 __all__: List[str] = [
-    "OpenDartClient"
+    "OpenDartClient",
+    "TransportConfig",
 ]  # Add all objects you want publicly available to users at this package level
@@ -6,11 +6,57 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+from typing import List, Optional
 
-__all__: List[str] = (
-    []
-)  # Add all objects you want publicly available to users at this package level
+from azure.core.credentials import AccessToken
+
+from finance_clue._pipeline import FastSendRequestMixin
+from finance_clue._pipeline import PROFILE_DEFAULT
+from finance_clue._pipeline import apply_profile
+from finance_clue._transport import TransportConfig
+from finance_clue._transport import aiohttp_transport
+from finance_clue._transport import apply_transport
+from finance_clue.opendart._patch import CustomAuthenticationPolicy
+from finance_clue.opendart._patch import CustomCredentials
+from finance_clue.opendart.aio import GenOpenDartClient
+
+
+class AsyncCustomCredentials:
+
+    def __init__(self, credential: CustomCredentials):
+        self.credential = credential
+
+    async def get_token(self, *args, **kwargs) -> AccessToken:
+        return self.credential.get_token(*args, **kwargs)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "AsyncCustomCredentials":
+        return self
+
+    async def __aexit__(self, *exc_details) -> None:
+        pass
+
+
+class OpenDartClient(FastSendRequestMixin, GenOpenDartClient):
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        timeout: int = 120,
+        profile: str = PROFILE_DEFAULT,
+        transport_config: Optional[TransportConfig] = None,
+        **kwargs,
+    ):
+        credential = CustomCredentials(token)
+        kwargs["authentication_policy"] = CustomAuthenticationPolicy(credential)
+        kwargs["timeout"] = timeout
+        self._profile = profile
+        apply_profile(kwargs, profile, is_async=True)
+        apply_transport(kwargs, transport_config, is_async=True)
+        super().__init__(credential=AsyncCustomCredentials(credential), **kwargs)
 
 
 def patch_sdk():
@@ -20,3 +66,9 @@ def patch_sdk():
     you can't accomplish using the techniques described in
     https://aka.ms/azsdk/python/dpcodegen/python/customize
     """
+
+
+__all__: List[str] = [
+    "OpenDartClient",
+    "aiohttp_transport",
+]  # Add all objects you want publicly available to users at this package level
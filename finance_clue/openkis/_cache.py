@@ -0,0 +1,329 @@
+"""KIS 조회 API 응답 cache
+
+재무비율, 종목정보, 시가총액 순위처럼 자주 바뀌지 않는 조회 결과를 TTL 동안 재사용한다.
+cache policy는 pipeline 맨 앞에 두어서, cache hit은 rate limit과 인증 policy를 거치지 않는다.
+같은 요청이 동시에 여러 개 들어오면 첫 요청만 보내고 나머지는 그 응답을 기다려서 함께 쓴다.
+
+cache key는 요청 method, query parameter를 포함한 URL, tr_id header로 만든다.
+연속조회 다음 page 요청(tr_cont header가 있는 요청)은 cache하지 않는다.
+HTTP 200이고 body의 rt_cd가 성공(0)인 응답만 저장한다.
+"""
+
+import asyncio
+import base64
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from azure.core.pipeline import PipelineRequest
+from azure.core.pipeline import PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+from azure.core.pipeline.policies import HTTPPolicy
+from azure.core.utils import CaseInsensitiveDict
+
+# tr_id별 기본 TTL(초)
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "CTPF1002R": 24 * 60 * 60,  # search_stock_info: 주식기본조회
+    "FHKST66430300": 6 * 60 * 60,  # get_financial_ratio: 재무비율
+    "FHPST01740000": 60,  # get_ranking_market_cap: 시가총액 상위
+}
+
+# (status_code, headers, body)
+CacheEntry = Tuple[int, Dict[str, str], bytes]
+
+
+@dataclass
+class CacheMetrics:
+    """
+    응답 cache 통계
+
+    Attributes:
+        hits (int): cache에서 응답한 요청 수
+        misses (int): 서버로 보낸 요청 수
+        coalesced (int): 진행 중인 같은 요청의 응답을 함께 쓴 요청 수
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+
+class _CachedResponse:
+    """cache에 저장한 응답으로 만든 http response. 생성된 operation 코드가 쓰는 속성만 갖는다."""
+
+    def __init__(self, request: Any, entry: CacheEntry):
+        self.request = request
+        self.status_code, headers, self.content = entry
+        self.headers = CaseInsensitiveDict(headers)
+        self.reason = "OK"
+        self.is_closed = True
+        self.is_stream_consumed = True
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return self.headers.get("content-type")
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        return self.content.decode(encoding or self.encoding)
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def read(self) -> bytes:
+        return self.content
+
+    def close(self) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class ResponseCache:
+    """
+    TTL과 LRU로 관리하는 응답 cache
+
+    Args:
+        ttls (Optional[Mapping[str, float]]): tr_id별 TTL(초). 기본값은 DEFAULT_CACHE_TTLS
+        default_ttl (float): ttls에 없는 tr_id의 TTL(초). 0이면 저장하지 않는다.
+        max_entries (int): 메모리에 저장할 최대 응답 수. 넘치면 가장 오래 쓰지 않은 응답부터 지운다.
+        disk_path (Optional[str]): 응답을 파일로도 저장할 디렉터리. process를 다시 시작해도 TTL 동안 재사용한다.
+
+    Example:
+        .. code-block:: python
+
+            cache = ResponseCache(disk_path=".kis_cache")
+            client = OpenKisClient(app_key, app_secret, cache=cache)
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0,
+        max_entries: int = 4096,
+        disk_path: Optional[str] = None,
+    ):
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self._entries: "OrderedDict[str, Tuple[float, CacheEntry]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = CacheMetrics()
+        if disk_path is not None:
+            os.makedirs(disk_path, exist_ok=True)
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        """cache 통계 snapshot"""
+        with self._lock:
+            return CacheMetrics(**vars(self._metrics))
+
+    def _record(self, name: str) -> None:
+        with self._lock:
+            setattr(self._metrics, name, getattr(self._metrics, name) + 1)
+
+    def ttl(self, request: Any) -> float:
+        """요청의 TTL(초). 0이면 cache하지 않는다."""
+        if request.method != "GET":
+            return 0
+        # 연속조회(tr_cont=N) 요청은 URL이 같아도 page마다 응답이 다르므로 cache하지 않는다.
+        if request.headers.get("tr_cont"):
+            return 0
+        return self.ttls.get(request.headers.get("tr_id", ""), self.default_ttl)
+
+    @staticmethod
+    def key(request: Any) -> str:
+        return f"{request.method} {request.url} {request.headers.get('tr_id', '')}"
+
+    @staticmethod
+    def _disk_file(disk_path: str, key: str) -> str:
+        return os.path.join(
+            disk_path, hashlib.sha256(key.encode()).hexdigest() + ".json"
+        )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                if item[0] > now:
+                    self._entries.move_to_end(key)
+                    return item[1]
+                del self._entries[key]
+
+        if self.disk_path is None:
+            return None
+        try:
+            with open(self._disk_file(self.disk_path, key), "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if stored["key"] != key or stored["expires"] <= now:
+            return None
+        entry = (stored["status"], stored["headers"], base64.b64decode(stored["body"]))
+        self._put_memory(key, stored["expires"], entry)
+        return entry
+
+    def _put_memory(self, key: str, expires: float, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = (expires, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        expires = time.time() + ttl
+        self._put_memory(key, expires, entry)
+        if self.disk_path is None:
+            return
+
+        stored = {
+            "key": key,
+            "expires": expires,
+            "status": entry[0],
+            "headers": entry[1],
+            "body": base64.b64encode(entry[2]).decode(),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, self._disk_file(self.disk_path, key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.disk_path is None:
+            return
+        for name in os.listdir(self.disk_path):
+            if name.endswith(".json"):
+                os.unlink(os.path.join(self.disk_path, name))
+
+
+def _cache_entry(response: PipelineResponse) -> Optional[CacheEntry]:
+    """저장할 수 있는 응답이면 CacheEntry로 변환한다."""
+    http_response = response.http_response
+    if http_response.status_code != 200:
+        return None
+    body = http_response.content
+    try:
+        if json.loads(body).get("rt_cd", "0") != "0":
+            return None
+    except (ValueError, AttributeError):
+        return None
+    return http_response.status_code, dict(http_response.headers), body
+
+
+def _cached_response(request: PipelineRequest, entry: CacheEntry) -> PipelineResponse:
+    return PipelineResponse(
+        request.http_request,
+        _CachedResponse(request.http_request, entry),
+        request.context,
+    )
+
+
+class CachePolicy(HTTPPolicy):
+    """
+    ResponseCache로 응답하고, 진행 중인 같은 요청을 하나로 합치는 policy
+
+    pipeline 맨 앞(per_call_policies)에 둔다.
+    """
+
+    def __init__(self, cache: ResponseCache):
+        super().__init__()
+        self.cache = cache
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        http_request = request.http_request
+        ttl = self.cache.ttl(http_request)
+        if ttl <= 0:
+            return self.next.send(request)
+
+        key = self.cache.key(http_request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache._record("hits")
+            return _cached_response(request, entry)
+
+        event = threading.Event()
+        with self._lock:
+            leader = self._inflight.setdefault(key, event)
+
+        if leader is not event:
+            # 같은 요청의 응답을 기다린다. 저장되지 않은 응답이면 직접 보낸다.
+            leader.wait()
+            entry = self.cache.get(key)
+            if entry is None:
+                return self.next.send(request)
+            self.cache._record("coalesced")
+            return _cached_response(request, entry)
+
+        try:
+            self.cache._record("misses")
+            response = self.next.send(request)
+            entry = _cache_entry(response)
+            if entry is not None:
+                self.cache.set(key, entry, ttl)
+            return response
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+
+
+class AsyncCachePolicy(AsyncHTTPPolicy):
+    """CachePolicy의 async 버전"""
+
+    def __init__(self, cache: ResponseCache):
+        super().__init__()
+        self.cache = cache
+        self._inflight: Dict[str, "asyncio.Future[None]"] = {}
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        http_request = request.http_request
+        ttl = self.cache.ttl(http_request)
+        if ttl <= 0:
+            return await self.next.send(request)
+
+        key = self.cache.key(http_request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache._record("hits")
+            return _cached_response(request, entry)
+
+        waiter = self._inflight.get(key)
+        if waiter is not None:
+            await asyncio.shield(waiter)
+            entry = self.cache.get(key)
+            if entry is None:
+                return await self.next.send(request)
+            self.cache._record("coalesced")
+            return _cached_response(request, entry)
+
+        waiter = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            self.cache._record("misses")
+            response = await self.next.send(request)
+            entry = _cache_entry(response)
+            if entry is not None:
+                self.cache.set(key, entry, ttl)
+            return response
+        finally:
+            del self._inflight[key]
+            waiter.set_result(None)
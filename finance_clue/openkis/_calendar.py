@@ -0,0 +1,340 @@
+"""국내주식 개장일 calendar
+
+check_domestic_holiday는 기준일자부터 며칠씩 연속조회로 개장일 여부(opnd_yn)를 반환한다.
+필요한 기간을 한 번에 받아 파일로 저장해 두고, 정렬한 개장일 목록에서 이진 탐색으로
+개장일 여부, N 개장일 전후, 기간 내 개장일 목록을 API 호출 없이 계산한다.
+
+check_domestic_holiday는 아직 정해지지 않은 먼 미래의 날짜는 반환하지 않는다.
+load()는 받을 수 있는 날짜까지만 calendar에 넣고, 그 뒤는 요청한 종료일자와 조회한 날을 기록해서
+같은 날에는 다시 조회하지 않는다.
+"""
+
+from bisect import bisect_left
+from bisect import bisect_right
+from datetime import datetime
+from datetime import timedelta
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from finance_clue.openkis._paging import AsyncCursorIterator
+from finance_clue.openkis._paging import CursorIterator
+from finance_clue.openkis._paging import extract_rows
+
+_DATE_FORMAT = "%Y%m%d"
+
+
+def _add_days(day: str, days: int) -> str:
+    return (datetime.strptime(day, _DATE_FORMAT) + timedelta(days=days)).strftime(
+        _DATE_FORMAT
+    )
+
+
+class TradingCalendar:
+    """
+    first부터 last까지의 개장일 목록
+
+    Args:
+        first (str): calendar 시작일자(YYYYMMDD)
+        last (str): calendar 종료일자(YYYYMMDD)
+        open_days (Iterable[str]): first와 last 사이의 개장일(YYYYMMDD). 나머지 날은 휴장일로 본다.
+        requested_last (Optional[str]): last 이후로 조회했지만 check_domestic_holiday가 반환하지 않은
+            마지막 요청 종료일자(YYYYMMDD)
+        checked_on (Optional[str]): requested_last까지 조회한 날(YYYYMMDD)
+
+    Attributes:
+        open_days (List[str]): 오름차순 개장일 목록. PeriodPriceLoader의 trading_days로 넘길 수 있다.
+
+    Example:
+        .. code-block:: python
+
+            calendar = TradingCalendar.load(client, "20200101", "20251231", path="calendar.json")
+            calendar.shift("20250102", -20)
+            PeriodPriceLoader(client, trading_days=calendar.open_days)
+    """
+
+    def __init__(
+        self,
+        first: str,
+        last: str,
+        open_days: Iterable[str],
+        requested_last: Optional[str] = None,
+        checked_on: Optional[str] = None,
+    ):
+        self.first = first
+        self.last = last
+        self.open_days: List[str] = sorted(
+            {day for day in open_days if first <= day <= last}
+        )
+        self.requested_last = requested_last
+        self.checked_on = checked_on
+
+    def __len__(self) -> int:
+        return len(self.open_days)
+
+    def covers(self, start: str, end: str) -> bool:
+        """start부터 end까지가 calendar 기간 안에 있는지 여부"""
+        return self.first <= start and end <= self.last
+
+    def _check(self, day: str) -> None:
+        if not self.covers(day, day):
+            raise ValueError(
+                f"{day} is outside the trading calendar ({self.first}~{self.last})"
+            )
+
+    def is_open(self, day: str) -> bool:
+        """
+        개장일 여부
+
+        Raises:
+            ValueError: day가 calendar 기간 밖일 때
+        """
+        self._check(day)
+        i = bisect_left(self.open_days, day)
+        return i < len(self.open_days) and self.open_days[i] == day
+
+    def shift(self, day: str, n: int) -> str:
+        """
+        day에서 n 개장일 뒤(n < 0이면 앞)의 개장일.
+
+        day가 휴장일이면 n=1은 다음 개장일, n=-1은 이전 개장일이다.
+        n=0이면 day가 개장일일 때 day, 아니면 다음 개장일이다.
+
+        Raises:
+            ValueError: day나 결과가 calendar 기간 밖일 때
+        """
+        self._check(day)
+        i = bisect_left(self.open_days, day)
+        is_open = i < len(self.open_days) and self.open_days[i] == day
+        j = i + n - 1 if n > 0 and not is_open else i + n
+        if not 0 <= j < len(self.open_days):
+            raise ValueError(
+                f"Shifting {day} by {n} trading days leaves the trading calendar "
+                f"({self.first}~{self.last})"
+            )
+        return self.open_days[j]
+
+    def previous(self, day: str) -> str:
+        """day 이전의 마지막 개장일"""
+        return self.shift(day, -1)
+
+    def next(self, day: str) -> str:
+        """day 다음의 첫 개장일"""
+        return self.shift(day, 1)
+
+    def range(self, start: str, end: str) -> List[str]:
+        """
+        start부터 end까지(양끝 포함)의 개장일 목록
+
+        Raises:
+            ValueError: 기간이 calendar 기간 밖일 때
+        """
+        self._check(start)
+        self._check(end)
+        return self.open_days[
+            bisect_left(self.open_days, start) : bisect_right(self.open_days, end)
+        ]
+
+    def count(self, start: str, end: str) -> int:
+        """start부터 end까지(양끝 포함)의 개장일 수"""
+        return len(self.range(start, end))
+
+    def merge(self, other: "TradingCalendar") -> "TradingCalendar":
+        """두 calendar를 합친다. 기간이 겹치거나 이어져 있어야 한다."""
+        if other.first > _add_days(self.last, 1) or self.first > _add_days(
+            other.last, 1
+        ):
+            raise ValueError("Trading calendars do not overlap or touch")
+        # 더 늦은 날까지 가진 쪽의 조회 기록을 남긴다.
+        latest = other if other.last > self.last else self
+        return TradingCalendar(
+            min(self.first, other.first),
+            max(self.last, other.last),
+            set(self.open_days) | set(other.open_days),
+            latest.requested_last,
+            latest.checked_on,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "first": self.first,
+            "last": self.last,
+            "open_days": self.open_days,
+            "requested_last": self.requested_last,
+            "checked_on": self.checked_on,
+        }
+
+    def save(self, path: str) -> None:
+        """calendar를 json 파일로 저장한다."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def from_file(cls, path: str) -> "TradingCalendar":
+        with open(path, "r", encoding="utf-8") as f:
+            obj = json.load(f)
+        return cls(
+            obj["first"],
+            obj["last"],
+            obj["open_days"],
+            obj.get("requested_last"),
+            obj.get("checked_on"),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> "TradingCalendar":
+        """check_domestic_holiday output row로 calendar를 만든다."""
+        days = {row["bass_dt"]: row.get("opnd_yn") == "Y" for row in rows}
+        if not days:
+            raise ValueError("No check_domestic_holiday rows")
+        return cls(
+            min(days), max(days), [day for day, is_open in days.items() if is_open]
+        )
+
+    @classmethod
+    def fetch(cls, client: Any, start: str, end: str) -> "TradingCalendar":
+        """
+        check_domestic_holiday를 연속조회해서 start부터 end까지의 calendar를 만든다.
+
+        check_domestic_holiday가 end까지 반환하지 않으면 반환한 마지막 날짜까지의 calendar를 만든다.
+
+        Args:
+            client: sync OpenKisClient
+            start (str): 시작일자(YYYYMMDD)
+            end (str): 종료일자(YYYYMMDD)
+
+        Raises:
+            ValueError: start부터의 날짜를 하나도 반환하지 않을 때
+        """
+        return cls.from_rows(cls._fetch_rows(client, start, end))
+
+    @staticmethod
+    def _fetch_rows(client: Any, start: str, end: str) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        pages = CursorIterator(client.check_domestic_holiday, bass_dt=start).pages()
+        for page in pages:
+            # end가 들어 있는 page까지 받고, 그 page의 end 이후 날짜도 calendar에 넣는다.
+            rows += extract_rows(page)
+            if rows and rows[-1]["bass_dt"] >= end:
+                break
+        return rows
+
+    @classmethod
+    async def afetch(cls, client: Any, start: str, end: str) -> "TradingCalendar":
+        """fetch()의 async 버전. openkis.aio client를 넘긴다."""
+        return cls.from_rows(await cls._afetch_rows(client, start, end))
+
+    @staticmethod
+    async def _afetch_rows(client: Any, start: str, end: str) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        pages = AsyncCursorIterator(client.check_domestic_holiday, bass_dt=start)
+        async for page in pages.pages():
+            rows += extract_rows(page)
+            if rows and rows[-1]["bass_dt"] >= end:
+                break
+        return rows
+
+    @classmethod
+    def _missing(
+        cls, cached: Optional["TradingCalendar"], start: str, end: str, today: str
+    ) -> List[Tuple[str, str]]:
+        """저장된 calendar에 없는 (시작일, 종료일) 기간"""
+        if cached is None:
+            return [(start, end)]
+        missing = []
+        if start < cached.first:
+            missing.append((start, _add_days(cached.first, -1)))
+        # 오늘 이미 end 이후까지 조회했는데 last까지만 받았으면 다시 조회하지 않는다.
+        checked = cached.checked_on == today and (cached.requested_last or "") >= end
+        if end > cached.last and not checked:
+            missing.append((_add_days(cached.last, 1), end))
+        return missing
+
+    @staticmethod
+    def _read_cache(path: Optional[str]) -> Optional["TradingCalendar"]:
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            return TradingCalendar.from_file(path)
+        except (ValueError, KeyError):
+            return None
+
+    @classmethod
+    def _combine(
+        cls,
+        cached: Optional["TradingCalendar"],
+        fetched: List[Tuple[str, str, List[Dict[str, Any]]]],
+        path: Optional[str],
+        today: str,
+    ) -> "TradingCalendar":
+        calendar = cached
+        for _, _, rows in fetched:
+            if rows:
+                part = cls.from_rows(rows)
+                calendar = part if calendar is None else calendar.merge(part)
+        if calendar is None:
+            raise ValueError("No check_domestic_holiday rows")
+        for _, end, _ in fetched:
+            if end > calendar.last:
+                # check_domestic_holiday가 반환하지 않은 기간을 기록한다.
+                calendar.requested_last = max(end, calendar.requested_last or "")
+                calendar.checked_on = today
+        if fetched and path is not None:
+            calendar.save(path)
+        return calendar
+
+    @classmethod
+    def load(
+        cls,
+        client: Any,
+        start: str,
+        end: str,
+        path: Optional[str] = None,
+        today: Optional[str] = None,
+    ) -> "TradingCalendar":
+        """
+        path에 저장된 calendar를 읽고, start부터 end까지 중 없는 기간만 조회해서 합친다.
+
+        check_domestic_holiday가 end까지 반환하지 않으면 반환한 날까지만 담는다. 이때 covers(start, end)는
+        False이고, 남은 기간은 다음 날 load()할 때 다시 조회한다.
+
+        Args:
+            client: sync OpenKisClient
+            start (str): 시작일자(YYYYMMDD)
+            end (str): 종료일자(YYYYMMDD)
+            path (Optional[str]): calendar 파일 경로. 조회한 기간이 있으면 합친 calendar를 저장한다.
+            today (Optional[str]): 기준일자(YYYYMMDD). 없으면 오늘
+        """
+        today = today or datetime.now().strftime(_DATE_FORMAT)
+        cached = cls._read_cache(path)
+        fetched = [
+            (s, e, cls._fetch_rows(client, s, e))
+            for s, e in cls._missing(cached, start, end, today)
+        ]
+        return cls._combine(cached, fetched, path, today)
+
+    @classmethod
+    async def aload(
+        cls,
+        client: Any,
+        start: str,
+        end: str,
+        path: Optional[str] = None,
+        today: Optional[str] = None,
+    ) -> "TradingCalendar":
+        """load()의 async 버전"""
+        today = today or datetime.now().strftime(_DATE_FORMAT)
+        cached = cls._read_cache(path)
+        fetched = [
+            (s, e, await cls._afetch_rows(client, s, e))
+            for s, e in cls._missing(cached, start, end, today)
+        ]
+        return cls._combine(cached, fetched, path, today)
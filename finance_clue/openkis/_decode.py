@@ -0,0 +1,258 @@
+"""KIS 응답 output 목록의 NumPy 변환
+
+KIS 응답은 숫자도 모두 문자열이라 ("stck_prpr": "75700") row마다 변환하면 CPU 시간이 많이 든다.
+operation별 field schema로 output/output2 목록을 field별 문자열 배열로 모은 뒤
+field마다 astype 한 번으로 typed 배열을 만든다.
+
+numpy가 설치되어 있어야 한다.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# field 이름과 numpy dtype. "date"는 YYYYMMDD 문자열을 datetime64[D]로 변환한다.
+FieldSchema = Mapping[str, str]
+
+DATE = "date"
+
+# 값이 없거나 변환할 수 없는 칸을 채우는 값
+_FILL_VALUES = {"i": "0", "u": "0", "f": "nan", "U": "", "S": ""}
+
+# bool field에서 True로 보는 값. 나머지 값과 빈 칸은 False
+_TRUE_VALUES = ("1", "Y", "y", "true", "True")
+
+_PRICE_ROW: Dict[str, str] = {
+    "stck_bsop_date": DATE,
+    "stck_oprc": "i8",
+    "stck_hgpr": "i8",
+    "stck_lwpr": "i8",
+    "stck_clpr": "i8",
+    "acml_vol": "i8",
+}
+
+_INDEX_ROW: Dict[str, str] = {
+    "stck_bsop_date": DATE,
+    "bstp_nmix_prpr": "f8",
+    "bstp_nmix_oprc": "f8",
+    "bstp_nmix_hgpr": "f8",
+    "bstp_nmix_lwpr": "f8",
+    "bstp_nmix_prdy_vrss": "f8",
+    "bstp_nmix_prdy_ctrt": "f8",
+    "acml_vol": "i8",
+    "acml_tr_pbmn": "i8",
+}
+
+# operation 이름 -> output key -> field schema
+OPERATION_SCHEMAS: Dict[str, Dict[str, Dict[str, str]]] = {
+    "get_domestic_stock_price": {
+        "output": {
+            "stck_prpr": "i8",
+            "prdy_vrss": "i8",
+            "prdy_ctrt": "f8",
+            "stck_oprc": "i8",
+            "stck_hgpr": "i8",
+            "stck_lwpr": "i8",
+            "acml_vol": "i8",
+            "acml_tr_pbmn": "i8",
+            "hts_avls": "i8",
+            "per": "f8",
+            "pbr": "f8",
+        },
+    },
+    "get_domestic_stock_daily_price": {
+        "output": {
+            **_PRICE_ROW,
+            "prdy_vrss": "i8",
+            "prdy_ctrt": "f8",
+            "hts_frgn_ehrt": "f8",
+            "frgn_ntby_qty": "i8",
+        },
+    },
+    "get_domestic_stock_period_price": {
+        "output2": {**_PRICE_ROW, "acml_tr_pbmn": "i8"},
+    },
+    "get_domestic_stock_time_minute_price": {
+        "output2": {
+            "stck_bsop_date": DATE,
+            "stck_cntg_hour": "i4",
+            "stck_prpr": "i8",
+            "stck_oprc": "i8",
+            "stck_hgpr": "i8",
+            "stck_lwpr": "i8",
+            "cntg_vol": "i8",
+            "acml_tr_pbmn": "i8",
+        },
+    },
+    "get_index_daily_price": {"output2": _INDEX_ROW},
+    "get_index_category_price": {
+        "output2": {
+            "bstp_cls_code": "U",
+            "hts_kor_isnm": "U",
+            "bstp_nmix_prpr": "f8",
+            "bstp_nmix_prdy_vrss": "f8",
+            "bstp_nmix_prdy_ctrt": "f8",
+            "acml_vol": "i8",
+            "acml_tr_pbmn": "i8",
+        },
+    },
+}
+
+
+def _yyyymmdd_to_datetime64(values: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    ymd = values.astype(np.int64)
+    years = (ymd // 10000 - 1970).astype("datetime64[Y]")
+    months = years.astype("datetime64[M]") + (ymd // 100 % 100 - 1)
+    dates = months.astype("datetime64[D]") + (ymd % 100 - 1)
+    return np.where(ymd > 0, dates, np.datetime64("NaT"))
+
+
+def _astype(
+    values: "np.ndarray",
+    dtype: Union[str, "np.dtype"],
+    invalid: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
+    import numpy as np
+
+    if dtype == DATE:
+        values = np.where(values == "", "0", values)
+        try:
+            return _yyyymmdd_to_datetime64(values)
+        except ValueError:
+            return _yyyymmdd_to_datetime64(_coerce(values, np.dtype("i8"), invalid))
+
+    dtype = np.dtype(dtype)
+    if dtype.kind == "b":
+        # 문자열을 bool로 astype 하면 "0", "N"도 True가 된다.
+        return np.isin(values, _TRUE_VALUES)
+    fill = _FILL_VALUES.get(dtype.kind, "")
+    values = np.where(values == "", fill, values)
+    try:
+        return values.astype(dtype)
+    except ValueError:
+        return _coerce(values, dtype, invalid)
+
+
+def _coerce(
+    values: "np.ndarray", dtype: "np.dtype", invalid: Optional["np.ndarray"] = None
+) -> "np.ndarray":
+    """
+    변환할 수 없는 값이 섞여 있을 때만 칸별로 변환하고, 실패한 칸은 fill 값으로 채운다.
+
+    invalid를 넘기면 실패한 칸을 True로 표시한다.
+    """
+    import numpy as np
+
+    fill = _FILL_VALUES.get(dtype.kind, "")
+    result = np.empty(len(values), dtype=dtype)
+    for i, value in enumerate(values):
+        try:
+            result[i] = value
+        except ValueError:
+            try:
+                # "1,234", "75700.0" 처럼 정수로 바로 변환되지 않는 값
+                result[i] = float(str(value).replace(",", ""))
+            except ValueError:
+                result[i] = fill
+                if invalid is not None:
+                    invalid[i] = True
+    return result
+
+
+def decode_columns(
+    rows: Union[Iterable[Mapping[str, Any]], Mapping[str, Any], None],
+    schema: FieldSchema,
+    invalid: Optional["np.ndarray"] = None,
+) -> Dict[str, "np.ndarray"]:
+    """
+    output 목록을 field별 typed 배열로 변환한다.
+
+    Args:
+        rows: 응답 body의 output 목록. dict 하나면 row 한 개로 본다.
+        schema (FieldSchema): 변환할 field와 dtype. schema에 없는 field는 버린다.
+        invalid (Optional[np.ndarray]): row 수 길이의 bool 배열. 넘기면 변환할 수 없어
+            fill 값으로 채운 칸이 있는 row를 True로 표시한다.
+
+    Returns:
+        Dict[str, np.ndarray]: field별 배열
+    """
+    import numpy as np
+
+    if rows is None:
+        rows = []
+    elif isinstance(rows, Mapping):
+        rows = [rows]
+    fields = list(schema)
+    # (row 수, field 수) 문자열 배열 하나로 모은다.
+    table = np.array(
+        [tuple(row.get(f) or "" for f in fields) for row in rows], dtype=str
+    ).reshape(-1, len(fields))
+
+    return {
+        field: _astype(table[:, i], schema[field], invalid)
+        for i, field in enumerate(fields)
+    }
+
+
+def decode_rows(
+    rows: Union[Iterable[Mapping[str, Any]], Mapping[str, Any], None],
+    schema: FieldSchema,
+    structured: bool = False,
+) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+    """
+    output 목록을 field별 typed 배열로 변환한다.
+
+    Args:
+        rows: 응답 body의 output 목록. dict 하나면 row 한 개로 본다.
+        schema (FieldSchema): 변환할 field와 dtype. schema에 없는 field는 버린다.
+        structured (bool): True면 field별 dict 대신 numpy structured array를 반환한다.
+
+    Returns:
+        Union[Dict[str, np.ndarray], np.ndarray]: field별 배열 또는 structured array
+
+    Example:
+        .. code-block:: python
+
+            resp = client.get_domestic_stock_daily_price(...)
+            columns = decode_rows(resp["output"], {"stck_bsop_date": "date", "stck_clpr": "i8"})
+            columns["stck_clpr"]
+    """
+    import numpy as np
+
+    columns = decode_columns(rows, schema)
+    if not structured:
+        return columns
+
+    fields = list(schema)
+    array = np.empty(
+        len(columns[fields[0]]) if fields else 0,
+        dtype=[(field, columns[field].dtype) for field in fields],
+    )
+    for field in fields:
+        array[field] = columns[field]
+    return array
+
+
+def decode_response(
+    operation: str,
+    body: Optional[Mapping[str, Any]],
+    output_key: Optional[str] = None,
+    structured: bool = False,
+) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+    """
+    OPERATION_SCHEMAS에 등록된 operation의 응답 body를 typed 배열로 변환한다.
+
+    Args:
+        operation (str): client method 이름 (예: "get_domestic_stock_daily_price")
+        body (Optional[Mapping[str, Any]]): 응답 body
+        output_key (Optional[str]): 변환할 body key. 없으면 schema에 등록된 첫 key
+        structured (bool): True면 numpy structured array를 반환한다.
+    """
+    if operation not in OPERATION_SCHEMAS:
+        raise KeyError(f"No field schema for operation: {operation}")
+    schemas = OPERATION_SCHEMAS[operation]
+    output_key = output_key or next(iter(schemas))
+    return decode_rows((body or {}).get(output_key), schemas[output_key], structured)
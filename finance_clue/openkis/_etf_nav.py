@@ -0,0 +1,310 @@
+"""ETF 장중 NAV(iNAV) 계산
+
+get_etf_n_etn_component_stock_price는 ETF 하나의 구성종목(output2)과 CU 단위 증권 수를 반환한다.
+구성종목별 CU당 보유 수량(평가금액 / 현재가)을 ETF x 구성종목 sparse 행렬로 모아 두면,
+구성종목 현재가 vector 하나로 모든 ETF의 NAV를 행렬-vector 곱 한 번으로 계산할 수 있다.
+일부 구성종목의 가격만 바뀌면 그 구성종목을 담은 ETF의 NAV만 가격 변화분으로 갱신한다.
+
+scipy 없이 numpy 배열(CSR/CSC index)과 np.bincount로 sparse 곱을 계산한다.
+numpy가 설치되어 있어야 한다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Tuple
+
+from finance_clue.openkis._paging import extract_rows
+from finance_clue.openkis._paging import iter_tr_cont_pages
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+@dataclass
+class EtfBasket:
+    """
+    ETF 하나의 CU(설정 단위) 구성
+
+    Attributes:
+        etf (str): ETF 종목코드
+        quantities (Dict[str, float]): 구성종목 종목코드 -> CU당 보유 수량
+        cu_units (float): CU 하나의 ETF 증권 수
+        cash (float): CU당 현금 등 구성종목 가격에 따라 바뀌지 않는 금액
+    """
+
+    etf: str
+    quantities: Dict[str, float]
+    cu_units: float
+    cash: float = 0.0
+
+
+def basket_from_response(etf: str, pages: Iterable[Mapping[str, Any]]) -> EtfBasket:
+    """
+    get_etf_n_etn_component_stock_price 응답 page로 basket을 만든다.
+
+    구성종목 수량은 ETF구성종목내평가금액(etf_vltn_amt) / 현재가(stck_prpr)이고,
+    응답의 NAV와 구성종목 평가금액 합의 차이는 cash로 둔다.
+    """
+    pages = list(pages)
+    first = pages[0] if pages else None
+    # 응답에 따라 ETF 정보가 output1 또는 output에 온다.
+    header = extract_rows(first, "output1") or extract_rows(first)
+    output = header[0] if header else {}
+    cu_units = _float(output.get("etf_cu_unit_scrt_cnt"))
+    if not cu_units > 0:
+        raise ValueError(f"{etf} has no CU unit count")
+    quantities: Dict[str, float] = {}
+    value = 0.0
+    for page in pages:
+        for row in extract_rows(page, "output2"):
+            symbol = row.get("stck_shrn_iscd")
+            price = _float(row.get("stck_prpr"))
+            amount = _float(row.get("etf_vltn_amt"))
+            if not symbol or not price > 0 or amount != amount:
+                continue
+            quantities[symbol] = quantities.get(symbol, 0.0) + amount / price
+            value += amount
+    nav = _float(output.get("nav"))
+    cash = nav * cu_units - value if nav == nav else 0.0
+    return EtfBasket(etf=etf, quantities=quantities, cu_units=cu_units, cash=cash)
+
+
+class EtfNavEngine:
+    """
+    여러 ETF의 NAV와 괴리율을 구성종목 가격으로 계산하는 engine
+
+    NAV = (CU당 보유 수량 행렬 @ 구성종목 가격 + cash) / CU 단위 증권 수
+    괴리율 = (ETF 가격 - NAV) / NAV
+
+    가격을 모르는 구성종목이 있는 ETF의 NAV는 NaN이다.
+
+    Args:
+        max_workers (int): load_baskets()에서 동시에 보낼 요청 수
+
+    Attributes:
+        baskets (Dict[str, EtfBasket]): ETF 종목코드 -> basket
+        errors (Dict[str, Exception]): 마지막 load_baskets()에서 실패한 ETF
+
+    Example:
+        .. code-block:: python
+
+            engine = EtfNavEngine()
+            engine.load_baskets(client, ["069500", "102110"])
+            engine.update_prices({"005930": 75800, "000660": 181000})
+            engine.update_etf_prices({"069500": 36500})
+            engine.snapshot()["premium"]
+    """
+
+    def __init__(self, max_workers: int = 8):
+        import numpy as np
+
+        self.max_workers = max_workers
+        self.baskets: Dict[str, EtfBasket] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.etfs: List[str] = []
+        self.components: List[str] = []
+        self._component_index: Dict[str, int] = {}
+        # 구성종목 순서(CSC)로 정렬한 basket 행렬: 원소의 ETF 행, 구성종목 열, 1좌당 수량
+        self._rows = np.array([], dtype=np.int64)
+        self._cols = np.array([], dtype=np.int64)
+        self._data = np.array([], dtype=np.float64)
+        # 구성종목 j의 원소는 _colptr[j]:_colptr[j + 1] 구간이다.
+        self._colptr = np.zeros(1, dtype=np.int64)
+        self._cash = np.array([], dtype=np.float64)
+        self._prices = np.array([], dtype=np.float64)
+        self._nav = np.array([], dtype=np.float64)
+        self._etf_prices: Dict[str, float] = {}
+        self._dirty = True
+
+    def set_basket(self, basket: EtfBasket) -> None:
+        """basket을 추가하거나 바꾼다. 다음 계산 때 행렬을 다시 만든다."""
+        self.baskets[basket.etf] = basket
+        self._dirty = True
+
+    def remove_basket(self, etf: str) -> None:
+        self.baskets.pop(etf, None)
+        self._dirty = True
+
+    def _fetch_basket(
+        self, client: Any, etf: str
+    ) -> Tuple[EtfBasket, Dict[str, float]]:
+        pages = list(
+            iter_tr_cont_pages(
+                client.get_etf_n_etn_component_stock_price, fid_input_iscd=etf
+            )
+        )
+        basket = basket_from_response(etf, pages)
+        basket_prices = {
+            row["stck_shrn_iscd"]: _float(row.get("stck_prpr"))
+            for page in pages
+            for row in extract_rows(page, "output2")
+            if row.get("stck_shrn_iscd")
+        }
+        return basket, basket_prices
+
+    def load_baskets(self, client: Any, etfs: Iterable[str]) -> List[str]:
+        """
+        get_etf_n_etn_component_stock_price로 ETF basket을 받는다.
+
+        응답의 구성종목 현재가로 가격도 채운다. 실패한 ETF는 errors에 남는다.
+
+        Args:
+            client: sync OpenKisClient
+            etfs (Iterable[str]): ETF 종목코드
+
+        Returns:
+            List[str]: basket을 받은 ETF 종목코드
+        """
+        self.errors = {}
+        loaded = []
+        prices: Dict[str, float] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                etf: executor.submit(self._fetch_basket, client, etf)
+                for etf in dict.fromkeys(etfs)
+            }
+            for etf, future in futures.items():
+                try:
+                    basket, basket_prices = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    self.errors[etf] = e
+                    continue
+                self.set_basket(basket)
+                prices.update(basket_prices)
+                loaded.append(etf)
+        self.update_prices(prices)
+        return loaded
+
+    def _build(self) -> None:
+        import numpy as np
+
+        old_prices = dict(zip(self.components, self._prices.tolist()))
+        self.etfs = list(self.baskets)
+        self.components = sorted(
+            {s for basket in self.baskets.values() for s in basket.quantities}
+        )
+        self._component_index = {s: j for j, s in enumerate(self.components)}
+
+        row_list: List[int] = []
+        col_list: List[int] = []
+        data_list: List[float] = []
+        for i, basket in enumerate(self.baskets.values()):
+            for symbol, quantity in basket.quantities.items():
+                row_list.append(i)
+                col_list.append(self._component_index[symbol])
+                data_list.append(quantity / basket.cu_units)
+        rows = np.array(row_list, dtype=np.int64)
+        cols = np.array(col_list, dtype=np.int64)
+        data = np.array(data_list, dtype=np.float64)
+        # 구성종목 순서(CSC)로 정렬해 두면 가격이 바뀐 구성종목의 원소를 구간으로 찾을 수 있다.
+        order = np.argsort(cols, kind="stable")
+        self._rows, self._cols, self._data = rows[order], cols[order], data[order]
+        self._colptr = np.searchsorted(self._cols, np.arange(len(self.components) + 1))
+        self._cash = np.array(
+            [basket.cash / basket.cu_units for basket in self.baskets.values()],
+            dtype=np.float64,
+        )
+        self._prices = np.array(
+            [old_prices.get(s, np.nan) for s in self.components], dtype=np.float64
+        )
+        self._dirty = False
+        self.recompute()
+
+    def recompute(self) -> "np.ndarray":
+        """모든 ETF의 NAV를 처음부터 다시 계산한다."""
+        import numpy as np
+
+        if self._dirty:
+            self._build()
+            return self._nav
+        values = np.bincount(
+            self._rows,
+            weights=self._data * self._prices[self._cols],
+            minlength=len(self.etfs),
+        )
+        self._nav = values + self._cash
+        return self._nav
+
+    def update_prices(self, prices: Mapping[str, float]) -> List[str]:
+        """
+        구성종목 가격을 바꾸고, 그 구성종목을 담은 ETF의 NAV를 가격 변화분만큼 갱신한다.
+
+        Args:
+            prices (Mapping[str, float]): 구성종목 종목코드 -> 가격. basket에 없는 종목은 무시한다.
+
+        Returns:
+            List[str]: NAV가 바뀐 ETF 종목코드
+        """
+        import numpy as np
+
+        if self._dirty:
+            self._build()
+        index = self._component_index
+        symbols = [s for s in prices if s in index]
+        cols = np.array([index[s] for s in symbols], dtype=np.int64)
+        new = np.array([prices[s] for s in symbols], dtype=np.float64)
+        delta = new - self._prices[cols]
+        # 값이 같은 가격은 건너뛴다. NaN과 관련된 변화는 남긴다.
+        keep = delta != 0
+        cols, new, delta = cols[keep], new[keep], delta[keep]
+        if not len(cols):
+            return []
+        self._prices[cols] = new
+
+        # 바뀐 구성종목의 원소 위치: colptr 구간을 이어 붙인다.
+        starts, ends = self._colptr[cols], self._colptr[cols + 1]
+        lengths = ends - starts
+        entries = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(
+            lengths.sum()
+        )
+        etf_rows = self._rows[entries]
+        if np.isnan(delta).any():
+            # NaN이던 가격이 채워지면 변화분을 더할 수 없으므로 다시 계산한다.
+            self.recompute()
+        else:
+            self._nav += np.bincount(
+                etf_rows,
+                weights=self._data[entries] * np.repeat(delta, lengths),
+                minlength=len(self.etfs),
+            )
+        return [self.etfs[i] for i in np.unique(etf_rows)]
+
+    def update_etf_prices(self, prices: Mapping[str, float]) -> None:
+        """괴리율 계산에 쓰는 ETF 시장 가격을 바꾼다."""
+        self._etf_prices.update({etf: float(p) for etf, p in prices.items()})
+
+    @property
+    def nav(self) -> "np.ndarray":
+        """etfs 순서의 NAV"""
+        if self._dirty:
+            self._build()
+        return self._nav
+
+    def snapshot(self) -> Dict[str, "np.ndarray"]:
+        """
+        ETF별 NAV, 시장 가격, 괴리율
+
+        Returns:
+            Dict[str, np.ndarray]: etf, nav, price, premium 배열. 시장 가격을 모르면 price, premium은 NaN
+        """
+        import numpy as np
+
+        nav = self.nav.copy()
+        price = np.array(
+            [self._etf_prices.get(etf, np.nan) for etf in self.etfs], dtype=np.float64
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            premium = (price - nav) / nav
+        return {
+            "etf": np.array(self.etfs, dtype=str),
+            "nav": nav,
+            "price": price,
+            "premium": premium,
+        }
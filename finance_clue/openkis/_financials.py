@@ -0,0 +1,336 @@
+"""국내주식 재무제표 warehouse
+
+get_financial_* 조회는 종목 하나, 재무제표 하나에 한 번씩 호출해야 해서 전 종목을 다시 받으면
+7 × 2,500번 가까이 호출한다. 재무제표는 분기마다 한 번 바뀌므로, 종목마다 재무제표 하나(probe)만
+먼저 조회해서 최신 결산년월(stac_yymm)이 저장된 값과 다른 종목만 나머지 재무제표를 다시 받는다.
+
+받은 값은 재무제표별 column 배열(symbol, stac_yymm, field...)로 저장하고,
+특정 결산년월의 전 종목 횡단면이나 종목별 시계열은 API 호출 없이 저장된 배열에서 조회한다.
+
+numpy가 설치되어 있어야 한다.
+"""
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import json
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from finance_clue.openkis._io import atomic_write
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 재무제표 이름 -> client method
+FINANCIAL_STATEMENTS: Dict[str, str] = {
+    "balance_sheet": "get_financial_balance_sheet",
+    "income_statement": "get_financial_income_statement",
+    "ratio": "get_financial_ratio",
+    "profit_ratio": "get_financial_profit_ratio",
+    "stability_ratio": "get_financial_stability_ratio",
+    "growth_ratio": "get_financial_growth_ratio",
+    "other_major_ratio": "get_financial_other_major_ratio",
+}
+
+# 분류 구분 코드
+ANNUAL = "0"
+QUARTERLY = "1"
+
+_KEY_FIELDS = ("symbol", "stac_yymm")
+_MANIFEST = "manifest.json"
+
+
+class FinancialTable:
+    """
+    재무제표 하나의 column 배열. (symbol, stac_yymm)마다 row 하나를 갖는다.
+
+    Attributes:
+        columns (Dict[str, np.ndarray]): symbol, stac_yymm(문자열)과 field별 float64 배열
+    """
+
+    def __init__(self, columns: Optional[Dict[str, "np.ndarray"]] = None):
+        import numpy as np
+
+        self.columns: Dict[str, "np.ndarray"] = columns or {
+            "symbol": np.array([], dtype="U9"),
+            "stac_yymm": np.array([], dtype="U6"),
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns["symbol"])
+
+    @property
+    def fields(self) -> List[str]:
+        return [name for name in self.columns if name not in _KEY_FIELDS]
+
+    def upsert(self, rows_by_symbol: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        종목별 output row를 (symbol, stac_yymm) 기준으로 합친다.
+
+        같은 결산년월의 row는 새 값으로 바꾸고, 응답에 없는 예전 결산년월의 row는 그대로 둔다.
+        API는 최근 몇 분기만 반환하므로 응답에서 빠진 분기도 warehouse에는 남는다.
+
+        Args:
+            rows_by_symbol: 종목코드 -> 재무제표 output 목록
+        """
+        import numpy as np
+
+        from finance_clue.openkis._decode import _astype
+
+        rows = [
+            (symbol, row)
+            for symbol, symbol_rows in rows_by_symbol.items()
+            for row in {r.get("stac_yymm"): r for r in symbol_rows}.values()
+            if row.get("stac_yymm")
+        ]
+        fields = list(
+            dict.fromkeys(
+                self.fields
+                + [k for _, row in rows for k in row if k not in _KEY_FIELDS]
+            )
+        )
+        new: Dict[str, "np.ndarray"] = {
+            "symbol": np.array([s for s, _ in rows], dtype="U9"),
+            "stac_yymm": np.array([r["stac_yymm"] for _, r in rows], dtype="U6"),
+        }
+        for field in fields:
+            new[field] = _astype(
+                np.array([r.get(field) or "" for _, r in rows], dtype=str), "f8"
+            )
+
+        # stac_yymm은 항상 6자리이므로 앞에 붙이면 (symbol, stac_yymm)의 key가 된다.
+        keep = ~np.isin(
+            np.char.add(self.columns["stac_yymm"], self.columns["symbol"]),
+            np.char.add(new["stac_yymm"], new["symbol"]),
+        )
+        size = int(keep.sum())
+        columns = {}
+        for name in list(_KEY_FIELDS) + fields:
+            old = self.columns.get(name)
+            if old is None:
+                old = np.full(size, np.nan)
+            else:
+                old = old[keep]
+            columns[name] = np.concatenate((old, new[name]))
+        # 종목, 결산년월 순서로 정렬해 두면 종목별 조회가 연속된 구간이 된다.
+        order = np.lexsort((columns["stac_yymm"], columns["symbol"]))
+        self.columns = {name: values[order] for name, values in columns.items()}
+
+    def select(
+        self, index: Any, fields: Optional[Sequence[str]] = None
+    ) -> Dict[str, "np.ndarray"]:
+        """index(bool mask 또는 slice)에 해당하는 row의 key와 field 배열"""
+        names = list(_KEY_FIELDS) + list(self.fields if fields is None else fields)
+        return {name: self.columns[name][index] for name in names}
+
+
+def _save_columns(columns: Mapping[str, "np.ndarray"], f: BinaryIO) -> None:
+    import numpy as np
+
+    np.savez(f, allow_pickle=False, **columns)
+
+
+class FinancialWarehouse:
+    """
+    재무제표를 증분으로 받아 column 배열로 저장하는 warehouse
+
+    Args:
+        path (Optional[str]): 저장할 디렉터리. 있으면 열 때 읽고 refresh() 뒤에 저장한다.
+        div_cls_code (str): 분류 구분 코드. "0": 년, "1": 분기
+        statements (Optional[Sequence[str]]): 받을 재무제표. 기본값은 FINANCIAL_STATEMENTS 전체
+        probe (str): 최신 결산년월을 확인할 때 먼저 조회하는 재무제표
+        max_workers (int): 동시에 보낼 요청 수
+
+    Example:
+        .. code-block:: python
+
+            warehouse = FinancialWarehouse("financials")
+            warehouse.refresh(client, symbols)
+            warehouse.cross_section("ratio", "202403", ["roe_val", "eps"])
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        div_cls_code: str = QUARTERLY,
+        statements: Optional[Sequence[str]] = None,
+        probe: str = "ratio",
+        max_workers: int = 8,
+    ):
+        self.path = path
+        self.div_cls_code = div_cls_code
+        self.statements = list(statements or FINANCIAL_STATEMENTS)
+        unknown = set(self.statements) - set(FINANCIAL_STATEMENTS)
+        if unknown:
+            raise KeyError(f"Unknown financial statements: {sorted(unknown)}")
+        if probe not in self.statements:
+            raise ValueError(f"probe statement {probe} is not in statements")
+        self.probe = probe
+        self.max_workers = max_workers
+        self.tables: Dict[str, FinancialTable] = {}
+        # 종목별로 마지막으로 모든 재무제표를 받은 최신 결산년월
+        self.latest: Dict[str, str] = {}
+        self.errors: Dict[Tuple[str, str], Exception] = {}
+        if path is not None and os.path.exists(os.path.join(path, _MANIFEST)):
+            self._load(path)
+
+    def table(self, statement: str) -> FinancialTable:
+        if statement not in self.tables:
+            self.tables[statement] = FinancialTable()
+        return self.tables[statement]
+
+    def _fetch(self, client: Any, statement: str, symbol: str) -> List[Dict[str, Any]]:
+        operation = getattr(client, FINANCIAL_STATEMENTS[statement])
+        resp = operation(fid_input_iscd=symbol, fid_div_cls_code=self.div_cls_code)
+        return (resp or {}).get("output") or []
+
+    def refresh(
+        self, client: Any, symbols: Iterable[str], force: bool = False
+    ) -> List[str]:
+        """
+        최신 결산년월이 바뀐 종목만 모든 재무제표를 다시 받는다.
+
+        조회에 실패한 (종목, 재무제표)는 errors에 남고, 그 종목은 다음 refresh()에서 다시 받는다.
+
+        Args:
+            client: sync OpenKisClient
+            symbols (Iterable[str]): 종목코드
+            force (bool): True면 최신 결산년월과 관계 없이 모두 다시 받는다.
+
+        Returns:
+            List[str]: 다시 받은 종목코드
+        """
+        self.errors = {}
+        symbols = list(dict.fromkeys(symbols))
+        others = [s for s in self.statements if s != self.probe]
+        fetched: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+            statement: {} for statement in self.statements
+        }
+        changed: List[str] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            probes = {
+                symbol: executor.submit(self._fetch, client, self.probe, symbol)
+                for symbol in symbols
+            }
+            futures: Dict[Tuple[str, str], Future] = {}
+            for symbol, future in probes.items():
+                try:
+                    rows = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    self.errors[(symbol, self.probe)] = e
+                    continue
+                latest = max((r.get("stac_yymm") or "" for r in rows), default="")
+                if not force and latest == self.latest.get(symbol, None):
+                    continue
+                changed.append(symbol)
+                fetched[self.probe][symbol] = rows
+                for statement in others:
+                    futures[(symbol, statement)] = executor.submit(
+                        self._fetch, client, statement, symbol
+                    )
+
+            failed = set()
+            for (symbol, statement), future in futures.items():
+                try:
+                    fetched[statement][symbol] = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    self.errors[(symbol, statement)] = e
+                    failed.add(symbol)
+
+        for statement, rows_by_symbol in fetched.items():
+            if rows_by_symbol:
+                self.table(statement).upsert(rows_by_symbol)
+        for symbol in changed:
+            if symbol in failed:
+                # 다음 refresh()에서 다시 받도록 최신 결산년월을 기록하지 않는다.
+                self.latest.pop(symbol, None)
+            else:
+                self.latest[symbol] = max(
+                    (r.get("stac_yymm") or "" for r in fetched[self.probe][symbol]),
+                    default="",
+                )
+        if self.path is not None:
+            self.save()
+        return changed
+
+    def cross_section(
+        self,
+        statement: str,
+        stac_yymm: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        결산년월 하나의 전 종목 값
+
+        Args:
+            statement (str): 재무제표 이름 (예: "ratio")
+            stac_yymm (str): 결산년월(YYYYMM)
+            fields (Optional[Sequence[str]]): 반환할 field. 없으면 모든 field
+
+        Returns:
+            Dict[str, np.ndarray]: symbol, stac_yymm과 field별 배열
+        """
+        table = self.table(statement)
+        return table.select(table.columns["stac_yymm"] == stac_yymm, fields)
+
+    def history(
+        self,
+        statement: str,
+        symbol: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, "np.ndarray"]:
+        """종목 하나의 결산년월 오름차순 값"""
+        import numpy as np
+
+        table = self.table(statement)
+        symbols = table.columns["symbol"]
+        # 종목, 결산년월 순서로 정렬되어 있으므로 종목의 row는 연속된 구간이다.
+        start = np.searchsorted(symbols, symbol, side="left")
+        end = np.searchsorted(symbols, symbol, side="right")
+        return table.select(slice(start, end), fields)
+
+    def save(self) -> None:
+        """warehouse를 path에 저장한다. path가 없으면 ValueError를 던진다."""
+        path = self.path
+        if path is None:
+            raise ValueError("FinancialWarehouse has no path to save to")
+        os.makedirs(path, exist_ok=True)
+        for statement, table in self.tables.items():
+            atomic_write(
+                os.path.join(path, f"{statement}.npz"),
+                partial(_save_columns, table.columns),
+            )
+        manifest = {"div_cls_code": self.div_cls_code, "latest": self.latest}
+        atomic_write(os.path.join(path, _MANIFEST), json.dumps(manifest).encode())
+
+    def _load(self, path: str) -> None:
+        import numpy as np
+
+        with open(os.path.join(path, _MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("div_cls_code") != self.div_cls_code:
+            raise ValueError(
+                f"{path} holds div_cls_code {manifest.get('div_cls_code')}, "
+                f"not {self.div_cls_code}"
+            )
+        self.latest = manifest["latest"]
+        for statement in self.statements:
+            file = os.path.join(path, f"{statement}.npz")
+            if os.path.exists(file):
+                with np.load(file) as data:
+                    self.tables[statement] = FinancialTable(
+                        {name: data[name] for name in data.files}
+                    )
@@ -0,0 +1,267 @@
+"""국내주식 기간별 시세 history loader
+
+get_domestic_stock_period_price는 한 번에 최대 100건만 반환한다.
+여러 해의 일/주/월봉을 받으려면 조회 기간을 100건 이하로 나눠 조회하고 이어 붙여야 해서,
+영업일 목록으로 조회 기간을 나누고 여러 기간, 여러 종목을 thread pool에서 동시에 조회한다.
+
+numpy가 설치되어 있어야 한다.
+"""
+
+from bisect import bisect_left
+from bisect import bisect_right
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from finance_clue.openkis._decode import OPERATION_SCHEMAS
+from finance_clue.openkis._decode import decode_rows
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 한 번에 조회할 수 있는 최대 건수
+PERIOD_PRICE_MAX_ROWS = 100
+
+_DATE_FORMAT = "%Y%m%d"
+
+# 영업일자, 시가, 고가, 저가, 종가, 누적거래량, 누적거래대금
+_PRICE_SCHEMA = OPERATION_SCHEMAS["get_domestic_stock_period_price"]["output2"]
+
+
+@dataclass
+class PriceHistory:
+    """
+    종목 하나의 기간별 시세 배열 (날짜 오름차순)
+
+    Attributes:
+        symbol (str): 종목코드
+        period (str): 기간 분류 코드 (D, W, M, Y)
+        date (np.ndarray): 영업일자, datetime64[D]
+        open (np.ndarray): 시가, int64
+        high (np.ndarray): 고가, int64
+        low (np.ndarray): 저가, int64
+        close (np.ndarray): 종가, int64
+        volume (np.ndarray): 누적거래량, int64
+        amount (np.ndarray): 누적거래대금, int64
+    """
+
+    symbol: str
+    period: str
+    date: "np.ndarray"
+    open: "np.ndarray"
+    high: "np.ndarray"
+    low: "np.ndarray"
+    close: "np.ndarray"
+    volume: "np.ndarray"
+    amount: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, _DATE_FORMAT).date()
+
+
+def _format_date(value: date) -> str:
+    return value.strftime(_DATE_FORMAT)
+
+
+def _weekdays(start: date, end: date) -> List[str]:
+    days = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            days.append(_format_date(day))
+        day += timedelta(days=1)
+    return days
+
+
+def _add_months(value: date, months: int) -> date:
+    month = value.month - 1 + months
+    return date(value.year + month // 12, month % 12 + 1, 1)
+
+
+def split_date_windows(
+    start: str,
+    end: str,
+    period: str = "D",
+    trading_days: Optional[Sequence[str]] = None,
+    max_rows: int = PERIOD_PRICE_MAX_ROWS,
+) -> List[Tuple[str, str]]:
+    """
+    조회 기간을 max_rows건 이하가 나오는 (시작일, 종료일) 목록으로 나눈다.
+
+    Args:
+        start (str): 조회 시작일자(YYYYMMDD)
+        end (str): 조회 종료일자(YYYYMMDD)
+        period (str): 기간 분류 코드 (D, W, M, Y)
+        trading_days (Optional[Sequence[str]]): 오름차순 영업일 목록(YYYYMMDD).
+            일봉을 나눌 때 쓰고, 없으면 평일을 영업일로 본다. TradingCalendar.open_days를 넘길 수 있다.
+        max_rows (int): 한 번에 조회할 수 있는 최대 건수
+
+    Returns:
+        List[Tuple[str, str]]: 날짜 오름차순 (시작일, 종료일) 목록
+    """
+    start_date, end_date = _parse_date(start), _parse_date(end)
+    if start_date > end_date:
+        return []
+
+    if period == "D":
+        if trading_days is None:
+            days = _weekdays(start_date, end_date)
+        else:
+            days = list(
+                trading_days[
+                    bisect_left(trading_days, start) : bisect_right(trading_days, end)
+                ]
+            )
+        return [
+            (days[i], days[min(i + max_rows, len(days)) - 1])
+            for i in range(0, len(days), max_rows)
+        ]
+
+    windows = []
+    window_start = start_date
+    while window_start <= end_date:
+        if period == "W":
+            # 시작일이 주 중간이어도 max_rows주를 넘지 않도록 (max_rows - 1)주만 더한다.
+            window_end = window_start + timedelta(weeks=max_rows - 1, days=-1)
+            window_end += timedelta(days=6 - window_end.weekday())
+        elif period == "M":
+            window_end = _add_months(window_start, max_rows) - timedelta(days=1)
+        elif period == "Y":
+            window_end = date(window_start.year + max_rows - 1, 12, 31)
+        else:
+            raise ValueError(f"Unknown period: {period}")
+        window_end = min(window_end, end_date)
+        windows.append((_format_date(window_start), _format_date(window_end)))
+        window_start = window_end + timedelta(days=1)
+    return windows
+
+
+def _to_price_history(
+    symbol: str, period: str, rows: Dict[str, Mapping[str, Any]]
+) -> PriceHistory:
+    columns = decode_rows([rows[d] for d in sorted(rows)], _PRICE_SCHEMA)
+    return PriceHistory(
+        symbol=symbol,
+        period=period,
+        date=columns["stck_bsop_date"],
+        open=columns["stck_oprc"],
+        high=columns["stck_hgpr"],
+        low=columns["stck_lwpr"],
+        close=columns["stck_clpr"],
+        volume=columns["acml_vol"],
+        amount=columns["acml_tr_pbmn"],
+    )
+
+
+class PeriodPriceLoader:
+    """
+    여러 종목의 기간별 시세를 조회 기간을 나눠서 동시에 받는 loader
+
+    모든 종목의 모든 조회 기간을 하나의 thread pool에서 조회하므로, 종목 수와 관계 없이
+    동시에 보내는 요청은 max_workers개를 넘지 않는다. 호출 속도는 client의 rate limit policy가 맞춘다.
+
+    Args:
+        client: OpenKisClient
+        period (str): 기간 분류 코드 (D: 일봉, W: 주봉, M: 월봉, Y: 년봉)
+        adjusted (bool): 수정주가 반영 여부
+        trading_days (Optional[Sequence[str]]): 오름차순 영업일 목록(YYYYMMDD). 없으면 평일을 영업일로 본다.
+        max_workers (int): 동시에 보낼 요청 수
+
+    Example:
+        .. code-block:: python
+
+            loader = PeriodPriceLoader(client, period="D")
+            histories = loader.load_many(["005930", "000660"], "20150101", "20241231")
+            histories["005930"].close
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        period: str = "D",
+        adjusted: bool = True,
+        trading_days: Optional[Sequence[str]] = None,
+        max_workers: int = 8,
+    ):
+        self.client = client
+        self.period = period
+        self.adjusted = adjusted
+        self.trading_days = trading_days
+        self.max_workers = max_workers
+        self.errors: Dict[str, Exception] = {}
+
+    def windows(self, start: str, end: str) -> List[Tuple[str, str]]:
+        return split_date_windows(start, end, self.period, self.trading_days)
+
+    def _fetch_window(self, symbol: str, window: Tuple[str, str]) -> List[Any]:
+        resp = self.client.get_domestic_stock_period_price(
+            fid_input_iscd=symbol,
+            fid_input_date1=window[0],
+            fid_input_date2=window[1],
+            fid_period_div_code=self.period,
+            fid_org_adj_prc="0" if self.adjusted else "1",
+        )
+        return (resp or {}).get("output2") or []
+
+    def load(self, symbol: str, start: str, end: str) -> PriceHistory:
+        """종목 하나의 기간별 시세를 조회한다. 실패하면 예외가 발생한다."""
+        histories = self.load_many([symbol], start, end)
+        if symbol in self.errors:
+            raise self.errors[symbol]
+        return histories[symbol]
+
+    def load_many(
+        self, symbols: Iterable[str], start: str, end: str
+    ) -> Dict[str, PriceHistory]:
+        """
+        여러 종목의 기간별 시세를 조회한다.
+
+        조회에 실패한 종목은 결과에서 빠지고 errors에 예외가 남는다.
+        """
+        self.errors = {}
+        windows = self.windows(start, end)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures: Dict[str, List[Future]] = {
+                symbol: [
+                    executor.submit(self._fetch_window, symbol, window)
+                    for window in windows
+                ]
+                for symbol in dict.fromkeys(symbols)
+            }
+
+            results: Dict[str, PriceHistory] = {}
+            for symbol, symbol_futures in futures.items():
+                rows: Dict[str, Mapping[str, Any]] = {}
+                try:
+                    for future in symbol_futures:
+                        for row in future.result():
+                            d = row.get("stck_bsop_date")
+                            # 조회 기간 밖이거나 빈 row는 버리고, 겹치는 날짜는 하나만 남긴다.
+                            if d and start <= d <= end:
+                                rows[d] = row
+                except Exception as e:  # pylint: disable=broad-except
+                    self.errors[symbol] = e
+                    for future in symbol_futures:
+                        future.cancel()
+                    continue
+                results[symbol] = _to_price_history(symbol, self.period, rows)
+        return results
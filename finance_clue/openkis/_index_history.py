@@ -0,0 +1,357 @@
+"""국내업종 지수 history, 분봉 loader
+
+업종 지수 조회는 한 번에 받을 수 있는 건수가 API마다 다르고, 다음 page를 받는 방법도 다르다.
+
+- get_index_daily_price: fid_input_date1 이전 최대 100건. 받은 가장 이른 날짜 전날로 다시 조회한다.
+- get_index_chart_price: 조회 기간 안의 최대 50건. 조회 기간을 50건 이하로 나눠 동시에 조회한다.
+- get_index_minute_chart_price: 최대 102건. 응답 header의 tr_cont로 이어서 조회한다.
+
+업종 코드는 get_index_category_price로 찾고, 여러 지수를 thread pool에서 동시에 받은 뒤
+날짜(시각) 축을 맞춘 field별 2차원 배열로 모은다.
+
+numpy가 설치되어 있어야 한다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from finance_clue.openkis._decode import DATE
+from finance_clue.openkis._decode import _astype
+from finance_clue.openkis._history import split_date_windows
+from finance_clue.openkis._paging import extract_rows
+from finance_clue.openkis._paging import iter_tr_cont_pages
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 한 번에 조회할 수 있는 최대 건수
+INDEX_DAILY_PRICE_MAX_ROWS = 100
+INDEX_CHART_PRICE_MAX_ROWS = 50
+
+# 시장 구분 코드 -> 업종 구분별 시세를 조회할 때 넘기는 대표 업종 코드
+INDEX_MARKETS: Dict[str, str] = {"K": "0001", "Q": "1001", "K2": "2001"}
+
+_DATE_FORMAT = "%Y%m%d"
+
+# IndexPanel field -> output2 field
+_DAILY_FIELDS: Dict[str, str] = {
+    "open": "bstp_nmix_oprc",
+    "high": "bstp_nmix_hgpr",
+    "low": "bstp_nmix_lwpr",
+    "close": "bstp_nmix_prpr",
+    "volume": "acml_vol",
+    "amount": "acml_tr_pbmn",
+}
+_MINUTE_FIELDS: Dict[str, str] = {**_DAILY_FIELDS, "volume": "cntg_vol"}
+
+
+@dataclass
+class IndexPanel:
+    """
+    여러 지수의 시세를 날짜(시각) 축에 맞춘 2차원 배열
+
+    columns의 배열은 (len(index), len(codes)) 모양이고, 그 날짜(시각)에 값이 없는 칸은 NaN이다.
+
+    Attributes:
+        codes (List[str]): 업종 코드. 배열의 열 순서
+        index (np.ndarray): 오름차순 날짜(datetime64[D]) 또는 시각(datetime64[s])
+        columns (Dict[str, np.ndarray]): open, high, low, close, volume, amount float64 배열
+    """
+
+    codes: List[str]
+    index: "np.ndarray"
+    columns: Dict[str, "np.ndarray"]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, field: str) -> "np.ndarray":
+        return self.columns[field]
+
+    def series(self, code: str, field: str = "close") -> "np.ndarray":
+        """지수 하나의 field 값. index와 같은 길이다."""
+        return self.columns[field][:, self.codes.index(code)]
+
+
+def _build_panel(
+    rows_by_code: Mapping[str, Mapping[str, Mapping[str, Any]]],
+    fields: Mapping[str, str],
+    to_index,
+) -> IndexPanel:
+    import numpy as np
+
+    codes = list(rows_by_code)
+    keys = sorted({key for rows in rows_by_code.values() for key in rows})
+    columns = {name: np.full((len(keys), len(codes)), np.nan) for name in fields}
+    for j, code in enumerate(codes):
+        rows = rows_by_code[code]
+        code_keys = sorted(rows)
+        positions = np.searchsorted(keys, code_keys)
+        for name, field in fields.items():
+            values = np.array([rows[k].get(field) or "" for k in code_keys], dtype=str)
+            columns[name][positions, j] = _astype(values, "f8")
+    return IndexPanel(codes=codes, index=to_index(keys), columns=columns)
+
+
+def _date_index(keys: Sequence[str]) -> "np.ndarray":
+    import numpy as np
+
+    return _astype(np.array(keys, dtype=str), DATE)
+
+
+def _time_index(keys: Sequence[str]) -> "np.ndarray":
+    import numpy as np
+
+    dates = _astype(np.array([k[:8] for k in keys], dtype=str), DATE)
+    hhmmss = np.array([k[8:] for k in keys], dtype=str).astype(np.int64)
+    seconds = hhmmss // 10000 * 3600 + hhmmss // 100 % 100 * 60 + hhmmss % 100
+    return dates.astype("datetime64[s]") + seconds.astype("timedelta64[s]")
+
+
+def _previous_day(day: str) -> str:
+    return (datetime.strptime(day, _DATE_FORMAT) - timedelta(days=1)).strftime(
+        _DATE_FORMAT
+    )
+
+
+class IndexLoader:
+    """
+    업종 지수의 일/주/월 history와 분봉을 동시에 받는 loader
+
+    Args:
+        client: sync OpenKisClient
+        trading_days (Optional[Sequence[str]]): 오름차순 영업일 목록(YYYYMMDD).
+            source="chart"로 일봉 조회 기간을 나눌 때 쓴다. TradingCalendar.open_days를 넘길 수 있다.
+        max_workers (int): 동시에 보낼 요청 수
+
+    Attributes:
+        names (Dict[str, str]): discover()로 찾은 업종 코드 -> 업종명
+        errors (Dict[str, Exception]): 마지막 조회에서 실패한 업종 코드
+
+    Example:
+        .. code-block:: python
+
+            loader = IndexLoader(client)
+            codes = loader.discover()
+            panel = loader.history(codes, "20150101", "20241231")
+            panel.series("0001", "close")
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        trading_days: Optional[Sequence[str]] = None,
+        max_workers: int = 8,
+    ):
+        self.client = client
+        self.trading_days = trading_days
+        self.max_workers = max_workers
+        self.names: Dict[str, str] = {}
+        self.errors: Dict[str, Exception] = {}
+
+    def discover(self, markets: Iterable[str] = tuple(INDEX_MARKETS)) -> List[str]:
+        """
+        get_index_category_price로 시장별 전업종 코드를 찾는다.
+
+        Args:
+            markets (Iterable[str]): 시장 구분 코드 (K: 거래소, Q: 코스닥, K2: 코스피200)
+
+        Returns:
+            List[str]: 찾은 순서대로의 업종 코드
+        """
+        for market in markets:
+            resp = self.client.get_index_category_price(
+                fid_input_iscd=INDEX_MARKETS[market],
+                fid_mrkt_cls_code=market,
+                fid_blng_cls_code="0",
+            )
+            for row in extract_rows(resp, "output2"):
+                code = row.get("bstp_cls_code")
+                if code:
+                    self.names.setdefault(code, row.get("hts_kor_isnm", ""))
+        return list(self.names)
+
+    def _daily_rows(
+        self, code: str, start: str, end: str, period: str
+    ) -> Dict[str, Dict[str, Any]]:
+        rows: Dict[str, Dict[str, Any]] = {}
+        cursor = end
+        while cursor >= start:
+            resp = self.client.get_index_daily_price(
+                fid_input_iscd=code, fid_input_date1=cursor, fid_period_div_code=period
+            )
+            page = [
+                row
+                for row in extract_rows(resp, "output2")
+                if row.get("stck_bsop_date") and row["stck_bsop_date"] <= cursor
+            ]
+            for row in page:
+                if row["stck_bsop_date"] >= start:
+                    rows[row["stck_bsop_date"]] = row
+            earliest = min((row["stck_bsop_date"] for row in page), default=start)
+            # 더 이전 데이터가 없거나 start까지 받았으면 끝
+            if len(page) < INDEX_DAILY_PRICE_MAX_ROWS or earliest <= start:
+                break
+            cursor = _previous_day(earliest)
+        return rows
+
+    def _chart_rows(
+        self, code: str, window: Tuple[str, str], period: str
+    ) -> Dict[str, Dict[str, Any]]:
+        resp = self.client.get_index_chart_price(
+            fid_input_iscd=code,
+            fid_input_date1=window[0],
+            fid_input_date2=window[1],
+            fid_period_div_code=period,
+        )
+        return {
+            row["stck_bsop_date"]: row
+            for row in extract_rows(resp, "output2")
+            if window[0] <= row.get("stck_bsop_date", "") <= window[1]
+        }
+
+    def history(
+        self,
+        codes: Iterable[str],
+        start: str,
+        end: str,
+        period: str = "D",
+        source: str = "daily",
+    ) -> IndexPanel:
+        """
+        여러 지수의 기간별 시세를 받는다.
+
+        조회에 실패한 지수는 결과에서 빠지고 errors에 예외가 남는다.
+
+        Args:
+            codes (Iterable[str]): 업종 코드
+            start (str): 조회 시작일자(YYYYMMDD)
+            end (str): 조회 종료일자(YYYYMMDD)
+            period (str): 기간 분류 코드 (D, W, M. source="chart"면 Y도 가능)
+            source (str): "daily"면 get_index_daily_price(100건씩 날짜를 거슬러 조회),
+                "chart"면 get_index_chart_price(50건 이하 기간으로 나눠 동시에 조회)
+
+        Returns:
+            IndexPanel: 날짜 축을 맞춘 지수별 시세
+        """
+        if source not in ("daily", "chart"):
+            raise ValueError(f"Unknown index history source: {source}")
+        self.errors = {}
+        codes = list(dict.fromkeys(codes))
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if source == "daily":
+                futures = {
+                    code: [executor.submit(self._daily_rows, code, start, end, period)]
+                    for code in codes
+                }
+            else:
+                windows = split_date_windows(
+                    start,
+                    end,
+                    period,
+                    self.trading_days,
+                    max_rows=INDEX_CHART_PRICE_MAX_ROWS,
+                )
+                futures = {
+                    code: [
+                        executor.submit(self._chart_rows, code, window, period)
+                        for window in windows
+                    ]
+                    for code in codes
+                }
+            for code, code_futures in futures.items():
+                rows: Dict[str, Dict[str, Any]] = {}
+                try:
+                    for future in code_futures:
+                        rows.update(future.result())
+                except Exception as e:  # pylint: disable=broad-except
+                    self.errors[code] = e
+                    for future in code_futures:
+                        future.cancel()
+                    continue
+                results[code] = rows
+        return _build_panel(results, _DAILY_FIELDS, _date_index)
+
+    def _minute_rows(
+        self,
+        code: str,
+        interval: str,
+        include_past: bool,
+        since: Optional[str],
+        max_pages: Optional[int],
+    ) -> Dict[str, Dict[str, Any]]:
+        rows: Dict[str, Dict[str, Any]] = {}
+        pages = iter_tr_cont_pages(
+            self.client.get_index_minute_chart_price,
+            max_pages=max_pages,
+            fid_input_iscd=code,
+            fid_etc_cls_code="0",
+            fid_input_hour1=interval,
+            fid_pw_data_incu_yn="Y" if include_past else "N",
+        )
+        for page in pages:
+            keys = []
+            for row in extract_rows(page, "output2"):
+                key = f"{row.get('stck_bsop_date', '')}{row.get('stck_cntg_hour', '')}"
+                if len(key) != 14:
+                    continue
+                keys.append(key)
+                if since is None or key >= since:
+                    rows[key] = row
+            # since 이전까지 받았으면 다음 page는 받지 않는다.
+            if since is not None and keys and min(keys) < since:
+                break
+        return rows
+
+    def intraday(
+        self,
+        codes: Iterable[str],
+        interval: str = "60",
+        include_past: bool = False,
+        since: Optional[str] = None,
+        max_pages: Optional[int] = None,
+    ) -> IndexPanel:
+        """
+        여러 지수의 분봉을 받는다.
+
+        Args:
+            codes (Iterable[str]): 업종 코드
+            interval (str): 분봉 간격(초). 30, 60, 300, 600
+            include_past (bool): 전 영업일 분봉도 받을지 여부
+            since (Optional[str]): 이 시각(YYYYMMDDHHMMSS) 이전 분봉이 나오면 이어서 조회하지 않는다.
+            max_pages (Optional[int]): 지수 하나에 조회할 최대 page 수 (page당 최대 102건)
+
+        Returns:
+            IndexPanel: 시각 축을 맞춘 지수별 분봉. volume은 분봉 체결거래량이다.
+        """
+        self.errors = {}
+        codes = list(dict.fromkeys(codes))
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                code: executor.submit(
+                    self._minute_rows, code, interval, include_past, since, max_pages
+                )
+                for code in codes
+            }
+            for code, future in futures.items():
+                try:
+                    results[code] = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    self.errors[code] = e
+        return _build_panel(results, _MINUTE_FIELDS, _time_index)
@@ -0,0 +1,28 @@
+"""파일 저장 helper"""
+
+import os
+import tempfile
+from typing import Any, BinaryIO, Callable, Union
+
+
+def atomic_write(path: str, content: Union[bytes, Callable[[BinaryIO], Any]]) -> None:
+    """
+    같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 path를 교체한다.
+
+    쓰는 도중에 실패하거나 중단되어도 path에는 이전 내용이나 새 내용만 남는다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        content (Union[bytes, Callable[[BinaryIO], Any]]): 쓸 내용 또는 열린 파일에 쓰는 함수
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if isinstance(content, bytes):
+                f.write(content)
+            else:
+                content(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
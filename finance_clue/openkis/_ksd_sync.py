@@ -0,0 +1,334 @@
+"""예탁원(KSD) 권리 일정 증분 동기화
+
+get_ksd_* 조회는 조회일자 기간(f_dt ~ t_dt)으로 배당, 합병/분할, 액면교체, 감자, 유무상증자,
+주주총회, 상장정보 일정을 반환한다. 매일 넓은 기간을 다시 받지 않도록 일정마다 마지막으로
+동기화한 날짜(high-water mark)를 저장해 두고, 다음 동기화는 그 날짜 조금 앞부터만 받는다.
+
+받을 기간은 chunk_days일 단위로 나눠 동시에 조회하고, 일정마다 key field로 중복을 없앤
+event table에 합친다. 같은 key의 row가 다시 오면 새 row로 바꾼다(지급일 확정 등 정정 반영).
+
+get_ksd_*의 cts(연속조회키) parameter는 KIS 문서상 항상 공백이고 응답 body에도 연속조회키가 없다.
+다음 page는 응답 header의 tr_cont로만 알 수 있으므로 cts는 공백으로 보내고 tr_cont로 연속조회한다.
+"""
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from finance_clue.openkis._io import atomic_write
+from finance_clue.openkis._paging import iter_tr_cont_rows
+
+_DATE_FORMAT = "%Y%m%d"
+_MANIFEST = "manifest.json"
+
+
+@dataclass
+class KsdEndpoint:
+    """
+    get_ksd_* 조회 하나
+
+    Attributes:
+        method (str): client method 이름
+        key (Tuple[str, ...]): 같은 일정인지 판단하는 output field
+        params (Dict[str, str]): f_dt, t_dt, sht_cd 외에 넘길 parameter
+    """
+
+    method: str
+    key: Tuple[str, ...]
+    params: Dict[str, str] = field(default_factory=dict)
+
+
+# 일정 이름 -> 조회
+KSD_EVENTS: Dict[str, KsdEndpoint] = {
+    "dividend": KsdEndpoint(
+        "get_ksd_dividend_info",
+        ("sht_cd", "record_date", "divi_kind", "stk_kind"),
+        {"high_gb": "0", "gb1": "0"},
+    ),
+    "purchase_request": KsdEndpoint(
+        "get_ksd_purchase_request", ("sht_cd", "record_date", "stk_kind")
+    ),
+    "merger_and_split": KsdEndpoint(
+        "get_ksd_merger_and_split", ("sht_cd", "record_date", "opp_cust_cd", "seq")
+    ),
+    "change_par_value": KsdEndpoint(
+        "get_ksd_change_par_value", ("sht_cd", "record_date"), {"market_gb": "0"}
+    ),
+    "decrease_capital": KsdEndpoint(
+        "get_ksd_decrease_capital", ("sht_cd", "record_date", "stk_kind")
+    ),
+    "list_info": KsdEndpoint(
+        "get_ksd_list_info", ("sht_cd", "list_dt", "issue_type", "stk_kind")
+    ),
+    "public_offer_subscription": KsdEndpoint(
+        "get_ksd_public_offer_subscription", ("sht_cd", "record_date", "subscr_dt")
+    ),
+    "forfeited_stock": KsdEndpoint(
+        "get_ksd_forfeited_stock", ("sht_cd", "record_date", "subscr_dt")
+    ),
+    "mandatory_deposit": KsdEndpoint(
+        "get_ksd_mandatory_deposit", ("sht_cd", "depo_date", "depo_reason")
+    ),
+    "right_issue": KsdEndpoint(
+        "get_ksd_right_issue", ("sht_cd", "record_date", "stk_kind"), {"gb1": "2"}
+    ),
+    "bonus_issue": KsdEndpoint(
+        "get_ksd_bonus_issue", ("sht_cd", "record_date", "stk_kind")
+    ),
+    "shareholder_meeting": KsdEndpoint(
+        "get_ksd_shareholder_meeting", ("sht_cd", "gen_meet_dt", "gen_meet_type")
+    ),
+}
+
+
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, _DATE_FORMAT).date()
+
+
+def _format_date(value: date) -> str:
+    return value.strftime(_DATE_FORMAT)
+
+
+def split_date_range(start: str, end: str, days: int) -> List[Tuple[str, str]]:
+    """
+    start부터 end까지(양끝 포함)를 days일 이하의 (시작일, 종료일) 구간으로 나눈다.
+
+    Example:
+        >>> split_date_range("20240101", "20240110", 4)
+        [('20240101', '20240104'), ('20240105', '20240108'), ('20240109', '20240110')]
+    """
+    if days < 1:
+        raise ValueError("days must be positive")
+    first, last = _parse_date(start), _parse_date(end)
+    chunks = []
+    while first <= last:
+        chunk_end = min(first + timedelta(days=days - 1), last)
+        chunks.append((_format_date(first), _format_date(chunk_end)))
+        first = chunk_end + timedelta(days=1)
+    return chunks
+
+
+class KsdEventSync:
+    """
+    예탁원 권리 일정을 증분으로 받아 중복 없는 event table로 저장한다.
+
+    일정마다 high-water mark(마지막으로 동기화한 날짜)를 기록한다. 다음 sync()는
+    high-water mark에서 lookback_days 앞부터 오늘 이후 lookahead_days까지만 받는다.
+    미래 일정은 확정 전에 바뀔 수 있어서, 동기화한 날 이후의 일정은 매번 다시 받는다.
+
+    Args:
+        path (Optional[str]): 저장할 디렉터리. 있으면 열 때 읽고 sync() 뒤에 저장한다.
+        events (Optional[Sequence[str]]): 받을 일정. 기본값은 KSD_EVENTS 전체
+        chunk_days (int): 요청 하나의 조회 기간(일)
+        lookback_days (int): high-water mark 앞으로 다시 받을 기간(일). 늦게 올라온 정정을 반영한다.
+        lookahead_days (int): 오늘 이후로 받을 기간(일)
+        max_workers (int): 동시에 보낼 요청 수
+
+    Attributes:
+        tables (Dict[str, Dict[Tuple[str, ...], Dict[str, Any]]]): 일정별 key -> row
+        high_water_marks (Dict[str, str]): 일정별 마지막으로 동기화한 날짜(YYYYMMDD)
+        errors (Dict[Tuple[str, str, str], Exception]): 실패한 (일정, 시작일, 종료일)
+
+    Example:
+        .. code-block:: python
+
+            ksd = KsdEventSync("ksd")
+            ksd.sync(client, start="20200101")  # 처음 한 번
+            ksd.sync(client)  # 매일
+            ksd.events("dividend", sht_cd="005930")
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        events: Optional[Sequence[str]] = None,
+        chunk_days: int = 31,
+        lookback_days: int = 7,
+        lookahead_days: int = 92,
+        max_workers: int = 8,
+    ):
+        self.path = path
+        self.event_names = list(events or KSD_EVENTS)
+        unknown = set(self.event_names) - set(KSD_EVENTS)
+        if unknown:
+            raise KeyError(f"Unknown KSD events: {sorted(unknown)}")
+        self.chunk_days = chunk_days
+        self.lookback_days = lookback_days
+        self.lookahead_days = lookahead_days
+        self.max_workers = max_workers
+        self.tables: Dict[str, Dict[Tuple[str, ...], Dict[str, Any]]] = {
+            name: {} for name in self.event_names
+        }
+        self.high_water_marks: Dict[str, str] = {}
+        self.errors: Dict[Tuple[str, str, str], Exception] = {}
+        if path is not None and os.path.exists(os.path.join(path, _MANIFEST)):
+            self._load(path)
+
+    def _fetch(
+        self, client: Any, name: str, start: str, end: str
+    ) -> List[Dict[str, Any]]:
+        endpoint = KSD_EVENTS[name]
+        return list(
+            iter_tr_cont_rows(
+                getattr(client, endpoint.method),
+                output_key="output1",
+                params={
+                    "cts": "",
+                    "f_dt": start,
+                    "t_dt": end,
+                    "sht_cd": "",
+                    **endpoint.params,
+                },
+            )
+        )
+
+    def _window(
+        self, name: str, start: Optional[str], end: str
+    ) -> Optional[Tuple[str, str]]:
+        if start is None:
+            mark = self.high_water_marks.get(name)
+            if mark is None:
+                raise ValueError(
+                    f"{name} has never been synced; pass start for the first sync"
+                )
+            start = _format_date(_parse_date(mark) - timedelta(days=self.lookback_days))
+        return (start, end) if start <= end else None
+
+    def sync(
+        self,
+        client: Any,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        today: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        high-water mark 이후의 일정을 받아 event table에 합친다.
+
+        조회에 실패한 구간은 errors에 남고, 그 일정의 high-water mark는 그대로 두어
+        다음 sync()에서 다시 받는다.
+
+        Args:
+            client: sync OpenKisClient
+            start (Optional[str]): 조회 시작일자(YYYYMMDD). 없으면 일정별 high-water mark에서
+                lookback_days 앞. 처음 동기화하는 일정은 반드시 넘긴다.
+            end (Optional[str]): 조회 종료일자(YYYYMMDD). 없으면 today 이후 lookahead_days
+            today (Optional[str]): 기준일자(YYYYMMDD). 없으면 오늘
+
+        Returns:
+            Dict[str, int]: 일정별로 새로 생기거나 바뀐 row 수
+        """
+        self.errors = {}
+        today = today or _format_date(date.today())
+        if end is None:
+            end = _format_date(_parse_date(today) + timedelta(days=self.lookahead_days))
+        windows = {name: self._window(name, start, end) for name in self.event_names}
+
+        futures: Dict[Tuple[str, str, str], Future] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for name, window in windows.items():
+                if window is None:
+                    continue
+                for chunk_start, chunk_end in split_date_range(
+                    *window, self.chunk_days
+                ):
+                    futures[(name, chunk_start, chunk_end)] = executor.submit(
+                        self._fetch, client, name, chunk_start, chunk_end
+                    )
+
+            changed = {name: 0 for name in self.event_names}
+            failed = set()
+            for (name, chunk_start, chunk_end), future in futures.items():
+                try:
+                    rows = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    self.errors[(name, chunk_start, chunk_end)] = e
+                    failed.add(name)
+                    continue
+                changed[name] += self._merge(name, rows)
+
+        # 동기화한 날 이후의 일정은 아직 바뀔 수 있으므로 high-water mark는 today를 넘지 않는다.
+        mark = min(end, today)
+        for name, window in windows.items():
+            if window is None or name in failed:
+                continue
+            self.high_water_marks[name] = max(
+                mark, self.high_water_marks.get(name, mark)
+            )
+        if self.path is not None:
+            self.save()
+        return changed
+
+    def _merge(self, name: str, rows: Iterable[Dict[str, Any]]) -> int:
+        table = self.tables[name]
+        key_fields = KSD_EVENTS[name].key
+        changed = 0
+        for row in rows:
+            row = {k: v for k, v in row.items() if k != "rt_cd"}
+            key = tuple(row.get(k) or "" for k in key_fields)
+            if table.get(key) != row:
+                table[key] = row
+                changed += 1
+        return changed
+
+    def events(
+        self,
+        name: str,
+        sht_cd: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        event table의 row를 key 순서로 반환한다.
+
+        Args:
+            name (str): 일정 이름 (예: "dividend")
+            sht_cd (Optional[str]): 종목코드. 없으면 전 종목
+            start (Optional[str]): key의 첫 날짜 field가 start 이상인 row만
+            end (Optional[str]): key의 첫 날짜 field가 end 이하인 row만
+        """
+        date_index = 1  # key는 (sht_cd, 기준 날짜, ...) 순서다.
+        rows = []
+        for key in sorted(self.tables[name]):
+            if sht_cd is not None and key[0] != sht_cd:
+                continue
+            if start is not None and key[date_index] < start:
+                continue
+            if end is not None and key[date_index] > end:
+                continue
+            rows.append(self.tables[name][key])
+        return rows
+
+    def save(self) -> None:
+        """event table과 high-water mark를 path에 저장한다. path가 없으면 ValueError를 던진다."""
+        path = self.path
+        if path is None:
+            raise ValueError("KsdEventSync has no path to save to")
+        os.makedirs(path, exist_ok=True)
+        for name, table in self.tables.items():
+            rows = [table[key] for key in sorted(table)]
+            atomic_write(os.path.join(path, f"{name}.json"), json.dumps(rows).encode())
+        atomic_write(
+            os.path.join(path, _MANIFEST),
+            json.dumps({"high_water_marks": self.high_water_marks}).encode(),
+        )
+
+    def _load(self, path: str) -> None:
+        with open(os.path.join(path, _MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.high_water_marks = {
+            name: mark
+            for name, mark in manifest["high_water_marks"].items()
+            if name in self.tables
+        }
+        for name in self.event_names:
+            file = os.path.join(path, f"{name}.json")
+            if os.path.exists(file):
+                with open(file, "r", encoding="utf-8") as f:
+                    self._merge(name, json.load(f))
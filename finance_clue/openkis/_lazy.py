@@ -0,0 +1,42 @@
+"""operation group module lazy loading
+
+생성된 operation 코드는 2만 줄이 넘어서 import할 때 compile과 메모리 비용이 크다.
+tools/split_kis_operations.py가 operation을 group별 module로 나누고,
+GenOpenKisClientOperationsMixin에는 처음 접근할 때 group module을 import하는 descriptor만 남긴다.
+"""
+
+import importlib
+from typing import Any, Optional
+
+
+class LazyOperation:
+    """
+    처음 접근할 때 group module에서 operation을 불러와 class attribute를 교체하는 descriptor
+
+    Args:
+        module (str): operation이 정의된 module 이름 (절대 경로)
+        group (str): module 안의 operation group class 이름
+    """
+
+    def __init__(self, module: str, group: str):
+        self.module = module
+        self.group = group
+        self.name = ""
+        self.owner: Optional[type] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.owner = owner
+
+    def load(self) -> Any:
+        group = getattr(importlib.import_module(self.module), self.group)
+        func = group.__dict__[self.name]
+        # 다음부터는 descriptor를 거치지 않도록 operation을 정의한 class의 attribute를 교체한다.
+        setattr(self.owner, self.name, func)
+        return func
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        func = self.load()
+        if instance is None:
+            return func
+        return func.__get__(instance, owner)
@@ -0,0 +1,222 @@
+"""국내주식 당일 분봉 backfill
+
+get_domestic_stock_time_minute_price는 fid_input_hour1 이전 1분봉을 한 번에 최대 30건만 반환한다.
+장 시작(09:00)부터 장 마감(15:30)까지 채우려면 시간을 거슬러 올라가며 여러 번 호출해야 해서,
+종목별로 반복 호출하고 겹치는 분봉을 제거한 뒤 종목별 OHLCV 배열로 만든다.
+
+numpy가 설치되어 있어야 한다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+from finance_clue.openkis._decode import OPERATION_SCHEMAS
+from finance_clue.openkis._decode import decode_rows
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SESSION_START = "090000"
+SESSION_END = "153000"
+
+# 분봉 row 순서: 영업일자, 시가, 고가, 저가, 종가, 체결거래량
+_BAR_FIELDS = (
+    "stck_bsop_date",
+    "stck_oprc",
+    "stck_hgpr",
+    "stck_lwpr",
+    "stck_prpr",
+    "cntg_vol",
+)
+_BAR_SCHEMA = OPERATION_SCHEMAS["get_domestic_stock_time_minute_price"]["output2"]
+
+
+@dataclass
+class MinuteBars:
+    """
+    종목 하나의 1분봉 OHLCV 배열 (시간 오름차순)
+
+    Attributes:
+        symbol (str): 종목코드
+        date (str): 영업일자(YYYYMMDD)
+        time (np.ndarray): 체결시간(HHMMSS), int32
+        open (np.ndarray): 시가, int64
+        high (np.ndarray): 고가, int64
+        low (np.ndarray): 저가, int64
+        close (np.ndarray): 종가, int64
+        volume (np.ndarray): 체결거래량, int64
+    """
+
+    symbol: str
+    date: str
+    time: "np.ndarray"
+    open: "np.ndarray"
+    high: "np.ndarray"
+    low: "np.ndarray"
+    close: "np.ndarray"
+    volume: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+def _previous_minute(hhmmss: str) -> str:
+    t = datetime.strptime(hhmmss, "%H%M%S") - timedelta(minutes=1)
+    return t.strftime("%H%M%S")
+
+
+def _to_minute_bars(symbol: str, bars: Dict[str, List[str]]) -> MinuteBars:
+    hours = sorted(bars)
+    columns = decode_rows(
+        [{"stck_cntg_hour": h, **dict(zip(_BAR_FIELDS, bars[h]))} for h in hours],
+        _BAR_SCHEMA,
+    )
+    return MinuteBars(
+        symbol=symbol,
+        date=bars[hours[-1]][0] if hours else "",
+        time=columns["stck_cntg_hour"],
+        open=columns["stck_oprc"],
+        high=columns["stck_hgpr"],
+        low=columns["stck_lwpr"],
+        close=columns["stck_prpr"],
+        volume=columns["cntg_vol"],
+    )
+
+
+class MinuteBarBackfill:
+    """
+    여러 종목의 당일 1분봉을 장 시작부터 채우는 backfill engine
+
+    종목별로 session_end부터 30분씩 거슬러 올라가며 조회하고, 여러 종목은 thread pool에서 동시에 조회한다.
+    호출 속도는 client의 rate limit policy가 맞춘다.
+
+    Args:
+        client: OpenKisClient
+        session_start (str): 채울 첫 분봉 시간(HHMMSS)
+        session_end (str): 채울 마지막 분봉 시간(HHMMSS)
+        max_workers (int): 동시에 조회할 종목 수
+        checkpoint_path (Optional[str]): 진행 상황을 저장할 json 파일.
+            지정하면 중단된 backfill을 이어서 실행하고, 이미 끝난 종목은 다시 조회하지 않는다.
+            checkpoint에는 session_date를 함께 저장하고, 다른 날짜의 checkpoint는 버린다.
+        session_date (Optional[str]): 채울 영업일자(YYYYMMDD). API는 당일 분봉만 반환하므로 기본값은 오늘
+
+    Example:
+        .. code-block:: python
+
+            backfill = MinuteBarBackfill(client, checkpoint_path="minute.json")
+            bars = backfill.run(["005930", "000660"])
+            bars["005930"].close
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        session_start: str = SESSION_START,
+        session_end: str = SESSION_END,
+        max_workers: int = 8,
+        checkpoint_path: Optional[str] = None,
+        session_date: Optional[str] = None,
+    ):
+        self.client = client
+        self.session_start = session_start
+        self.session_end = session_end
+        self.max_workers = max_workers
+        self.checkpoint_path = checkpoint_path
+        self.session_date = session_date or datetime.now().strftime("%Y%m%d")
+        self.errors: Dict[str, Exception] = {}
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = self._load_checkpoint()
+
+    def _load_checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        # 다른 영업일의 checkpoint로 이어서 채우면 그날의 분봉이 남으므로 버린다.
+        if checkpoint.get("date") != self.session_date:
+            return {}
+        return checkpoint.get("symbols", {})
+
+    def save_checkpoint(self) -> None:
+        if self.checkpoint_path is None:
+            return
+        with self._lock:
+            tmp_path = f"{self.checkpoint_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"date": self.session_date, "symbols": self._state}, f)
+            os.replace(tmp_path, self.checkpoint_path)
+
+    def _fetch_page(self, symbol: str, hour: str) -> List[Dict[str, str]]:
+        resp = self.client.get_domestic_stock_time_minute_price(
+            fid_input_iscd=symbol, fid_input_hour1=hour
+        )
+        return (resp or {}).get("output2") or []
+
+    def fetch_symbol(self, symbol: str) -> MinuteBars:
+        """종목 하나의 분봉을 장 시작까지 채운다."""
+        with self._lock:
+            state = self._state.setdefault(
+                symbol, {"next_hour": self.session_end, "bars": {}}
+            )
+        bars: Dict[str, List[str]] = state["bars"]
+
+        while state["next_hour"] is not None:
+            hour = state["next_hour"]
+            rows = [
+                row
+                for row in self._fetch_page(symbol, hour)
+                if self.session_start <= row.get("stck_cntg_hour", "") <= hour
+            ]
+            earliest = min((row["stck_cntg_hour"] for row in rows), default=None)
+            # 다른 thread가 checkpoint를 저장하는 중에 state를 바꾸지 않도록 lock 안에서 갱신한다.
+            with self._lock:
+                for row in rows:
+                    bars[row["stck_cntg_hour"]] = [row.get(k, "") for k in _BAR_FIELDS]
+                # 더 이전 분봉이 없거나 장 시작까지 채웠으면 끝
+                if earliest is None or earliest <= self.session_start:
+                    state["next_hour"] = None
+                else:
+                    state["next_hour"] = _previous_minute(earliest)
+
+        return _to_minute_bars(symbol, bars)
+
+    def _fetch_or_record_error(self, symbol: str) -> Optional[MinuteBars]:
+        try:
+            return self.fetch_symbol(symbol)
+        except Exception as e:  # pylint: disable=broad-except
+            self.errors[symbol] = e
+            return None
+        finally:
+            self.save_checkpoint()
+
+    def run(
+        self,
+        symbols: Iterable[str],
+        on_complete: Optional[Callable[[MinuteBars], None]] = None,
+    ) -> Dict[str, MinuteBars]:
+        """
+        여러 종목의 분봉을 동시에 채운다.
+
+        조회에 실패한 종목은 결과에서 빠지고 errors에 예외가 남는다.
+        checkpoint_path를 지정했다면 다시 run()을 호출해서 실패한 종목만 이어서 조회할 수 있다.
+        """
+        self.errors = {}
+        results: Dict[str, MinuteBars] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            symbols = list(dict.fromkeys(symbols))
+            for symbol, bars in zip(
+                symbols, executor.map(self._fetch_or_record_error, symbols)
+            ):
+                if bars is None:
+                    continue
+                results[symbol] = bars
+                if on_complete is not None:
+                    on_complete(bars)
+        return results
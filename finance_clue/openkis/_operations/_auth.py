@@ -0,0 +1,652 @@
+# pylint: disable=too-many-lines,too-many-statements
+# coding=utf-8
+# --------------------------------------------------------------------------
+# Code generated by Microsoft (R) AutoRest Code Generator (autorest: 3.10.2, generator: @autorest/python@6.13.15)
+# Changes may cause incorrect behavior and will be lost if the code is regenerated.
+# --------------------------------------------------------------------------
+from io import IOBase
+import sys
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from azure.core.exceptions import ClientAuthenticationError
+from azure.core.exceptions import HttpResponseError
+from azure.core.exceptions import ResourceExistsError
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.exceptions import ResourceNotModifiedError
+from azure.core.exceptions import map_error
+from azure.core.pipeline import PipelineResponse
+from azure.core.rest import HttpRequest
+from azure.core.rest import HttpResponse
+from azure.core.tracing.decorator import distributed_trace
+from azure.core.utils import case_insensitive_dict
+
+from .._serialization import Serializer
+from .._vendor import GenOpenKisClientMixinABC
+
+if sys.version_info >= (3, 9):
+    from collections.abc import MutableMapping
+else:
+    from typing import (
+        MutableMapping,  # type: ignore  # pylint: disable=ungrouped-imports
+    )
+JSON = MutableMapping[str, Any]  # pylint: disable=unsubscriptable-object
+T = TypeVar("T")
+ClsType = Optional[
+    Callable[[PipelineResponse[HttpRequest, HttpResponse], T, Dict[str, Any]], Any]
+]
+
+_SERIALIZER = Serializer()
+_SERIALIZER.client_side_validation = False
+
+
+def build_gen_open_kis_get_access_token_request(
+    **kwargs: Any,
+) -> HttpRequest:  # pylint: disable=name-too-long
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+
+    content_type: Optional[str] = kwargs.pop(
+        "content_type", _headers.pop("Content-Type", None)
+    )
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/oauth2/tokenP"
+
+    # Construct headers
+    if content_type is not None:
+        _headers["Content-Type"] = _SERIALIZER.header(
+            "content_type", content_type, "str"
+        )
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(method="POST", url=_url, headers=_headers, **kwargs)
+
+
+def build_gen_open_kis_revoke_access_token_request(
+    **kwargs: Any,
+) -> HttpRequest:  # pylint: disable=name-too-long
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+
+    content_type: Optional[str] = kwargs.pop(
+        "content_type", _headers.pop("Content-Type", None)
+    )
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/oauth2/revokeP"
+
+    # Construct headers
+    if content_type is not None:
+        _headers["Content-Type"] = _SERIALIZER.header(
+            "content_type", content_type, "str"
+        )
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(method="POST", url=_url, headers=_headers, **kwargs)
+
+
+def build_gen_open_kis_get_hash_key_request(
+    *,
+    appkey: Optional[str] = None,
+    appsecret: Optional[str] = None,
+    json: Optional[JSON] = None,
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+
+    content_type: Optional[str] = kwargs.pop(
+        "content_type", _headers.pop("content-type", None)
+    )
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/hashkey"
+
+    # Construct headers
+    if content_type is not None:
+        _headers["content-type"] = _SERIALIZER.header(
+            "content_type", content_type, "str"
+        )
+    if appkey is not None:
+        _headers["appkey"] = _SERIALIZER.header("appkey", appkey, "str")
+    if appsecret is not None:
+        _headers["appsecret"] = _SERIALIZER.header("appsecret", appsecret, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(method="POST", url=_url, headers=_headers, json=json, **kwargs)
+
+
+class GenOpenKisClientAuthOperationsMixin(GenOpenKisClientMixinABC):
+    @overload
+    def get_access_token(
+        self,
+        body: Optional[JSON] = None,
+        *,
+        content_type: str = "application/json",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """접근 토큰 발급.
+
+        본인 계좌에 필요한 인증 절차로, 인증을 통해 접근 토큰을 부여받아 오픈API 활용이 가능합니다.
+
+        [참고]
+        '23.4.28 이후 지나치게 잦은 토큰 발급 요청건을 제어 하기 위해 신규 접근토큰발급 이후 일정시간 이내에 재호출 시에는 직전 토큰값을 리턴하게 되었습니다. 일정시간
+        이후 접근토큰발급 API 호출 시에는 신규 토큰값을 리턴합니다.
+        접근토큰발급 API 호출 및 코드 작성하실 때 해당 사항을 참고하시길 바랍니다.
+
+        :param body: Default value is None.
+        :type body: JSON
+        :keyword content_type: Body Parameter content-type. Content type parameter for JSON body.
+         Default value is "application/json".
+        :paramtype content_type: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # JSON input template you can fill out and use as your body input.
+                body = {
+                    "appkey": "str",  # "ud55c"uad6d"ud22c"uc790"uc99d"uad8c
+                      "ud648"ud398"uc774"uc9c0"uc5d0"uc11c "ubc1c"uae09"ubc1b"uc740 appkey
+                      ("uc808"ub300 "ub178"ucd9c"ub418"uc9c0 "uc54a"ub3c4"ub85d
+                      "uc8fc"uc758"ud574"uc8fc"uc138"uc694.). Required.
+                    "appsecret": "str",  # "ud55c"uad6d"ud22c"uc790"uc99d"uad8c
+                      "ud648"ud398"uc774"uc9c0"uc5d0"uc11c "ubc1c"uae09"ubc1b"uc740 appsecret
+                      ("uc808"ub300 "ub178"ucd9c"ub418"uc9c0 "uc54a"ub3c4"ub85d
+                      "uc8fc"uc758"ud574"uc8fc"uc138"uc694.). Required.
+                    "grant_type": "str"  # "uc778"uc99d"ubc29"uc2dd (client_credentials
+                      "uace0"uc815). Required.
+                }
+
+                # response body for status code(s): 200
+                response == {
+                    "access_token": "str",  # Optional. OAuth "ud1a0"ud070"uc774
+                      "ud544"uc694"ud55c API "uacbd"uc6b0 "ubc1c"uae09"ud55c Access token:code:`<br/>`
+                      ex) "eyJ0eXUxMiJ9.eyJz"u2026..................................."   *
+                      "uc77c"ubc18"uac1c"uc778"uace0"uac1d/"uc77c"ubc18"ubc95"uc778"uace0"uac1d:code:`<br/>`
+                      . Access token "uc720"ud6a8"uae30"uac04 1"uc77c:code:`<br/>`   ..
+                      "uc77c"uc815"uc2dc"uac04(6"uc2dc"uac04) "uc774"ub0b4"uc5d0 "uc7ac"ud638"ucd9c
+                      "uc2dc"uc5d0"ub294 "uc9c1"uc804 "ud1a0"ud070"uac12"uc744
+                      "ub9ac"ud134:code:`<br/>`   . OAuth 2.0"uc758 Client Credentials Grant
+                      "uc808"ucc28"ub97c "uc900"uc6a9  *    "uc81c"ud734"ubc95"uc778:code:`<br/>`   .
+                      Access token "uc720"ud6a8"uae30"uac04 3"uac1c"uc6d4:code:`<br/>`   . Refresh
+                      token "uc720"ud6a8"uae30"uac04 1"ub144:code:`<br/>`   . OAuth 2.0"uc758
+                      Authorization Code Grant "uc808"ucc28"ub97c "uc900"uc6a9.
+                    "access_token_token_expire": "2020-02-20 00:00:00",  # Optional. Access token
+                      "ub9cc"ub8cc"uc2dc"uac04 ("ub144:"uc6d4:"uc77c "uc2dc:"ubd84:"ucd08).
+                    "expires_in": 0,  # Optional. Access token "ub9cc"ub8cc"uc2dc"uac04 ("ucd08).
+                    "token_type": "str"  # Optional. "uc811"uadfc"ud1a0"ud070"uc720"ud615 (Bearer
+                      "uace0"uc815).
+                }
+        """
+
+    @overload
+    def get_access_token(
+        self,
+        body: Optional[IO[bytes]] = None,
+        *,
+        content_type: str = "application/json",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """접근 토큰 발급.
+
+        본인 계좌에 필요한 인증 절차로, 인증을 통해 접근 토큰을 부여받아 오픈API 활용이 가능합니다.
+
+        [참고]
+        '23.4.28 이후 지나치게 잦은 토큰 발급 요청건을 제어 하기 위해 신규 접근토큰발급 이후 일정시간 이내에 재호출 시에는 직전 토큰값을 리턴하게 되었습니다. 일정시간
+        이후 접근토큰발급 API 호출 시에는 신규 토큰값을 리턴합니다.
+        접근토큰발급 API 호출 및 코드 작성하실 때 해당 사항을 참고하시길 바랍니다.
+
+        :param body: Default value is None.
+        :type body: IO[bytes]
+        :keyword content_type: Body Parameter content-type. Content type parameter for binary body.
+         Default value is "application/json".
+        :paramtype content_type: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "access_token": "str",  # Optional. OAuth "ud1a0"ud070"uc774
+                      "ud544"uc694"ud55c API "uacbd"uc6b0 "ubc1c"uae09"ud55c Access token:code:`<br/>`
+                      ex) "eyJ0eXUxMiJ9.eyJz"u2026..................................."   *
+                      "uc77c"ubc18"uac1c"uc778"uace0"uac1d/"uc77c"ubc18"ubc95"uc778"uace0"uac1d:code:`<br/>`
+                      . Access token "uc720"ud6a8"uae30"uac04 1"uc77c:code:`<br/>`   ..
+                      "uc77c"uc815"uc2dc"uac04(6"uc2dc"uac04) "uc774"ub0b4"uc5d0 "uc7ac"ud638"ucd9c
+                      "uc2dc"uc5d0"ub294 "uc9c1"uc804 "ud1a0"ud070"uac12"uc744
+                      "ub9ac"ud134:code:`<br/>`   . OAuth 2.0"uc758 Client Credentials Grant
+                      "uc808"ucc28"ub97c "uc900"uc6a9  *    "uc81c"ud734"ubc95"uc778:code:`<br/>`   .
+                      Access token "uc720"ud6a8"uae30"uac04 3"uac1c"uc6d4:code:`<br/>`   . Refresh
+                      token "uc720"ud6a8"uae30"uac04 1"ub144:code:`<br/>`   . OAuth 2.0"uc758
+                      Authorization Code Grant "uc808"ucc28"ub97c "uc900"uc6a9.
+                    "access_token_token_expire": "2020-02-20 00:00:00",  # Optional. Access token
+                      "ub9cc"ub8cc"uc2dc"uac04 ("ub144:"uc6d4:"uc77c "uc2dc:"ubd84:"ucd08).
+                    "expires_in": 0,  # Optional. Access token "ub9cc"ub8cc"uc2dc"uac04 ("ucd08).
+                    "token_type": "str"  # Optional. "uc811"uadfc"ud1a0"ud070"uc720"ud615 (Bearer
+                      "uace0"uc815).
+                }
+        """
+
+    @distributed_trace
+    def get_access_token(
+        self, body: Optional[Union[JSON, IO[bytes]]] = None, **kwargs: Any
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """접근 토큰 발급.
+
+        본인 계좌에 필요한 인증 절차로, 인증을 통해 접근 토큰을 부여받아 오픈API 활용이 가능합니다.
+
+        [참고]
+        '23.4.28 이후 지나치게 잦은 토큰 발급 요청건을 제어 하기 위해 신규 접근토큰발급 이후 일정시간 이내에 재호출 시에는 직전 토큰값을 리턴하게 되었습니다. 일정시간
+        이후 접근토큰발급 API 호출 시에는 신규 토큰값을 리턴합니다.
+        접근토큰발급 API 호출 및 코드 작성하실 때 해당 사항을 참고하시길 바랍니다.
+
+        :param body: Is either a JSON type or a IO[bytes] type. Default value is None.
+        :type body: JSON or IO[bytes]
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # JSON input template you can fill out and use as your body input.
+                body = {
+                    "appkey": "str",  # "ud55c"uad6d"ud22c"uc790"uc99d"uad8c
+                      "ud648"ud398"uc774"uc9c0"uc5d0"uc11c "ubc1c"uae09"ubc1b"uc740 appkey
+                      ("uc808"ub300 "ub178"ucd9c"ub418"uc9c0 "uc54a"ub3c4"ub85d
+                      "uc8fc"uc758"ud574"uc8fc"uc138"uc694.). Required.
+                    "appsecret": "str",  # "ud55c"uad6d"ud22c"uc790"uc99d"uad8c
+                      "ud648"ud398"uc774"uc9c0"uc5d0"uc11c "ubc1c"uae09"ubc1b"uc740 appsecret
+                      ("uc808"ub300 "ub178"ucd9c"ub418"uc9c0 "uc54a"ub3c4"ub85d
+                      "uc8fc"uc758"ud574"uc8fc"uc138"uc694.). Required.
+                    "grant_type": "str"  # "uc778"uc99d"ubc29"uc2dd (client_credentials
+                      "uace0"uc815). Required.
+                }
+
+                # response body for status code(s): 200
+                response == {
+                    "access_token": "str",  # Optional. OAuth "ud1a0"ud070"uc774
+                      "ud544"uc694"ud55c API "uacbd"uc6b0 "ubc1c"uae09"ud55c Access token:code:`<br/>`
+                      ex) "eyJ0eXUxMiJ9.eyJz"u2026..................................."   *
+                      "uc77c"ubc18"uac1c"uc778"uace0"uac1d/"uc77c"ubc18"ubc95"uc778"uace0"uac1d:code:`<br/>`
+                      . Access token "uc720"ud6a8"uae30"uac04 1"uc77c:code:`<br/>`   ..
+                      "uc77c"uc815"uc2dc"uac04(6"uc2dc"uac04) "uc774"ub0b4"uc5d0 "uc7ac"ud638"ucd9c
+                      "uc2dc"uc5d0"ub294 "uc9c1"uc804 "ud1a0"ud070"uac12"uc744
+                      "ub9ac"ud134:code:`<br/>`   . OAuth 2.0"uc758 Client Credentials Grant
+                      "uc808"ucc28"ub97c "uc900"uc6a9  *    "uc81c"ud734"ubc95"uc778:code:`<br/>`   .
+                      Access token "uc720"ud6a8"uae30"uac04 3"uac1c"uc6d4:code:`<br/>`   . Refresh
+                      token "uc720"ud6a8"uae30"uac04 1"ub144:code:`<br/>`   . OAuth 2.0"uc758
+                      Authorization Code Grant "uc808"ucc28"ub97c "uc900"uc6a9.
+                    "access_token_token_expire": "2020-02-20 00:00:00",  # Optional. Access token
+                      "ub9cc"ub8cc"uc2dc"uac04 ("ub144:"uc6d4:"uc77c "uc2dc:"ubd84:"ucd08).
+                    "expires_in": 0,  # Optional. Access token "ub9cc"ub8cc"uc2dc"uac04 ("ucd08).
+                    "token_type": "str"  # Optional. "uc811"uadfc"ud1a0"ud070"uc720"ud615 (Bearer
+                      "uace0"uc815).
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+        _params = kwargs.pop("params", {}) or {}
+
+        content_type: Optional[str] = kwargs.pop(
+            "content_type", _headers.pop("Content-Type", None)
+        )
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        content_type = content_type or "application/json"
+        _json = None
+        _content = None
+        if isinstance(body, (IOBase, bytes)):
+            _content = body
+        else:
+            if body is not None:
+                _json = body
+            else:
+                _json = None
+
+        _request = build_gen_open_kis_get_access_token_request(
+            content_type=content_type,
+            json=_json,
+            content=_content,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), {})  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @overload
+    def revoke_access_token(
+        self,
+        body: Optional[JSON] = None,
+        *,
+        content_type: str = "application/json",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """접근 토큰 폐기.
+
+        부여받은 접큰토큰을 더 이상 활용하지 않을 때 사용합니다.
+
+        :param body: Default value is None.
+        :type body: JSON
+        :keyword content_type: Body Parameter content-type. Content type parameter for JSON body.
+         Default value is "application/json".
+        :paramtype content_type: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # JSON input template you can fill out and use as your body input.
+                body = {
+                    "appkey": "str",  # "ud55c"uad6d"ud22c"uc790"uc99d"uad8c
+                      "ud648"ud398"uc774"uc9c0"uc5d0"uc11c "ubc1c"uae09"ubc1b"uc740 appkey
+                      ("uc808"ub300 "ub178"ucd9c"ub418"uc9c0 "uc54a"ub3c4"ub85d
+                      "uc8fc"uc758"ud574"uc8fc"uc138"uc694.). Required.
+                    "appsecret": "str",  # "ud55c"uad6d"ud22c"uc790"uc99d"uad8c
+                      "ud648"ud398"uc774"uc9c0"uc5d0"uc11c "ubc1c"uae09"ubc1b"uc740 appsecret
+                      ("uc808"ub300 "ub178"ucd9c"ub418"uc9c0 "uc54a"ub3c4"ub85d
+                      "uc8fc"uc758"ud574"uc8fc"uc138"uc694.). Required.
+                    "token": "str"  # "uc811"uadfc"ud1a0"ud070  OAuth "ud1a0"ud070"uc774
+                      "ud544"uc694"ud55c API "uacbd"uc6b0 "ubc1c"uae09"ud55c Access token:code:`<br/>`
+                      "uc77c"ubc18"uace0"uac1d(Access token "uc720"ud6a8"uae30"uac04 1"uc77c, OAuth
+                      2.0"uc758 Client Credentials Grant "uc808"ucc28"ub97c "uc900"uc6a9):code:`<br/>`
+                      "ubc95"uc778(Access token "uc720"ud6a8"uae30"uac04 3"uac1c"uc6d4, Refresh token
+                      "uc720"ud6a8"uae30"uac04 1"ub144, OAuth 2.0"uc758 Authorization Code Grant
+                      "uc808"ucc28"ub97c "uc900"uc6a9). Required.
+                }
+
+                # response body for status code(s): 200
+                response == {
+                    "code": "str",  # Optional. HTTP "uc751"ub2f5"ucf54"ub4dc.
+                    "message": "str"  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                }
+        """
+
+    @overload
+    def revoke_access_token(
+        self,
+        body: Optional[IO[bytes]] = None,
+        *,
+        content_type: str = "application/json",
+        **kwargs: Any,
+    ) -> JSON:
+        """접근 토큰 폐기.
+
+        부여받은 접큰토큰을 더 이상 활용하지 않을 때 사용합니다.
+
+        :param body: Default value is None.
+        :type body: IO[bytes]
+        :keyword content_type: Body Parameter content-type. Content type parameter for binary body.
+         Default value is "application/json".
+        :paramtype content_type: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "code": "str",  # Optional. HTTP "uc751"ub2f5"ucf54"ub4dc.
+                    "message": "str"  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                }
+        """
+
+    @distributed_trace
+    def revoke_access_token(
+        self, body: Optional[Union[JSON, IO[bytes]]] = None, **kwargs: Any
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """접근 토큰 폐기.
+
+        부여받은 접큰토큰을 더 이상 활용하지 않을 때 사용합니다.
+
+        :param body: Is either a JSON type or a IO[bytes] type. Default value is None.
+        :type body: JSON or IO[bytes]
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # JSON input template you can fill out and use as your body input.
+                body = {
+                    "appkey": "str",  # "ud55c"uad6d"ud22c"uc790"uc99d"uad8c
+                      "ud648"ud398"uc774"uc9c0"uc5d0"uc11c "ubc1c"uae09"ubc1b"uc740 appkey
+                      ("uc808"ub300 "ub178"ucd9c"ub418"uc9c0 "uc54a"ub3c4"ub85d
+                      "uc8fc"uc758"ud574"uc8fc"uc138"uc694.). Required.
+                    "appsecret": "str",  # "ud55c"uad6d"ud22c"uc790"uc99d"uad8c
+                      "ud648"ud398"uc774"uc9c0"uc5d0"uc11c "ubc1c"uae09"ubc1b"uc740 appsecret
+                      ("uc808"ub300 "ub178"ucd9c"ub418"uc9c0 "uc54a"ub3c4"ub85d
+                      "uc8fc"uc758"ud574"uc8fc"uc138"uc694.). Required.
+                    "token": "str"  # "uc811"uadfc"ud1a0"ud070  OAuth "ud1a0"ud070"uc774
+                      "ud544"uc694"ud55c API "uacbd"uc6b0 "ubc1c"uae09"ud55c Access token:code:`<br/>`
+                      "uc77c"ubc18"uace0"uac1d(Access token "uc720"ud6a8"uae30"uac04 1"uc77c, OAuth
+                      2.0"uc758 Client Credentials Grant "uc808"ucc28"ub97c "uc900"uc6a9):code:`<br/>`
+                      "ubc95"uc778(Access token "uc720"ud6a8"uae30"uac04 3"uac1c"uc6d4, Refresh token
+                      "uc720"ud6a8"uae30"uac04 1"ub144, OAuth 2.0"uc758 Authorization Code Grant
+                      "uc808"ucc28"ub97c "uc900"uc6a9). Required.
+                }
+
+                # response body for status code(s): 200
+                response == {
+                    "code": "str",  # Optional. HTTP "uc751"ub2f5"ucf54"ub4dc.
+                    "message": "str"  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+        _params = kwargs.pop("params", {}) or {}
+
+        content_type: Optional[str] = kwargs.pop(
+            "content_type", _headers.pop("Content-Type", None)
+        )
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        content_type = content_type or "application/json"
+        _json = None
+        _content = None
+        if isinstance(body, (IOBase, bytes)):
+            _content = body
+        else:
+            if body is not None:
+                _json = body
+            else:
+                _json = None
+
+        _request = build_gen_open_kis_revoke_access_token_request(
+            content_type=content_type,
+            json=_json,
+            content=_content,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), {})  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_hash_key(
+        self,
+        body: Optional[JSON] = None,
+        *,
+        appkey: Optional[str] = None,
+        appsecret: Optional[str] = None,
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """Hashkey 생성.
+
+        해쉬키(Hashkey)는 보안을 위한 요소로 사용자가 보낸 요청 값을 중간에 탈취하여 변조하지 못하도록 하는데 사용됩니다.:code:`<br/>`
+        해쉬키를 사용하면 POST로 보내는 요청(주로 주문/정정/취소 API 해당)의 body 값을 사전에 암호화시킬 수 있습니다.:code:`<br/>`
+        해쉬키는 비필수값으로 사용하지 않아도 POST API 호출은 가능합니다.
+
+        :param body: Default value is None.
+        :type body: JSON
+        :keyword appkey: Default value is None.
+        :paramtype appkey: str
+        :keyword appsecret: Default value is None.
+        :paramtype appsecret: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "BODY": {},  # Optional. "ud574"uc26c"ud0a4 "uc0dd"uc131 "uc694"uccad Body
+                      "ub370"uc774"ud130.
+                    "HASH": "str"  # Optional. [POST API "ub300"uc0c1] Client"uac00
+                      "uc694"uccad"ud558"ub294 Request Body"ub97c hashkey api"ub85c "uc0dd"uc131"ud55c
+                      Hash"uac12   * API"ubb38"uc11c > hashkey "ucc38"uc870.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+        _params = kwargs.pop("params", {}) or {}
+
+        content_type: str = kwargs.pop(
+            "content_type", _headers.pop("content-type", "application/json")
+        )
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        if body is not None:
+            _json = body
+        else:
+            _json = None
+
+        _request = build_gen_open_kis_get_hash_key_request(
+            appkey=appkey,
+            appsecret=appsecret,
+            content_type=content_type,
+            json=_json,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), {})  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
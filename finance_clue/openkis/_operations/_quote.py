@@ -0,0 +1,6356 @@
+# pylint: disable=too-many-lines,too-many-statements
+# coding=utf-8
+# --------------------------------------------------------------------------
+# Code generated by Microsoft (R) AutoRest Code Generator (autorest: 3.10.2, generator: @autorest/python@6.13.15)
+# Changes may cause incorrect behavior and will be lost if the code is regenerated.
+# --------------------------------------------------------------------------
+from io import IOBase
+import sys
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from azure.core.exceptions import ClientAuthenticationError
+from azure.core.exceptions import HttpResponseError
+from azure.core.exceptions import ResourceExistsError
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.exceptions import ResourceNotModifiedError
+from azure.core.exceptions import map_error
+from azure.core.pipeline import PipelineResponse
+from azure.core.rest import HttpRequest
+from azure.core.rest import HttpResponse
+from azure.core.tracing.decorator import distributed_trace
+from azure.core.utils import case_insensitive_dict
+
+from .._serialization import Serializer
+from .._vendor import GenOpenKisClientMixinABC
+
+if sys.version_info >= (3, 9):
+    from collections.abc import MutableMapping
+else:
+    from typing import (
+        MutableMapping,  # type: ignore  # pylint: disable=ungrouped-imports
+    )
+JSON = MutableMapping[str, Any]  # pylint: disable=unsubscriptable-object
+T = TypeVar("T")
+ClsType = Optional[
+    Callable[[PipelineResponse[HttpRequest, HttpResponse], T, Dict[str, Any]], Any]
+]
+
+_SERIALIZER = Serializer()
+_SERIALIZER.client_side_validation = False
+
+
+def build_gen_open_kis_get_domestic_stock_price_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST01010100",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-price"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_conclusion_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST01010300",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-ccnl"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_daily_price_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    fid_org_adj_prc: str,
+    fid_period_div_code: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST01010400",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-daily-price"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_org_adj_prc"] = _SERIALIZER.query(
+        "fid_org_adj_prc", fid_org_adj_prc, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+    _params["fid_period_div_code"] = _SERIALIZER.query(
+        "fid_period_div_code", fid_period_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_quote_and_expected_conclusion_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST01010200",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_investor_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST01010900",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-investor"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_member_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST01010600",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-member"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_period_price_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    fid_org_adj_prc: str,
+    fid_input_date1: str,
+    fid_input_date2: str,
+    fid_period_div_code: str,
+    custtype: str = "P",
+    tr_id: str = "FHKST03010100",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_org_adj_prc"] = _SERIALIZER.query(
+        "fid_org_adj_prc", fid_org_adj_prc, "str"
+    )
+    _params["fid_input_date_1"] = _SERIALIZER.query(
+        "fid_input_date1", fid_input_date1, "str", max_length=10
+    )
+    _params["fid_input_date_2"] = _SERIALIZER.query(
+        "fid_input_date2", fid_input_date2, "str", max_length=10
+    )
+    _params["fid_period_div_code"] = _SERIALIZER.query(
+        "fid_period_div_code", fid_period_div_code, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_time_conclusion_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    fid_input_hour1: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHPST01060000",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-time-itemconclusion"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+    _params["fid_input_hour_1"] = _SERIALIZER.query(
+        "fid_input_hour1", fid_input_hour1, "str", max_length=10
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_over_time_conclusion_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHPST02310000",
+    fid_cond_mrkt_div_code: str = "J",
+    fid_hour_cls_code: str = "1",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-time-overtimeconclusion"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+    _params["fid_hour_cls_code"] = _SERIALIZER.query(
+        "fid_hour_cls_code", fid_hour_cls_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_over_time_daily_price_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHPST02320000",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-daily-overtimeprice"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_time_minute_price_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    fid_etc_cls_code: str = "",
+    fid_input_hour1: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST03010200",
+    fid_cond_mrkt_div_code: str = "J",
+    fid_pw_data_incu_yn: str = "N",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+    _params["fid_etc_cls_code"] = _SERIALIZER.query(
+        "fid_etc_cls_code", fid_etc_cls_code, "str"
+    )
+    _params["fid_input_hour_1"] = _SERIALIZER.query(
+        "fid_input_hour1", fid_input_hour1, "str", max_length=6
+    )
+    _params["fid_pw_data_incu_yn"] = _SERIALIZER.query(
+        "fid_pw_data_incu_yn", fid_pw_data_incu_yn, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_price2_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHPST01010000",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-price-2"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_over_time_price_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHPST02300000",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-overtime-price"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_over_time_quote_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHPST02300400",
+    fid_cond_mrkt_div_code: str = "J",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-overtime-asking-price"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_closing_expected_conclusion_request(  # pylint: disable=name-too-long
+    *,
+    fid_rank_sort_cls_code: str = "0",
+    fid_input_iscd: str = "0",
+    fid_blng_cls_code: str = "0",
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST117300C0",
+    fid_cond_mrkt_div_code: str = "J",
+    fid_cond_scr_div_code: str = "11173",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/exp-closing-price"
+
+    # Construct parameters
+    _params["fid_rank_sort_cls_code"] = _SERIALIZER.query(
+        "fid_rank_sort_cls_code", fid_rank_sort_cls_code, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+    _params["fid_cond_scr_div_code"] = _SERIALIZER.query(
+        "fid_cond_scr_div_code", fid_cond_scr_div_code, "str"
+    )
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_blng_cls_code"] = _SERIALIZER.query(
+        "fid_blng_cls_code", fid_blng_cls_code, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_vi_status_request(
+    *,
+    fid_input_iscd: str,
+    fid_div_cls_code: str = "0",
+    fid_mrkt_cls_code: str = "0",
+    fid_rank_sort_cls_code: str = "0",
+    fid_input_date1: str,
+    fid_trgt_cls_code: str,
+    fid_trgt_exls_cls_code: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHPST01390000",
+    fid_cond_scr_div_code: str = "20139",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/inquire-vi-status"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_div_cls_code"] = _SERIALIZER.query(
+        "fid_div_cls_code", fid_div_cls_code, "str"
+    )
+    _params["fid_cond_scr_div_code"] = _SERIALIZER.query(
+        "fid_cond_scr_div_code", fid_cond_scr_div_code, "str"
+    )
+    _params["fid_mrkt_cls_code"] = _SERIALIZER.query(
+        "fid_mrkt_cls_code", fid_mrkt_cls_code, "str"
+    )
+    _params["fid_rank_sort_cls_code"] = _SERIALIZER.query(
+        "fid_rank_sort_cls_code", fid_rank_sort_cls_code, "str"
+    )
+    _params["fid_input_date_1"] = _SERIALIZER.query(
+        "fid_input_date1", fid_input_date1, "str", pattern=r"^[0-9]{8}$"
+    )
+    _params["fid_trgt_cls_code"] = _SERIALIZER.query(
+        "fid_trgt_cls_code", fid_trgt_cls_code, "str", max_length=32
+    )
+    _params["fid_trgt_exls_cls_code"] = _SERIALIZER.query(
+        "fid_trgt_exls_cls_code", fid_trgt_exls_cls_code, "str", max_length=32
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_invest_opinion_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    fid_input_date1: str,
+    fid_input_date2: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST663300C0",
+    fid_cond_mrkt_div_code: str = "J",
+    fid_cond_scr_div_code: str = "16633",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/invest-opinion"
+
+    # Construct parameters
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+    _params["fid_cond_scr_div_code"] = _SERIALIZER.query(
+        "fid_cond_scr_div_code", fid_cond_scr_div_code, "str"
+    )
+    _params["fid_input_date_1"] = _SERIALIZER.query(
+        "fid_input_date1", fid_input_date1, "str", max_length=10
+    )
+    _params["fid_input_date_2"] = _SERIALIZER.query(
+        "fid_input_date2", fid_input_date2, "str", max_length=10
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_get_domestic_stock_securities_opinion_request(  # pylint: disable=name-too-long
+    *,
+    fid_input_iscd: str,
+    fid_input_date1: str,
+    fid_input_date2: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "FHKST663400C0",
+    fid_cond_mrkt_div_code: str = "J",
+    fid_cond_scr_div_code: str = "16634",
+    fid_div_cls_code: str = "0",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/invest-opbysec"
+
+    # Construct parameters
+    _params["fid_cond_mrkt_div_code"] = _SERIALIZER.query(
+        "fid_cond_mrkt_div_code", fid_cond_mrkt_div_code, "str"
+    )
+    _params["fid_cond_scr_div_code"] = _SERIALIZER.query(
+        "fid_cond_scr_div_code", fid_cond_scr_div_code, "str"
+    )
+    _params["fid_input_iscd"] = _SERIALIZER.query(
+        "fid_input_iscd", fid_input_iscd, "str"
+    )
+    _params["fid_div_cls_code"] = _SERIALIZER.query(
+        "fid_div_cls_code", fid_div_cls_code, "str"
+    )
+    _params["fid_input_date_1"] = _SERIALIZER.query(
+        "fid_input_date1", fid_input_date1, "str"
+    )
+    _params["fid_input_date_2"] = _SERIALIZER.query(
+        "fid_input_date2", fid_input_date2, "str"
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_check_domestic_holiday_request(  # pylint: disable=name-too-long
+    *,
+    bass_dt: str,
+    ctx_area_nk: str = "",
+    ctx_area_fk: str = "",
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "CTCA0903R",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/chk-holiday"
+
+    # Construct parameters
+    _params["bass_dt"] = _SERIALIZER.query("bass_dt", bass_dt, "str", max_length=8)
+    _params["ctx_area_nk"] = _SERIALIZER.query(
+        "ctx_area_nk", ctx_area_nk, "str", max_length=6
+    )
+    _params["ctx_area_fk"] = _SERIALIZER.query(
+        "ctx_area_fk", ctx_area_fk, "str", max_length=6
+    )
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_search_product_info_request(  # pylint: disable=name-too-long
+    *,
+    pdno: str,
+    prdt_type_cd: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "CTPF1604R",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/search-info"
+
+    # Construct parameters
+    _params["pdno"] = _SERIALIZER.query("pdno", pdno, "str", max_length=12)
+    _params["prdt_type_cd"] = _SERIALIZER.query("prdt_type_cd", prdt_type_cd, "str")
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+def build_gen_open_kis_search_stock_info_request(  # pylint: disable=name-too-long
+    *,
+    prdt_type_cd: str,
+    pdno: str,
+    personalseckey: Optional[str] = None,
+    tr_cont: str = "",
+    custtype: str = "P",
+    seq_no: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    phone_number: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    hashkey: Optional[str] = None,
+    gt_uid: Optional[str] = None,
+    tr_id: str = "CTPF1002R",
+    **kwargs: Any,
+) -> HttpRequest:
+    _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
+    _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+
+    accept = _headers.pop("Accept", "application/json")
+
+    # Construct URL
+    _url = "/uapi/domestic-stock/v1/quotations/search-stock-info"
+
+    # Construct parameters
+    _params["prdt_type_cd"] = _SERIALIZER.query("prdt_type_cd", prdt_type_cd, "str")
+    _params["pdno"] = _SERIALIZER.query("pdno", pdno, "str", max_length=12)
+
+    # Construct headers
+    if personalseckey is not None:
+        _headers["personalseckey"] = _SERIALIZER.header(
+            "personalseckey", personalseckey, "str"
+        )
+    if tr_cont is not None:
+        _headers["tr_cont"] = _SERIALIZER.header("tr_cont", tr_cont, "str")
+    if custtype is not None:
+        _headers["custtype"] = _SERIALIZER.header("custtype", custtype, "str")
+    if seq_no is not None:
+        _headers["seq_no"] = _SERIALIZER.header("seq_no", seq_no, "str")
+    if mac_address is not None:
+        _headers["mac_address"] = _SERIALIZER.header("mac_address", mac_address, "str")
+    if phone_number is not None:
+        _headers["phone_number"] = _SERIALIZER.header(
+            "phone_number", phone_number, "str"
+        )
+    if ip_address is not None:
+        _headers["ip_address"] = _SERIALIZER.header("ip_address", ip_address, "str")
+    if hashkey is not None:
+        _headers["hashkey"] = _SERIALIZER.header("hashkey", hashkey, "str")
+    if gt_uid is not None:
+        _headers["gt_uid"] = _SERIALIZER.header("gt_uid", gt_uid, "str")
+    _headers["tr_id"] = _SERIALIZER.header("tr_id", tr_id, "str")
+    _headers["Accept"] = _SERIALIZER.header("accept", accept, "str")
+
+    return HttpRequest(
+        method="GET", url=_url, params=_params, headers=_headers, **kwargs
+    )
+
+
+class GenOpenKisClientQuoteOperationsMixin(GenOpenKisClientMixinABC):
+    @distributed_trace
+    def get_domestic_stock_price(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST01010100",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 시세 조회.
+
+        주식 현재가 시세 API입니다. 실시간 시세를 원하신다면 웹소켓 API를 활용하세요.
+
+        ※ 종목코드 마스터파일 파이썬 정제코드는 한국투자증권 Github 참고 부탁드립니다.:code:`<br/>`
+          https://github.com/koreainvestment/open-trading-api/tree/main/stocks_info.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHKST01010100 : 주식현재가 시세. "FHKST01010100" Default value is "FHKST01010100".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: FID 조건 시장 분류 코드
+
+         J : 주식, ETF, ETN:code:`<br/>`
+         W: ELW. Known values are: "J" and "W". Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": {
+                        "acml_tr_pbmn": "str",  # Optional. "ub204"uc801 "uac70"ub798
+                          "ub300"uae08.
+                        "acml_vol": "str",  # Optional. "ub204"uc801 "uac70"ub798"ub7c9.
+                        "apprch_rate": "str",  # Optional. "uc811"uadfc"ub3c4.
+                        "aspr_unit": "str",  # Optional. "ud638"uac00"ub2e8"uc704.
+                        "bps": "str",  # Optional. BPS.
+                        "bstp_kor_isnm": "str",  # Optional. "uc5c5"uc885 "ud55c"uae00
+                          "uc885"ubaa9"uba85.
+                        "clpr_rang_cont_yn": "str",  # Optional. "uc885"uac00 "ubc94"uc704
+                          "uc5f0"uc7a5 "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "cpfn": "str",  # Optional. "uc790"ubcf8"uae08.
+                        "cpfn_cnnm": "str",  # Optional. "uc790"ubcf8"uae08
+                          "ud1b5"ud654"uba85:code:`<br/>` "uc678"uad6d"uc8fc"uad8c"uc740
+                          "uc5b5"uc73c"ub85c "ub5a8"uc5b4"uc9c0"uba70, "uadf8 "uc678"uc5d0"ub294
+                          "ub9cc"uc73c"ub85c "ud45c"uc2dc"ub428.
+                        "crdt_able_yn": "str",  # Optional. "uc2e0"uc6a9 "uac00"ub2a5
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "d250_hgpr": "str",  # Optional. 250"uc77c "ucd5c"uace0"uac00.
+                        "d250_hgpr_date": "str",  # Optional. 250"uc77c "ucd5c"uace0"uac00
+                          "uc77c"uc790.
+                        "d250_hgpr_vrss_prpr_rate": "str",  # Optional. 250"uc77c
+                          "ucd5c"uace0"uac00 "ub300"ube44 "ud604"uc7ac"uac00 "ube44"uc728.
+                        "d250_lwpr": "str",  # Optional. 250"uc77c "ucd5c"uc800"uac00.
+                        "d250_lwpr_date": "str",  # Optional. 250"uc77c "ucd5c"uc800"uac00
+                          "uc77c"uc790.
+                        "d250_lwpr_vrss_prpr_rate": "str",  # Optional. 250"uc77c
+                          "ucd5c"uc800"uac00 "ub300"ube44 "ud604"uc7ac"uac00 "ube44"uc728.
+                        "dryy_hgpr_date": "str",  # Optional. "uc5f0"uc911 "ucd5c"uace0"uac00
+                          "uc77c"uc790.
+                        "dryy_hgpr_vrss_prpr_rate": "str",  # Optional. "uc5f0"uc911
+                          "ucd5c"uace0"uac00 "ub300"ube44 "ud604"uc7ac"uac00 "ube44"uc728.
+                        "dryy_lwpr_date": "str",  # Optional. "uc5f0"uc911 "ucd5c"uc800"uac00
+                          "uc77c"uc790.
+                        "dryy_lwpr_vrss_prpr_rate": "str",  # Optional. "uc5f0"uc911
+                          "ucd5c"uc800"uac00 "ub300"ube44 "ud604"uc7ac"uac00 "ube44"uc728.
+                        "elw_pblc_yn": "str",  # Optional. ELW "ubc1c"ud589 "uc5ec"ubd80.
+                          Known values are: "Y" and "N".
+                        "eps": "str",  # Optional. EPS.
+                        "fcam_cnnm": "str",  # Optional. "uc561"uba74"uac00
+                          "ud1b5"ud654"uba85.
+                        "frgn_hldn_qty": "str",  # Optional. "uc678"uad6d"uc778 "ubcf4"uc720
+                          "uc218"ub7c9.
+                        "frgn_ntby_qty": "str",  # Optional. "uc678"uad6d"uc778
+                          "uc21c"ub9e4"uc218 "uc218"ub7c9.
+                        "grmn_rate_cls_code": "str",  # Optional. "ubcf4"uc99d"uae08
+                          "ube44"uc728 "uad6c"ubd84 "ucf54"ub4dc  "ud55c"uad6d"ud22c"uc790
+                          "uc99d"uac70"uae08"ube44"uc728 (marg_rate "ucc38"uace0) 40 : 20%, 30%, 40% 50
+                          : 50% 60 : 60%. Known values are: "40", "50", and "60".
+                        "hts_avls": "str",  # Optional. HTS "uc2dc"uac00"ucd1d"uc561.
+                        "hts_deal_qty_unit_val": "str",  # Optional. HTS "ub9e4"ub9e4
+                          "uc218"ub7c9 "ub2e8"uc704 "uac12.
+                        "hts_frgn_ehrt": "str",  # Optional. HTS "uc678"uad6d"uc778
+                          "uc18c"uc9c4"uc728.
+                        "invt_caful_yn": "str",  # Optional.
+                          "ud22c"uc790"uc720"uc758"uc5ec"ubd80. Known values are: "Y" and "N".
+                        "iscd_stat_cls_code": "str",  # Optional.
+                          "uc885"ubaa9"uc0c1"ud0dc"uad6c"ubd84"ucf54"ub4dc  00 :
+                          "uadf8"uc678:code:`<br/>` 51 : "uad00"ub9ac"uc885"ubaa9:code:`<br/>` 52 :
+                          "ud22c"uc790"uc704"ud5d8:code:`<br/>` 53 :
+                          "ud22c"uc790"uacbd"uace0:code:`<br/>` 54 :
+                          "ud22c"uc790"uc8fc"uc758:code:`<br/>` 55 :
+                          "uc2e0"uc6a9"uac00"ub2a5:code:`<br/>` 57 : "uc99d"uac70"uae08
+                          100%:code:`<br/>` 58 : "uac70"ub798"uc815"uc9c0:code:`<br/>` 59 :
+                          "ub2e8"uae30"uacfc"uc5f4. Known values are: "00", "51", "52", "53", "54",
+                          "55", "57", "58", and "59".
+                        "last_ssts_cntg_qty": "str",  # Optional. "ucd5c"uc885
+                          "uacf5"ub9e4"ub3c4 "uccb4"uacb0 "uc218"ub7c9.
+                        "lstn_stcn": "str",  # Optional. "uc0c1"uc7a5 "uc8fc"uc218.
+                        "marg_rate": "str",  # Optional. "uc99d"uac70"uae08 "ube44"uc728.
+                        "mrkt_warn_cls_code": "str",  # Optional.
+                          "uc2dc"uc7a5"uacbd"uace0"ucf54"ub4dc  00 : "uc5c6"uc74c 01 :
+                          "ud22c"uc790"uc8fc"uc758 02 : "ud22c"uc790"uacbd"uace0 03 :
+                          "ud22c"uc790"uc704"ud5d8. Known values are: "00", "01", "02", and "03".
+                        "new_hgpr_lwpr_cls_code": "str",  # Optional. "uc2e0 "uace0"uac00
+                          "uc800"uac00 "uad6c"ubd84 "ucf54"ub4dc:code:`<br/>` "uc870"ud68c"ud558"ub294
+                          "uc885"ubaa9"uc774 "uc2e0"uace0/"uc2e0"uc800"uc5d0 "ub3c4"ub2ec"ud588"uc744
+                          "uacbd"uc6b0"uc5d0"ub9cc "uc870"ud68c"ub428.
+                        "oprc_rang_cont_yn": "str",  # Optional. "uc2dc"uac00 "ubc94"uc704
+                          "uc5f0"uc7a5 "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "ovtm_vi_cls_code": "str",  # Optional.
+                          "uc2dc"uac04"uc678"ub2e8"uc77c"uac00VI"uc801"uc6a9"uad6c"ubd84"ucf54"ub4dc.
+                          Known values are: "Y" and "N".
+                        "pbr": "str",  # Optional. PBR.
+                        "per": "str",  # Optional. PER.
+                        "pgtr_ntby_qty": "str",  # Optional.
+                          "ud504"ub85c"uadf8"ub7a8"ub9e4"ub9e4 "uc21c"ub9e4"uc218 "uc218"ub7c9.
+                        "prdy_ctrt": "str",  # Optional. "uc804"uc77c "ub300"ube44"uc728.
+                        "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                        "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c "ub300"ube44
+                          "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "prdy_vrss_vol_rate": "str",  # Optional. "uc804"uc77c "ub300"ube44
+                          "uac70"ub798"ub7c9 "ube44"uc728:code:`<br/>` "uc8fc"uc2dd"ud604"uc7ac"uac00
+                          "uc77c"uc790"ubcc4 API "uc751"ub2f5"uac12 "uc0ac"uc6a9.
+                        "rprs_mrkt_kor_name": "str",  # Optional. "ub300"ud45c "uc2dc"uc7a5
+                          "ud55c"uae00 "uba85.
+                        "rstc_wdth_prc": "str",  # Optional. "uc81c"ud55c "ud3ed
+                          "uac00"uaca9.
+                        "short_over_yn": "str",  # Optional.
+                          "ub2e8"uae30"uacfc"uc5f4"uc5ec"ubd80. Known values are: "Y" and "N".
+                        "sltr_yn": "str",  # Optional. "uc815"ub9ac"ub9e4"ub9e4"uc5ec"ubd80.
+                          Known values are: "Y" and "N".
+                        "ssts_yn": "str",  # Optional.
+                          "uacf5"ub9e4"ub3c4"uac00"ub2a5"uc5ec"ubd80. Known values are: "Y" and "N".
+                        "stac_month": "str",  # Optional. "uacb0"uc0b0 "uc6d4. Known values
+                          are: "01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", and
+                          "12".
+                        "stck_dryy_hgpr": "str",  # Optional. "uc8fc"uc2dd "uc5f0"uc911
+                          "ucd5c"uace0"uac00.
+                        "stck_dryy_lwpr": "str",  # Optional. "uc8fc"uc2dd "uc5f0"uc911
+                          "ucd5c"uc800"uac00.
+                        "stck_fcam": "str",  # Optional. "uc8fc"uc2dd "uc561"uba74"uac00.
+                        "stck_hgpr": "str",  # Optional. "uc8fc"uc2dd "ucd5c"uace0"uac00.
+                        "stck_llam": "str",  # Optional. "uc8fc"uc2dd "ud558"ud55c"uac00.
+                        "stck_lwpr": "str",  # Optional. "uc8fc"uc2dd "ucd5c"uc800"uac00.
+                        "stck_mxpr": "str",  # Optional. "uc8fc"uc2dd "uc0c1"ud55c"uac00.
+                        "stck_oprc": "str",  # Optional. "uc8fc"uc2dd "uc2dc"uac00.
+                        "stck_prpr": "str",  # Optional. "uc8fc"uc2dd "ud604"uc7ac"uac00.
+                        "stck_sdpr": "str",  # Optional. "uc8fc"uc2dd "uae30"uc900"uac00.
+                        "stck_shrn_iscd": "str",  # Optional. "uc8fc"uc2dd "ub2e8"ucd95
+                          "uc885"ubaa9"ucf54"ub4dc.
+                        "stck_sspr": "str",  # Optional. "uc8fc"uc2dd "ub300"uc6a9"uac00.
+                        "temp_stop_yn": "str",  # Optional. "uc784"uc2dc "uc815"uc9c0
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "vi_cls_code": "str",  # Optional.
+                          VI"uc801"uc6a9"uad6c"ubd84"ucf54"ub4dc. Known values are: "Y" and "N".
+                        "vol_tnrt": "str",  # Optional. "uac70"ub798"ub7c9
+                          "ud68c"uc804"uc728.
+                        "w52_hgpr": "str",  # Optional. 52"uc8fc"uc77c "ucd5c"uace0"uac00.
+                        "w52_hgpr_date": "str",  # Optional. 52"uc8fc"uc77c
+                          "ucd5c"uace0"uac00 "uc77c"uc790.
+                        "w52_hgpr_vrss_prpr_ctrt": "str",  # Optional. 52"uc8fc"uc77c
+                          "ucd5c"uace0"uac00 "ub300"ube44 "ud604"uc7ac"uac00 "ub300"ube44.
+                        "w52_lwpr": "str",  # Optional. 52"uc8fc"uc77c "ucd5c"uc800"uac00.
+                        "w52_lwpr_date": "str",  # Optional. 52"uc8fc"uc77c
+                          "ucd5c"uc800"uac00 "uc77c"uc790.
+                        "w52_lwpr_vrss_prpr_ctrt": "str",  # Optional. 52"uc8fc"uc77c
+                          "ucd5c"uc800"uac00 "ub300"ube44 "ud604"uc7ac"uac00 "ub300"ube44.
+                        "wghn_avrg_stck_prc": "str",  # Optional. "uac00"uc911 "ud3c9"uade0
+                          "uc8fc"uc2dd "uac00"uaca9.
+                        "whol_loan_rmnd_rate": "str"  # Optional. "uc804"uccb4 "uc735"uc790
+                          "uc794"uace0 "ube44"uc728.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_price_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_conclusion(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST01010300",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 체결 조회.
+
+        국내현재가 체결 API 입니다. 종목의 체결 정보를 확인할 수 있습니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHKST01010300 : 주식현재가 체결. "FHKST01010300" Default value is "FHKST01010300".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: FID 조건 시장 분류 코드
+
+         J : 주식, ETF, ETN:code:`<br/>`
+         W: ELW. Known values are: "J" and "W". Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "cntg_vol": "str",  # Optional. "uccb4"uacb0
+                              "uac70"ub798"ub7c9.
+                            "prdy_ctrt": "str",  # Optional. "uc804"uc77c
+                              "ub300"ube44"uc728.
+                            "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                            "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c
+                              "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                              "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                              "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2",
+                              "3", "4", and "5".
+                            "stck_cntg_hour": "str",  # Optional. "uc8fc"uc2dd
+                              "uccb4"uacb0 "uc2dc"uac04.
+                            "stck_prpr": "str",  # Optional. "uc8fc"uc2dd
+                              "ud604"uc7ac"uac00.
+                            "tday_rltv": "str"  # Optional. "ub2f9"uc77c
+                              "uccb4"uacb0"uac15"ub3c4  "uccb4"uacb0"uac70"ub798"uac00
+                              "ubc1c"uc0dd"ud558"ub294 "uc2dc"uc810"uc758 "uccb4"uacb0"uac15"ub3c4.
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_conclusion_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_daily_price(
+        self,
+        *,
+        fid_input_iscd: str,
+        fid_org_adj_prc: str,
+        fid_period_div_code: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST01010400",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 일자별 조회.
+
+        주식현재가 일자별 API입니다. 일/주/월별 주가를 확인할 수 있으며 최근 30일(주,별)로 제한되어 있습니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword fid_org_adj_prc: FID 수정주가 원주가 가격
+
+         0 : 수정주가반영:code:`<br/>`
+         1 : 수정주가미반영:code:`<br/>`
+
+
+         * 수정주가는 액면분할/액면병합 등 권리 발생 시 과거 시세를 현재 주가에 맞게 보정한 가격. Known values are: "0" and "1". Required.
+        :paramtype fid_org_adj_prc: str
+        :keyword fid_period_div_code: FID 기간 분류 코드
+
+         D : (일)최근 30거래일:code:`<br/>`
+         W : (주)최근 30주:code:`<br/>`
+         M : (월)최근 30개월. Known values are: "D", "W", and "M". Required.
+        :paramtype fid_period_div_code: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHKST01010400 : 주식현재가 일자별. "FHKST01010400" Default value is "FHKST01010400".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN. Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "acml_prtt_rate": "str",  # Optional. "ub204"uc801
+                              "ubd84"ud560 "ube44"uc728.
+                            "acml_vol": "str",  # Optional. "ub204"uc801
+                              "uac70"ub798"ub7c9.
+                            "flng_cls_code": "str",  # Optional. "ub77d "uad6c"ubd84
+                              "ucf54"ub4dc  01 : "uad8c"ub9ac"ub77d:code:`<br/>` 02 :
+                              "ubc30"ub2f9"ub77d:code:`<br/>` 03 : "ubd84"ubc30"ub77d:code:`<br/>` 04 :
+                              "uad8c"ubc30"ub77d:code:`<br/>` 05 :
+                              "uc911"uac04("ubd84"uae30)"ubc30"ub2f9"ub77d:code:`<br/>` 06 :
+                              "uad8c"ub9ac"uc911"uac04"ubc30"ub2f9"ub77d:code:`<br/>` 07 :
+                              "uad8c"ub9ac"ubd84"uae30"ubc30"ub2f9"ub77d. Known values are: "01", "02",
+                              "03", "04", "05", "06", and "07".
+                            "frgn_ntby_qty": "str",  # Optional. "uc678"uad6d"uc778
+                              "uc21c"ub9e4"uc218 "uc218"ub7c9.
+                            "hts_frgn_ehrt": "str",  # Optional. HTS "uc678"uad6d"uc778
+                              "uc18c"uc9c4"uc728.
+                            "prdy_ctrt": "str",  # Optional. "uc804"uc77c
+                              "ub300"ube44"uc728.
+                            "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                            "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c
+                              "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                              "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                              "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2",
+                              "3", "4", and "5".
+                            "prdy_vrss_vol_rate": "str",  # Optional. "uc804"uc77c
+                              "ub300"ube44 "uac70"ub798"ub7c9 "ube44"uc728.
+                            "stck_bsop_date": "str",  # Optional. "uc8fc"uc2dd
+                              "uc601"uc5c5 "uc77c"uc790.
+                            "stck_clpr": "str",  # Optional. "uc8fc"uc2dd "uc885"uac00.
+                            "stck_hgpr": "str",  # Optional. "uc8fc"uc2dd
+                              "ucd5c"uace0"uac00.
+                            "stck_lwpr": "str",  # Optional. "uc8fc"uc2dd
+                              "ucd5c"uc800"uac00.
+                            "stck_oprc": "str"  # Optional. "uc8fc"uc2dd "uc2dc"uac00.
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_daily_price_request(
+            fid_input_iscd=fid_input_iscd,
+            fid_org_adj_prc=fid_org_adj_prc,
+            fid_period_div_code=fid_period_div_code,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_quote_and_expected_conclusion(  # pylint: disable=name-too-long
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST01010200",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 호가/예상체결 조회.
+
+        주식현재가 호가 예상체결 API입니다.
+
+        매수 매도 호가를 확인하실 수 있습니다.:code:`<br/>` 실시간 데이터를 원하신다면 웹소켓 API를 활용하세요.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHKST01010200 : 주식현재가 호가 예상체결. "FHKST01010200" Default value is "FHKST01010200".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: FID 조건 시장 분류 코드
+
+         J : 주식, ETF, ETN. "J" Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output1": [
+                        {
+                            "askp1": "str",  # Optional. "ub9e4"ub3c4"ud638"uac001.
+                            "askp10": "str",  # Optional. "ub9e4"ub3c4"ud638"uac0010.
+                            "askp2": "str",  # Optional. "ub9e4"ub3c4"ud638"uac002.
+                            "askp3": "str",  # Optional. "ub9e4"ub3c4"ud638"uac003.
+                            "askp4": "str",  # Optional. "ub9e4"ub3c4"ud638"uac004.
+                            "askp5": "str",  # Optional. "ub9e4"ub3c4"ud638"uac005.
+                            "askp6": "str",  # Optional. "ub9e4"ub3c4"ud638"uac006.
+                            "askp7": "str",  # Optional. "ub9e4"ub3c4"ud638"uac007.
+                            "askp8": "str",  # Optional. "ub9e4"ub3c4"ud638"uac008.
+                            "askp9": "str",  # Optional. "ub9e4"ub3c4"ud638"uac009.
+                            "askp_rsqn1": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c91.
+                            "askp_rsqn10": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c910.
+                            "askp_rsqn2": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c92.
+                            "askp_rsqn3": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c93.
+                            "askp_rsqn4": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c94.
+                            "askp_rsqn5": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c95.
+                            "askp_rsqn6": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c96.
+                            "askp_rsqn7": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c97.
+                            "askp_rsqn8": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c98.
+                            "askp_rsqn9": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00
+                              "uc794"ub7c99.
+                            "askp_rsqn_icdc1": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac101.
+                            "askp_rsqn_icdc10": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac1010.
+                            "askp_rsqn_icdc2": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac102.
+                            "askp_rsqn_icdc3": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac103.
+                            "askp_rsqn_icdc4": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac104.
+                            "askp_rsqn_icdc5": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac105.
+                            "askp_rsqn_icdc6": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac106.
+                            "askp_rsqn_icdc7": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac107.
+                            "askp_rsqn_icdc8": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac108.
+                            "askp_rsqn_icdc9": "str",  # Optional.
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac109.
+                            "aspr_acpt_hour": "str",  # Optional. "ud638"uac00
+                              "uc811"uc218 "uc2dc"uac04.
+                            "bidp1": "str",  # Optional. "ub9e4"uc218"ud638"uac001.
+                            "bidp10": "str",  # Optional. "ub9e4"uc218"ud638"uac0010.
+                            "bidp2": "str",  # Optional. "ub9e4"uc218"ud638"uac002.
+                            "bidp3": "str",  # Optional. "ub9e4"uc218"ud638"uac003.
+                            "bidp4": "str",  # Optional. "ub9e4"uc218"ud638"uac004.
+                            "bidp5": "str",  # Optional. "ub9e4"uc218"ud638"uac005.
+                            "bidp6": "str",  # Optional. "ub9e4"uc218"ud638"uac006.
+                            "bidp7": "str",  # Optional. "ub9e4"uc218"ud638"uac007.
+                            "bidp8": "str",  # Optional. "ub9e4"uc218"ud638"uac008.
+                            "bidp9": "str",  # Optional. "ub9e4"uc218"ud638"uac009.
+                            "bidp_rsqn1": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c91.
+                            "bidp_rsqn10": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c910.
+                            "bidp_rsqn2": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c92.
+                            "bidp_rsqn3": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c93.
+                            "bidp_rsqn4": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c94.
+                            "bidp_rsqn5": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c95.
+                            "bidp_rsqn6": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c96.
+                            "bidp_rsqn7": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c97.
+                            "bidp_rsqn8": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c98.
+                            "bidp_rsqn9": "str",  # Optional. "ub9e4"uc218"ud638"uac00
+                              "uc794"ub7c99.
+                            "bidp_rsqn_icdc1": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac101.
+                            "bidp_rsqn_icdc10": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac1010.
+                            "bidp_rsqn_icdc2": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac102.
+                            "bidp_rsqn_icdc3": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac103.
+                            "bidp_rsqn_icdc4": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac104.
+                            "bidp_rsqn_icdc5": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac105.
+                            "bidp_rsqn_icdc6": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac106.
+                            "bidp_rsqn_icdc7": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac107.
+                            "bidp_rsqn_icdc8": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac108.
+                            "bidp_rsqn_icdc9": "str",  # Optional.
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac109.
+                            "new_mkop_cls_code": "str",  # Optional. "uc2e0
+                              "uc7a5"uc6b4"uc601 "uad6c"ubd84 "ucf54"ub4dc  '00' : "uc7a5"uc804
+                              "uc608"uc0c1"uccb4"uacb0"uac00"uc640 "uc7a5"ub9c8"uac10
+                              "ub3d9"uc2dc"ud638"uac00 '49' : "uc7a5"ud6c4
+                              "uc608"uc0c1"uccb4"uacb0"uac00  (1) "uccab "ubc88"uc9f8 "ube44"ud2b8 1 :
+                              "uc7a5"uac1c"uc2dc"uc804 2 : "uc7a5"uc911 3 : "uc7a5"uc885"ub8cc"ud6c4 4
+                              : "uc2dc"uac04"uc678"ub2e8"uc77c"uac00 7 : "uc77c"ubc18Buy-in 8 :
+                              "ub2f9"uc77cBuy-in (2) "ub450 "ubc88"uc9f8 "ube44"ud2b8 0 : "ubcf4"ud1b5
+                              1 : "uc885"uac00 2 : "ub300"ub7c9 3 : "ubc14"uc2a4"ucf13 7 :
+                              "uc815"ub9ac"ub9e4"ub9e4 8 : Buy-in.
+                            "ntby_aspr_rsqn": "str",  # Optional. "uc21c"ub9e4"uc218
+                              "ud638"uac00 "uc794"ub7c9.
+                            "ovtm_total_askp_icdc": "str",  # Optional.
+                              "uc2dc"uac04"uc678 "ucd1d "ub9e4"ub3c4"ud638"uac00 "uc99d"uac10.
+                            "ovtm_total_askp_rsqn": "str",  # Optional.
+                              "uc2dc"uac04"uc678 "ucd1d "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9.
+                            "ovtm_total_bidp_icdc": "str",  # Optional.
+                              "uc2dc"uac04"uc678 "ucd1d "ub9e4"uc218"ud638"uac00 "uc99d"uac10.
+                            "ovtm_total_bidp_rsqn": "str",  # Optional.
+                              "uc2dc"uac04"uc678 "ucd1d "ub9e4"uc218"ud638"uac00 "uc794"ub7c9.
+                            "total_askp_rsqn": "str",  # Optional. "ucd1d
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9.
+                            "total_askp_rsqn_icdc": "str",  # Optional. "ucd1d
+                              "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac10.
+                            "total_bidp_rsqn": "str",  # Optional. "ucd1d
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9.
+                            "total_bidp_rsqn_icdc": "str"  # Optional. "ucd1d
+                              "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac10.
+                        }
+                    ],
+                    "output2": {
+                        "antc_cnpr": "str",  # Optional. "uc608"uc0c1 "uccb4"uacb0"uac00.
+                        "antc_cntg_prdy_ctrt": "str",  # Optional. "uc608"uc0c1 "uccb4"uacb0
+                          "uc804"uc77c "ub300"ube44"uc728.
+                        "antc_cntg_vrss": "str",  # Optional. "uc608"uc0c1 "uccb4"uacb0
+                          "ub300"ube44.
+                        "antc_cntg_vrss_sign": "str",  # Optional. "uc608"uc0c1 "uccb4"uacb0
+                          "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                          "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                          "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2", "3",
+                          "4", and "5".
+                        "antc_mkop_cls_code": "str",  # Optional. "uc608"uc0c1
+                          "uc7a5"uc6b4"uc601 "uad6c"ubd84 "ucf54"ub4dc  311 :
+                          "uc608"uc0c1"uccb4"uacb0"uc2dc"uc791 112 :
+                          "uc608"uc0c1"uccb4"uacb0"uc885"ub8cc. Known values are: "311" and "112".
+                        "antc_vol": "str",  # Optional. "uc608"uc0c1 "uac70"ub798"ub7c9.
+                        "stck_hgpr": "str",  # Optional. "uc8fc"uc2dd "ucd5c"uace0"uac00.
+                        "stck_lwpr": "str",  # Optional. "uc8fc"uc2dd "ucd5c"uc800"uac00.
+                        "stck_oprc": "str",  # Optional. "uc8fc"uc2dd "uc2dc"uac00.
+                        "stck_prpr": "str",  # Optional. "uc8fc"uc2dd "ud604"uc7ac"uac00.
+                        "stck_sdpr": "str",  # Optional. "uc8fc"uc2dd "uae30"uc900"uac00.
+                        "stck_shrn_iscd": "str",  # Optional. "uc8fc"uc2dd "ub2e8"ucd95
+                          "uc885"ubaa9"ucf54"ub4dc.
+                        "vi_cls_code": "str"  # Optional.
+                          VI"uc801"uc6a9"uad6c"ubd84"ucf54"ub4dc. Known values are: "Y" and "N".
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = (
+            build_gen_open_kis_get_domestic_stock_quote_and_expected_conclusion_request(
+                fid_input_iscd=fid_input_iscd,
+                personalseckey=personalseckey,
+                tr_cont=tr_cont,
+                custtype=custtype,
+                seq_no=seq_no,
+                mac_address=mac_address,
+                phone_number=phone_number,
+                ip_address=ip_address,
+                hashkey=hashkey,
+                gt_uid=gt_uid,
+                tr_id=tr_id,
+                fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+                headers=_headers,
+                params=_params,
+            )
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_investor(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST01010900",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 투자자 조회.
+
+        주식현재가 투자자 API입니다. 개인, 외국인, 기관 등 투자 정보를 확인할 수 있습니다.
+
+        [유의사항]:code:`<br/>`
+
+
+        * 외국인은 외국인(외국인투자등록 고유번호가 있는 경우)+기타 외국인을 지칭합니다.:code:`<br/>`
+        * 당일 데이터는 장 종료 후 제공됩니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHKST01010900 : 주식현재가 투자자. "FHKST01010900" Default value is "FHKST01010900".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: FID 조건 시장 분류 코드
+
+         J : 주식, ETF, ETN. "J" Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "frgn_ntby_qty": "str",  # Optional. "uc678"uad6d"uc778
+                              "uc21c"ub9e4"uc218 "uc218"ub7c9.
+                            "frgn_ntby_tr_pbmn": "str",  # Optional. "uc678"uad6d"uc778
+                              "uc21c"ub9e4"uc218 "uac70"ub798 "ub300"uae08.
+                            "frgn_seln_tr_pbmn": "str",  # Optional. "uc678"uad6d"uc778
+                              "ub9e4"ub3c4 "uac70"ub798 "ub300"uae08.
+                            "frgn_seln_vol": "str",  # Optional. "uc678"uad6d"uc778
+                              "ub9e4"ub3c4 "uac70"ub798"ub7c9.
+                            "frgn_shnu_tr_pbmn": "str",  # Optional. "uc678"uad6d"uc778
+                              "ub9e4"uc2182 "uac70"ub798 "ub300"uae08.
+                            "frgn_shnu_vol": "str",  # Optional. "uc678"uad6d"uc778
+                              "ub9e4"uc2182 "uac70"ub798"ub7c9.
+                            "orgn_ntby_qty": "str",  # Optional. "uae30"uad00"uacc4
+                              "uc21c"ub9e4"uc218 "uc218"ub7c9.
+                            "orgn_ntby_tr_pbmn": "str",  # Optional. "uae30"uad00"uacc4
+                              "uc21c"ub9e4"uc218 "uac70"ub798 "ub300"uae08.
+                            "orgn_seln_tr_pbmn": "str",  # Optional. "uae30"uad00"uacc4
+                              "ub9e4"ub3c4 "uac70"ub798 "ub300"uae08.
+                            "orgn_seln_vol": "str",  # Optional. "uae30"uad00"uacc4
+                              "ub9e4"ub3c4 "uac70"ub798"ub7c9.
+                            "orgn_shnu_tr_pbmn": "str",  # Optional. "uae30"uad00"uacc4
+                              "ub9e4"uc2182 "uac70"ub798 "ub300"uae08.
+                            "orgn_shnu_vol": "str",  # Optional. "uae30"uad00"uacc4
+                              "ub9e4"uc2182 "uac70"ub798"ub7c9.
+                            "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                            "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c
+                              "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                              "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                              "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2",
+                              "3", "4", and "5".
+                            "prsn_ntby_qty": "str",  # Optional. "uac1c"uc778
+                              "uc21c"ub9e4"uc218 "uc218"ub7c9.
+                            "prsn_ntby_tr_pbmn": "str",  # Optional. "uac1c"uc778
+                              "uc21c"ub9e4"uc218 "uac70"ub798 "ub300"uae08.
+                            "prsn_seln_tr_pbmn": "str",  # Optional. "uac1c"uc778
+                              "ub9e4"ub3c4 "uac70"ub798 "ub300"uae08.
+                            "prsn_seln_vol": "str",  # Optional. "uac1c"uc778
+                              "ub9e4"ub3c4 "uac70"ub798"ub7c9.
+                            "prsn_shnu_tr_pbmn": "str",  # Optional. "uac1c"uc778
+                              "ub9e4"uc2182 "uac70"ub798 "ub300"uae08.
+                            "prsn_shnu_vol": "str",  # Optional. "uac1c"uc778
+                              "ub9e4"uc2182 "uac70"ub798"ub7c9.
+                            "stck_bsop_date": "str",  # Optional. "uc8fc"uc2dd
+                              "uc601"uc5c5 "uc77c"uc790.
+                            "stck_clpr": "str"  # Optional. "uc8fc"uc2dd "uc885"uac00.
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_investor_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_member(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST01010600",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 회원사 조회.
+
+        주식 현재가 회원사 API입니다. 회원사의 투자 정보를 확인할 수 있습니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHKST01010600 : 주식현재가 회원사. "FHKST01010600" Default value is "FHKST01010600".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: FID 조건 시장 분류 코드
+
+         J : 주식, ETF, ETN. "J" Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_member_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_period_price(
+        self,
+        *,
+        fid_input_iscd: str,
+        fid_org_adj_prc: str,
+        fid_input_date1: str,
+        fid_input_date2: str,
+        fid_period_div_code: str,
+        custtype: str = "P",
+        tr_id: str = "FHKST03010100",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 기간별 시세(일/주/월/년) 조회.
+
+        국내주식기간별시세(일/주/월/년) API입니다.:code:`<br/>`
+        실전계좌/모의계좌의 경우, 한 번의 호출에 최대 100건까지 확인 가능합니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword fid_org_adj_prc: FID 수정주가 원주가 가격
+
+         0 : 수정주가반영:code:`<br/>`
+         1 : 수정주가미반영:code:`<br/>`
+
+
+         * 수정주가는 액면분할/액면병합 등 권리 발생 시 과거 시세를 현재 주가에 맞게 보정한 가격. Known values are: "0" and "1". Required.
+        :paramtype fid_org_adj_prc: str
+        :keyword fid_input_date1: 입력 날짜 (시작):code:`<br/>`
+         조회 시작일자 (ex. 20220501). Required.
+        :paramtype fid_input_date1: str
+        :keyword fid_input_date2: 입력 날짜 (종료):code:`<br/>`
+         조회 종료일자 (ex. 20220530). Required.
+        :paramtype fid_input_date2: str
+        :keyword fid_period_div_code: 기간 분류 코드
+
+         D : 일봉:code:`<br/>`
+         W : 주봉:code:`<br/>`
+         M : 월봉:code:`<br/>`
+         Y : 년봉. Known values are: "D", "W", "M", and "Y". Required.
+        :paramtype fid_period_div_code: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHKST03010100 : 국내주식 기간별 시세(일/주/월/년). "FHKST03010100" Default value is "FHKST03010100".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN. Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output1": {
+                        "acml_tr_pbmn": "str",  # Optional. "ub204"uc801 "uac70"ub798
+                          "ub300"uae08.
+                        "acml_vol": "str",  # Optional. "ub204"uc801 "uac70"ub798"ub7c9.
+                        "askp": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00.
+                        "bidp": "str",  # Optional. "ub9e4"uc218"ud638"uac00.
+                        "cpfn": "str",  # Optional. "uc790"ubcf8"uae08.
+                        "eps": "str",  # Optional. EPS.
+                        "hts_avls": "str",  # Optional. HTS "uc2dc"uac00"ucd1d"uc561.
+                        "hts_kor_isnm": "str",  # Optional. HTS "ud55c"uae00
+                          "uc885"ubaa9"uba85.
+                        "itewhol_loan_rmnd_ratem": "str",  # Optional. "uc804"uccb4
+                          "uc735"uc790 "uc794"uace0 "ube44"uc728.
+                        "lstn_stcn": "str",  # Optional. "uc0c1"uc7a5 "uc8fc"uc218.
+                        "output2": [
+                            {
+                                "acml_tr_pbmn": "str",  # Optional. "ub204"uc801
+                                  "uac70"ub798 "ub300"uae08.
+                                "acml_vol": "str",  # Optional. "ub204"uc801
+                                  "uac70"ub798"ub7c9.
+                                "flng_cls_code": "str",  # Optional. "ub77d
+                                  "uad6c"ubd84 "ucf54"ub4dc
+                                  00:"ud574"ub2f9"uc0ac"ud56d"uc5c6"uc74c("ub77d"uc774
+                                  "ubc1c"uc0dd"uc548"ud55c "uacbd"uc6b0) 01:"uad8c"ub9ac"ub77d
+                                  02:"ubc30"ub2f9"ub77d 03:"ubd84"ubc30"ub77d 04:"uad8c"ubc30"ub77d
+                                  05:"uc911"uac04("ubd84"uae30)"ubc30"ub2f9"ub77d
+                                  06:"uad8c"ub9ac"uc911"uac04"ubc30"ub2f9"ub77d
+                                  07:"uad8c"ub9ac"ubd84"uae30"ubc30"ub2f9"ub77d.
+                                "mod_yn": "str",  # Optional.
+                                  "ubd84"ud560"ubcc0"uacbd"uc5ec"ubd80. Known values are: "Y" and "N".
+                                "prdy_vrss": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44.
+                                "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                                  "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                                  "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1",
+                                  "2", "3", "4", and "5".
+                                "prtt_rate": "str",  # Optional. "ubd84"ud560
+                                  "ube44"uc728.
+                                "revl_issu_reas": "str",  # Optional.
+                                  "uc7ac"ud3c9"uac00"uc0ac"uc720"ucf54"ub4dc.
+                                "stck_bsop_date": "str",  # Optional. "uc8fc"uc2dd
+                                  "uc601"uc5c5 "uc77c"uc790.
+                                "stck_clpr": "str",  # Optional. "uc8fc"uc2dd
+                                  "uc885"uac00.
+                                "stck_hgpr": "str",  # Optional. "uc8fc"uc2dd
+                                  "ucd5c"uace0"uac00.
+                                "stck_lwpr": "str",  # Optional. "uc8fc"uc2dd
+                                  "ucd5c"uc800"uac00.
+                                "stck_oprc": "str"  # Optional. "uc8fc"uc2dd
+                                  "uc2dc"uac00.
+                            }
+                        ],
+                        "pbr": "str",  # Optional. PBR.
+                        "per": "str",  # Optional. PER.
+                        "prdy_ctrt": "str",  # Optional. "uc804"uc77c "ub300"ube44"uc728.
+                        "prdy_vol": "str",  # Optional. "uc804"uc77c "uac70"ub798"ub7c9.
+                        "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                        "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c "ub300"ube44
+                          "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "prdy_vrss_vol": "str",  # Optional. "uc804"uc77c "ub300"ube44
+                          "uac70"ub798"ub7c9.
+                        "stck_fcam": "str",  # Optional. "uc8fc"uc2dd "uc561"uba74"uac00.
+                        "stck_hgpr": "str",  # Optional. "ucd5c"uace0"uac00.
+                        "stck_llam": "str",  # Optional. "ud558"ud55c"uac00.
+                        "stck_lwpr": "str",  # Optional. "ucd5c"uc800"uac00.
+                        "stck_mxpr": "str",  # Optional. "uc0c1"ud55c"uac00.
+                        "stck_oprc": "str",  # Optional. "uc2dc"uac00.
+                        "stck_prdy_clpr": "str",  # Optional. "uc8fc"uc2dd "uc804"uc77c
+                          "uc885"uac00.
+                        "stck_prdy_hgpr": "str",  # Optional. "uc8fc"uc2dd "uc804"uc77c
+                          "ucd5c"uace0"uac00.
+                        "stck_prdy_lwpr": "str",  # Optional. "uc8fc"uc2dd "uc804"uc77c
+                          "ucd5c"uc800"uac00.
+                        "stck_prdy_oprc": "str",  # Optional. "uc8fc"uc2dd "uc804"uc77c
+                          "uc2dc"uac00.
+                        "stck_prpr": "str",  # Optional. "uc8fc"uc2dd "ud604"uc7ac"uac00.
+                        "stck_shrn_iscd": "str",  # Optional. "uc8fc"uc2dd "ub2e8"ucd95
+                          "uc885"ubaa9"ucf54"ub4dc.
+                        "vol_tnrt": "str"  # Optional. "uac70"ub798"ub7c9 "ud68c"uc804"uc728.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_period_price_request(
+            fid_input_iscd=fid_input_iscd,
+            fid_org_adj_prc=fid_org_adj_prc,
+            fid_input_date1=fid_input_date1,
+            fid_input_date2=fid_input_date2,
+            fid_period_div_code=fid_period_div_code,
+            custtype=custtype,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_time_conclusion(
+        self,
+        *,
+        fid_input_iscd: str,
+        fid_input_hour1: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHPST01060000",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 당일시간대별 체결 조회.
+
+        주식현재가 당일시간대별체결 API입니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword fid_input_hour1: 조회 시작시간
+
+         기준시간 (6자리; HH:MM:SS):code:`<br/>`
+         ex) 155000 입력시 15시 50분 00초 기준 이전 체결 내역이 조회됨. Required.
+        :paramtype fid_input_hour1: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHPST01060000 : 주식현재가 당일시간대별체결. "FHPST01060000" Default value is "FHPST01060000".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN. Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": {
+                        "acml_vol": "str",  # Optional. "ub204"uc801 "uac70"ub798"ub7c9.
+                        "output2": [
+                            {
+                                "acml_vol": "str",  # Optional. "ub204"uc801
+                                  "uac70"ub798"ub7c9.
+                                "askp": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00.
+                                "bidp": "str",  # Optional. "ub9e4"uc218"ud638"uac00.
+                                "cnqn": "str",  # Optional. "uccb4"uacb0"ub7c9.
+                                "prdy_ctrt": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44"uc728.
+                                "prdy_vrss": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44.
+                                "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                                  "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                                  "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1",
+                                  "2", "3", "4", and "5".
+                                "stck_cntg_hour": "str",  # Optional. "uc8fc"uc2dd
+                                  "uccb4"uacb0 "uc2dc"uac04.
+                                "stck_prpr": "str",  # Optional. "uc8fc"uc2dd
+                                  "ud604"uc7ac"uac00.
+                                "tday_rltv": "str"  # Optional. "ub2f9"uc77c
+                                  "uccb4"uacb0"uac15"ub3c4.
+                            }
+                        ],
+                        "prdy_ctrt": "str",  # Optional. "uc804"uc77c "ub300"ube44"uc728.
+                        "prdy_vol": "str",  # Optional. "uc804"uc77c "uac70"ub798"ub7c9.
+                        "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                        "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c "ub300"ube44
+                          "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "rprs_mrkt_kor_name": "str",  # Optional. "ub300"ud45c "uc2dc"uc7a5
+                          "ud55c"uae00"uba85.
+                        "stck_prpr": "str"  # Optional. "uc8fc"uc2dd "ud604"uc7ac"uac00.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_time_conclusion_request(
+            fid_input_iscd=fid_input_iscd,
+            fid_input_hour1=fid_input_hour1,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_over_time_conclusion(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHPST02310000",
+        fid_cond_mrkt_div_code: str = "J",
+        fid_hour_cls_code: str = "1",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 시간외 시간대별 체결 조회.
+
+        주식현재가 시간외시간별체결 API입니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHPST02310000 : 주식현재가 시간외시간별체결. "FHPST02310000" Default value is "FHPST02310000".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN. Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :keyword fid_hour_cls_code: 시간 구분 코드
+
+         1 : 시간외 (Default). "1" Default value is "1".
+        :paramtype fid_hour_cls_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output1": {
+                        "lslm_sign": "str",  # Optional. "ud558"ud55c "ubd80"ud638.
+                        "output2": [
+                            {
+                                "acml_vol": "str",  # Optional. "ub204"uc801
+                                  "uac70"ub798"ub7c9.
+                                "askp": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00.
+                                "bidp": "str",  # Optional. "ub9e4"uc218"ud638"uac00.
+                                "cntg_vol": "str",  # Optional. "uccb4"uacb0
+                                  "uac70"ub798"ub7c9.
+                                "prdy_ctrt": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44"uc728.
+                                "prdy_vrss": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44.
+                                "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                                  "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                                  "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1",
+                                  "2", "3", "4", and "5".
+                                "stck_cntg_hour": "str",  # Optional. "uc8fc"uc2dd
+                                  "uccb4"uacb0 "uc2dc"uac04.
+                                "stck_prpr": "str"  # Optional. "uc8fc"uc2dd
+                                  "ud604"uc7ac"uac00.
+                            }
+                        ],
+                        "ovtm_untp_antc_cnpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0"uac00.
+                        "ovtm_untp_antc_cntg_ctrt": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44"uc728.
+                        "ovtm_untp_antc_cntg_vrss": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44.
+                        "ovtm_untp_antc_cntg_vrss_sign": "str",  # Optional.
+                          "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44
+                          1 : "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "ovtm_untp_antc_vol": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uac70"ub798"ub7c9.
+                        "ovtm_untp_hgpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd5c"uace0"uac00.
+                        "ovtm_untp_llam": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ud558"ud55c"uac00.
+                        "ovtm_untp_lwpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd5c"uc800"uac00.
+                        "ovtm_untp_mxpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc0c1"ud55c"uac00.
+                        "ovtm_untp_oprc": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc2dc"uac002.
+                        "ovtm_untp_prdy_ctrt": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44"uc728.
+                        "ovtm_untp_prdy_vrss": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44.
+                        "ovtm_untp_prdy_vrss_sign": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44 "ubd80"ud638  1 :
+                          "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                        "ovtm_untp_prpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ud604"uc7ac"uac00.
+                        "ovtm_untp_tr_pbmn": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uac70"ub798 "ub300"uae08.
+                        "ovtm_untp_vol": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "uac70"ub798"ub7c9.
+                        "uplm_sign": "str"  # Optional. "uc0c1"ud55c "ubd80"ud638.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_over_time_conclusion_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            fid_hour_cls_code=fid_hour_cls_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_over_time_daily_price(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHPST02320000",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 시간외 일자별 주가 조회.
+
+        주식현재가 시간외일자별주가 API입니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         [실전투자/모의투자]:code:`<br/>`
+         FHPST02310000 : 주식현재가 시간외일자별체결. "FHPST02320000" Default value is "FHPST02320000".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN. Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output1": {
+                        "output2": [
+                            {
+                                "acml_vol": "str",  # Optional. "ub204"uc801
+                                  "uac70"ub798"ub7c9.
+                                "ovtm_untp_prdy_ctrt": "str",  # Optional.
+                                  "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "uc804"uc77c
+                                  "ub300"ube44"uc728.
+                                "ovtm_untp_prdy_vrss": "str",  # Optional.
+                                  "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44.
+                                "ovtm_untp_prdy_vrss_sign": "str",  # Optional.
+                                  "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44
+                                  "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                                  "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                                  "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1",
+                                  "2", "3", "4", and "5".
+                                "ovtm_untp_prpr": "str",  # Optional.
+                                  "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "ud604"uc7ac"uac00.
+                                "ovtm_untp_tr_pbmn": "str",  # Optional.
+                                  "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "uac70"ub798 "ub300"uae08.
+                                "ovtm_untp_vol": "str",  # Optional.
+                                  "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "uac70"ub798"ub7c9.
+                                "prdy_ctrt": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44"uc728.
+                                "prdy_vrss": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44.
+                                "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c
+                                  "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                                  "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                                  "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1",
+                                  "2", "3", "4", and "5".
+                                "stck_bsop_date": "str",  # Optional. "uc8fc"uc2dd
+                                  "uc601"uc5c5 "uc77c"uc790.
+                                "stck_clpr": "str"  # Optional. "uc8fc"uc2dd
+                                  "uc885"uac00.
+                            }
+                        ],
+                        "ovtm_untp_antc_ctrt": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44"uc728.
+                        "ovtm_untp_antc_prpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0"uac00.
+                        "ovtm_untp_antc_vol": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uac70"ub798"ub7c9.
+                        "ovtm_untp_antc_vrss": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44.
+                        "ovtm_untp_antc_vrss_sign": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44  1 :
+                          "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "ovtm_untp_hgpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd5c"uace0"uac00.
+                        "ovtm_untp_llam": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ud558"ud55c"uac00.
+                        "ovtm_untp_lwpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd5c"uc800"uac00.
+                        "ovtm_untp_mxpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc0c1"ud55c"uac00.
+                        "ovtm_untp_oprc": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc2dc"uac00.
+                        "ovtm_untp_prdy_ctrt": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44"uc728.
+                        "ovtm_untp_prdy_vrss": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44.
+                        "ovtm_untp_prdy_vrss_sign": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44 "ubd80"ud638  1 :
+                          "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "ovtm_untp_prpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ud604"uc7ac"uac00.
+                        "ovtm_untp_tr_pbmn": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uac70"ub798 "ub300"uae08.
+                        "ovtm_untp_vol": "str"  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uac70"ub798"ub7c9.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_over_time_daily_price_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_time_minute_price(
+        self,
+        *,
+        fid_input_iscd: str,
+        fid_etc_cls_code: str = "",
+        fid_input_hour1: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST03010200",
+        fid_cond_mrkt_div_code: str = "J",
+        fid_pw_data_incu_yn: str = "N",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 당일 분봉 조회.
+
+        주식당일분봉조회 API입니다.:code:`<br/>`
+        실전계좌/모의계좌의 경우, 한 번의 호출에 최대 30건까지 확인 가능합니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword fid_etc_cls_code: FID 기타 구분 코드
+
+         기타 구분 코드(""). Required. Default value is "".
+        :paramtype fid_etc_cls_code: str
+        :keyword fid_input_hour1: FID 입력 시간1
+
+         조회대상(FID_COND_MRKT_DIV_CODE)에 따라 입력하는 값 상이
+
+         종목(J)일 경우, 조회 시작일자(HHMMSS):code:`<br/>`
+         ex) "123000" 입력 시 12시 30분 이전부터 1분 간격으로 조회
+
+         업종(U)일 경우, 조회간격(초) (60 or 120 만 입력 가능):code:`<br/>`
+         ex) "60" 입력 시 현재시간부터 1분간격으로 조회:code:`<br/>`
+         "120" 입력 시 현재시간부터 2분간격으로 조회
+
+         ※ FID_INPUT_HOUR_1 에 미래일시 입력 시에 현재가로 조회됩니다.:code:`<br/>`
+         ex) 오전 10시에 113000 입력 시에 오전 10시~11시30분 사이의 데이터가 오전 10시 값으로 조회됨. Required.
+        :paramtype fid_input_hour1: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         FHKST03010200 : 주식 당일 분봉 조회. "FHKST03010200" Default value is "FHKST03010200".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN:code:`<br/>`
+         U: 업종. Known values are: "J" and "U". Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :keyword fid_pw_data_incu_yn: FID 과거 데이터 포함 여부
+
+         과거 데이터 포함 여부(Y/N):code:`<br/>`
+
+
+         * 업종(U) 조회시에만 동작하는 구분값:code:`<br/>`
+           N : 당일데이터만 조회:code:`<br/>`
+           Y : 이후데이터도 조회:code:`<br/>`
+           (조회시점이 083000(오전8:30)일 경우 전일자 업종 시세 데이터도 같이 조회됨). Known values are: "Y" and "N". Default
+         value is "N".
+        :paramtype fid_pw_data_incu_yn: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output1": {
+                        "acml_tr_pbmn": "str",  # Optional. "ub204"uc801 "uac70"ub798
+                          "ub300"uae08.
+                        "acml_vol": "str",  # Optional. "ub204"uc801 "uac70"ub798"ub7c9.
+                        "hts_kor_isnm": "str",  # Optional. HTS "ud55c"uae00
+                          "uc885"ubaa9"uba85.
+                        "output2": [
+                            {
+                                "acml_tr_pbmn": "str",  # Optional. "ub204"uc801
+                                  "uac70"ub798 "ub300"uae08.
+                                "cntg_vol": "str",  # Optional. "uccb4"uacb0
+                                  "uac70"ub798"ub7c9.
+                                "stck_bsop_date": "str",  # Optional. "uc8fc"uc2dd
+                                  "uc601"uc5c5 "uc77c"uc790.
+                                "stck_cntg_hour": "str",  # Optional. "uc8fc"uc2dd
+                                  "uccb4"uacb0 "uc2dc"uac04.
+                                "stck_hgpr": "str",  # Optional. "uc8fc"uc2dd
+                                  "ucd5c"uace0"uac00.
+                                "stck_lwpr": "str",  # Optional. "uc8fc"uc2dd
+                                  "ucd5c"uc800"uac00.
+                                "stck_oprc": "str",  # Optional. "uc8fc"uc2dd
+                                  "uc2dc"uac002.
+                                "stck_prpr": "str"  # Optional. "uc8fc"uc2dd
+                                  "ud604"uc7ac"uac00.
+                            }
+                        ],
+                        "prdy_ctrt": "str",  # Optional. "uc804"uc77c "ub300"ube44"uc728.
+                        "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                        "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c "ub300"ube44
+                          "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "stck_prdy_clpr": "str",  # Optional. "uc8fc"uc2dd "uc804"uc77c
+                          "uc885"uac00.
+                        "stck_prpr": "str"  # Optional. "uc8fc"uc2dd "ud604"uc7ac"uac00.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_time_minute_price_request(
+            fid_input_iscd=fid_input_iscd,
+            fid_etc_cls_code=fid_etc_cls_code,
+            fid_input_hour1=fid_input_hour1,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            fid_pw_data_incu_yn=fid_pw_data_incu_yn,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_price2(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHPST01010000",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 현재가 시세2 조회.
+
+        주식현재가 시세2 API입니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         FHPST01010000 : 주식현재가 시세2. "FHPST01010000" Default value is "FHPST01010000".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN. Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": {
+                        "acml_tr_pbmn": "str",  # Optional. "ub204"uc801 "uac70"ub798
+                          "ub300"uae08.
+                        "acml_vol": "str",  # Optional. "ub204"uc801 "uac70"ub798"ub7c9.
+                        "bstp_cls_code": "str",  # Optional. "uc5c5"uc885 "uad6c"ubd84
+                          "ucf54"ub4dc.
+                        "bstp_kor_isnm": "str",  # Optional. "uc5c5"uc885 "ud55c"uae00
+                          "uc885"ubaa9"uba85.
+                        "crdt_able_yn": "str",  # Optional. "uc2e0"uc6a9 "uac00"ub2a5
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "crdt_rate": "str",  # Optional. "uc2e0"uc6a9 "ube44"uc728.
+                        "divi_app_cls_code": "str",  # Optional.
+                          "ub3d9"uc2dc"ud638"uac00"ubc30"ubd84"ucc98"ub9ac"ucf54"ub4dc
+                          11:"ub9e4"uc218"uc0c1"ud55c"ubc30"ubd84:code:`<br/>`
+                          12:"ub9e4"uc218"ud558"ud55c"ubc30"ubd84:code:`<br/>` 13:
+                          "ub9e4"ub3c4"uc0c1"ud55c"ubc30"ubd84:code:`<br/>`
+                          14:"ub9e4"ub3c4"ud558"ud55c"ubc30"ubd84. Known values are: "11", "12", "13",
+                          and "14".
+                        "elw_pblc_yn": "str",  # Optional. ELW "ubc1c"ud589 "uc5ec"ubd80.
+                          Known values are: "Y" and "N".
+                        "fcam_mod_cls_name": "str",  # Optional. "uc561"uba74"uac00
+                          "ubcc0"uacbd "uad6c"ubd84 "uba85:code:`<br/>` "ud2b9"ubcc4"ud55c
+                          "uacbd"uc6b0"uc5d0"ub9cc "ub370"uc774"ud130 "ucd9c"ub825.
+                        "flng_cls_name": "str",  # Optional. "ub77d "uad6c"ubd84
+                          "uc774"ub984:code:`<br/>` "ud2b9"ubcc4"ud55c "uacbd"uc6b0"uc5d0"ub9cc
+                          "ub370"uc774"ud130 "ucd9c"ub825.
+                        "hgpr_vrss_prpr": "str",  # Optional. "ucd5c"uace0"uac00 "ub300"ube44
+                          "ud604"uc7ac"uac00.
+                        "hgpr_vrss_prpr_sign": "str",  # Optional. "ucd5c"uace0"uac00
+                          "ub300"ube44 "ud604"uc7ac"uac00 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2
+                          : "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                          "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2", "3",
+                          "4", and "5".
+                        "insn_pbnt_yn": "str",  # Optional. "ubd88"uc131"uc2e4 "uacf5"uc2dc
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "invt_caful_yn": "str",  # Optional.
+                          "ud22c"uc790"uc720"uc758"uc5ec"ubd80. Known values are: "Y" and "N".
+                        "low_current_yn": "str",  # Optional. "uc800"uc720"ub3d9"uc131
+                          "uc885"ubaa9 "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "lwpr_vrss_prpr": "str",  # Optional. "ucd5c"uc800"uac00 "ub300"ube44
+                          "ud604"uc7ac"uac00.
+                        "lwpr_vrss_prpr_sign": "str",  # Optional. "ucd5c"uc800"uac00
+                          "ub300"ube44 "ud604"uc7ac"uac00 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2
+                          : "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                          "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2", "3",
+                          "4", and "5".
+                        "mang_issu_yn": "str",  # Optional. "uad00"ub9ac "uc885"ubaa9
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "marg_rate": "str",  # Optional. "uc99d"uac70"uae08 "ube44"uc728.
+                        "mrkt_warn_cls_code": "str",  # Optional.
+                          "uc2dc"uc7a5"uacbd"uace0"ucf54"ub4dc  00: "uc5c6"uc74c 01:
+                          "ud22c"uc790"uc8fc"uc758 02:"ud22c"uc790"uacbd"uace0
+                          03:"ud22c"uc790"uc704"ud5d8. Known values are: "00", "01", "02", and "03".
+                        "mrkt_warn_cls_name": "str",  # Optional. "uc2dc"uc7a5 "uacbd"uace0
+                          "uad6c"ubd84 "uba85:code:`<br/>` "ud2b9"ubcc4"ud55c "uacbd"uc6b0"uc5d0"ub9cc
+                          "ub370"uc774"ud130 "ucd9c"ub825:code:`<br/>` ""ud22c"uc790"ud658"uae30" /
+                          ""ud22c"uc790"uacbd"uace0".
+                        "mxpr_llam_cls_code": "str",  # Optional. "uc0c1"ud558"ud55c"uac00
+                          "uad6c"ubd84 "ucf54"ub4dc:code:`<br/>` "uc870"ud68c"ud558"ub294
+                          "uc885"ubaa9"uc774 "uc0c1/"ud558"ud55c"uac00"uc5d0 "ub3c4"ub2ec"ud588"uc744
+                          "uacbd"uc6b0"uc5d0"ub9cc "uc870"ud68c"ub428.
+                        "new_hgpr_lwpr_cls_code": "str",  # Optional. "uc2e0 "uace0"uac00
+                          "uc800"uac00 "uad6c"ubd84 "ucf54"ub4dc:code:`<br/>` "uc870"ud68c"ud558"ub294
+                          "uc885"ubaa9"uc774 "uc2e0"uace0/"uc2e0"uc800"uc5d0 "ub3c4"ub2ec"ud588"uc744
+                          "uacbd"uc6b0"uc5d0"ub9cc "uc870"ud68c"ub428.
+                        "new_lstn_cls_name": "str",  # Optional. "uc2e0"uaddc "uc0c1"uc7a5
+                          "uad6c"ubd84 "uba85.
+                        "oprc_rang_cont_yn": "str",  # Optional. "uc2dc"uac00 "ubc94"uc704
+                          "uc5f0"uc7a5 "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "oprc_vrss_prpr": "str",  # Optional. "uc2dc"uac002 "ub300"ube44
+                          "ud604"uc7ac"uac00.
+                        "oprc_vrss_prpr_sign": "str",  # Optional. "uc2dc"uac002 "ub300"ube44
+                          "ud604"uc7ac"uac00 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                          "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                          "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2", "3",
+                          "4", and "5".
+                        "prdy_clpr_vrss_hgpr_rate": "str",  # Optional. "uc804"uc77c
+                          "uc885"uac00 "ub300"ube44 "ucd5c"uace0"uac00 "ube44"uc728.
+                        "prdy_clpr_vrss_lwpr_rate": "str",  # Optional. "uc804"uc77c
+                          "uc885"uac00 "ub300"ube44 "ucd5c"uc800"uac00 "ube44"uc728.
+                        "prdy_clpr_vrss_oprc_rate": "str",  # Optional. "uc804"uc77c
+                          "uc885"uac00 "ub300"ube44 "uc2dc"uac002 "ube44"uc728.
+                        "prdy_ctrt": "str",  # Optional. "uc804"uc77c "ub300"ube44"uc728.
+                        "prdy_vol": "str",  # Optional. "uc804"uc77c "uac70"ub798"ub7c9.
+                        "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                        "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c "ub300"ube44
+                          "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "prdy_vrss_vol_rate": "str",  # Optional. "uc804"uc77c "ub300"ube44
+                          "uac70"ub798"ub7c9 "ube44"uc728.
+                        "revl_issu_reas_name": "str",  # Optional. "uc7ac"ud3c9"uac00
+                          "uc885"ubaa9 "uc0ac"uc720 "uba85:code:`<br/>` "ud2b9"ubcc4"ud55c
+                          "uacbd"uc6b0"uc5d0"ub9cc "ub370"uc774"ud130 "ucd9c"ub825.
+                        "rprs_mrkt_kor_name": "str",  # Optional. "ub300"ud45c "uc2dc"uc7a5
+                          "ud55c"uae00 "uba85.
+                        "short_over_cls_code": "str",  # Optional.
+                          "ub2e8"uae30"uacfc"uc5f4"uad6c"ubd84"ucf54"ub4dc.
+                        "short_over_yn": "str",  # Optional.
+                          "ub2e8"uae30"uacfc"uc5f4"uc5ec"ubd80. Known values are: "Y" and "N".
+                        "sltr_yn": "str",  # Optional. "uc815"ub9ac"ub9e4"ub9e4 "uc5ec"ubd80.
+                          Known values are: "Y" and "N".
+                        "ssts_hot_yn": "str",  # Optional. "uacf5"ub9e4"ub3c4"uacfc"uc5f4
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "stange_runup_yn": "str",  # Optional.
+                          "uc774"uc0c1"uae09"ub4f1"uc5ec"ubd80. Known values are: "Y" and "N".
+                        "stck_hgpr": "str",  # Optional. "uc8fc"uc2dd "ucd5c"uace0"uac00.
+                        "stck_llam": "str",  # Optional. "uc8fc"uc2dd "ud558"ud55c"uac00.
+                        "stck_lwpr": "str",  # Optional. "uc8fc"uc2dd "ucd5c"uc800"uac00.
+                        "stck_mxpr": "str",  # Optional. "uc8fc"uc2dd "uc0c1"ud55c"uac00.
+                        "stck_oprc": "str",  # Optional. "uc8fc"uc2dd "uc2dc"uac002.
+                        "stck_prdy_clpr": "str",  # Optional. "uc8fc"uc2dd "uc804"uc77c
+                          "uc885"uac00.
+                        "stck_prpr": "str",  # Optional. "uc8fc"uc2dd "ud604"uc7ac"uac00.
+                        "stck_sdpr": "str",  # Optional. "uc8fc"uc2dd "uae30"uc900"uac00.
+                        "trht_yn": "str",  # Optional. "uac70"ub798"uc815"uc9c0 "uc5ec"ubd80.
+                          Known values are: "Y" and "N".
+                        "vi_cls_code": "str",  # Optional.
+                          VI"uc801"uc6a9"uad6c"ubd84"ucf54"ub4dc. Known values are: "Y" and "N".
+                        "vlnt_deal_cls_name": "str",  # Optional. "uc784"uc758 "ub9e4"ub9e4
+                          "uad6c"ubd84 "uba85.
+                        "vlnt_fin_cls_code": "str"  # Optional. "uc784"uc758 "uc885"ub8cc
+                          "uad6c"ubd84 "ucf54"ub4dc. Known values are: "Y" and "N".
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_price2_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_over_time_price(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHPST02300000",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 시간외 현재가 조회.
+
+        국내주식 시간외현재가 API입니다.
+
+        한국투자 HTS(eFriend Plus) > [0230] 시간외 현재가 화면의 좌측 상단기능을 API로 개발한 사항으로, 해당 화면을 참고하시면 기능을 이해하기 쉽습니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         FHPST02300000 : 국내주식 시간외 현재가. "FHPST02300000" Default value is "FHPST02300000".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN. Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output1": {
+                        "askp": "str",  # Optional. "ub9e4"ub3c4"ud638"uac00.
+                        "bidp": "str",  # Optional. "ub9e4"uc218"ud638"uac00.
+                        "bstp_kor_isnm": "str",  # Optional. "uc5c5"uc885 "ud55c"uae00
+                          "uc885"ubaa9"uba85.
+                        "crdt_able_yn": "str",  # Optional. "uc2e0"uc6a9 "uac00"ub2a5
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "flng_cls_name": "str",  # Optional. "ub77d "uad6c"ubd84
+                          "uc774"ub984.
+                        "insn_pbnt_yn": "str",  # Optional. "ubd88"uc131"uc2e4 "uacf5"uc2dc
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "mang_issu_cls_name": "str",  # Optional. "uad00"ub9ac "uc885"ubaa9
+                          "uad6c"ubd84 "uba85.
+                        "mang_issu_yn": "str",  # Optional. "uad00"ub9ac "uc885"ubaa9
+                          "uc5ec"ubd80. Known values are: "Y" and "N".
+                        "marg_rate": "str",  # Optional. "uc99d"uac70"uae08 "ube44"uc728.
+                        "mrkt_warn_cls_code": "str",  # Optional. "uc2dc"uc7a5 "uacbd"uace0
+                          "uad6c"ubd84 "ucf54"ub4dc.
+                        "mrkt_warn_cls_name": "str",  # Optional. "uc2dc"uc7a5 "uacbd"uad6c
+                          "uad6c"ubd84 "uba85.
+                        "new_lstn_cls_name": "str",  # Optional. "uc2e0"uaddc "uc0c1"uc7a5
+                          "uad6c"ubd84 "uba85.
+                        "ovtm_untp_antc_cnpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0"uac00.
+                        "ovtm_untp_antc_cnqn": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0"ub7c9.
+                        "ovtm_untp_antc_cntg_ctrt": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44"uc728.
+                        "ovtm_untp_antc_cntg_vrss": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44.
+                        "ovtm_untp_antc_cntg_vrss_sign": "str",  # Optional.
+                          "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "uc608"uc0c1 "uccb4"uacb0 "ub300"ube44
+                          "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "ovtm_untp_hgpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd5c"uace0"uac00.
+                        "ovtm_untp_llam": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ud558"ud55c"uac00.
+                        "ovtm_untp_lwpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd5c"uc800"uac00.
+                        "ovtm_untp_mxpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc0c1"ud55c"uac00.
+                        "ovtm_untp_oprc": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc2dc"uac002.
+                        "ovtm_untp_prdy_ctrt": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44"uc728.
+                        "ovtm_untp_prdy_vrss": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44.
+                        "ovtm_untp_prdy_vrss_sign": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "ub300"ube44 "ubd80"ud638  1 :
+                          "uc0c1"ud55c:code:`<br/>` 2 : "uc0c1"uc2b9:code:`<br/>` 3 :
+                          "ubcf4"ud569:code:`<br/>` 4 : "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d.
+                          Known values are: "1", "2", "3", "4", and "5".
+                        "ovtm_untp_prpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ud604"uc7ac"uac00.
+                        "ovtm_untp_sdpr": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uae30"uc900"uac00.
+                        "ovtm_untp_tr_pbmn": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "uac70"ub798 "ub300"uae08.
+                        "ovtm_untp_vol": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc804"uc77c "uac70"ub798"ub7c9.
+                        "ovtm_vi_cls_code": "str",  # Optional.
+                          "uc2dc"uac04"uc678"ub2e8"uc77c"uac00VI"uc801"uc6a9"uad6c"ubd84"ucf54"ub4dc.
+                        "revl_issu_reas_name": "str",  # Optional. "uc7ac"ud3c9"uac00
+                          "uc885"ubaa9 "uc0ac"uc720 "uba85.
+                        "rprs_mrkt_kor_name": "str",  # Optional. "ub300"ud45c "uc2dc"uc7a5
+                          "ud55c"uae00 "uba85.
+                        "sltr_yn": "str",  # Optional. "uc815"ub9ac"ub9e4"ub9e4 "uc5ec"ubd80.
+                          Known values are: "Y" and "N".
+                        "trht_yn": "str",  # Optional. "uac70"ub798"uc815"uc9c0 "uc5ec"ubd80.
+                          Known values are: "Y" and "N".
+                        "vlnt_deal_cls_name": "str"  # Optional. "uc784"uc758 "ub9e4"ub9e4
+                          "uad6c"ubd84 "uba85.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_over_time_price_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_over_time_quote(
+        self,
+        *,
+        fid_input_iscd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHPST02300400",
+        fid_cond_mrkt_div_code: str = "J",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 시간외 호가 조회.
+
+        국내주식 시간외호가 API입니다.
+
+        한국투자 HTS(eFriend Plus) > [0230] 시간외 현재가 화면의 '호가' 기능을 API로 개발한 사항으로, 해당 화면을 참고하시면 기능을 이해하기 쉽습니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         FHPST02300400 : 국내주식 시간외호가 조회. "FHPST02300400" Default value is "FHPST02300400".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 시장 분류 코드:code:`<br/>`
+         J : 주식, ETF, ETN:code:`<br/>`. Known values are: "J" and "U". Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": {
+                        "ovtm_total_askp_icdc": "str",  # Optional. "uc2dc"uac04"uc678 "ucd1d
+                          "ub9e4"ub3c4"ud638"uac00 "uc99d"uac10.
+                        "ovtm_total_askp_rsqn": "str",  # Optional. "uc2dc"uac04"uc678 "ucd1d
+                          "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9.
+                        "ovtm_total_bidp_icdc": "str",  # Optional. "uc2dc"uac04"uc678 "ucd1d
+                          "ub9e4"uc218"ud638"uac00 "uc99d"uac10.
+                        "ovtm_total_bidp_rsqn": "str",  # Optional. "uc2dc"uac04"uc678 "ucd1d
+                          "ub9e4"uc218"ud638"uac00 "uc794"ub7c9.
+                        "ovtm_untp_askp1": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac001.
+                        "ovtm_untp_askp10": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac0010.
+                        "ovtm_untp_askp2": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac002.
+                        "ovtm_untp_askp3": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac003.
+                        "ovtm_untp_askp4": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac004.
+                        "ovtm_untp_askp5": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac005.
+                        "ovtm_untp_askp6": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac006.
+                        "ovtm_untp_askp7": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac007.
+                        "ovtm_untp_askp8": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac008.
+                        "ovtm_untp_askp9": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac009.
+                        "ovtm_untp_askp_icdc1": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc99d"uac101.
+                        "ovtm_untp_askp_icdc2": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc99d"uac102.
+                        "ovtm_untp_askp_icdc3": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc99d"uac103.
+                        "ovtm_untp_askp_rsqn1": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c91.
+                        "ovtm_untp_askp_rsqn10": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c910.
+                        "ovtm_untp_askp_rsqn2": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c92.
+                        "ovtm_untp_askp_rsqn3": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c93.
+                        "ovtm_untp_askp_rsqn4": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c94.
+                        "ovtm_untp_askp_rsqn5": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c95.
+                        "ovtm_untp_askp_rsqn6": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c96.
+                        "ovtm_untp_askp_rsqn7": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c97.
+                        "ovtm_untp_askp_rsqn8": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c98.
+                        "ovtm_untp_askp_rsqn9": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c99.
+                        "ovtm_untp_bidp1": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac001.
+                        "ovtm_untp_bidp10": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac0010.
+                        "ovtm_untp_bidp2": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac002.
+                        "ovtm_untp_bidp3": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac003.
+                        "ovtm_untp_bidp4": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac004.
+                        "ovtm_untp_bidp5": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac005.
+                        "ovtm_untp_bidp6": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac006.
+                        "ovtm_untp_bidp7": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac007.
+                        "ovtm_untp_bidp8": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac008.
+                        "ovtm_untp_bidp9": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac009.
+                        "ovtm_untp_bidp_icdc1": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc99d"uac101.
+                        "ovtm_untp_bidp_icdc2": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc99d"uac102.
+                        "ovtm_untp_bidp_icdc3": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc99d"uac103.
+                        "ovtm_untp_bidp_rsqn1": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c91.
+                        "ovtm_untp_bidp_rsqn10": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c910.
+                        "ovtm_untp_bidp_rsqn2": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c92.
+                        "ovtm_untp_bidp_rsqn3": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c93.
+                        "ovtm_untp_bidp_rsqn4": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c94.
+                        "ovtm_untp_bidp_rsqn5": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c95.
+                        "ovtm_untp_bidp_rsqn6": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c96.
+                        "ovtm_untp_bidp_rsqn7": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c97.
+                        "ovtm_untp_bidp_rsqn8": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c98.
+                        "ovtm_untp_bidp_rsqn9": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ub9e4"uc218"ud638"uac00 "uc794"ub7c99.
+                        "ovtm_untp_last_hour": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd5c"uc885 "uc2dc"uac04.
+                        "ovtm_untp_ntby_bidp_rsqn": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "uc21c"ub9e4"uc218 "ud638"uac00 "uc794"ub7c9.
+                        "ovtm_untp_total_askp_rsqn": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd1d "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9.
+                        "ovtm_untp_total_askp_rsqn_icdc": "str",  # Optional.
+                          "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "ucd1d "ub9e4"ub3c4"ud638"uac00
+                          "uc99d"uac10.
+                        "ovtm_untp_total_bidp_rsqn": "str",  # Optional. "uc2dc"uac04"uc678
+                          "ub2e8"uc77c"uac00 "ucd1d "ub9e4"uc218"ud638"uac00 "uc794"ub7c9.
+                        "ovtm_untp_total_bidp_rsqn_icdc": "str",  # Optional.
+                          "uc2dc"uac04"uc678 "ub2e8"uc77c"uac00 "ucd1d "ub9e4"uc218"ud638"uac00
+                          "uc99d"uac10.
+                        "total_askp_rsqn": "str",  # Optional. "ucd1d
+                          "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9.
+                        "total_askp_rsqn_icdc": "str",  # Optional. "ucd1d
+                          "ub9e4"ub3c4"ud638"uac00 "uc794"ub7c9 "uc99d"uac10.
+                        "total_bidp_rsqn": "str",  # Optional. "ucd1d
+                          "ub9e4"uc218"ud638"uac00 "uc794"ub7c9.
+                        "total_bidp_rsqn_icdc": "str"  # Optional. "ucd1d
+                          "ub9e4"uc218"ud638"uac00 "uc794"ub7c9 "uc99d"uac10.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_over_time_quote_request(
+            fid_input_iscd=fid_input_iscd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_closing_expected_conclusion(  # pylint: disable=name-too-long
+        self,
+        *,
+        fid_rank_sort_cls_code: str = "0",
+        fid_input_iscd: str = "0",
+        fid_blng_cls_code: str = "0",
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST117300C0",
+        fid_cond_mrkt_div_code: str = "J",
+        fid_cond_scr_div_code: str = "11173",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 장마감 예상체결가 조회.
+
+        국내주식 장마감 예상체결가 API입니다.
+
+        한국투자 HTS(eFriend Plus) > [0183] 장마감 예상체결가 화면의 기능을 API로 개발한 사항으로, 해당 화면을 참고하시면 기능을 이해하기 쉽습니다.
+
+        :keyword fid_rank_sort_cls_code: 순위 정렬 구분 코드
+
+         0:전체:code:`<br/>`
+         1:상한가마감예상:code:`<br/>`
+         2:하한가마감예상:code:`<br/>`
+         3:직전대비상승률상위:code:`<br/>`
+         4:직전대비하락률상위. Known values are: "0", "1", "2", "3", and "4". Required. Default value is "0".
+        :paramtype fid_rank_sort_cls_code: str
+        :keyword fid_input_iscd: 종목코드
+
+         0000:전체:code:`<br/>`
+         0001:거래소:code:`<br/>`
+         1001:코스닥:code:`<br/>`
+         2001:코스피200:code:`<br/>`
+         4001: KRX100. Known values are: "0000", "0001", "1001", "2001", and "4001". Required. Default
+         value is "0".
+        :paramtype fid_input_iscd: str
+        :keyword fid_blng_cls_code: 소속 구분 코드
+
+         0:전체:code:`<br/>`
+         1:종가범위연장. Known values are: "0" and "1". Required. Default value is "0".
+        :paramtype fid_blng_cls_code: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         FHKST117300C0 : 국내주식 장마감 예상체결가 조회. "FHKST117300C0" Default value is "FHKST117300C0".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: FID 조건 시장 분류 코드
+
+         J : 주식. "J" Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :keyword fid_cond_scr_div_code: FID 조건 화면 구분 코드:code:`<br/>`
+         Unique key(11173). "11173" Default value is "11173".
+        :paramtype fid_cond_scr_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "cntg_vol": "str",  # Optional. "uccb4"uacb0
+                              "uac70"ub798"ub7c9.
+                            "hts_kor_isnm": "str",  # Optional. HTS "ud55c"uae00
+                              "uc885"ubaa9"uba85.
+                            "prdy_ctrt": "str",  # Optional. "uc804"uc77c
+                              "ub300"ube44"uc728.
+                            "prdy_vrss": "str",  # Optional. "uc804"uc77c "ub300"ube44.
+                            "prdy_vrss_sign": "str",  # Optional. "uc804"uc77c
+                              "ub300"ube44 "ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                              "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                              "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2",
+                              "3", "4", and "5".
+                            "sdpr_vrss_prpr": "str",  # Optional. "uae30"uc900"uac00
+                              "ub300"ube44 "ud604"uc7ac"uac00.
+                            "sdpr_vrss_prpr_rate": "str",  # Optional. "uae30"uc900"uac00
+                              "ub300"ube44 "ud604"uc7ac"uac00 "ube44"uc728.
+                            "stck_prpr": "str",  # Optional. "uc8fc"uc2dd
+                              "ud604"uc7ac"uac00.
+                            "stck_shrn_iscd": "str"  # Optional. "uc8fc"uc2dd
+                              "ub2e8"ucd95 "uc885"ubaa9"ucf54"ub4dc.
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = (
+            build_gen_open_kis_get_domestic_stock_closing_expected_conclusion_request(
+                fid_rank_sort_cls_code=fid_rank_sort_cls_code,
+                fid_input_iscd=fid_input_iscd,
+                fid_blng_cls_code=fid_blng_cls_code,
+                personalseckey=personalseckey,
+                tr_cont=tr_cont,
+                custtype=custtype,
+                seq_no=seq_no,
+                mac_address=mac_address,
+                phone_number=phone_number,
+                ip_address=ip_address,
+                hashkey=hashkey,
+                gt_uid=gt_uid,
+                tr_id=tr_id,
+                fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+                fid_cond_scr_div_code=fid_cond_scr_div_code,
+                headers=_headers,
+                params=_params,
+            )
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_vi_status(
+        self,
+        *,
+        fid_input_iscd: str,
+        fid_div_cls_code: str = "0",
+        fid_mrkt_cls_code: str = "0",
+        fid_rank_sort_cls_code: str = "0",
+        fid_input_date1: str,
+        fid_trgt_cls_code: str,
+        fid_trgt_exls_cls_code: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHPST01390000",
+        fid_cond_scr_div_code: str = "20139",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 변동성완화장치(VI) 현황.
+
+        HTS(eFriend Plus) [0139] 변동성 완화장치(VI) 현황 데이터를 확인할 수 있는 API입니다.
+
+        최근 30건까지 확인 가능합니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword fid_div_cls_code: FID 분류 구분 코드
+
+         0: 전체:code:`<br/>`
+         1: 상승:code:`<br/>`
+         2: 하락. Known values are: "0", "1", and "2". Required. Default value is "0".
+        :paramtype fid_div_cls_code: str
+        :keyword fid_mrkt_cls_code: FID 시장 구분 코드
+
+         0: 전체:code:`<br/>`
+         1: 거래소:code:`<br/>`
+         2: 코스닥. Known values are: "0", "1", and "2". Required. Default value is "0".
+        :paramtype fid_mrkt_cls_code: str
+        :keyword fid_rank_sort_cls_code: FID 순위 정렬 구분 코드
+
+         0: 전체:code:`<br/>`
+         1: 정적:code:`<br/>`
+         2: 동적:code:`<br/>`
+         3: 정적&동적. Known values are: "0", "1", "2", and "3". Required. Default value is "0".
+        :paramtype fid_rank_sort_cls_code: str
+        :keyword fid_input_date1: FID 입력일자
+
+         YYYYMMDD. Required.
+        :paramtype fid_input_date1: str
+        :keyword fid_trgt_cls_code: FID 대상 구분 코드. Required.
+        :paramtype fid_trgt_cls_code: str
+        :keyword fid_trgt_exls_cls_code: FID 대상 제외 구분 코드. Required.
+        :paramtype fid_trgt_exls_cls_code: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         FHPST01390000 : 변동성완화장치(VI) 현황. "FHPST01390000" Default value is "FHPST01390000".
+        :paramtype tr_id: str
+        :keyword fid_cond_scr_div_code: FID 조건 화면 구분 코드:code:`<br/>`
+         Unique key(20139). "20139" Default value is "20139".
+        :paramtype fid_cond_scr_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "bsop_date": "str",  # Optional. "uc601"uc5c5 "uc77c"uc790.
+                            "cntg_vi_hour": "str",  # Optional.
+                              VI"ubc1c"ub3d9"uc2dc"uac04.
+                            "hts_kor_isnm": "str",  # Optional. HTS "ud55c"uae00
+                              "uc885"ubaa9"uba85.
+                            "mksc_shrn_iscd": "str",  # Optional.
+                              "uc720"uac00"uc99d"uad8c "ub2e8"ucd95 "uc885"ubaa9"ucf54"ub4dc.
+                            "vi_cls_code": "str",  # Optional.
+                              VI"ubc1c"ub3d9"uc0c1"ud0dc:code:`<br/>` Y: "ubc1c"ub3d9 / N:
+                              "ud574"uc81c. Known values are: "Y" and "N".
+                            "vi_cncl_hour": "str",  # Optional.
+                              VI"ud574"uc81c"uc2dc"uac04.
+                            "vi_count": "str",  # Optional. VI"ubc1c"ub3d9"ud69f"uc218.
+                            "vi_dmc_dprt": "str",  # Optional.
+                              "ub3d9"uc801VI"ubc1c"ub3d9"uad34"ub9ac"uc728.
+                            "vi_dmc_stnd_prc": "str",  # Optional.
+                              "ub3d9"uc801VI"ubc1c"ub3d9"uae30"uc900"uac00"uaca9.
+                            "vi_dprt": "str",  # Optional.
+                              "uc815"uc801VI"ubc1c"ub3d9"uad34"ub9ac"uc728.
+                            "vi_kind_code": "str",  # Optional.
+                              VI"uc885"ub958"ucf54"ub4dc  1:"uc815"uc801:code:`<br/>`
+                              2:"ub3d9"uc801:code:`<br/>` 3:"uc815"uc801&"ub3d9"uc801. Known values
+                              are: "1", "2", and "3".
+                            "vi_prc": "str",  # Optional. VI"ubc1c"ub3d9"uac00"uaca9.
+                            "vi_stnd_prc": "str"  # Optional.
+                              "uc815"uc801VI"ubc1c"ub3d9"uae30"uc900"uac00"uaca9.
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_vi_status_request(
+            fid_input_iscd=fid_input_iscd,
+            fid_div_cls_code=fid_div_cls_code,
+            fid_mrkt_cls_code=fid_mrkt_cls_code,
+            fid_rank_sort_cls_code=fid_rank_sort_cls_code,
+            fid_input_date1=fid_input_date1,
+            fid_trgt_cls_code=fid_trgt_cls_code,
+            fid_trgt_exls_cls_code=fid_trgt_exls_cls_code,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_scr_div_code=fid_cond_scr_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_invest_opinion(
+        self,
+        *,
+        fid_input_iscd: str,
+        fid_input_date1: str,
+        fid_input_date2: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST663300C0",
+        fid_cond_mrkt_div_code: str = "J",
+        fid_cond_scr_div_code: str = "16633",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 종목투자의견.
+
+        국내주식 종목투자의견 API입니다.
+
+        한국투자 HTS(eFriend Plus) > [0605] 종목투자의견 화면 의 기능을 API로 개발한 사항으로, 해당 화면을 참고하시면 기능을 이해하기 쉽습니다.
+
+        한 번의 호출에 100건까지 조회가 가능하기에, 일자 파라미터(FID_INPUT_DATE_1, FID_INPUT_DATE_2)를 조절하여 다음 데이터 조회하시기 바랍니다.
+
+        :keyword fid_input_iscd: FID 조건 종목코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype fid_input_iscd: str
+        :keyword fid_input_date1: 입력날짜1:code:`<br/>`
+         이후 ~(ex) 20231113. Required.
+        :paramtype fid_input_date1: str
+        :keyword fid_input_date2: 입력날짜2:code:`<br/>`
+         ~ 이전(ex) 20240513. Required.
+        :paramtype fid_input_date2: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         FHKST663300C0 : 국내주식 종목투자의견. "FHKST663300C0" Default value is "FHKST663300C0".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 조건시장분류코드:code:`<br/>`
+         J : 주식. "J" Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :keyword fid_cond_scr_div_code: 조건화면분류코드:code:`<br/>`
+         16633 : Primary key. "16633" Default value is "16633".
+        :paramtype fid_cond_scr_div_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "dprt": "str",  # Optional. "uad34"ub9ac"uc728.
+                            "hts_goal_prc": "str",  # Optional.
+                              HTS"ubaa9"ud45c"uac00"uaca9.
+                            "invt_opnn": "str",  # Optional. "ud22c"uc790"uc758"uacac.
+                            "invt_opnn_cls_code": "str",  # Optional.
+                              "ud22c"uc790"uc758"uacac"uad6c"ubd84"ucf54"ub4dc.
+                            "mbcr_name": "str",  # Optional. "ud68c"uc6d0"uc0ac"uba85.
+                            "nday_dprt": "str",  # Optional. N"uc77c"uad34"ub9ac"uc728.
+                            "rgbf_invt_opnn": "str",  # Optional.
+                              "uc9c1"uc804"ud22c"uc790"uc758"uacac.
+                            "rgbf_invt_opnn_cls_code": "str",  # Optional.
+                              "uc9c1"uc804"ud22c"uc790"uc758"uacac"uad6c"ubd84"ucf54"ub4dc.
+                            "stck_bsop_date": "str",  # Optional.
+                              "uc8fc"uc2dd"uc601"uc5c5"uc77c"uc790.
+                            "stck_nday_esdg": "str",  # Optional.
+                              "uc8fc"uc2ddN"uc77c"uad34"ub9ac"ub3c4.
+                            "stck_prdy_clpr": "str",  # Optional.
+                              "uc8fc"uc2dd"uc804"uc77c"uc885"uac00.
+                            "stft_esdg": "str"  # Optional.
+                              "uc8fc"uc2dd"uc120"ubb3c"uad34"ub9ac"ub3c4.
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_invest_opinion_request(
+            fid_input_iscd=fid_input_iscd,
+            fid_input_date1=fid_input_date1,
+            fid_input_date2=fid_input_date2,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            fid_cond_scr_div_code=fid_cond_scr_div_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def get_domestic_stock_securities_opinion(
+        self,
+        *,
+        fid_input_iscd: str,
+        fid_input_date1: str,
+        fid_input_date2: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "FHKST663400C0",
+        fid_cond_mrkt_div_code: str = "J",
+        fid_cond_scr_div_code: str = "16634",
+        fid_div_cls_code: str = "0",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 증권사별 투자의견.
+
+        국내주식 증권사별 투자의견 API입니다.
+
+        한국투자 HTS(eFriend Plus) > [0608] 증권사별 투자의견 화면 의 기능을 API로 개발한 사항으로, 해당 화면을 참고하시면 기능을 이해하기 쉽습니다.
+
+        한 번의 호출에 20건까지 조회가 가능하기에, 일자 파라미터(FID_INPUT_DATE_1, FID_INPUT_DATE_2)를 조절하여 다음 데이터 조회하시기 바랍니다.
+
+        :keyword fid_input_iscd: 입력종목코드
+
+         회원사코드 (kis developers 포탈 사이트 포럼-> FAQ -> 종목정보 다운로드(국내) 참조). Required.
+        :paramtype fid_input_iscd: str
+        :keyword fid_input_date1: 입력날짜1
+
+         이후 ~. Required.
+        :paramtype fid_input_date1: str
+        :keyword fid_input_date2: 입력날짜2
+
+         ~ 이전. Required.
+        :paramtype fid_input_date2: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         FHKST663400C0 : 국내주식 증권사별 투자의견. "FHKST663400C0" Default value is "FHKST663400C0".
+        :paramtype tr_id: str
+        :keyword fid_cond_mrkt_div_code: 조건시장분류코드
+
+         J(시장 구분 코드). "J" Default value is "J".
+        :paramtype fid_cond_mrkt_div_code: str
+        :keyword fid_cond_scr_div_code: 조건화면분류코드
+
+         16634(Primary key). "16634" Default value is "16634".
+        :paramtype fid_cond_scr_div_code: str
+        :keyword fid_div_cls_code: 분류구분코드
+
+         전체(0) 매수(1) 중립(2) 매도(3). Known values are: "0", "1", "2", and "3". Default value is "0".
+        :paramtype fid_div_cls_code: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "dprt": "str",  # Optional. "uad34"ub9ac"uc728.
+                            "hts_goal_prc": "str",  # Optional.
+                              HTS"ubaa9"ud45c"uac00"uaca9.
+                            "hts_kor_isnm": "str",  # Optional.
+                              HTS"ud55c"uae00"uc885"ubaa9"uba85.
+                            "invt_opnn": "str",  # Optional. "ud22c"uc790"uc758"uacac.
+                            "invt_opnn_cls_code": "str",  # Optional.
+                              "ud22c"uc790"uc758"uacac"uad6c"ubd84"ucf54"ub4dc.
+                            "mbcr_name": "str",  # Optional. "ud68c"uc6d0"uc0ac"uba85.
+                            "prdy_ctrt": "str",  # Optional.
+                              "uc804"uc77c"ub300"ube44"uc728.
+                            "prdy_vrss": "str",  # Optional. "uc804"uc77c"ub300"ube44.
+                            "prdy_vrss_sign": "str",  # Optional.
+                              "uc804"uc77c"ub300"ube44"ubd80"ud638  1 : "uc0c1"ud55c:code:`<br/>` 2 :
+                              "uc0c1"uc2b9:code:`<br/>` 3 : "ubcf4"ud569:code:`<br/>` 4 :
+                              "ud558"ud55c:code:`<br/>` 5 : "ud558"ub77d. Known values are: "1", "2",
+                              "3", "4", and "5".
+                            "rgbf_invt_opnn": "str",  # Optional.
+                              "uc9c1"uc804"ud22c"uc790"uc758"uacac.
+                            "rgbf_invt_opnn_cls_code": "str",  # Optional.
+                              "uc9c1"uc804"ud22c"uc790"uc758"uacac"uad6c"ubd84"ucf54"ub4dc.
+                            "stck_bsop_date": "str",  # Optional.
+                              "uc8fc"uc2dd"uc601"uc5c5"uc77c"uc790.
+                            "stck_prdy_clpr": "str",  # Optional.
+                              "uc8fc"uc2dd"uc804"uc77c"uc885"uac00.
+                            "stck_prpr": "str",  # Optional.
+                              "uc8fc"uc2dd"ud604"uc7ac"uac00.
+                            "stck_shrn_iscd": "str",  # Optional.
+                              "uc8fc"uc2dd"ub2e8"ucd95"uc885"ubaa9"ucf54"ub4dc.
+                            "stft_esdg": "str"  # Optional.
+                              "uc8fc"uc2dd"uc120"ubb3c"uad34"ub9ac"ub3c4.
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_get_domestic_stock_securities_opinion_request(
+            fid_input_iscd=fid_input_iscd,
+            fid_input_date1=fid_input_date1,
+            fid_input_date2=fid_input_date2,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            fid_cond_scr_div_code=fid_cond_scr_div_code,
+            fid_div_cls_code=fid_div_cls_code,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def check_domestic_holiday(
+        self,
+        *,
+        bass_dt: str,
+        ctx_area_nk: str = "",
+        ctx_area_fk: str = "",
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "CTCA0903R",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내 휴장일 확인.
+
+        국내휴장일조회 API입니다.
+
+        영업일, 거래일, 개장일, 결제일 여부를 조회할 수 있습니다.:code:`<br/>`
+        주문을 넣을 수 있는지 확인하고자 하실 경우 개장일여부(opnd_yn)을 사용하시면 됩니다.
+
+        :keyword bass_dt: 기준일자
+
+         기준일자(YYYYMMDD). Required.
+        :paramtype bass_dt: str
+        :keyword ctx_area_nk: 연속조회키. Required. Default value is "".
+        :paramtype ctx_area_nk: str
+        :keyword ctx_area_fk: 연속조회검색조건. Required. Default value is "".
+        :paramtype ctx_area_fk: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         CTCA0903R : 주식현재가 시간외일자별체결. "CTCA0903R" Default value is "CTCA0903R".
+        :paramtype tr_id: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "ctx_area_fk": "str",  # Optional.
+                      "uc5f0"uc18d"uc870"ud68c"uac80"uc0c9"uc870"uac74.
+                    "ctx_area_nk": "str",  # Optional. "uc5f0"uc18d"uc870"ud68c"ud0a4.
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "bass_dt": "str",  # Optional.
+                              "uae30"uc900"uc77c"uc790(YYYYMMDD).
+                            "bzdy_yn": "str",  # Optional.
+                              "uc601"uc5c5"uc77c"uc5ec"ubd80:code:`<br/>`
+                              "uae08"uc735"uae30"uad00"uc774 "uc5c5"ubb34"ub97c "ud558"ub294 "ub0a0.
+                              Known values are: "Y" and "N".
+                            "opnd_yn": "str",  # Optional.
+                              "uac1c"uc7a5"uc77c"uc5ec"ubd80:code:`<br/>`
+                              "uc8fc"uc2dd"uc2dc"uc7a5"uc774 "uac1c"uc7a5"ub418"ub294
+                              "ub0a0:code:`<br/>`   * "uc8fc"ubb38"uc744 "ub123"uace0"uc790 "ud560
+                              "uacbd"uc6b0 "uac1c"uc7a5"uc77c"uc5ec"ubd80(opnd_yn)"ub97c "uc0ac"uc6a9.
+                              Known values are: "Y" and "N".
+                            "sttl_day_yn": "str",  # Optional.
+                              "uacb0"uc81c"uc77c"uc5ec"ubd80:code:`<br/>` "uc8fc"uc2dd
+                              "uac70"ub798"uc5d0"uc11c "uc2e4"uc81c"ub85c "uc8fc"uc2dd"uc744
+                              "uc778"uc218"ud558"uace0 "ub3c8"uc744 "uc9c0"ubd88"ud558"ub294 "ub0a0.
+                              Known values are: "Y" and "N".
+                            "tr_day_yn": "str",  # Optional.
+                              "uac70"ub798"uc77c"uc5ec"ubd80:code:`<br/>` "uc99d"uad8c
+                              "uc5c5"ubb34"uac00 "uac00"ub2a5"ud55c "ub0a0("uc785"ucd9c"uae08,
+                              "uc774"uccb4 "ub4f1"uc758 "uc5c5"ubb34 "ud3ec"ud568). Known values are:
+                              "Y" and "N".
+                            "wday_dvsn_cd": "str"  # Optional.
+                              "uc694"uc77c"uad6c"ubd84"ucf54"ub4dc  01:"uc77c"uc694"uc77c:code:`<br/>`
+                              02:"uc6d4"uc694"uc77c:code:`<br/>` 03:"ud654"uc694"uc77c:code:`<br/>`
+                              04:"uc218"uc694"uc77c:code:`<br/>` 05:"ubaa9"uc694"uc77c:code:`<br/>`
+                              06:"uae08"uc694"uc77c:code:`<br/>` 07:"ud1a0"uc694"uc77c. Known values
+                              are: "01", "02", "03", "04", "05", "06", and "07".
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_check_domestic_holiday_request(
+            bass_dt=bass_dt,
+            ctx_area_nk=ctx_area_nk,
+            ctx_area_fk=ctx_area_fk,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def search_product_info(
+        self,
+        *,
+        pdno: str,
+        prdt_type_cd: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "CTPF1604R",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """상품기본조회.
+
+        국내주식뿐 아니라 선물, 채권, 해외주식의 기본 정보를 조회하는 API 입니다.
+
+        :keyword pdno: 상품번호
+
+         주식(하이닉스) : 000660 (코드 : 300)
+         선물(101S12) : KR4101SC0009 (코드 : 301)
+         미국(AAPL) : AAPL (코드 : 512). Required.
+        :paramtype pdno: str
+        :keyword prdt_type_cd: 상품유형코드
+
+         300 주식
+         301 선물옵션
+         302 채권
+         512 미국 나스닥 / 513 미국 뉴욕 / 529 미국 아멕스
+         515 일본
+         501 홍콩 / 543 홍콩CNY / 558 홍콩USD
+         507 베트남 하노이 / 508 베트남 호치민
+         551 중국 상해A / 552 중국 심천A. Known values are: "300", "301", "302", "512", "513", "529", "515",
+         "501", "543", "558", "507", "508", "551", and "552". Required.
+        :paramtype prdt_type_cd: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         CTPF1604R : 주식현재가 시간외일자별체결. "CTPF1604R" Default value is "CTPF1604R".
+        :paramtype tr_id: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": {
+                        "frst_erlm_dt": "str",  # Optional.
+                          "ucd5c"ucd08"ub4f1"ub85d"uc77c"uc790.
+                        "ivst_prdt_type_cd": "str",  # Optional.
+                          "ud22c"uc790"uc0c1"ud488"uc720"ud615"ucf54"ub4dc.
+                        "ivst_prdt_type_cd_name": "str",  # Optional.
+                          "ud22c"uc790"uc0c1"ud488"uc720"ud615"ucf54"ub4dc"uba85.
+                        "pdno": "str",  # Optional. "uc0c1"ud488"ubc88"ud638.
+                        "prdt_abrv_name": "str",  # Optional. "uc0c1"ud488"uc57d"uc5b4"uba85.
+                        "prdt_clsf_cd": "str",  # Optional.
+                          "uc0c1"ud488"ubd84"ub958"ucf54"ub4dc.
+                        "prdt_clsf_name": "str",  # Optional. "uc0c1"ud488"ubd84"ub958"uba85.
+                        "prdt_eng_abrv_name": "str",  # Optional.
+                          "uc0c1"ud488"uc601"ubb38"uc57d"uc5b4"uba85.
+                        "prdt_eng_name": "str",  # Optional. "uc0c1"ud488"uc601"ubb38"uba85.
+                        "prdt_eng_name120": "str",  # Optional.
+                          "uc0c1"ud488"uc601"ubb38"uba85120.
+                        "prdt_name": "str",  # Optional. "uc0c1"ud488"uba85.
+                        "prdt_name120": "str",  # Optional. "uc0c1"ud488"uba85120.
+                        "prdt_risk_grad_cd": "str",  # Optional.
+                          "uc0c1"ud488"uc704"ud5d8"ub4f1"uae09"ucf54"ub4dc.
+                        "prdt_sale_stat_cd": "str",  # Optional.
+                          "uc0c1"ud488"ud310"ub9e4"uc0c1"ud0dc"ucf54"ub4dc.
+                        "prdt_type_cd": "str",  # Optional.
+                          "uc0c1"ud488"uc720"ud615"ucf54"ub4dc.
+                        "sale_end_dt": "str",  # Optional.
+                          "ud310"ub9e4"uc885"ub8cc"uc77c"uc790.
+                        "sale_strt_dt": "str",  # Optional.
+                          "ud310"ub9e4"uc2dc"uc791"uc77c"uc790.
+                        "shtn_pdno": "str",  # Optional.
+                          "ub2e8"ucd95"uc0c1"ud488"ubc88"ud638.
+                        "std_pdno": "str",  # Optional. "ud45c"uc900"uc0c1"ud488"ubc88"ud638.
+                        "wrap_asst_type_cd": "str"  # Optional.
+                          "ub7a9"uc5b4"uce74"uc6b4"ud2b8"uc790"uc0b0"uc720"ud615"ucf54"ub4dc.
+                    },
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_search_product_info_request(
+            pdno=pdno,
+            prdt_type_cd=prdt_type_cd,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
+
+    @distributed_trace
+    def search_stock_info(
+        self,
+        *,
+        prdt_type_cd: str,
+        pdno: str,
+        personalseckey: Optional[str] = None,
+        tr_cont: str = "",
+        custtype: str = "P",
+        seq_no: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        hashkey: Optional[str] = None,
+        gt_uid: Optional[str] = None,
+        tr_id: str = "CTPF1002R",
+        **kwargs: Any,
+    ) -> JSON:
+        # pylint: disable=line-too-long
+        """국내주식 기본조회.
+
+        주식기본조회 API입니다.
+
+        국내주식 종목의 종목상세정보를 확인할 수 있습니다.
+
+        :keyword prdt_type_cd: 상품유형코드
+
+         300: 주식, ETF, ETN, ELW:code:`<br/>`
+         301 : 선물옵션:code:`<br/>`
+         302 : 채권:code:`<br/>`
+         306 : ELS. Known values are: "300", "301", "302", and "306". Required.
+        :paramtype prdt_type_cd: str
+        :keyword pdno: 상품코드
+
+         종목번호 (6자리):code:`<br/>`
+         ETN의 경우, Q로 시작 (EX. Q500001). Required.
+        :paramtype pdno: str
+        :keyword personalseckey: 고객 식별키
+
+         [법인 필수] 제휴사 회원 관리를 위한 고객식별키. Default value is None.
+        :paramtype personalseckey: str
+        :keyword tr_cont: 연속 거래 여부
+
+         공백 : 초기 조회:code:`<br/>`
+         N: 다음 데이터 조회 (output header의 tr_cont가 M일 경우). Default value is "".
+        :paramtype tr_cont: str
+        :keyword custtype: 고객타입
+
+         B : 법인:code:`<br/>`
+         P : 개인. Known values are: "B" and "P". Default value is "P".
+        :paramtype custtype: str
+        :keyword seq_no: 일련번호
+
+         [법인 필수] 001. Default value is None.
+        :paramtype seq_no: str
+        :keyword mac_address: 맥주소
+
+         법인고객 혹은 개인고객의 Mac address 값. Default value is None.
+        :paramtype mac_address: str
+        :keyword phone_number: 핸드폰번호
+
+         [법인 필수] 제휴사APP을 사용하는 경우 사용자(회원) 핸드폰번호:code:`<br/>`
+         ex) 01011112222 (하이픈 등 구분값 제거). Default value is None.
+        :paramtype phone_number: str
+        :keyword ip_address: 접속 단말 공인 IP
+
+         [법인 필수] 사용자(회원)의 IP Address. Default value is None.
+        :paramtype ip_address: str
+        :keyword hashkey: 해쉬키
+
+         [POST API 대상] Client가 요청하는 Request Body를 hashkey api로 생성한 Hash값:code:`<br/>`
+
+
+         * API문서 > hashkey 참조. Default value is None.
+        :paramtype hashkey: str
+        :keyword gt_uid: Global UID
+
+         [법인 필수] 거래고유번호로 사용하므로 거래별로 UNIQUE해야 함. Default value is None.
+        :paramtype gt_uid: str
+        :keyword tr_id: 거래ID
+
+         모의투자 미지원:code:`<br/>`
+         CTPF1002R : 국내주식 종목투자의견. "CTPF1002R" Default value is "CTPF1002R".
+        :paramtype tr_id: str
+        :return: JSON object
+        :rtype: JSON
+        :raises ~azure.core.exceptions.HttpResponseError:
+
+        Example:
+            .. code-block:: python
+
+                # response body for status code(s): 200
+                response == {
+                    "msg1": "str",  # Optional. "uc751"ub2f5"uba54"uc2dc"uc9c0.
+                    "msg_cd": "str",  # Optional. "uc751"ub2f5"ucf54"ub4dc.
+                    "output": [
+                        {
+                            "dprt": "str",  # Optional. "uad34"ub9ac"uc728.
+                            "hts_goal_prc": "str",  # Optional.
+                              HTS"ubaa9"ud45c"uac00"uaca9.
+                            "invt_opnn": "str",  # Optional. "ud22c"uc790"uc758"uacac.
+                            "invt_opnn_cls_code": "str",  # Optional.
+                              "ud22c"uc790"uc758"uacac"uad6c"ubd84"ucf54"ub4dc.
+                            "mbcr_name": "str",  # Optional. "ud68c"uc6d0"uc0ac"uba85.
+                            "nday_dprt": "str",  # Optional. N"uc77c"uad34"ub9ac"uc728.
+                            "rgbf_invt_opnn": "str",  # Optional.
+                              "uc9c1"uc804"ud22c"uc790"uc758"uacac.
+                            "rgbf_invt_opnn_cls_code": "str",  # Optional.
+                              "uc9c1"uc804"ud22c"uc790"uc758"uacac"uad6c"ubd84"ucf54"ub4dc.
+                            "stck_bsop_date": "str",  # Optional.
+                              "uc8fc"uc2dd"uc601"uc5c5"uc77c"uc790.
+                            "stck_nday_esdg": "str",  # Optional.
+                              "uc8fc"uc2ddN"uc77c"uad34"ub9ac"ub3c4.
+                            "stck_prdy_clpr": "str",  # Optional.
+                              "uc8fc"uc2dd"uc804"uc77c"uc885"uac00.
+                            "stft_esdg": "str"  # Optional.
+                              "uc8fc"uc2dd"uc120"ubb3c"uad34"ub9ac"ub3c4.
+                        }
+                    ],
+                    "rt_cd": "str"  # Optional. "uc131"uacf5 "uc2e4"ud328 "uc5ec"ubd80  0:
+                      "uc131"uacf5:code:`<br/>` 0 "uc774"uc678"uc758 "uac12: "uc2e4"ud328.
+                }
+        """
+        error_map: MutableMapping[int, Type[HttpResponseError]] = {
+            401: ClientAuthenticationError,
+            404: ResourceNotFoundError,
+            409: ResourceExistsError,
+            304: ResourceNotModifiedError,
+        }
+        error_map.update(kwargs.pop("error_map", {}) or {})
+
+        _headers = kwargs.pop("headers", {}) or {}
+        _params = kwargs.pop("params", {}) or {}
+
+        cls: ClsType[JSON] = kwargs.pop("cls", None)
+
+        _request = build_gen_open_kis_search_stock_info_request(
+            prdt_type_cd=prdt_type_cd,
+            pdno=pdno,
+            personalseckey=personalseckey,
+            tr_cont=tr_cont,
+            custtype=custtype,
+            seq_no=seq_no,
+            mac_address=mac_address,
+            phone_number=phone_number,
+            ip_address=ip_address,
+            hashkey=hashkey,
+            gt_uid=gt_uid,
+            tr_id=tr_id,
+            headers=_headers,
+            params=_params,
+        )
+        _request.url = self._client.format_url(_request.url)
+
+        _stream = False
+        pipeline_response: PipelineResponse = (
+            self._client._pipeline.run(  # pylint: disable=protected-access
+                _request, stream=_stream, **kwargs
+            )
+        )
+
+        response = pipeline_response.http_response
+
+        if response.status_code not in [200]:
+            if _stream:
+                response.read()  # Load the body in memory and close the socket
+            map_error(
+                status_code=response.status_code, response=response, error_map=error_map
+            )
+            raise HttpResponseError(response=response)
+
+        response_headers = {}
+        response_headers["content-type"] = self._deserialize(
+            "str", response.headers.get("content-type")
+        )
+        response_headers["tr_id"] = self._deserialize(
+            "str", response.headers.get("tr_id")
+        )
+        response_headers["tr_cont"] = self._deserialize(
+            "str", response.headers.get("tr_cont")
+        )
+        response_headers["gt_uid"] = self._deserialize(
+            "str", response.headers.get("gt_uid")
+        )
+
+        if response.content:
+            deserialized = response.json()
+        else:
+            deserialized = None
+
+        if cls:
+            return cls(pipeline_response, cast(JSON, deserialized), response_headers)  # type: ignore
+
+        return cast(JSON, deserialized)  # type: ignore
@@ -0,0 +1,276 @@
+"""KIS 연속조회 API paging
+
+연속조회를 지원하는 API는 응답 header의 tr_cont가 M(또는 F)이면 다음 데이터가 있다는 뜻이고,
+요청 header의 tr_cont에 N을 넣어 다음 데이터를 조회한다.
+operation(client의 bound method)을 넘기면 tr_cont가 더 이상 M/F가 아닐 때까지 반복해서 호출한다.
+"""
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+JSON = MutableMapping[str, Any]
+# cls=_body_and_headers로 호출한 operation의 반환값: (응답 body, 응답 header)
+Page = Tuple[JSON, Dict[str, Any]]
+
+# 응답 header tr_cont 값. M, F: 다음 데이터 있음, D, E: 마지막 데이터
+TR_CONT_HAS_NEXT = ("M", "F")
+TR_CONT_NEXT = "N"
+
+
+def _body_and_headers(_, body: JSON, headers: Dict[str, Any]) -> Page:
+    return body, headers
+
+
+def has_next_page(headers: Dict[str, Any]) -> bool:
+    """응답 header의 tr_cont로 다음 데이터가 있는지 판단한다."""
+    return (headers.get("tr_cont") or "").strip() in TR_CONT_HAS_NEXT
+
+
+def extract_rows(
+    page: Optional[Mapping[str, Any]], output_key: str = "output"
+) -> List[Any]:
+    """응답 body의 output_key 값을 row 목록으로 변환한다. dict 하나면 row 한 개로 본다."""
+    if not page:
+        return []
+    rows = page.get(output_key)
+    if rows is None:
+        return []
+    return rows if isinstance(rows, list) else [rows]
+
+
+def iter_tr_cont_pages(
+    operation: Callable[..., Any],
+    *args: Any,
+    max_pages: Optional[int] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    **kwargs: Any,
+) -> Iterator[JSON]:
+    """
+    tr_cont 연속조회로 모든 page를 순서대로 반환한다.
+
+    Args:
+        operation (Callable[..., Any]): client의 조회 method (예: client.get_domestic_stock_investor)
+        max_pages (Optional[int]): 최대 조회 page 수
+        params (Optional[Mapping[str, Any]]): operation에 넘길 parameter. 이름이 max_pages처럼
+            이 함수의 인자와 겹쳐도 operation에 넘어간다.
+        kwargs: operation에 넘길 parameter
+
+    Example:
+        .. code-block:: python
+
+            for page in iter_tr_cont_pages(client.get_domestic_stock_investor, fid_input_iscd="005930"):
+                ...
+    """
+    kwargs = {**(params or {}), **kwargs}
+    tr_cont = kwargs.pop("tr_cont", "")
+    page_count = 0
+    while max_pages is None or page_count < max_pages:
+        page: Page = operation(*args, tr_cont=tr_cont, cls=_body_and_headers, **kwargs)
+        body, headers = page
+        page_count += 1
+        yield body
+
+        if not has_next_page(headers):
+            return
+        tr_cont = TR_CONT_NEXT
+
+
+def iter_tr_cont_rows(
+    operation: Callable[..., Any],
+    *args: Any,
+    output_key: str = "output",
+    max_pages: Optional[int] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """iter_tr_cont_pages()로 조회한 page의 output_key row를 하나씩 반환한다."""
+    for page in iter_tr_cont_pages(
+        operation, *args, max_pages=max_pages, params=params, **kwargs
+    ):
+        yield from extract_rows(page, output_key)
+
+
+async def aiter_tr_cont_pages(
+    operation: Callable[..., Awaitable[Any]],
+    *args: Any,
+    max_pages: Optional[int] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    **kwargs: Any,
+) -> AsyncIterator[JSON]:
+    """iter_tr_cont_pages()의 async 버전. openkis.aio client의 method를 넘긴다."""
+    kwargs = {**(params or {}), **kwargs}
+    tr_cont = kwargs.pop("tr_cont", "")
+    page_count = 0
+    while max_pages is None or page_count < max_pages:
+        page: Page = await operation(
+            *args, tr_cont=tr_cont, cls=_body_and_headers, **kwargs
+        )
+        body, headers = page
+        page_count += 1
+        yield body
+
+        if not has_next_page(headers):
+            return
+        tr_cont = TR_CONT_NEXT
+
+
+async def aiter_tr_cont_rows(
+    operation: Callable[..., Awaitable[Any]],
+    *args: Any,
+    output_key: str = "output",
+    max_pages: Optional[int] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """iter_tr_cont_rows()의 async 버전"""
+    async for page in aiter_tr_cont_pages(
+        operation, *args, max_pages=max_pages, params=params, **kwargs
+    ):
+        for row in extract_rows(page, output_key):
+            yield row
+
+
+# 연속조회키(ctx_area_nk), 연속조회검색조건(ctx_area_fk) parameter 이름
+CURSOR_KEYS = ("ctx_area_nk", "ctx_area_fk")
+
+
+def extract_cursor(
+    body: Optional[Mapping[str, Any]], cursor_keys: Tuple[str, ...] = CURSOR_KEYS
+) -> Dict[str, str]:
+    """
+    응답 body에서 다음 요청에 넘길 연속조회키를 꺼낸다.
+
+    API에 따라 body의 key가 대문자이거나 ctx_area_nk100 처럼 길이가 붙어 있어서
+    대소문자 구분 없이 parameter 이름으로 시작하는 key를 찾는다.
+    """
+    cursor: Dict[str, str] = {}
+    if not body:
+        return cursor
+    for key, value in body.items():
+        lower_key = key.lower()
+        for cursor_key in cursor_keys:
+            if lower_key.startswith(cursor_key) and isinstance(value, str):
+                cursor[cursor_key] = value
+    return cursor
+
+
+class _CursorBase:
+    def __init__(
+        self,
+        operation: Callable[..., Any],
+        *args: Any,
+        output_key: str = "output",
+        until: Optional[Callable[[Any], bool]] = None,
+        cursor_keys: Tuple[str, ...] = CURSOR_KEYS,
+        max_pages: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        self.operation = operation
+        self.args = args
+        self.output_key = output_key
+        self.until = until
+        self.cursor_keys = cursor_keys
+        self.max_pages = max_pages
+        self.kwargs = kwargs
+        self.page_count = 0
+
+    def _first_request(self) -> Dict[str, Any]:
+        request = dict(self.kwargs)
+        request.setdefault("tr_cont", "")
+        return request
+
+    def _next_request(
+        self, request: Dict[str, Any], body: JSON, headers: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """다음 page 요청 parameter. 마지막 page면 None"""
+        if self.max_pages is not None and self.page_count >= self.max_pages:
+            return None
+        if not has_next_page(headers):
+            return None
+
+        cursor = extract_cursor(body, self.cursor_keys)
+        if not any(v.strip() for v in cursor.values()):
+            return None
+        if all(request.get(k) == v for k, v in cursor.items()):
+            # 같은 연속조회키가 반복되면 무한 반복을 막기 위해 멈춘다.
+            return None
+        return {**request, **cursor, "tr_cont": TR_CONT_NEXT}
+
+
+class CursorIterator(_CursorBase):
+    """
+    ctx_area_nk/ctx_area_fk 연속조회 API의 row를 lazy하게 반환하는 iterator
+
+    응답 body의 연속조회키와 header의 tr_cont를 읽어 다음 page를 요청한다.
+    page는 row를 다 소비했을 때 요청하므로, until 조건을 만족하면 남은 page는 요청하지 않는다.
+
+    Args:
+        operation (Callable[..., Any]): client의 조회 method (예: client.check_domestic_holiday)
+        output_key (str): row 목록이 있는 body key
+        until (Optional[Callable[[Any], bool]]): True를 반환하는 row까지 반환하고 멈춘다.
+        cursor_keys (Tuple[str, ...]): 연속조회키 parameter 이름
+        max_pages (Optional[int]): 최대 조회 page 수
+        kwargs: operation에 넘길 parameter
+
+    Example:
+        .. code-block:: python
+
+            holidays = CursorIterator(
+                client.check_domestic_holiday,
+                bass_dt="20240101",
+                until=lambda row: row["bass_dt"] >= "20241231",
+            )
+            for row in holidays:
+                ...
+    """
+
+    def pages(self) -> Iterator[JSON]:
+        request: Optional[Dict[str, Any]] = self._first_request()
+        self.page_count = 0
+        while request is not None:
+            page: Page = self.operation(*self.args, cls=_body_and_headers, **request)
+            body, headers = page
+            self.page_count += 1
+            yield body
+            request = self._next_request(request, body, headers)
+
+    def __iter__(self) -> Iterator[Any]:
+        for page in self.pages():
+            for row in extract_rows(page, self.output_key):
+                yield row
+                if self.until is not None and self.until(row):
+                    return
+
+
+class AsyncCursorIterator(_CursorBase):
+    """CursorIterator의 async 버전. openkis.aio client의 method를 넘기고 async for로 사용한다."""
+
+    async def pages(self) -> AsyncIterator[JSON]:
+        request: Optional[Dict[str, Any]] = self._first_request()
+        self.page_count = 0
+        while request is not None:
+            page: Page = await self.operation(
+                *self.args, cls=_body_and_headers, **request
+            )
+            body, headers = page
+            self.page_count += 1
+            yield body
+            request = self._next_request(request, body, headers)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for page in self.pages():
+            for row in extract_rows(page, self.output_key):
+                yield row
+                if self.until is not None and self.until(row):
+                    return
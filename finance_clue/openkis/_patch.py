@@ -6,18 +6,69 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
-import json
-import os
-from typing import Any, Awaitable, Dict, List, MutableMapping, Union
+import threading
+import time
+from typing import Any, Awaitable, Dict, List, MutableMapping, Optional, Union
 
 from azure.core.credentials import AccessToken
 from azure.core.pipeline import PipelineRequest
+from azure.core.pipeline import PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from azure.core.pipeline.policies._base import HTTPRequestType
 
+from finance_clue._pipeline import FastSendRequestMixin
+from finance_clue._pipeline import PROFILE_DEFAULT
+from finance_clue._pipeline import apply_profile
+from finance_clue._transport import TransportConfig
+from finance_clue._transport import apply_transport
 from finance_clue.openkis import GenOpenKisClient
+from finance_clue.openkis._cache import CachePolicy
+from finance_clue.openkis._cache import ResponseCache
+from finance_clue.openkis._calendar import TradingCalendar
+from finance_clue.openkis._decode import decode_response
+from finance_clue.openkis._decode import decode_rows
+from finance_clue.openkis._etf_nav import EtfBasket
+from finance_clue.openkis._etf_nav import EtfNavEngine
+from finance_clue.openkis._financials import FinancialTable
+from finance_clue.openkis._financials import FinancialWarehouse
+from finance_clue.openkis._history import PeriodPriceLoader
+from finance_clue.openkis._history import PriceHistory
+from finance_clue.openkis._history import split_date_windows
+from finance_clue.openkis._index_history import IndexLoader
+from finance_clue.openkis._index_history import IndexPanel
+from finance_clue.openkis._ksd_sync import KsdEventSync
+from finance_clue.openkis._minute_bars import MinuteBarBackfill
+from finance_clue.openkis._minute_bars import MinuteBars
+from finance_clue.openkis._paging import CursorIterator
+from finance_clue.openkis._paging import iter_tr_cont_pages
+from finance_clue.openkis._paging import iter_tr_cont_rows
+from finance_clue.openkis._ranking_recorder import RankingBoard
+from finance_clue.openkis._ranking_recorder import RankingQuery
+from finance_clue.openkis._ranking_recorder import RankingRecorder
+from finance_clue.openkis._rate_limit import FileTokenBucket
+from finance_clue.openkis._rate_limit import RateLimitPolicy
+from finance_clue.openkis._rate_limit import TokenBucket
+from finance_clue.openkis._rate_limit import get_token_bucket
+from finance_clue.openkis._realtime import RealtimeBuffer
+from finance_clue.openkis._realtime import RealtimeSubscriber
+from finance_clue.openkis._realtime import approval_request
+from finance_clue.openkis._realtime import approval_token
+from finance_clue.openkis._realtime import get_approval_store
+from finance_clue.openkis._realtime import parse_frame
+from finance_clue.openkis._retry import KisErrorPolicy
+from finance_clue.openkis._retry import KisRetryPolicy
+from finance_clue.openkis._retry import classify_kis_error
+from finance_clue.openkis._snapshot import QuoteSnapshot
+from finance_clue.openkis._snapshot import snapshot_quotes
+from finance_clue.openkis._token_broker import TokenBroker
+from finance_clue.openkis._token_broker import fetch_broker_token
+from finance_clue.openkis._token_broker import get_token_broker_url
+from finance_clue.openkis._token_store import TokenStore
+from finance_clue.openkis._token_store import get_token_store
 
 
 @dataclass
@@ -32,26 +83,30 @@ class CredentialInfo:
     expires_in: int
 
 
-access_token_file = "finance_clue.json"
-
-
-def _write_access_token(resp):
-    write_obj = {}
-    if os.path.exists(access_token_file):
-        f = open(access_token_file, "r")
-        write_obj = json.load(f)
-        f.close()
-
-    write_obj["open_kis"] = resp
-    with open(access_token_file, "w") as f:
-        json.dump(write_obj, f)
+# broker를 쓸 때 토큰 만료까지 이만큼(초) 남으면 broker에서 새 토큰을 받는다.
+BROKER_MIN_VALID_SECONDS = 300
+# broker에서 쓸 만한 토큰을 받지 못하면 이만큼(초) 지난 뒤에 다시 묻는다.
+BROKER_RETRY_SECONDS = 30.0
 
 
 class CustomCredentials:
+    """
+    KIS appkey, appsecret과 접근 토큰
+
+    Args:
+        app_key (str): appkey
+        app_secret (str): appsecret
+        token_broker (Optional[str]): 토큰 broker url. 지정하면 만료가 가까운 토큰을 broker에서 받아 바꾼다.
+        broker_retry_interval (float): broker에 연결할 수 없을 때 다시 시도하기까지 기다리는 시간(초).
+            그동안의 요청은 broker를 기다리지 않고 가지고 있는 토큰을 쓴다.
+    """
+
     def __init__(
         self,
         app_key: str,
         app_secret: str,
+        token_broker: Optional[str] = None,
+        broker_retry_interval: float = BROKER_RETRY_SECONDS,
     ):
         self.app_key = app_key
         self.app_secret = app_secret
@@ -60,11 +115,115 @@ class CustomCredentials:
         self.access_token_token_expired = None
         self.token_type = None
         self.expires_in = 0
+        self.token_broker = token_broker
+        self.broker_retry_interval = broker_retry_interval
+        self._broker_lock = threading.Lock()
+        self._broker_next_attempt = 0.0
+
+    def _needs_broker_token(self) -> bool:
+        if self.access_token is None or self.access_token_token_expired is None:
+            return True
+        remaining = self.access_token_token_expired - datetime.now()
+        return remaining.total_seconds() <= BROKER_MIN_VALID_SECONDS
+
+    def _has_valid_token(self) -> bool:
+        return (
+            self.access_token is not None
+            and self.access_token_token_expired is not None
+            and self.access_token_token_expired > datetime.now()
+        )
+
+    def _broker_due(self) -> bool:
+        return (
+            bool(self.token_broker)
+            and self._needs_broker_token()
+            and time.monotonic() >= self._broker_next_attempt
+        )
+
+    def update_from_broker(self) -> bool:
+        """
+        broker가 지정되어 있고 토큰 만료가 가까우면 broker의 토큰으로 바꾼다.
+
+        broker에 연결할 수 없으면 broker_retry_interval 동안은 다시 묻지 않는다.
+        아직 만료되지 않은 토큰이 있으면 다른 thread가 broker에 묻는 동안 기다리지 않는다.
+
+        Returns:
+            bool: broker에서 토큰을 받았으면 True. broker에 연결할 수 없으면 False
+        """
+        if not self._broker_due():
+            return False
+        if not self._broker_lock.acquire(blocking=not self._has_valid_token()):
+            return False
+        try:
+            if not self.token_broker or not self._broker_due():
+                return False
+            try:
+                token_obj = fetch_broker_token(self.token_broker, self.app_key)
+            except (OSError, ValueError):
+                self._broker_next_attempt = (
+                    time.monotonic() + self.broker_retry_interval
+                )
+                return False
+            _update_credential(self, token_obj)
+            # broker도 만료가 가까운 토큰을 들고 있으면 요청마다 다시 묻지 않는다.
+            self._broker_next_attempt = (
+                time.monotonic() + self.broker_retry_interval
+                if self._needs_broker_token()
+                else 0.0
+            )
+            return True
+        finally:
+            self._broker_lock.release()
+
+    def refresh_from_broker(self, stale_token: Optional[str] = None) -> bool:
+        """
+        서버가 stale_token이 만료되었다고 응답했을 때 broker에 새 토큰을 요청해서 바꾼다.
+
+        다른 thread가 이미 바꿨으면 broker에 묻지 않는다.
+
+        Returns:
+            bool: broker에서 토큰을 받았거나 이미 바뀌었으면 True. broker에 연결할 수 없으면 False
+        """
+        if not self.token_broker:
+            return False
+        with self._broker_lock:
+            if stale_token is not None and self.access_token != stale_token:
+                return True
+            try:
+                token_obj = fetch_broker_token(
+                    self.token_broker, self.app_key, stale_token=stale_token
+                )
+            except (OSError, ValueError):
+                return False
+            _update_credential(self, token_obj)
+            self._broker_next_attempt = 0.0
+            return True
+
+    async def arefresh_from_broker(self, stale_token: Optional[str] = None) -> bool:
+        """refresh_from_broker()의 async 버전. broker 요청은 executor에서 보낸다."""
+        if not self.token_broker:
+            return False
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.refresh_from_broker, stale_token
+        )
+
+    async def aupdate_from_broker(self) -> bool:
+        """update_from_broker()의 async 버전. broker 요청은 executor에서 보낸다."""
+        if not self._broker_due():
+            return False
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.update_from_broker
+        )
 
     def get_token(self, *args, **kwargs) -> AccessToken:
+        self.update_from_broker()
         return AccessToken(self.access_token, self.expires_in)
 
     def get_credential_info(self, *args, **kwargs) -> CredentialInfo:
+        self.update_from_broker()
+        return self._credential_info()
+
+    def _credential_info(self) -> CredentialInfo:
         return CredentialInfo(
             app_key=self.app_key,
             app_secret=self.app_secret,
@@ -85,81 +244,196 @@ class CustomCredentials:
 
 class CustomAuthenticationPolicy(SansIOHTTPPolicy):
 
-    def __init__(self, credentials: CustomCredentials):
+    def __init__(
+        self, credentials: CustomCredentials, token_store: Optional[TokenStore] = None
+    ):
         self._credentials = credentials
+        self._token_store = token_store or get_token_store()
 
     def on_request(
         self, request: PipelineRequest[HTTPRequestType]
     ) -> Union[None, Awaitable[None]]:
-        credential_info = self._credentials.get_credential_info()
-        request.http_request.headers["authorization"] = (
-            f"{credential_info.token_type} {credential_info.access_token}"
+        _set_auth_headers(
+            request, self._credentials.get_credential_info(), self._token_store
         )
-        request.http_request.headers["appkey"] = f"{credential_info.app_key}"
-        request.http_request.headers["appsecret"] = f"{credential_info.app_secret}"
-        # if url lastIndexOf revokeP, remove finance_clue.json
-        if "/oauth2/revokeP" in request.http_request.url:
-            if os.path.exists(access_token_file):
-                os.remove(access_token_file)
         return super().on_request(request)
 
 
-class OpenKisClient(GenOpenKisClient):
+class AsyncCustomAuthenticationPolicy(AsyncHTTPPolicy):
+    """CustomAuthenticationPolicy의 async 버전. broker에 묻는 동안 event loop를 막지 않는다."""
 
     def __init__(
-        self, app_key: str, app_secret: str, is_sandbox: bool = False, **kwargs
+        self, credentials: CustomCredentials, token_store: Optional[TokenStore] = None
     ):
-        self._credential = CustomCredentials(app_key, app_secret)
-        if "endpoint" not in kwargs:
-            endpoint = (
-                "https://openapivts.koreainvestment.com:29443"
-                if is_sandbox
-                else "https://openapi.koreainvestment.com:9443"
-            )
-            kwargs["endpoint"] = endpoint
+        super().__init__()
+        self._credentials = credentials
+        self._token_store = token_store or get_token_store()
 
-        kwargs["authentication_policy"] = CustomAuthenticationPolicy(self._credential)
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        await self._credentials.aupdate_from_broker()
+        _set_auth_headers(
+            request, self._credentials._credential_info(), self._token_store
+        )
+        return await self.next.send(request)
+
+
+def _set_auth_headers(
+    request: PipelineRequest, credential_info: CredentialInfo, token_store: TokenStore
+) -> None:
+    request.http_request.headers["authorization"] = (
+        f"{credential_info.token_type} {credential_info.access_token}"
+    )
+    request.http_request.headers["appkey"] = f"{credential_info.app_key}"
+    request.http_request.headers["appsecret"] = f"{credential_info.app_secret}"
+    # if url lastIndexOf revokeP, remove saved token
+    if "/oauth2/revokeP" in request.http_request.url:
+        token_store.clear()
+
+
+def _update_credential(credentials: CustomCredentials, token_obj: Dict[str, Any]):
+    credentials.update_token(
+        access_token=token_obj["access_token"],
+        access_token_token_expired=datetime.fromisoformat(
+            token_obj["access_token_token_expired"]
+        ),
+        token_type=token_obj["token_type"],
+        expires_in=token_obj["expires_in"],
+    )
+
+
+def _token_request_body(credentials: CustomCredentials) -> Dict[str, Any]:
+    return {
+        "appkey": credentials.app_key,
+        "appsecret": credentials.app_secret,
+        "grant_type": credentials.grant_type,
+    }
+
+
+def _endpoint(is_sandbox: bool) -> str:
+    return (
+        "https://openapivts.koreainvestment.com:29443"
+        if is_sandbox
+        else "https://openapi.koreainvestment.com:9443"
+    )
+
+
+class OpenKisClient(FastSendRequestMixin, GenOpenKisClient):
+    """
+    한국투자증권 OpenAPI client
+
+    Args:
+        app_key (str): 한국투자증권에서 발급받은 appkey
+        app_secret (str): 한국투자증권에서 발급받은 appsecret
+        is_sandbox (bool): 모의투자 서버 사용 여부
+        token_path (Optional[str]): 접근 토큰을 저장할 파일 경로. 기본값은 finance_clue.json
+        rate_limiter (Optional[TokenBucket]): 초당 거래건수 제한. 없으면 제한하지 않는다.
+            appkey별로 공유하는 실전/모의투자 기본 제한은 get_token_bucket()으로 만든다.
+            여러 process가 나눠 쓰려면 FileTokenBucket을 넘긴다.
+        token_broker (Optional[str]): 토큰 broker url. 없으면 FINANCE_CLUE_TOKEN_BROKER 환경변수를 쓰고,
+            빈 문자열이면 broker를 쓰지 않는다.
+        cache (Optional[ResponseCache]): 조회 응답 cache. 지정하면 tr_id별 TTL 동안 같은 요청의 응답을 재사용한다.
+        profile (str): pipeline profile. "fast"면 proxy, 재시도, 인증, rate limit, cache policy만 거친다.
+        kis_retry (Optional[Dict[str, Any]]): KisErrorPolicy 설정(max_throttle_retries, backoff_factor, backoff_max)
+        transport_config (Optional[TransportConfig]): connection pool, timeout 설정. transport를 직접 넘기면 무시한다.
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        is_sandbox: bool = False,
+        token_path: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache: Optional[ResponseCache] = None,
+        profile: str = PROFILE_DEFAULT,
+        token_broker: Optional[str] = None,
+        kis_retry: Optional[Dict[str, Any]] = None,
+        transport_config: Optional[TransportConfig] = None,
+        **kwargs,
+    ):
+        self._credential = CustomCredentials(
+            app_key, app_secret, get_token_broker_url(token_broker)
+        )
+        self._token_store = get_token_store(token_path)
+        self._approval_store = get_approval_store(self._token_store)
+        self.is_sandbox = is_sandbox
+        self.rate_limiter = rate_limiter
+        if "endpoint" not in kwargs:
+            kwargs["endpoint"] = _endpoint(is_sandbox)
+
+        self.cache = cache
+        if cache is not None:
+            kwargs["per_call_policies"] = [
+                CachePolicy(cache),
+                *kwargs.get("per_call_policies", []),
+            ]
+
+        # 업무 오류 재시도 policy를 rate limit 앞에 둬서 다시 보내는 요청도 rate limit을 거치게 한다.
+        self.error_policy = KisErrorPolicy(
+            self._credential, self._refresh_access_token, **(kis_retry or {})
+        )
+        kwargs["per_retry_policies"] = [
+            *kwargs.get("per_retry_policies", []),
+            self.error_policy,
+        ]
+        if rate_limiter is not None:
+            kwargs["per_retry_policies"].append(RateLimitPolicy(rate_limiter))
+        if kwargs.get("retry_policy") is None:
+            kwargs["retry_policy"] = KisRetryPolicy(**kwargs)
+
+        kwargs["authentication_policy"] = CustomAuthenticationPolicy(
+            self._credential, self._token_store
+        )
+        self._profile = profile
+        apply_profile(kwargs, profile)
+        apply_transport(kwargs, transport_config)
         super().__init__(credential=self._credential, **kwargs)
 
-    def init(self):
-        if os.path.exists(access_token_file):
-            with open(access_token_file, "r") as f:
-                token_obj = json.load(f)
-                open_kis = token_obj["open_kis"]
-
-                self._credential.update_token(
-                    access_token=open_kis["access_token"],
-                    access_token_token_expired=datetime.fromisoformat(
-                        open_kis["access_token_token_expired"]
-                    ),
-                    token_type=open_kis["token_type"],
-                    expires_in=open_kis["expires_in"],
-                )
+    def _issue_access_token(self) -> Dict[str, Any]:
+        return dict(self.get_access_token(_token_request_body(self._credential)))
 
-                # return if token is still valid(5 minutes before expiration) to avoid unnecessary token request
-                # if token is expired, get new token
-                if (
-                    self._credential.access_token_token_expired - datetime.now()
-                ).total_seconds() > 300:
-                    return
-
-        resp = self.get_access_token(
-            {
-                "appkey": self._credential.app_key,
-                "appsecret": self._credential.app_secret,
-                "grant_type": self._credential.grant_type,
-            }
+    def init(self):
+        # broker가 있으면 broker의 토큰을 쓴다. broker에 연결할 수 없으면 토큰 파일을 쓴다.
+        if self._credential.update_from_broker():
+            return
+        # 유효기간이 5분 이상 남은 토큰이 저장되어 있으면 재사용하고, 아니면 새로 발급받는다.
+        # 여러 process가 동시에 init()을 호출해도 발급은 한 번만 일어난다.
+        token_obj = self._token_store.get_or_issue(self._issue_access_token)
+        _update_credential(self._credential, token_obj)
+
+    def _refresh_access_token(self, stale_token: Optional[str] = None) -> None:
+        """
+        서버가 만료되었다고 응답한 토큰을 새 토큰으로 바꾼다.
+
+        다른 thread가 이미 바꿨으면 아무것도 하지 않는다. broker가 있으면 broker에 갱신을 요청하고,
+        broker에 연결할 수 없으면 토큰 파일 lock 안에서 발급하므로
+        여러 thread, process가 동시에 호출해도 발급은 한 번만 일어난다.
+        """
+        if stale_token is not None and self._credential.access_token != stale_token:
+            return
+        if self._credential.refresh_from_broker(stale_token):
+            return
+        token_obj = self._token_store.get_or_issue(
+            self._issue_access_token, stale_token=stale_token
         )
+        _update_credential(self._credential, token_obj)
 
-        _write_access_token(resp)
-        self._credential.update_token(
-            access_token=resp["access_token"],
-            access_token_token_expired=datetime.fromisoformat(
-                resp["access_token_token_expired"]
-            ),
-            token_type=resp["token_type"],
-            expires_in=resp["expires_in"],
-        )
+    def get_approval_key(self) -> str:
+        """
+        실시간 시세 웹소켓 접속키. 유효기간이 남은 접속키가 저장되어 있으면 재사용한다.
+
+        Returns:
+            str: approval_key
+        """
+
+        def issue() -> Dict[str, Any]:
+            response = self.send_request(
+                approval_request(self._credential.app_key, self._credential.app_secret)
+            )
+            response.raise_for_status()
+            return approval_token(response.json())
+
+        return self._approval_store.get_or_issue(issue)["approval_key"]
 
 
 def attach_headers():
@@ -184,6 +458,44 @@ def patch_sdk():
 
 
 __all__: List[str] = [
+    "CachePolicy",
+    "CursorIterator",
+    "EtfBasket",
+    "EtfNavEngine",
+    "FileTokenBucket",
+    "FinancialTable",
+    "FinancialWarehouse",
+    "IndexLoader",
+    "IndexPanel",
+    "KisErrorPolicy",
+    "KisRetryPolicy",
+    "KsdEventSync",
+    "MinuteBarBackfill",
+    "MinuteBars",
     "OpenKisClient",
+    "PeriodPriceLoader",
+    "PriceHistory",
+    "QuoteSnapshot",
+    "RankingBoard",
+    "RankingQuery",
+    "RankingRecorder",
+    "RateLimitPolicy",
+    "RealtimeBuffer",
+    "RealtimeSubscriber",
+    "ResponseCache",
+    "TokenBroker",
+    "TokenBucket",
+    "TokenStore",
+    "TradingCalendar",
+    "TransportConfig",
     "attach_headers",
+    "classify_kis_error",
+    "decode_response",
+    "decode_rows",
+    "get_token_bucket",
+    "iter_tr_cont_pages",
+    "iter_tr_cont_rows",
+    "parse_frame",
+    "snapshot_quotes",
+    "split_date_windows",
 ]  # Add all objects you want publicly available to users at this package level
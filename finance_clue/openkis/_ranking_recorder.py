@@ -0,0 +1,340 @@
+"""국내주식 순위 snapshot 기록
+
+get_ranking_* 조회는 순위표(최대 30종목)를 통째로 반환한다. 몇 초마다 전체 JSON을 저장하면
+대부분이 직전 순위표와 같은 값이다. 순위표를 keyframe(전체 row)과 delta(순서, 바뀐 종목의 바뀐 field,
+빠진 종목)로 나눠 기록하고, 특정 시각의 순위표는 가장 가까운 keyframe부터 delta를 적용해 복원한다.
+
+기록은 순위표마다 한 줄에 snapshot 하나인 jsonl 파일에 이어 쓴다.
+"""
+
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from finance_clue.openkis._paging import extract_rows
+from finance_clue.openkis._rate_limit import account_rate
+
+
+@dataclass
+class RankingQuery:
+    """
+    기록할 순위 조회 하나
+
+    Attributes:
+        method (str): client method 이름 (예: "get_ranking_volume")
+        params (Dict[str, str]): method에 넘길 parameter
+        symbol_field (str): row의 종목코드 field
+        output_key (str): 응답 body에서 순위 row 목록의 key
+    """
+
+    method: str
+    params: Dict[str, str] = field(default_factory=dict)
+    symbol_field: str = "mksc_shrn_iscd"
+    output_key: str = "output"
+
+
+_ALL_PRICES = {"fid_input_price1": "", "fid_input_price2": "", "fid_vol_cnt": ""}
+
+# 기본으로 기록하는 순위. 시장 전체(0000), 가격, 거래량 조건 없음
+DEFAULT_RANKINGS: Dict[str, RankingQuery] = {
+    "volume": RankingQuery(
+        "get_ranking_volume",
+        {
+            "fid_input_iscd": "0000",
+            "fid_div_cls_code": "0",
+            "fid_blng_cls_code": "0",
+            "fid_trgt_cls_code": "111111111",
+            "fid_trgt_exls_cls_code": "0000000000",
+            "fid_input_date1": "",
+            **_ALL_PRICES,
+        },
+    ),
+    "fluctuation_rate": RankingQuery(
+        "get_ranking_fluctuation_rate",
+        {
+            "fid_input_iscd": "0000",
+            "fid_rank_sort_cls_code": "0",
+            "fid_prc_cls_code": "1",
+            "fid_rsfl_rate1": "",
+            "fid_rsfl_rate2": "",
+            "fid_input_cnt1": "0",
+            **_ALL_PRICES,
+        },
+        symbol_field="stck_shrn_iscd",
+    ),
+    "market_cap": RankingQuery(
+        "get_ranking_market_cap",
+        {"fid_input_iscd": "0000", "fid_div_cls_code": "0", **_ALL_PRICES},
+    ),
+    "volume_power": RankingQuery(
+        "get_ranking_volume_power", dict(_ALL_PRICES), symbol_field="stck_shrn_iscd"
+    ),
+}
+
+
+class RankingBoard:
+    """
+    순위표 하나의 keyframe + delta 기록
+
+    snapshot은 {"t": 시각, "order": [종목코드...], ...} 형태다. keyframe은 "rows"에 모든 종목의 row를,
+    delta는 "set"에 새로 들어오거나 값이 바뀐 종목의 바뀐 field를, "drop"에 빠진 종목을 갖는다.
+    delta의 "order"는 순서가 바뀌었을 때만 있다.
+
+    Args:
+        symbol_field (str): row의 종목코드 field
+        keyframe_every (int): 몇 snapshot마다 keyframe을 둘지. 복원할 때 적용하는 delta 수의 상한이다.
+    """
+
+    def __init__(self, symbol_field: str = "mksc_shrn_iscd", keyframe_every: int = 100):
+        if keyframe_every < 1:
+            raise ValueError("keyframe_every must be positive")
+        self.symbol_field = symbol_field
+        self.keyframe_every = keyframe_every
+        self.snapshots: List[Dict[str, Any]] = []
+        self.timestamps: List[float] = []
+        self._keyframes: List[int] = []
+        # 마지막 snapshot의 순위표
+        self._order: List[str] = []
+        self._rows: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    def append(
+        self, timestamp: float, rows: Sequence[Mapping[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        순위 row 목록을 snapshot으로 기록한다.
+
+        Args:
+            timestamp (float): 조회 시각(epoch 초). 직전 snapshot보다 늦어야 한다.
+            rows (Sequence[Mapping[str, Any]]): 순위 순서대로의 row
+
+        Returns:
+            Dict[str, Any]: 기록한 keyframe 또는 delta
+        """
+        if self.timestamps and timestamp < self.timestamps[-1]:
+            raise ValueError("Snapshots must be appended in time order")
+        board = {str(row[self.symbol_field]): dict(row) for row in rows}
+        order = list(board)
+        if (
+            not self._keyframes
+            or len(self.snapshots) - self._keyframes[-1] >= self.keyframe_every
+        ):
+            snapshot: Dict[str, Any] = {"t": timestamp, "order": order, "rows": board}
+        else:
+            changes = {}
+            for symbol, row in board.items():
+                previous = self._rows.get(symbol)
+                if previous is None:
+                    changes[symbol] = row
+                    continue
+                diff = {k: v for k, v in row.items() if previous.get(k) != v}
+                if diff:
+                    changes[symbol] = diff
+            snapshot = {"t": timestamp, "set": changes}
+            dropped = [symbol for symbol in self._order if symbol not in board]
+            if dropped:
+                snapshot["drop"] = dropped
+            if order != self._order:
+                snapshot["order"] = order
+        self._add(snapshot)
+        return snapshot
+
+    def _add(self, snapshot: Dict[str, Any]) -> None:
+        if "rows" in snapshot:
+            self._keyframes.append(len(self.snapshots))
+        self.snapshots.append(snapshot)
+        self.timestamps.append(snapshot["t"])
+        self._order, self._rows = self._apply(self._order, self._rows, snapshot)
+
+    @staticmethod
+    def _apply(
+        order: List[str], rows: Dict[str, Dict[str, Any]], snapshot: Dict[str, Any]
+    ) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+        if "rows" in snapshot:
+            return snapshot["order"], {s: dict(r) for s, r in snapshot["rows"].items()}
+        rows = dict(rows)
+        for symbol in snapshot.get("drop", ()):
+            rows.pop(symbol, None)
+        for symbol, diff in snapshot["set"].items():
+            rows[symbol] = {**rows.get(symbol, {}), **diff}
+        return snapshot.get("order", order), rows
+
+    def at(self, timestamp: float) -> List[Dict[str, Any]]:
+        """
+        timestamp 시각(포함)의 마지막 순위표. 그 전 기록이 없으면 빈 목록
+
+        Returns:
+            List[Dict[str, Any]]: 순위 순서대로의 row
+        """
+        i = bisect_right(self.timestamps, timestamp) - 1
+        if i < 0:
+            return []
+        if i == len(self.snapshots) - 1:
+            order, rows = self._order, self._rows
+        else:
+            k = self._keyframes[bisect_right(self._keyframes, i) - 1]
+            order, rows = [], {}
+            for snapshot in self.snapshots[k : i + 1]:
+                order, rows = self._apply(order, rows, snapshot)
+        return [dict(rows[symbol]) for symbol in order]
+
+    def load(self, path: str) -> None:
+        """jsonl 파일의 snapshot을 읽는다."""
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    self._add(json.loads(line))
+
+
+def _board_file(path: str, name: str) -> str:
+    return os.path.join(path, f"{name}.jsonl")
+
+
+class RankingRecorder:
+    """
+    순위 조회를 주기적으로 호출해서 RankingBoard에 기록하는 recorder
+
+    한 번 poll()할 때 queries 수만큼 호출한다. run()의 주기는 rate_limiter의 초당 거래건수 중
+    budget 비율만 쓰도록 min_interval() 이상으로 맞춘다.
+
+    Args:
+        queries (Optional[Mapping[str, RankingQuery]]): 순위표 이름 -> 조회. 기본값은 DEFAULT_RANKINGS
+        path (Optional[str]): 기록할 디렉터리. 있으면 열 때 {이름}.jsonl을 읽고, snapshot마다 이어 쓴다.
+        keyframe_every (int): 몇 snapshot마다 keyframe을 둘지
+        budget (float): 순위 기록에 쓸 초당 거래건수 비율 (0 ~ 1)
+
+    Attributes:
+        boards (Dict[str, RankingBoard]): 순위표별 기록
+        errors (Dict[str, Exception]): 마지막 poll()에서 실패한 순위표
+
+    Example:
+        .. code-block:: python
+
+            recorder = RankingRecorder(path="ranking")
+            recorder.run(client, interval=5, until=time.time() + 3600)
+            recorder.board("volume", timestamp)
+    """
+
+    def __init__(
+        self,
+        queries: Optional[Mapping[str, RankingQuery]] = None,
+        path: Optional[str] = None,
+        keyframe_every: int = 100,
+        budget: float = 0.5,
+    ):
+        if not 0 < budget <= 1:
+            raise ValueError(f"budget must be in (0, 1]: {budget}")
+        self.queries = dict(queries or DEFAULT_RANKINGS)
+        self.path = path
+        self.budget = budget
+        self.boards = {
+            name: RankingBoard(query.symbol_field, keyframe_every)
+            for name, query in self.queries.items()
+        }
+        self.errors: Dict[str, Exception] = {}
+        if path is not None:
+            for name, board in self.boards.items():
+                file = _board_file(path, name)
+                if os.path.exists(file):
+                    board.load(file)
+
+    def min_interval(self, client: Any) -> float:
+        """
+        rate_limiter의 budget 비율 안에서 poll()할 수 있는 최소 주기(초)
+
+        client에 rate_limiter가 없으면 계정의 초당 거래건수 제한을 기준으로 한다.
+        """
+        rate = (
+            client.rate_limiter.rate
+            if client.rate_limiter is not None
+            else account_rate(client.is_sandbox)
+        )
+        return len(self.queries) / (rate * self.budget)
+
+    def _fetch(self, client: Any, name: str) -> List[Dict[str, Any]]:
+        query = self.queries[name]
+        resp = getattr(client, query.method)(**query.params)
+        return extract_rows(resp, query.output_key)
+
+    def poll(self, client: Any, timestamp: Optional[float] = None) -> Dict[str, int]:
+        """
+        모든 순위표를 한 번씩 조회해서 기록한다.
+
+        Args:
+            client: sync OpenKisClient
+            timestamp (Optional[float]): 기록할 시각(epoch 초). 없으면 현재 시각
+
+        Returns:
+            Dict[str, int]: 순위표별로 값이 바뀌거나 새로 들어온 종목 수. keyframe이면 전체 종목 수
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        self.errors = {}
+        changed = {}
+        with ThreadPoolExecutor(max_workers=len(self.queries) or 1) as executor:
+            futures = {
+                name: executor.submit(self._fetch, client, name)
+                for name in self.queries
+            }
+            for name, future in futures.items():
+                try:
+                    rows = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    self.errors[name] = e
+                    continue
+                snapshot = self.boards[name].append(timestamp, rows)
+                changed[name] = len(
+                    snapshot["rows"] if "rows" in snapshot else snapshot["set"]
+                )
+                if self.path is not None:
+                    os.makedirs(self.path, exist_ok=True)
+                    with open(_board_file(self.path, name), "a", encoding="utf-8") as f:
+                        f.write(json.dumps(snapshot) + "\n")
+        return changed
+
+    def run(
+        self,
+        client: Any,
+        interval: Optional[float] = None,
+        until: Optional[float] = None,
+        max_polls: Optional[int] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> int:
+        """
+        interval초마다 poll()한다. 늦어진 차례는 건너뛰고 다음 차례에 맞춘다.
+
+        Args:
+            client: sync OpenKisClient
+            interval (Optional[float]): 주기(초). min_interval()보다 짧으면 min_interval()을 쓴다.
+            until (Optional[float]): 이 시각(epoch 초)이 지나면 멈춘다.
+            max_polls (Optional[int]): 최대 poll 횟수
+            stop (Optional[threading.Event]): set되면 멈춘다.
+
+        Returns:
+            int: poll 횟수
+        """
+        interval = max(interval or 0.0, self.min_interval(client))
+        stop = stop or threading.Event()
+        polls = 0
+        start = time.monotonic()
+        while not stop.is_set():
+            if max_polls is not None and polls >= max_polls:
+                break
+            if until is not None and time.time() >= until:
+                break
+            self.poll(client)
+            polls += 1
+            elapsed = time.monotonic() - start
+            stop.wait(interval - elapsed % interval)
+        return polls
+
+    def board(self, name: str, timestamp: float) -> List[Dict[str, Any]]:
+        """timestamp 시각의 순위표. RankingBoard.at() 참고"""
+        return self.boards[name].at(timestamp)
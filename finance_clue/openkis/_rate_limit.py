@@ -0,0 +1,221 @@
+"""KIS OpenAPI 초당 거래건수 제한을 맞추기 위한 client 측 rate limit
+
+한국투자증권 OpenAPI는 appkey별로 초당 호출 건수를 제한하고, 초과한 요청은 오류로 응답한다.
+token bucket으로 요청 시점을 미리 나눠서 제한을 넘는 요청을 보내지 않도록 한다.
+
+bucket은 GCRA(Generic Cell Rate Algorithm)로 구현해서 다음 요청이 나갈 수 있는 시각(tat) 하나만 상태로 갖는다.
+그래서 lock은 tat을 갱신하는 동안만 잡고, 기다리는 동안에는 잡지 않는다.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import os
+import threading
+import time
+from typing import Dict, Optional, TextIO, Tuple
+
+from azure.core.pipeline import PipelineRequest
+from azure.core.pipeline import PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+from azure.core.pipeline.policies import HTTPPolicy
+
+from finance_clue.openkis._token_store import _lock_file
+from finance_clue.openkis._token_store import _unlock_file
+
+# 실전투자, 모의투자 appkey의 초당 거래건수 제한
+REAL_REQUESTS_PER_SECOND = 20.0
+SANDBOX_REQUESTS_PER_SECOND = 2.0
+
+
+def account_rate(is_sandbox: bool = False) -> float:
+    """실전투자, 모의투자 계정의 초당 거래건수 제한"""
+    return SANDBOX_REQUESTS_PER_SECOND if is_sandbox else REAL_REQUESTS_PER_SECOND
+
+
+@dataclass
+class RateLimitMetrics:
+    """
+    rate limit 대기 통계
+
+    Attributes:
+        acquired (int): 허용한 요청 수
+        delayed (int): 기다린 요청 수
+        total_wait (float): 기다린 시간 합계(초)
+        max_wait (float): 가장 오래 기다린 시간(초)
+    """
+
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class TokenBucket:
+    """
+    thread safe token bucket
+
+    Args:
+        rate (float): 초당 허용 요청 수
+        capacity (Optional[int]): 한 번에 몰아서 보낼 수 있는 요청 수. 기본값은 1 (균등 간격)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive: {rate}")
+        self.rate = rate
+        self.capacity = max(capacity or 1, 1)
+        self._interval = 1.0 / rate
+        self._tolerance = (self.capacity - 1) * self._interval
+        self._lock = threading.Lock()
+        self._tat = 0.0
+        self._metrics = RateLimitMetrics()
+
+    @classmethod
+    def for_account(cls, is_sandbox: bool = False, **kwargs) -> "TokenBucket":
+        """실전투자, 모의투자 계정의 초당 거래건수 제한에 맞춘 bucket"""
+        return cls(account_rate(is_sandbox), **kwargs)
+
+    @property
+    def metrics(self) -> RateLimitMetrics:
+        """대기 통계 snapshot"""
+        with self._lock:
+            return RateLimitMetrics(**vars(self._metrics))
+
+    def _now(self) -> float:
+        return time.monotonic()
+
+    def _advance(self, tat: float, now: float) -> Tuple[float, float]:
+        """tat을 한 요청만큼 옮긴 값과 기다려야 하는 시간을 반환한다."""
+        tat = max(tat, now)
+        delay = max(tat - self._tolerance - now, 0.0)
+        return tat + self._interval, delay
+
+    def reserve(self) -> float:
+        """요청 한 건을 예약하고, 요청을 보내기 전에 기다려야 하는 시간(초)을 반환한다."""
+        with self._lock:
+            self._tat, delay = self._advance(self._tat, self._now())
+            self._record(delay)
+        return delay
+
+    def _record(self, delay: float) -> None:
+        self._metrics.acquired += 1
+        if delay > 0:
+            self._metrics.delayed += 1
+            self._metrics.total_wait += delay
+            self._metrics.max_wait = max(self._metrics.max_wait, delay)
+
+    def acquire(self) -> float:
+        """요청을 보낼 수 있을 때까지 기다린다. 기다린 시간(초)을 반환한다."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """acquire()의 async 버전"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    같은 host의 여러 process가 함께 쓰는 token bucket
+
+    tat을 coordination 파일에 저장하고 advisory lock으로 갱신한다.
+    process 사이에 시각을 맞추기 위해 monotonic clock 대신 wall clock을 쓴다.
+
+    Args:
+        path (str): coordination 파일 경로. 같은 appkey를 쓰는 process는 같은 경로를 써야 한다.
+        rate (float): 초당 허용 요청 수
+        capacity (Optional[int]): 한 번에 몰아서 보낼 수 있는 요청 수
+    """
+
+    def __init__(self, path: str, rate: float, capacity: Optional[int] = None):
+        super().__init__(rate, capacity)
+        self.path = path
+
+    @classmethod
+    def for_account_file(
+        cls, path: str, is_sandbox: bool = False, **kwargs
+    ) -> "FileTokenBucket":
+        """실전투자, 모의투자 계정의 초당 거래건수 제한에 맞춘 bucket"""
+        return cls(path, account_rate(is_sandbox), **kwargs)
+
+    def _now(self) -> float:
+        return time.time()
+
+    def reserve(self) -> float:
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            with os.fdopen(fd, "r+", encoding="utf-8") as f:
+                _lock_file(f)
+                try:
+                    tat, delay = self._advance(_read_tat(f), self._now())
+                    _write_tat(f, tat)
+                finally:
+                    _unlock_file(f)
+            self._record(delay)
+        return delay
+
+
+def _read_tat(f: TextIO) -> float:
+    f.seek(0)
+    content = f.read().strip()
+    try:
+        return float(content) if content else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _write_tat(f: TextIO, tat: float) -> None:
+    f.seek(0)
+    f.truncate()
+    f.write(repr(tat))
+    f.flush()
+
+
+_buckets: Dict[Tuple[str, bool], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(app_key: str, is_sandbox: bool = False) -> TokenBucket:
+    """appkey별로 하나의 bucket을 공유한다. 같은 process의 client, thread가 같은 제한을 나눠 쓴다."""
+    with _buckets_lock:
+        key = (app_key, is_sandbox)
+        if key not in _buckets:
+            _buckets[key] = TokenBucket.for_account(is_sandbox)
+        return _buckets[key]
+
+
+class RateLimitPolicy(HTTPPolicy):
+    """
+    요청을 보내기 전에 token bucket에서 허용을 기다리는 policy
+
+    retry policy 뒤에 두면 재시도 요청도 제한에 포함된다.
+    """
+
+    def __init__(self, bucket: TokenBucket):
+        super().__init__()
+        self.bucket = bucket
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        self.bucket.acquire()
+        return self.next.send(request)
+
+
+class AsyncRateLimitPolicy(AsyncHTTPPolicy):
+    """RateLimitPolicy의 async 버전. 기다리는 동안 event loop를 막지 않는다."""
+
+    def __init__(self, bucket: TokenBucket):
+        super().__init__()
+        self.bucket = bucket
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        await self.bucket.acquire_async()
+        return await self.next.send(request)
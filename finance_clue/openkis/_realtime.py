@@ -0,0 +1,579 @@
+"""KIS 실시간 시세 WebSocket 구독
+
+실시간 체결가(H0STCNT0)와 호가(H0STASP0)를 구독하고, 받은 frame을 미리 할당한 배열에 바로 쓴다.
+
+data frame은 "암호화여부|tr_id|건수|값^값^..." 형태의 문자열이고, 건수만큼의 record가 field 순서대로
+이어져 있다. frame마다 "^"로 한 번만 나누고, buffer에 등록한 field만 stride slice로 골라
+미리 할당한 배열의 다음 칸에 그대로 대입한다. record별 dict나 중간 배열은 만들지 않는다.
+
+제어 frame(구독 응답, PINGPONG)은 json이다. PINGPONG은 받은 그대로 돌려보낸다.
+연결이 끊기면 지수 backoff로 다시 연결하고 등록했던 구독을 모두 다시 보낸다.
+
+RealtimeBuffer는 numpy, RealtimeSubscriber.run()은 websockets가 설치되어 있어야 한다.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+import inspect
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from azure.core.rest import HttpRequest
+
+from finance_clue.openkis._token_store import TokenStore
+
+if TYPE_CHECKING:
+    import numpy as np
+    from websockets.asyncio.client import ClientConnection
+
+TRADE = "H0STCNT0"  # 국내주식 실시간체결가
+ORDERBOOK = "H0STASP0"  # 국내주식 실시간호가
+
+APPROVAL_KEY = "open_kis_approval"
+# 웹소켓 접속키 유효기간은 24시간이다.
+APPROVAL_KEY_LIFETIME = timedelta(hours=24)
+
+# tr_id별 data frame의 field 순서
+REALTIME_FIELDS: Dict[str, Tuple[str, ...]] = {
+    TRADE: (
+        "mksc_shrn_iscd",
+        "stck_cntg_hour",
+        "stck_prpr",
+        "prdy_vrss_sign",
+        "prdy_vrss",
+        "prdy_ctrt",
+        "wghn_avrg_stck_prc",
+        "stck_oprc",
+        "stck_hgpr",
+        "stck_lwpr",
+        "askp1",
+        "bidp1",
+        "cntg_vol",
+        "acml_vol",
+        "acml_tr_pbmn",
+        "seln_cntg_csnu",
+        "shnu_cntg_csnu",
+        "ntby_cntg_csnu",
+        "cttr",
+        "seln_cntg_smtn",
+        "shnu_cntg_smtn",
+        "ccld_dvsn",
+        "shnu_rate",
+        "prdy_vol_vrss_acml_vol_rate",
+        "oprc_hour",
+        "oprc_vrss_prpr_sign",
+        "oprc_vrss_prpr",
+        "hgpr_hour",
+        "hgpr_vrss_prpr_sign",
+        "hgpr_vrss_prpr",
+        "lwpr_hour",
+        "lwpr_vrss_prpr_sign",
+        "lwpr_vrss_prpr",
+        "bsop_date",
+        "new_mkop_cls_code",
+        "trht_yn",
+        "askp_rsqn1",
+        "bidp_rsqn1",
+        "total_askp_rsqn",
+        "total_bidp_rsqn",
+        "vol_tnrt",
+        "prdy_smns_hour_acml_vol",
+        "prdy_smns_hour_acml_vol_rate",
+        "hour_cls_code",
+        "mrkt_trtm_cls_code",
+        "vi_stnd_prc",
+    ),
+    ORDERBOOK: (
+        "mksc_shrn_iscd",
+        "bsop_hour",
+        "hour_cls_code",
+        *[f"askp{i}" for i in range(1, 11)],
+        *[f"bidp{i}" for i in range(1, 11)],
+        *[f"askp_rsqn{i}" for i in range(1, 11)],
+        *[f"bidp_rsqn{i}" for i in range(1, 11)],
+        "total_askp_rsqn",
+        "total_bidp_rsqn",
+        "ovtm_total_askp_rsqn",
+        "ovtm_total_bidp_rsqn",
+        "antc_cnpr",
+        "antc_cnqn",
+        "antc_vol",
+        "antc_cntg_vrss",
+        "antc_cntg_vrss_sign",
+        "antc_cntg_prdy_ctrt",
+        "acml_vol",
+        "total_askp_rsqn_icdc",
+        "total_bidp_rsqn_icdc",
+        "ovtm_total_askp_icdc",
+        "ovtm_total_bidp_icdc",
+        "stck_deal_cls_code",
+    ),
+}
+
+# tr_id별 기본 buffer field와 numpy dtype
+REALTIME_SCHEMAS: Dict[str, Dict[str, str]] = {
+    TRADE: {
+        "mksc_shrn_iscd": "U9",
+        "stck_cntg_hour": "i4",
+        "stck_prpr": "i8",
+        "prdy_vrss": "i8",
+        "prdy_ctrt": "f8",
+        "stck_oprc": "i8",
+        "stck_hgpr": "i8",
+        "stck_lwpr": "i8",
+        "askp1": "i8",
+        "bidp1": "i8",
+        "cntg_vol": "i8",
+        "acml_vol": "i8",
+        "acml_tr_pbmn": "i8",
+        "ccld_dvsn": "U1",
+    },
+    ORDERBOOK: {
+        "mksc_shrn_iscd": "U9",
+        "bsop_hour": "i4",
+        **{f"askp{i}": "i8" for i in range(1, 11)},
+        **{f"bidp{i}": "i8" for i in range(1, 11)},
+        **{f"askp_rsqn{i}": "i8" for i in range(1, 11)},
+        **{f"bidp_rsqn{i}": "i8" for i in range(1, 11)},
+        "total_askp_rsqn": "i8",
+        "total_bidp_rsqn": "i8",
+        "acml_vol": "i8",
+    },
+}
+
+
+def _realtime_endpoint(is_sandbox: bool) -> str:
+    return (
+        "ws://ops.koreainvestment.com:31000"
+        if is_sandbox
+        else "ws://ops.koreainvestment.com:21000"
+    )
+
+
+def get_approval_store(token_store: TokenStore) -> TokenStore:
+    """접근 토큰과 같은 파일에 접속키를 저장하는 TokenStore"""
+    return TokenStore(token_store.path, key=APPROVAL_KEY)
+
+
+def approval_request(app_key: str, app_secret: str) -> HttpRequest:
+    """웹소켓 접속키 발급 요청"""
+    return HttpRequest(
+        "POST",
+        "/oauth2/Approval",
+        json={
+            "grant_type": "client_credentials",
+            "appkey": app_key,
+            "secretkey": app_secret,
+        },
+    )
+
+
+def approval_token(body: Mapping[str, Any]) -> Dict[str, Any]:
+    """접속키 응답을 TokenStore에 저장할 형태로 바꾼다."""
+    expired = datetime.now() + APPROVAL_KEY_LIFETIME
+    return {
+        "approval_key": body["approval_key"],
+        "access_token_token_expired": expired.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+@dataclass
+class RealtimeFrame:
+    """
+    실시간 data frame
+
+    Attributes:
+        encrypted (bool): 암호화된 frame 여부 (체결통보)
+        tr_id (str): 실시간 tr_id
+        count (int): frame에 담긴 record 수
+        payload (str): "^"로 구분한 record 값
+    """
+
+    encrypted: bool
+    tr_id: str
+    count: int
+    payload: str
+
+
+def parse_frame(frame: str) -> Optional[RealtimeFrame]:
+    """
+    data frame을 나눈다. json 제어 frame이면 None을 반환한다.
+
+    Args:
+        frame (str): WebSocket으로 받은 text message
+    """
+    if not frame or frame[0] not in "01":
+        return None
+    encrypted, tr_id, count, payload = frame.split("|", 3)
+    return RealtimeFrame(encrypted == "1", tr_id, int(count), payload)
+
+
+class RealtimeBuffer:
+    """
+    tr_id 하나의 실시간 record를 담는 미리 할당한 column 배열 (ring buffer)
+
+    capacity를 넘으면 가장 오래된 record부터 덮어쓴다.
+
+    Args:
+        tr_id (str): TRADE 또는 ORDERBOOK
+        capacity (int): 보관할 최대 record 수
+        schema (Optional[Mapping[str, str]]): 보관할 field와 dtype. 기본값은 REALTIME_SCHEMAS[tr_id]
+    """
+
+    def __init__(
+        self,
+        tr_id: str,
+        capacity: int = 65536,
+        schema: Optional[Mapping[str, str]] = None,
+    ):
+        import numpy as np
+
+        if tr_id not in REALTIME_FIELDS:
+            raise KeyError(f"No field layout for realtime tr_id: {tr_id}")
+        self.tr_id = tr_id
+        self.capacity = capacity
+        self.schema = dict(REALTIME_SCHEMAS[tr_id] if schema is None else schema)
+        fields = REALTIME_FIELDS[tr_id]
+        self.field_count = len(fields)
+        self._columns = {
+            field: np.zeros(capacity, dtype=dtype)
+            for field, dtype in self.schema.items()
+        }
+        self._targets = [
+            (self._columns[field], fields.index(field)) for field in self.schema
+        ]
+        # 지금까지 쓴 record 수. 다음 record는 total % capacity 칸에 쓴다.
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def append(self, payload: str, count: int) -> None:
+        """
+        data frame의 payload를 buffer에 쓴다.
+
+        Args:
+            payload (str): RealtimeFrame.payload
+            count (int): payload의 record 수
+        """
+        values = payload.split("^")
+        n = self.field_count
+        if len(values) < count * n:
+            raise ValueError(
+                f"{self.tr_id} frame has {len(values)} values, expected {count * n}"
+            )
+        pos = self.total % self.capacity
+        if count == 1:
+            # 대부분의 frame은 record가 하나이므로 slice 대신 칸 하나에 대입한다.
+            for column, index in self._targets:
+                try:
+                    column[pos] = values[index]
+                except ValueError:
+                    self._assign(column, pos, 1, values[index : index + 1])
+            self.total += 1
+            return
+
+        offset = 0
+        while offset < count:
+            # capacity 끝에서 잘리면 앞쪽에 이어서 쓴다.
+            size = min(count - offset, self.capacity - pos)
+            first = offset * n
+            last = (offset + size) * n
+            for column, index in self._targets:
+                self._assign(column, pos, size, values[first + index : last : n])
+            offset += size
+            pos = 0
+        self.total += count
+
+    @staticmethod
+    def _assign(column: "np.ndarray", pos: int, size: int, values: Any) -> None:
+        try:
+            column[pos : pos + size] = values
+        except ValueError:
+            # 빈 칸이나 "1,234"처럼 바로 변환되지 않는 값이 섞인 경우
+            import numpy as np
+
+            from finance_clue.openkis._decode import _astype
+
+            column[pos : pos + size] = _astype(
+                np.array(values, dtype=str), column.dtype
+            )
+
+    def columns(self) -> Dict[str, "np.ndarray"]:
+        """
+        시간 순서대로 정렬한 field별 배열.
+
+        buffer가 한 바퀴 돌기 전에는 내부 배열의 view를 반환하므로 복사하지 않는다.
+        """
+        import numpy as np
+
+        if self.total <= self.capacity:
+            return {
+                field: column[: self.total] for field, column in self._columns.items()
+            }
+        start = self.total % self.capacity
+        return {
+            field: np.concatenate((column[start:], column[:start]))
+            for field, column in self._columns.items()
+        }
+
+    def clear(self) -> None:
+        self.total = 0
+
+
+@dataclass
+class RealtimeMetrics:
+    """
+    실시간 구독 통계
+
+    Attributes:
+        connects (int): 연결한 횟수
+        frames (int): 받은 data frame 수
+        records (int): 받은 record 수
+        encrypted (int): buffer에 쓰지 않은 암호화 frame 수
+        pingpongs (int): 응답한 PINGPONG 수
+    """
+
+    connects: int = 0
+    frames: int = 0
+    records: int = 0
+    encrypted: int = 0
+    pingpongs: int = 0
+
+
+ApprovalKey = Union[str, Callable[[], Union[str, Awaitable[str]]]]
+
+
+class RealtimeSubscriber:
+    """
+    KIS 실시간 시세 WebSocket 구독자
+
+    Args:
+        approval_key: 웹소켓 접속키 또는 접속키를 반환하는 함수(coroutine 함수 가능).
+            연결할 때마다 호출하므로 OpenKisClient.get_approval_key처럼 저장된 접속키를 재사용하는 함수를 넘긴다.
+        url (str): 실시간 시세 서버 url
+        buffers (Optional[Mapping[str, RealtimeBuffer]]): tr_id별 buffer.
+            없으면 처음 받은 tr_id마다 기본 schema의 RealtimeBuffer를 만든다.
+        capacity (int): 자동으로 만드는 buffer의 capacity
+        on_frame (Optional[Callable[[RealtimeFrame], None]]): data frame을 받을 때마다 호출할 함수
+        custtype (str): 고객타입. P: 개인, B: 법인
+        reconnect_delay (float): 처음 다시 연결할 때까지 기다리는 시간(초). 실패할 때마다 두 배로 늘린다.
+        max_reconnect_delay (float): 다시 연결할 때까지 기다리는 최대 시간(초)
+        max_reconnects (Optional[int]): 연속으로 다시 연결할 최대 횟수. 넘으면 마지막 오류를 던진다.
+
+    Example:
+        .. code-block:: python
+
+            subscriber = RealtimeSubscriber.from_client(client)
+            await subscriber.subscribe(TRADE, "005930")
+            task = asyncio.create_task(subscriber.run())
+            ...
+            subscriber.buffers[TRADE].columns()["stck_prpr"]
+    """
+
+    def __init__(
+        self,
+        approval_key: ApprovalKey,
+        url: str = _realtime_endpoint(False),
+        buffers: Optional[Mapping[str, RealtimeBuffer]] = None,
+        capacity: int = 65536,
+        on_frame: Optional[Callable[[RealtimeFrame], None]] = None,
+        custtype: str = "P",
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        max_reconnects: Optional[int] = None,
+    ):
+        self.approval_key = approval_key
+        self.url = url
+        self.buffers: Dict[str, RealtimeBuffer] = dict(buffers or {})
+        self.capacity = capacity
+        self.on_frame = on_frame
+        self.custtype = custtype
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.max_reconnects = max_reconnects
+        self.subscriptions: Set[Tuple[str, str]] = set()
+        # (tr_id, tr_key) -> 구독 실패 메시지
+        self.errors: Dict[Tuple[str, str], str] = {}
+        self.metrics = RealtimeMetrics()
+        self._websocket: Optional["ClientConnection"] = None
+        self._key: Optional[str] = None
+        # 지금 연결에 등록 요청을 보낸 구독
+        self._registered: Set[Tuple[str, str]] = set()
+        self._resubscribed = False
+        self._stopped = False
+
+    @classmethod
+    def from_client(cls, client: Any, **kwargs) -> "RealtimeSubscriber":
+        """
+        OpenKisClient의 appkey로 접속키를 발급받는 구독자를 만든다.
+
+        Args:
+            client: sync 또는 async OpenKisClient
+            kwargs: RealtimeSubscriber 인자
+        """
+        kwargs.setdefault("url", _realtime_endpoint(client.is_sandbox))
+        return cls(client.get_approval_key, **kwargs)
+
+    async def _approval_key(self) -> str:
+        key = self.approval_key
+        if not callable(key):
+            return key
+        if inspect.iscoroutinefunction(key):
+            return await key()
+        # sync client는 HTTP 요청을 보내므로 event loop를 막지 않도록 thread에서 호출한다.
+        result = await asyncio.get_running_loop().run_in_executor(None, key)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def _request(self, tr_id: str, tr_key: str, tr_type: str) -> str:
+        return json.dumps(
+            {
+                "header": {
+                    "approval_key": self._key,
+                    "custtype": self.custtype,
+                    "tr_type": tr_type,
+                    "content-type": "utf-8",
+                },
+                "body": {"input": {"tr_id": tr_id, "tr_key": tr_key}},
+            }
+        )
+
+    async def subscribe(self, tr_id: str, tr_key: str) -> None:
+        """
+        실시간 시세를 등록한다. 연결 전이면 연결할 때 등록한다.
+
+        Args:
+            tr_id (str): TRADE 또는 ORDERBOOK
+            tr_key (str): 종목코드
+        """
+        self.subscriptions.add((tr_id, tr_key))
+        if self._websocket is not None and (tr_id, tr_key) not in self._registered:
+            # send()를 기다리는 동안 run()이 같은 구독을 다시 보내지 않도록 먼저 표시한다.
+            self._registered.add((tr_id, tr_key))
+            await self._websocket.send(self._request(tr_id, tr_key, "1"))
+
+    async def unsubscribe(self, tr_id: str, tr_key: str) -> None:
+        """실시간 시세 등록을 해제한다."""
+        self.subscriptions.discard((tr_id, tr_key))
+        if self._websocket is not None and (tr_id, tr_key) in self._registered:
+            self._registered.discard((tr_id, tr_key))
+            await self._websocket.send(self._request(tr_id, tr_key, "2"))
+
+    def buffer(self, tr_id: str) -> RealtimeBuffer:
+        """tr_id의 buffer. 없으면 만든다."""
+        buffer = self.buffers.get(tr_id)
+        if buffer is None:
+            buffer = self.buffers[tr_id] = RealtimeBuffer(tr_id, self.capacity)
+        return buffer
+
+    async def handle(self, message: Union[str, bytes]) -> None:
+        """받은 message 하나를 처리한다."""
+        if isinstance(message, bytes):
+            message = message.decode()
+        frame = parse_frame(message)
+        if frame is not None:
+            self.metrics.frames += 1
+            self.metrics.records += frame.count
+            if frame.encrypted:
+                # 체결통보는 AES로 암호화되어 오므로 buffer에 쓰지 않고 on_frame에만 넘긴다.
+                self.metrics.encrypted += 1
+            elif frame.tr_id in REALTIME_FIELDS:
+                self.buffer(frame.tr_id).append(frame.payload, frame.count)
+            if self.on_frame is not None:
+                self.on_frame(frame)
+            return
+
+        control = json.loads(message)
+        header = control.get("header", {})
+        if header.get("tr_id") == "PINGPONG":
+            self.metrics.pingpongs += 1
+            if self._websocket is not None:
+                await self._websocket.send(message)
+            return
+        body = control.get("body", {})
+        key = (header.get("tr_id", ""), header.get("tr_key", ""))
+        if body.get("rt_cd", "0") != "0":
+            self.errors[key] = body.get("msg1", "")
+        else:
+            self.errors.pop(key, None)
+
+    @property
+    def connected(self) -> bool:
+        """연결해서 구독을 등록한 상태인지 여부"""
+        return self._websocket is not None and self._resubscribed
+
+    async def wait_connected(self, interval: float = 0.01) -> None:
+        """연결하고 구독을 등록할 때까지 기다린다."""
+        while not self.connected:
+            await asyncio.sleep(interval)
+
+    async def _resubscribe(self) -> None:
+        # 등록 요청을 보내는 동안 subscribe()로 추가된 구독도 빠짐없이 보낸다.
+        while self._websocket is not None:
+            pending = sorted(self.subscriptions - self._registered)
+            if not pending:
+                break
+            for tr_id, tr_key in pending:
+                # 앞의 send()를 기다리는 동안 subscribe()/unsubscribe()가 이미 처리했을 수 있다.
+                key = (tr_id, tr_key)
+                if key in self._registered or key not in self.subscriptions:
+                    continue
+                self._registered.add(key)
+                await self._websocket.send(self._request(tr_id, tr_key, "1"))
+        self._resubscribed = True
+
+    async def run(self) -> None:
+        """stop()을 호출할 때까지 연결을 유지하며 frame을 받는다."""
+        from websockets.asyncio.client import connect
+        from websockets.exceptions import ConnectionClosed
+        from websockets.exceptions import InvalidHandshake
+
+        self._stopped = False
+        delay = self.reconnect_delay
+        failures = 0
+        while not self._stopped:
+            try:
+                self._key = await self._approval_key()
+                # 구독을 보내다 실패해도 finally에서 닫을 수 있도록 바로 self._websocket에 둔다.
+                self._websocket = await connect(self.url, open_timeout=10.0)
+                self.metrics.connects += 1
+                await self._resubscribe()
+                delay = self.reconnect_delay
+                failures = 0
+                while True:
+                    await self.handle(await self._websocket.recv())
+            except (ConnectionClosed, InvalidHandshake, OSError, asyncio.TimeoutError):
+                if self._stopped:
+                    break
+                failures += 1
+                if self.max_reconnects is not None and failures > self.max_reconnects:
+                    raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+            finally:
+                websocket, self._websocket = self._websocket, None
+                self._registered.clear()
+                self._resubscribed = False
+                if websocket is not None:
+                    await websocket.close()
+
+    async def stop(self) -> None:
+        """연결을 닫고 run()을 끝낸다."""
+        self._stopped = True
+        if self._websocket is not None:
+            await self._websocket.close()
@@ -0,0 +1,247 @@
+"""KIS 실시간 시세 replay server
+
+기록해 둔 frame(또는 synthetic_frames()로 만든 frame)을 KIS 실시간 서버와 같은 방식으로 보내는
+로컬 WebSocket server. 구독 요청에 응답하고, 구독한 tr_id와 종목의 frame만 보낸다.
+test와 throughput benchmark에서 실제 서버 대신 쓴다. websockets가 설치되어 있어야 한다.
+
+frame 파일은 한 줄에 frame 하나인 text 파일이다.
+"""
+
+import asyncio
+import json
+import random
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Set, Tuple
+
+from finance_clue.openkis._realtime import REALTIME_FIELDS
+
+if TYPE_CHECKING:
+    from websockets.asyncio.server import Server
+    from websockets.asyncio.server import ServerConnection
+
+
+def load_frames(path: str) -> List[str]:
+    """frame 파일을 읽는다. 빈 줄은 건너뛴다."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f if line.strip()]
+
+
+def _record(tr_id: str, symbol: str, seq: int, rng: random.Random) -> List[str]:
+    fields = REALTIME_FIELDS[tr_id]
+    price = 70000 + rng.randint(-50, 50) * 100
+    second = seq % 23400
+    hour = f"{9 + second // 3600:02d}{second // 60 % 60:02d}{second % 60:02d}"
+    values = []
+    for field in fields:
+        if field == "mksc_shrn_iscd":
+            values.append(symbol)
+        elif field in ("stck_cntg_hour", "bsop_hour"):
+            values.append(hour)
+        elif field.startswith(("askp_rsqn", "bidp_rsqn", "total_")) or "vol" in field:
+            values.append(str(rng.randint(1, 100000)))
+        elif field.startswith("askp"):
+            values.append(str(price + int(field[4:]) * 100))
+        elif field.startswith("bidp"):
+            values.append(str(price - int(field[4:]) * 100))
+        elif field.endswith("ctrt") or field.endswith("rate"):
+            values.append(f"{rng.uniform(-5, 5):.2f}")
+        elif field.endswith("sign") or field.endswith("code") or field == "ccld_dvsn":
+            values.append(str(rng.randint(1, 5)))
+        elif field == "bsop_date":
+            values.append("20250102")
+        elif field == "trht_yn":
+            values.append("N")
+        else:
+            values.append(str(price))
+    return values
+
+
+def synthetic_frames(
+    tr_id: str,
+    symbols: Iterable[str],
+    count: int,
+    records_per_frame: int = 1,
+    seed: int = 0,
+) -> Iterator[str]:
+    """
+    그럴듯한 값으로 채운 data frame을 만든다.
+
+    Args:
+        tr_id (str): TRADE 또는 ORDERBOOK
+        symbols (Iterable[str]): 종목코드. frame마다 돌아가며 쓴다.
+        count (int): 만들 frame 수
+        records_per_frame (int): frame 하나에 담을 같은 종목의 record 수
+        seed (int): 난수 seed
+    """
+    rng = random.Random(seed)
+    symbols = list(symbols)
+    for i in range(count):
+        symbol = symbols[i % len(symbols)]
+        values: List[str] = []
+        for j in range(records_per_frame):
+            values += _record(tr_id, symbol, i * records_per_frame + j, rng)
+        yield f"0|{tr_id}|{records_per_frame:03d}|{'^'.join(values)}"
+
+
+def _frame_key(frame: str) -> Tuple[str, str]:
+    """frame의 (tr_id, 첫 record 종목코드)"""
+    _, tr_id, _, payload = frame.split("|", 3)
+    return tr_id, payload.split("^", 1)[0]
+
+
+class RealtimeReplayServer:
+    """
+    기록한 frame을 보내는 로컬 KIS 실시간 시세 server
+
+    Args:
+        frames (Iterable[str]): 보낼 frame. 구독한 (tr_id, 종목코드)의 frame만 보낸다.
+        host (str): listen할 주소
+        port (int): listen할 port. 0이면 빈 port를 고른다.
+        approval_key (Optional[str]): 지정하면 다른 접속키의 구독 요청은 거절한다.
+        frames_per_second (Optional[float]): 전송 속도. 없으면 최대한 빨리 보낸다.
+        ping_interval (Optional[float]): PINGPONG frame을 보내는 간격(초)
+        drop_after (Optional[int]): 첫 연결에서 frame을 이만큼 보낸 뒤 연결을 끊는다. 재연결 test에 쓴다.
+
+    Example:
+        .. code-block:: python
+
+            async with RealtimeReplayServer(synthetic_frames(TRADE, ["005930"], 1000)) as server:
+                subscriber = RealtimeSubscriber("key", url=server.url)
+    """
+
+    def __init__(
+        self,
+        frames: Iterable[str],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        approval_key: Optional[str] = None,
+        frames_per_second: Optional[float] = None,
+        ping_interval: Optional[float] = None,
+        drop_after: Optional[int] = None,
+    ):
+        self.frames = [(frame, _frame_key(frame)) for frame in frames]
+        self.host = host
+        self.port = port
+        self.approval_key = approval_key
+        self.frames_per_second = frames_per_second
+        self.ping_interval = ping_interval
+        self.drop_after = drop_after
+        self.connections = 0
+        # 받은 구독 요청 (tr_type, tr_id, tr_key)
+        self.requests: List[Tuple[str, str, str]] = []
+        self.pongs = 0
+        self._server: Optional["Server"] = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        from websockets.asyncio.server import serve
+
+        self._server = await serve(self._handle, self.host, self.port)
+        self.port = list(self._server.sockets)[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            # 열린 연결을 닫고 handler가 끝날 때까지 기다린다.
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "RealtimeReplayServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def _ack(self, request: dict, subscriptions: Set[Tuple[str, str]]) -> str:
+        header = request.get("header", {})
+        body = request.get("body", {}).get("input", {})
+        tr_type = header.get("tr_type", "1")
+        key = (body.get("tr_id", ""), body.get("tr_key", ""))
+        self.requests.append((tr_type, *key))
+
+        if (
+            self.approval_key is not None
+            and header.get("approval_key") != self.approval_key
+        ):
+            rt_cd, msg1 = "1", "invalid approval : NOT FOUND"
+        elif tr_type == "1":
+            subscriptions.add(key)
+            rt_cd, msg1 = "0", "SUBSCRIBE SUCCESS"
+        else:
+            subscriptions.discard(key)
+            rt_cd, msg1 = "0", "UNSUBSCRIBE SUCCESS"
+        return json.dumps(
+            {
+                "header": {"tr_id": key[0], "tr_key": key[1], "encrypt": "N"},
+                "body": {"rt_cd": rt_cd, "msg_cd": "OPSP0000", "msg1": msg1},
+            }
+        )
+
+    async def _receive(
+        self,
+        websocket: "ServerConnection",
+        subscriptions: Set[Tuple[str, str]],
+        subscribed: asyncio.Event,
+    ) -> None:
+        while True:
+            request = json.loads(await websocket.recv())
+            if request.get("header", {}).get("tr_id") == "PINGPONG":
+                self.pongs += 1
+                continue
+            await websocket.send(self._ack(request, subscriptions))
+            if subscriptions:
+                subscribed.set()
+
+    async def _ping(self, websocket: "ServerConnection", interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await websocket.send(
+                json.dumps(
+                    {"header": {"tr_id": "PINGPONG", "datetime": "20250102090000"}}
+                )
+            )
+
+    async def _handle(self, websocket: "ServerConnection") -> None:
+        from websockets.exceptions import ConnectionClosed
+
+        self.connections += 1
+        drop_after = self.drop_after if self.connections == 1 else None
+        subscriptions: Set[Tuple[str, str]] = set()
+        subscribed = asyncio.Event()
+        receiver = asyncio.ensure_future(
+            self._receive(websocket, subscriptions, subscribed)
+        )
+        tasks = [receiver, asyncio.ensure_future(subscribed.wait())]
+        if self.ping_interval:
+            tasks.append(
+                asyncio.ensure_future(self._ping(websocket, self.ping_interval))
+            )
+        try:
+            await asyncio.wait(tasks[:2], return_when=asyncio.FIRST_COMPLETED)
+            interval = 1 / self.frames_per_second if self.frames_per_second else 0
+            sent = 0
+            for frame, key in self.frames:
+                if receiver.done():
+                    break
+                if key not in subscriptions:
+                    continue
+                if drop_after is not None and sent >= drop_after:
+                    return
+                await websocket.send(frame)
+                sent += 1
+                if interval:
+                    await asyncio.sleep(interval)
+                elif sent % 256 == 0:
+                    # 구독 요청과 PINGPONG 응답을 받을 수 있도록 가끔 event loop에 양보한다.
+                    await asyncio.sleep(0)
+            # 다 보낸 뒤에는 client가 닫을 때까지 연결을 유지한다.
+            await receiver
+        except ConnectionClosed:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
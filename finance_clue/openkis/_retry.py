@@ -0,0 +1,207 @@
+"""KIS OpenAPI 업무 오류 응답 재시도
+
+KIS OpenAPI는 초당 거래건수 초과나 토큰 만료 같은 오류도 HTTP 200 또는 500에 rt_cd/msg_cd를 담아 응답한다.
+생성된 operation은 200이면 성공으로 처리하고, azure RetryPolicy는 500이면 body와 관계없이 다시 보낸다.
+응답 body의 오류 코드로 재시도할 수 있는 오류인지 나눠서,
+초당 거래건수 초과는 jitter를 준 backoff 후 다시 보내고, 토큰 만료는 토큰을 한 번 새로 받은 뒤 다시 보낸다.
+그 밖의 업무 오류는 다시 보내도 같은 결과이므로 재시도하지 않는다.
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+
+from azure.core.pipeline import PipelineRequest
+from azure.core.pipeline import PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+from azure.core.pipeline.policies import AsyncRetryPolicy
+from azure.core.pipeline.policies import HTTPPolicy
+from azure.core.pipeline.policies import RetryPolicy
+
+KIS_ERROR_THROTTLED = "throttled"
+KIS_ERROR_TOKEN_EXPIRED = "token_expired"
+KIS_ERROR_PERMANENT = "permanent"
+
+# 초당 거래건수를 초과하였습니다.
+THROTTLED_MSG_CODES = frozenset({"EGW00201"})
+THROTTLED_MESSAGE = "초당 거래건수를 초과"
+# 기간이 만료된 token 입니다. / 유효하지 않은 token 입니다.
+TOKEN_EXPIRED_MSG_CODES = frozenset({"EGW00123", "EGW00121"})
+
+# 응답을 분류한 결과를 pipeline context에 남기는 key
+CONTEXT_KEY = "kis_error"
+INSPECTED_STATUS_CODES = (200, 500)
+
+
+def classify_kis_error(body: Any) -> Optional[str]:
+    """
+    KIS 응답 body의 오류 종류
+
+    Args:
+        body (Any): json으로 변환한 응답 body
+
+    Returns:
+        Optional[str]: 정상 응답이면 None. 오류면 "throttled", "token_expired", "permanent" 중 하나
+    """
+    if not isinstance(body, Mapping):
+        return None
+    msg_cd = str(body.get("msg_cd") or body.get("error_code") or "")
+    message = str(body.get("msg1") or body.get("error_description") or "")
+    if msg_cd in THROTTLED_MSG_CODES or THROTTLED_MESSAGE in message:
+        return KIS_ERROR_THROTTLED
+    if msg_cd in TOKEN_EXPIRED_MSG_CODES:
+        return KIS_ERROR_TOKEN_EXPIRED
+    if str(body.get("rt_cd", "0")) != "0" or "error_code" in body:
+        return KIS_ERROR_PERMANENT
+    return None
+
+
+def _classify_response(response: PipelineResponse) -> Optional[str]:
+    http_response = response.http_response
+    if http_response.status_code not in INSPECTED_STATUS_CODES:
+        return None
+    # stream으로 요청한 응답은 body를 읽지 않는다.
+    if response.context.options.get("stream", True):
+        return None
+    try:
+        return classify_kis_error(json.loads(http_response.text()))
+    except ValueError:
+        return None
+
+
+def _bearer_token(request: PipelineRequest) -> Optional[str]:
+    authorization = request.http_request.headers.get("authorization", "")
+    return authorization.split(" ", 1)[-1] or None
+
+
+class _KisErrorPolicyBase:
+    def __init__(
+        self,
+        credentials: Any,
+        max_throttle_retries: int = 3,
+        backoff_factor: float = 0.2,
+        backoff_max: float = 2.0,
+    ):
+        super().__init__()
+        self.credentials = credentials
+        self.max_throttle_retries = max_throttle_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.stats: Dict[str, int] = {
+            KIS_ERROR_THROTTLED: 0,
+            KIS_ERROR_TOKEN_EXPIRED: 0,
+            KIS_ERROR_PERMANENT: 0,
+        }
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째(0부터) 재시도 전에 기다릴 시간. 절반은 고정, 절반은 무작위로 준다."""
+        delay = min(self.backoff_max, self.backoff_factor * (2**attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _set_authorization(self, request: PipelineRequest) -> None:
+        request.http_request.headers["authorization"] = (
+            f"{self.credentials.token_type} {self.credentials.access_token}"
+        )
+
+    def _next_action(
+        self, response: PipelineResponse, throttled: int, refreshed: bool
+    ) -> Optional[str]:
+        kind = _classify_response(response)
+        response.context[CONTEXT_KEY] = kind
+        if kind is not None:
+            self.stats[kind] += 1
+        if kind == KIS_ERROR_THROTTLED and throttled < self.max_throttle_retries:
+            return kind
+        if kind == KIS_ERROR_TOKEN_EXPIRED and not refreshed:
+            return kind
+        return None
+
+
+class KisErrorPolicy(_KisErrorPolicyBase, HTTPPolicy):
+    """
+    KIS 업무 오류 응답을 보고 재시도하는 policy
+
+    retry policy 뒤, RateLimitPolicy 앞(per_retry_policies)에 두면 다시 보내는 요청도 rate limit을 거친다.
+    분류 결과는 response.context["kis_error"]에 남는다.
+
+    Args:
+        credentials (CustomCredentials): 토큰을 새로 받은 뒤 authorization header를 다시 만들 credential
+        refresh_token (Callable[[Optional[str]], None]): 만료된 토큰을 받아 새 토큰으로 바꾸는 함수.
+            여러 thread가 동시에 호출해도 발급은 한 번만 일어나야 한다.
+        max_throttle_retries (int): 초당 거래건수 초과 응답을 다시 보낼 최대 횟수
+        backoff_factor (float): 첫 재시도 backoff(초). 재시도마다 두 배로 늘어난다.
+        backoff_max (float): backoff 최댓값(초)
+
+    Attributes:
+        stats (Dict[str, int]): 오류 종류별 응답 수
+    """
+
+    def __init__(
+        self,
+        credentials: Any,
+        refresh_token: Callable[[Optional[str]], None],
+        **kwargs: Any,
+    ):
+        super().__init__(credentials, **kwargs)
+        self.refresh_token = refresh_token
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        throttled, refreshed = 0, False
+        while True:
+            response = self.next.send(request)
+            action = self._next_action(response, throttled, refreshed)
+            if action is None:
+                return response
+            if action == KIS_ERROR_THROTTLED:
+                time.sleep(self.backoff(throttled))
+                throttled += 1
+            else:
+                self.refresh_token(_bearer_token(request))
+                self._set_authorization(request)
+                refreshed = True
+
+
+class AsyncKisErrorPolicy(_KisErrorPolicyBase, AsyncHTTPPolicy):
+    """KisErrorPolicy의 async 버전. refresh_token은 coroutine 함수다."""
+
+    def __init__(
+        self,
+        credentials: Any,
+        refresh_token: Callable[[Optional[str]], Awaitable[None]],
+        **kwargs: Any,
+    ):
+        super().__init__(credentials, **kwargs)
+        self.refresh_token = refresh_token
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        throttled, refreshed = 0, False
+        while True:
+            response = await self.next.send(request)
+            action = self._next_action(response, throttled, refreshed)
+            if action is None:
+                return response
+            if action == KIS_ERROR_THROTTLED:
+                await asyncio.sleep(self.backoff(throttled))
+                throttled += 1
+            else:
+                await self.refresh_token(_bearer_token(request))
+                self._set_authorization(request)
+                refreshed = True
+
+
+class _KisRetryMixin:
+    def is_retry(self, settings: Dict[str, Any], response: PipelineResponse) -> bool:
+        # KisErrorPolicy가 이미 처리한 업무 오류 응답은 status와 관계없이 다시 보내지 않는다.
+        if response.context.get(CONTEXT_KEY) is not None:
+            return False
+        return super().is_retry(settings, response)  # type: ignore[misc]
+
+
+class KisRetryPolicy(_KisRetryMixin, RetryPolicy):
+    """업무 오류가 담긴 500 응답은 다시 보내지 않는 RetryPolicy"""
+
+
+class AsyncKisRetryPolicy(_KisRetryMixin, AsyncRetryPolicy):
+    """KisRetryPolicy의 async 버전"""
@@ -0,0 +1,190 @@
+"""국내주식 현재가 일괄 조회
+
+get_domestic_stock_price는 종목 하나의 현재가를 문자열 field 80여개로 반환한다.
+시장 전체 종목을 조회할 때는 종목별 호출을 rate limit 안에서 동시에 보내고,
+결과를 field별 typed 배열 하나씩으로 모은다.
+
+numpy가 설치되어 있어야 한다.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional
+
+from finance_clue.error import KisApiError
+from finance_clue.openkis._decode import FieldSchema
+from finance_clue.openkis._decode import decode_columns
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 기본으로 모으는 field와 numpy dtype
+DEFAULT_QUOTE_FIELDS: Dict[str, str] = {
+    "stck_prpr": "i8",  # 주식 현재가
+    "prdy_vrss": "i8",  # 전일 대비
+    "prdy_ctrt": "f8",  # 전일 대비율
+    "stck_oprc": "i8",  # 시가
+    "stck_hgpr": "i8",  # 최고가
+    "stck_lwpr": "i8",  # 최저가
+    "stck_mxpr": "i8",  # 상한가
+    "stck_llam": "i8",  # 하한가
+    "acml_vol": "i8",  # 누적 거래량
+    "acml_tr_pbmn": "i8",  # 누적 거래 대금
+    "hts_avls": "i8",  # HTS 시가총액
+    "per": "f8",
+    "pbr": "f8",
+    "eps": "f8",
+    "bps": "f8",
+    "hts_frgn_ehrt": "f8",  # HTS 외국인 소진율
+    "iscd_stat_cls_code": "U",  # 종목 상태 구분 코드
+}
+
+
+@dataclass
+class QuoteSnapshot:
+    """
+    여러 종목의 현재가를 field별 배열로 모은 표
+
+    columns의 배열과 errors는 symbols와 같은 순서다.
+    조회에 실패한 종목은 errors 칸에 예외가 들어가고, 배열 칸은 숫자는 0(실수는 NaN), 문자열은 빈 문자열로 채운다.
+
+    Attributes:
+        symbols (List[str]): 종목코드
+        columns (Dict[str, np.ndarray]): field별 배열
+        errors (List[Optional[Exception]]): 종목별 조회 예외. 성공하면 None
+    """
+
+    symbols: List[str]
+    columns: Dict[str, "np.ndarray"]
+    errors: List[Optional[Exception]]
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, field: str) -> "np.ndarray":
+        return self.columns[field]
+
+    @property
+    def ok(self) -> "np.ndarray":
+        """조회에 성공한 종목 mask"""
+        import numpy as np
+
+        return np.array([e is None for e in self.errors], dtype=bool)
+
+    @property
+    def failed(self) -> Dict[str, Exception]:
+        """조회에 실패한 종목코드와 예외"""
+        return {s: e for s, e in zip(self.symbols, self.errors) if e is not None}
+
+    def row(self, symbol: str) -> Dict[str, Any]:
+        """종목 하나의 field 값"""
+        i = self.symbols.index(symbol)
+        return {field: values[i].item() for field, values in self.columns.items()}
+
+
+def build_quote_snapshot(
+    symbols: List[str],
+    outputs: List[Optional[Mapping[str, Any]]],
+    errors: List[Optional[Exception]],
+    fields: Optional[FieldSchema] = None,
+) -> QuoteSnapshot:
+    """종목별 응답 output을 field별 배열로 변환한다. 변환할 수 없는 값은 그 종목의 error가 된다."""
+    import numpy as np
+
+    invalid = np.zeros(len(outputs), dtype=bool)
+    columns = decode_columns(
+        [output or {} for output in outputs], fields or DEFAULT_QUOTE_FIELDS, invalid
+    )
+    errors = [
+        error or (ValueError(f"Invalid quote value: {symbol}") if bad else None)
+        for symbol, error, bad in zip(symbols, errors, invalid)
+    ]
+    return QuoteSnapshot(symbols=list(symbols), columns=columns, errors=errors)
+
+
+def _output(resp: Any) -> Mapping[str, Any]:
+    """응답 body의 output. HTTP 200이어도 rt_cd가 0이 아니면 KisApiError를 던진다."""
+    body = resp or {}
+    if body.get("rt_cd", "0") != "0":
+        raise KisApiError(body.get("rt_cd"), body.get("msg_cd"), body.get("msg1"))
+    return body.get("output") or {}
+
+
+def snapshot_quotes(
+    client: Any,
+    symbols: Iterable[str],
+    fields: Optional[FieldSchema] = None,
+    max_workers: int = 16,
+    **kwargs: Any,
+) -> QuoteSnapshot:
+    """
+    여러 종목의 현재가를 thread pool에서 동시에 조회해서 field별 배열로 모은다.
+
+    호출 속도는 client의 rate limit policy가 맞춘다.
+
+    Args:
+        client: OpenKisClient
+        symbols (Iterable[str]): 종목코드
+        fields (Optional[FieldSchema]): 모을 field와 numpy dtype. 기본값은 DEFAULT_QUOTE_FIELDS
+        max_workers (int): 동시에 보낼 요청 수
+        kwargs: get_domestic_stock_price에 넘길 parameter
+
+    Returns:
+        QuoteSnapshot: 종목 순서대로 모은 현재가 표
+
+    Example:
+        .. code-block:: python
+
+            snapshot = snapshot_quotes(client, ["005930", "000660"])
+            snapshot["stck_prpr"][snapshot.ok]
+    """
+    symbols = list(symbols)
+    outputs: List[Optional[Mapping[str, Any]]] = [None] * len(symbols)
+    errors: List[Optional[Exception]] = [None] * len(symbols)
+
+    def fetch(i: int) -> None:
+        try:
+            outputs[i] = _output(
+                client.get_domestic_stock_price(fid_input_iscd=symbols[i], **kwargs)
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            errors[i] = e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fetch, range(len(symbols))))
+    return build_quote_snapshot(symbols, outputs, errors, fields)
+
+
+async def asnapshot_quotes(
+    client: Any,
+    symbols: Iterable[str],
+    fields: Optional[FieldSchema] = None,
+    concurrency: int = 32,
+    **kwargs: Any,
+) -> QuoteSnapshot:
+    """snapshot_quotes()의 async 버전. openkis.aio client를 넘긴다."""
+    symbols = list(symbols)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(symbol: str) -> Mapping[str, Any]:
+        async with semaphore:
+            return _output(
+                await client.get_domestic_stock_price(fid_input_iscd=symbol, **kwargs)
+            )
+
+    results = await asyncio.gather(
+        *[fetch(symbol) for symbol in symbols], return_exceptions=True
+    )
+    outputs: List[Optional[Mapping[str, Any]]] = []
+    errors: List[Optional[Exception]] = []
+    for r in results:
+        if isinstance(r, Exception):
+            outputs.append(None)
+            errors.append(r)
+        elif isinstance(r, BaseException):
+            raise r
+        else:
+            outputs.append(r)
+            errors.append(None)
+    return build_quote_snapshot(symbols, outputs, errors, fields)
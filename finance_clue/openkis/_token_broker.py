@@ -0,0 +1,266 @@
+"""KIS 접근 토큰 broker
+
+짧게 실행되는 process가 많으면 process마다 init()에서 토큰 파일을 확인하고, 만료가 가까우면
+토큰 발급을 기다린다. broker는 loopback HTTP server로 토큰을 들고 있다가
+access_token_token_expired 전에 미리 갱신하고, client에는 들고 있는 토큰을 바로 돌려준다.
+
+broker를 실행한다.
+
+    OPENKIS_APP_KEY=... OPENKIS_APP_SECRET=... python -m finance_clue.openkis._token_broker --port 8765
+
+client는 token_broker 인자나 FINANCE_CLUE_TOKEN_BROKER 환경변수로 broker url을 지정한다.
+서버가 토큰이 만료되었다고 응답하면 client는 직접 발급하지 않고 POST /token/refresh로 broker에 갱신을 요청한다.
+"""
+
+import argparse
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import os
+import sys
+import threading
+from typing import Any, Dict, Optional
+from urllib.request import Request
+from urllib.request import urlopen
+
+TOKEN_BROKER_ENV = "FINANCE_CLUE_TOKEN_BROKER"
+
+
+def get_token_broker_url(url: Optional[str] = None) -> Optional[str]:
+    """broker url. None이면 FINANCE_CLUE_TOKEN_BROKER 환경변수를 쓰고, 빈 문자열이면 broker를 쓰지 않는다."""
+    if url is None:
+        url = os.environ.get(TOKEN_BROKER_ENV)
+    return url or None
+
+
+def fetch_broker_token(
+    url: str,
+    app_key: str,
+    timeout: float = 5.0,
+    stale_token: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    broker에서 토큰을 받는다.
+
+    Args:
+        url (str): broker url (예: http://127.0.0.1:8765)
+        app_key (str): 토큰을 요청할 appkey. broker의 appkey와 다르면 거절된다.
+        timeout (float): 요청 제한 시간(초)
+        stale_token (Optional[str]): 서버가 만료되었다고 응답한 토큰. 넘기면 broker가 이 토큰을 버리고
+            새 토큰을 받아 돌려준다.
+
+    Raises:
+        OSError: broker에 연결할 수 없거나 broker가 오류로 응답했을 때
+    """
+    if stale_token is None:
+        request = Request(f"{url.rstrip('/')}/token", headers={"appkey": app_key})
+    else:
+        request = Request(
+            f"{url.rstrip('/')}/token/refresh",
+            data=json.dumps({"stale_token": stale_token}).encode(),
+            headers={"appkey": app_key, "Content-Type": "application/json"},
+            method="POST",
+        )
+    with urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+class TokenBroker:
+    """
+    접근 토큰을 들고 있다가 만료 전에 갱신하고, loopback HTTP로 나눠주는 broker
+
+    GET /token 요청의 appkey header가 broker의 appkey와 같을 때만 토큰을 돌려준다.
+    POST /token/refresh는 body의 stale_token을 버리고 새로 받은 토큰을 돌려준다.
+    여러 client가 같은 토큰으로 요청해도 발급은 한 번만 일어난다.
+
+    Args:
+        client: 토큰을 발급받을 sync OpenKisClient. broker를 쓰지 않도록 token_broker=""로 만든다.
+        host (str): listen할 주소. 토큰을 보내므로 loopback 주소만 쓴다.
+        port (int): listen할 port. 0이면 빈 port를 고른다.
+        refresh_before (int): 만료 몇 초 전에 토큰을 갱신할지
+        retry_interval (float): 발급에 실패했을 때 다시 시도할 때까지 기다리는 시간(초).
+            KIS는 1분에 한 번만 토큰을 발급한다.
+
+    Example:
+        .. code-block:: python
+
+            broker = TokenBroker(OpenKisClient(app_key, app_secret), port=8765)
+            broker.serve_forever()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        refresh_before: int = 600,
+        retry_interval: float = 60.0,
+    ):
+        self.client = client
+        self.refresh_before = refresh_before
+        self.retry_interval = retry_interval
+        self.token_obj: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host = self._server.server_address[0]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{self._server.server_port}"
+
+    def _handler_class(self) -> type:
+        broker = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                if self.path != "/token":
+                    self._reply(404, {"error": "not found"})
+                elif self.headers.get("appkey") != broker.client._credential.app_key:
+                    self._reply(403, {"error": "appkey mismatch"})
+                else:
+                    token_obj = broker.token()
+                    if token_obj is None:
+                        self._reply(503, {"error": str(broker.error)})
+                    else:
+                        self._reply(200, token_obj)
+
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                if self.path != "/token/refresh":
+                    self._reply(404, {"error": "not found"})
+                elif self.headers.get("appkey") != broker.client._credential.app_key:
+                    self._reply(403, {"error": "appkey mismatch"})
+                else:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    try:
+                        body = json.loads(self.rfile.read(length) or b"{}")
+                        token_obj = broker.refresh(body.get("stale_token"))
+                    except Exception as e:  # pylint: disable=broad-except
+                        self._reply(503, {"error": str(e)})
+                    else:
+                        self._reply(200, token_obj)
+
+            def _reply(self, status: int, body: Dict[str, Any]) -> None:
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+    def token(self) -> Optional[Dict[str, Any]]:
+        """들고 있는 토큰. 발급 전이면 None"""
+        with self._lock:
+            return self.token_obj
+
+    def refresh(self, stale_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        만료까지 refresh_before초 넘게 남은 토큰을 확보한다.
+
+        토큰 파일(TokenStore)에 남은 토큰이 충분하면 재사용하고, 아니면 새로 발급받아 저장한다.
+
+        Args:
+            stale_token (Optional[str]): 만료시각이 남았더라도 쓸 수 없는 토큰. 이미 다른 토큰으로 바꿨으면 다시 발급하지 않는다.
+        """
+        token_obj = self.client._token_store.get_or_issue(
+            self.client._issue_access_token,
+            min_valid_seconds=self.refresh_before,
+            stale_token=stale_token,
+        )
+        with self._lock:
+            self.token_obj = token_obj
+            self.error = None
+        return token_obj
+
+    def _seconds_until_refresh(self) -> float:
+        token_obj = self.token()
+        if token_obj is None:
+            return 0
+        expired = datetime.fromisoformat(token_obj["access_token_token_expired"])
+        remaining = (expired - datetime.now()).total_seconds()
+        return max(remaining - self.refresh_before, 1)
+
+    def _refresh_loop(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.refresh()
+                wait = self._seconds_until_refresh()
+            except Exception as e:  # pylint: disable=broad-except
+                with self._lock:
+                    self.error = e
+                wait = self.retry_interval
+            self._stopped.wait(wait)
+
+    def start(self) -> None:
+        """토큰을 한 번 확보하고, 갱신 thread와 HTTP server thread를 시작한다."""
+        try:
+            self.refresh()
+        except Exception as e:  # pylint: disable=broad-except
+            self.error = e
+        self._stopped.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._refresher.start()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def serve_forever(self) -> None:
+        """start()한 뒤 stop()할 때까지 기다린다."""
+        self.start()
+        self._stopped.wait()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+        if self._refresher is not None:
+            self._refresher.join()
+
+    def __enter__(self) -> "TokenBroker":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+def main(argv: Optional[list] = None) -> int:
+    from finance_clue.openkis._patch import OpenKisClient
+
+    parser = argparse.ArgumentParser(description="KIS access token broker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sandbox", action="store_true")
+    parser.add_argument("--token-path", default=None)
+    parser.add_argument("--refresh-before", type=int, default=600)
+    args = parser.parse_args(argv)
+
+    client = OpenKisClient(
+        os.environ["OPENKIS_APP_KEY"],
+        os.environ["OPENKIS_APP_SECRET"],
+        is_sandbox=args.sandbox,
+        token_path=args.token_path,
+        token_broker="",
+    )
+    broker = TokenBroker(
+        client, args.host, args.port, refresh_before=args.refresh_before
+    )
+    print(f"token broker listening on {broker.url}", flush=True)
+    try:
+        broker.serve_forever()
+    except KeyboardInterrupt:
+        broker.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""여러 process가 함께 쓰는 KIS 접근 토큰 저장소
+
+토큰 파일은 advisory lock을 잡은 상태에서만 읽고 쓰며, 임시 파일에 쓴 뒤 os.replace로 교체하므로
+다른 process가 쓰다 만 json을 읽는 일이 없다.
+토큰이 만료됐을 때는 lock을 잡은 process 하나만 토큰을 발급하고, 나머지는 lock이 풀린 뒤 새 토큰을 읽는다.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import os
+import sys
+import tempfile
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _try_lock_file(f) -> bool:
+        f.seek(0)
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _unlock_file(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _try_lock_file(f) -> bool:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def _unlock_file(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+DEFAULT_TOKEN_FILE = "finance_clue.json"
+# alock()이 lock을 다시 확인하기까지 기다리는 시간(초)
+LOCK_POLL_SECONDS = 0.01
+TOKEN_KEY = "open_kis"
+
+
+def is_token_valid(token_obj: Optional[Dict[str, Any]], min_valid_seconds: int) -> bool:
+    """토큰 만료시각(access_token_token_expired)까지 min_valid_seconds 이상 남았는지 여부"""
+    if not token_obj or "access_token_token_expired" not in token_obj:
+        return False
+    expired = datetime.fromisoformat(token_obj["access_token_token_expired"])
+    return (expired - datetime.now()).total_seconds() > min_valid_seconds
+
+
+def _is_usable(
+    token_obj: Optional[Dict[str, Any]],
+    min_valid_seconds: int,
+    stale_token: Optional[str],
+) -> bool:
+    if stale_token is not None and token_obj is not None:
+        if token_obj.get("access_token") == stale_token:
+            return False
+    return is_token_valid(token_obj, min_valid_seconds)
+
+
+class TokenStore:
+    """
+    KIS 접근 토큰 파일 저장소
+
+    Args:
+        path (Optional[str]): 토큰 파일 경로. 없으면 FINANCE_CLUE_TOKEN_FILE 환경변수,
+            그것도 없으면 현재 디렉토리의 finance_clue.json을 사용한다.
+        key (str): 토큰 파일에서 토큰을 저장하는 key
+    """
+
+    def __init__(self, path: Optional[str] = None, key: str = TOKEN_KEY):
+        self.path = path or os.environ.get(
+            "FINANCE_CLUE_TOKEN_FILE", DEFAULT_TOKEN_FILE
+        )
+        self.key = key
+        self._thread_lock = threading.RLock()
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._async_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def lock_path(self) -> str:
+        return f"{self.path}.lock"
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """같은 토큰 파일을 쓰는 thread, process 사이의 exclusive lock"""
+        with self._thread_lock:
+            with open(self.lock_path, "a+", encoding="utf-8") as f:
+                _lock_file(f)
+                try:
+                    yield
+                finally:
+                    _unlock_file(f)
+
+    @asynccontextmanager
+    async def alock(self) -> AsyncIterator[None]:
+        """
+        lock()의 async 버전
+
+        다른 thread나 process가 lock을 잡고 있으면 event loop를 막지 않고 asyncio.sleep으로 기다린다.
+        thread lock은 재진입이 되므로 같은 event loop의 coroutine끼리는 aget_or_issue()의 asyncio.Lock으로 나눈다.
+        """
+        while not self._thread_lock.acquire(blocking=False):
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+        try:
+            with open(self.lock_path, "a+", encoding="utf-8") as f:
+                while not _try_lock_file(f):
+                    await asyncio.sleep(LOCK_POLL_SECONDS)
+                try:
+                    yield
+                finally:
+                    _unlock_file(f)
+        finally:
+            self._thread_lock.release()
+
+    def _read_all(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_all(self, obj: Dict[str, Any]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".finance_clue.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(obj, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """저장된 토큰. 없으면 None"""
+        with self.lock():
+            return self._read_all().get(self.key)
+
+    def write(self, token_obj: Dict[str, Any]) -> None:
+        with self.lock():
+            self._write_unlocked(token_obj)
+
+    def _write_unlocked(self, token_obj: Dict[str, Any]) -> None:
+        obj = self._read_all()
+        obj[self.key] = token_obj
+        self._write_all(obj)
+
+    def clear(self) -> None:
+        """저장된 토큰을 삭제한다. 다른 key가 없으면 파일도 삭제한다."""
+        if not os.path.exists(self.path):
+            return
+
+        with self.lock():
+            obj = self._read_all()
+            obj.pop(self.key, None)
+            if obj:
+                self._write_all(obj)
+            elif os.path.exists(self.path):
+                os.remove(self.path)
+
+    def get_or_issue(
+        self,
+        issue: Callable[[], Dict[str, Any]],
+        min_valid_seconds: int = 300,
+        stale_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        유효한 토큰이 있으면 반환하고, 없으면 issue()로 발급받아 저장한 뒤 반환한다.
+
+        lock을 잡은 상태에서 확인하고 발급하므로 여러 process가 동시에 호출해도 발급은 한 번만 일어난다.
+        stale_token을 넘기면 만료시각이 남았더라도 그 토큰은 유효하지 않은 것으로 본다.
+        """
+        with self.lock():
+            token_obj = self._read_all().get(self.key)
+            if token_obj is not None and _is_usable(
+                token_obj, min_valid_seconds, stale_token
+            ):
+                return token_obj
+
+            token_obj = issue()
+            self._write_unlocked(token_obj)
+            return token_obj
+
+    async def aget_or_issue(
+        self,
+        issue: Callable[[], Awaitable[Dict[str, Any]]],
+        min_valid_seconds: int = 300,
+        stale_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        get_or_issue()의 async 버전
+
+        파일 lock은 alock()으로 event loop를 막지 않고 기다린다. 발급을 기다리는 동안 lock을 잡고 있으므로,
+        같은 event loop의 다른 coroutine은 asyncio.Lock에서 기다린다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_lock is None or self._async_lock_loop is not loop:
+            self._async_lock = asyncio.Lock()
+            self._async_lock_loop = loop
+
+        async with self._async_lock:
+            async with self.alock():
+                token_obj = self._read_all().get(self.key)
+                if token_obj is not None and _is_usable(
+                    token_obj, min_valid_seconds, stale_token
+                ):
+                    return token_obj
+
+                token_obj = await issue()
+                self._write_unlocked(token_obj)
+                return token_obj
+
+
+_stores: Dict[str, TokenStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_token_store(path: Optional[str] = None) -> TokenStore:
+    """경로별로 하나의 TokenStore를 공유한다. 같은 process 안에서는 같은 lock을 쓰게 된다."""
+    store = TokenStore(os.path.abspath(TokenStore(path).path))
+    with _stores_lock:
+        return _stores.setdefault(store.path, store)
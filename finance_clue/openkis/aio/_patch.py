@@ -6,11 +6,169 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+import asyncio
+from typing import Any, Dict, List, Optional
 
-__all__: List[str] = (
-    []
-)  # Add all objects you want publicly available to users at this package level
+from azure.core.credentials import AccessToken
+
+from finance_clue._pipeline import FastSendRequestMixin
+from finance_clue._pipeline import PROFILE_DEFAULT
+from finance_clue._pipeline import apply_profile
+from finance_clue._transport import TransportConfig
+from finance_clue._transport import aiohttp_transport
+from finance_clue._transport import apply_transport
+from finance_clue.openkis._cache import AsyncCachePolicy
+from finance_clue.openkis._cache import ResponseCache
+from finance_clue.openkis._paging import AsyncCursorIterator
+from finance_clue.openkis._paging import aiter_tr_cont_pages
+from finance_clue.openkis._paging import aiter_tr_cont_rows
+from finance_clue.openkis._patch import AsyncCustomAuthenticationPolicy
+from finance_clue.openkis._patch import CustomCredentials
+from finance_clue.openkis._patch import _endpoint
+from finance_clue.openkis._patch import _token_request_body
+from finance_clue.openkis._patch import _update_credential
+from finance_clue.openkis._rate_limit import AsyncRateLimitPolicy
+from finance_clue.openkis._rate_limit import TokenBucket
+from finance_clue.openkis._realtime import approval_request
+from finance_clue.openkis._realtime import approval_token
+from finance_clue.openkis._realtime import get_approval_store
+from finance_clue.openkis._retry import AsyncKisErrorPolicy
+from finance_clue.openkis._retry import AsyncKisRetryPolicy
+from finance_clue.openkis._snapshot import asnapshot_quotes
+from finance_clue.openkis._token_broker import get_token_broker_url
+from finance_clue.openkis._token_store import get_token_store
+from finance_clue.openkis.aio import GenOpenKisClient
+
+
+class AsyncCustomCredentials:
+    """
+    CustomCredentials를 AsyncTokenCredential로 감싼다. 토큰은 감싼 CustomCredentials와 공유한다.
+
+    Args:
+        credential (CustomCredentials): appkey, appsecret과 접근 토큰
+    """
+
+    def __init__(self, credential: CustomCredentials):
+        self.credential = credential
+
+    async def get_token(self, *args, **kwargs) -> AccessToken:
+        return self.credential.get_token(*args, **kwargs)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "AsyncCustomCredentials":
+        return self
+
+    async def __aexit__(self, *exc_details) -> None:
+        pass
+
+
+class OpenKisClient(FastSendRequestMixin, GenOpenKisClient):
+    """
+    한국투자증권 OpenAPI async client
+
+    Args:
+        app_key (str): 한국투자증권에서 발급받은 appkey
+        app_secret (str): 한국투자증권에서 발급받은 appsecret
+        is_sandbox (bool): 모의투자 서버 사용 여부
+        token_path (Optional[str]): 접근 토큰을 저장할 파일 경로. 기본값은 finance_clue.json
+        rate_limiter (Optional[TokenBucket]): 초당 거래건수 제한. 없으면 제한하지 않는다.
+            appkey별로 공유하는 실전/모의투자 기본 제한은 get_token_bucket()으로 만든다.
+        token_broker (Optional[str]): 토큰 broker url. 없으면 FINANCE_CLUE_TOKEN_BROKER 환경변수를 쓰고,
+            빈 문자열이면 broker를 쓰지 않는다.
+        cache (Optional[ResponseCache]): 조회 응답 cache. 지정하면 tr_id별 TTL 동안 같은 요청의 응답을 재사용한다.
+        profile (str): pipeline profile. "fast"면 proxy, 재시도, 인증, rate limit, cache policy만 거친다.
+        kis_retry (Optional[Dict[str, Any]]): AsyncKisErrorPolicy 설정(max_throttle_retries, backoff_factor, backoff_max)
+        transport_config (Optional[TransportConfig]): aiohttp transport의 connection pool, timeout 설정.
+            aiohttp가 없거나 event loop 밖에서 client를 만들면 PooledAsyncioRequestsTransport를 쓴다.
+            transport를 직접 넘기면 무시한다.
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        is_sandbox: bool = False,
+        token_path: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache: Optional[ResponseCache] = None,
+        profile: str = PROFILE_DEFAULT,
+        token_broker: Optional[str] = None,
+        kis_retry: Optional[Dict[str, Any]] = None,
+        transport_config: Optional[TransportConfig] = None,
+        **kwargs,
+    ):
+        self._credential = CustomCredentials(
+            app_key, app_secret, get_token_broker_url(token_broker)
+        )
+        self._token_store = get_token_store(token_path)
+        self._approval_store = get_approval_store(self._token_store)
+        self.is_sandbox = is_sandbox
+        self.rate_limiter = rate_limiter
+        if "endpoint" not in kwargs:
+            kwargs["endpoint"] = _endpoint(is_sandbox)
+
+        self.cache = cache
+        if cache is not None:
+            kwargs["per_call_policies"] = [
+                AsyncCachePolicy(cache),
+                *kwargs.get("per_call_policies", []),
+            ]
+
+        self.error_policy = AsyncKisErrorPolicy(
+            self._credential, self._refresh_access_token, **(kis_retry or {})
+        )
+        kwargs["per_retry_policies"] = [
+            *kwargs.get("per_retry_policies", []),
+            self.error_policy,
+        ]
+        if rate_limiter is not None:
+            kwargs["per_retry_policies"].append(AsyncRateLimitPolicy(rate_limiter))
+        if kwargs.get("retry_policy") is None:
+            kwargs["retry_policy"] = AsyncKisRetryPolicy(**kwargs)
+
+        kwargs["authentication_policy"] = AsyncCustomAuthenticationPolicy(
+            self._credential, self._token_store
+        )
+        self._profile = profile
+        apply_profile(kwargs, profile, is_async=True)
+        apply_transport(kwargs, transport_config, is_async=True)
+        super().__init__(credential=AsyncCustomCredentials(self._credential), **kwargs)
+
+    async def _issue_access_token(self) -> Dict[str, Any]:
+        return dict(await self.get_access_token(_token_request_body(self._credential)))
+
+    async def init(self):
+        if await self._credential.aupdate_from_broker():
+            return
+        token_obj = await self._token_store.aget_or_issue(self._issue_access_token)
+        _update_credential(self._credential, token_obj)
+
+    async def _refresh_access_token(self, stale_token: Optional[str] = None) -> None:
+        """_refresh_access_token()의 async 버전"""
+        if stale_token is not None and self._credential.access_token != stale_token:
+            return
+        if await self._credential.arefresh_from_broker(stale_token):
+            return
+        token_obj = await self._token_store.aget_or_issue(
+            self._issue_access_token, stale_token=stale_token
+        )
+        _update_credential(self._credential, token_obj)
+
+    async def get_approval_key(self) -> str:
+        """get_approval_key()의 async 버전"""
+
+        async def issue() -> Dict[str, Any]:
+            response = await self.send_request(
+                approval_request(self._credential.app_key, self._credential.app_secret)
+            )
+            response.raise_for_status()
+            await response.read()
+            return approval_token(response.json())
+
+        token_obj = await self._approval_store.aget_or_issue(issue)
+        return token_obj["approval_key"]
 
 
 def patch_sdk():
@@ -20,3 +178,17 @@ def patch_sdk():
     you can't accomplish using the techniques described in
     https://aka.ms/azsdk/python/dpcodegen/python/customize
     """
+
+
+__all__: List[str] = [
+    "AsyncCachePolicy",
+    "AsyncCursorIterator",
+    "AsyncKisErrorPolicy",
+    "AsyncKisRetryPolicy",
+    "AsyncRateLimitPolicy",
+    "OpenKisClient",
+    "aiohttp_transport",
+    "aiter_tr_cont_pages",
+    "aiter_tr_cont_rows",
+    "asnapshot_quotes",
+]  # Add all objects you want publicly available to users at this package level
@@ -6,13 +6,19 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import Awaitable, List, Union
+from typing import Awaitable, List, Optional, Union
 
 from azure.core.credentials import AccessToken
 from azure.core.pipeline import PipelineRequest
+from azure.core.pipeline.policies import BearerTokenCredentialPolicy
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from azure.core.pipeline.policies._base import HTTPRequestType
 
+from finance_clue._pipeline import FastSendRequestMixin
+from finance_clue._pipeline import PROFILE_DEFAULT
+from finance_clue._pipeline import apply_profile
+from finance_clue._transport import TransportConfig
+from finance_clue._transport import apply_transport
 from finance_clue.openkrx import GenOpenKrxClient
 
 
@@ -47,9 +53,21 @@ class CustomProxyPolicy(SansIOHTTPPolicy):
         return super().on_request(request)
 
 
-class OpenKrxClient(GenOpenKrxClient):
+# 생성된 configuration의 기본 credential scope
+KRX_CREDENTIAL_SCOPE = "http://data-dbg.krx.co.kr"
 
-    def __init__(self, token: str, *, timeout: int = 120, **kwargs):
+
+class OpenKrxClient(FastSendRequestMixin, GenOpenKrxClient):
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        timeout: int = 120,
+        profile: str = PROFILE_DEFAULT,
+        transport_config: Optional[TransportConfig] = None,
+        **kwargs,
+    ):
         credential = CustomCredentials(token)
         custom_proxy = CustomProxyPolicy(
             proxies=kwargs.pop(
@@ -57,7 +75,17 @@ class OpenKrxClient(GenOpenKrxClient):
             )
         )
         kwargs["proxy_policy"] = custom_proxy
-        super().__init__(credential=credential, timeout=timeout, **kwargs)
+        kwargs["timeout"] = timeout
+        self._profile = profile
+        apply_profile(
+            kwargs,
+            profile,
+            authentication_policy=BearerTokenCredentialPolicy(
+                credential, KRX_CREDENTIAL_SCOPE, **kwargs
+            ),
+        )
+        apply_transport(kwargs, transport_config)
+        super().__init__(credential=credential, **kwargs)
 
 
 def patch_sdk():
@@ -70,5 +98,6 @@ def patch_sdk():
 
 
 __all__: List[str] = [
-    "OpenKrxClient"
+    "OpenKrxClient",
+    "TransportConfig",
 ]  # Add all objects you want publicly available to users at this package level
@@ -6,11 +6,71 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+from typing import List, Optional
 
-__all__: List[str] = (
-    []
-)  # Add all objects you want publicly available to users at this package level
+from azure.core.credentials import AccessToken
+from azure.core.pipeline.policies import AsyncBearerTokenCredentialPolicy
+
+from finance_clue._pipeline import FastSendRequestMixin
+from finance_clue._pipeline import PROFILE_DEFAULT
+from finance_clue._pipeline import apply_profile
+from finance_clue._transport import TransportConfig
+from finance_clue._transport import aiohttp_transport
+from finance_clue._transport import apply_transport
+from finance_clue.openkrx._patch import CustomProxyPolicy
+from finance_clue.openkrx._patch import KRX_CREDENTIAL_SCOPE
+from finance_clue.openkrx.aio import GenOpenKrxClient
+
+
+class AsyncCustomCredentials:
+
+    def __init__(self, token: str):
+        self._token = token
+        self._expires_on = 0
+
+    async def get_token(self, *args, **kwargs) -> AccessToken:
+        return AccessToken(self._token, self._expires_on)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "AsyncCustomCredentials":
+        return self
+
+    async def __aexit__(self, *exc_details) -> None:
+        pass
+
+
+class OpenKrxClient(FastSendRequestMixin, GenOpenKrxClient):
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        timeout: int = 120,
+        profile: str = PROFILE_DEFAULT,
+        transport_config: Optional[TransportConfig] = None,
+        **kwargs,
+    ):
+        credential = AsyncCustomCredentials(token)
+        custom_proxy = CustomProxyPolicy(
+            proxies=kwargs.pop(
+                "proxies", {"https://data-dbg.krx.co.kr": "http://data-dbg.krx.co.kr"}
+            )
+        )
+        kwargs["proxy_policy"] = custom_proxy
+        kwargs["timeout"] = timeout
+        self._profile = profile
+        apply_profile(
+            kwargs,
+            profile,
+            authentication_policy=AsyncBearerTokenCredentialPolicy(
+                credential, KRX_CREDENTIAL_SCOPE, **kwargs
+            ),
+            is_async=True,
+        )
+        apply_transport(kwargs, transport_config, is_async=True)
+        super().__init__(credential=credential, **kwargs)
 
 
 def patch_sdk():
@@ -20,3 +80,9 @@ def patch_sdk():
     you can't accomplish using the techniques described in
     https://aka.ms/azsdk/python/dpcodegen/python/customize
     """
+
+
+__all__: List[str] = [
+    "OpenKrxClient",
+    "aiohttp_transport",
+]  # Add all objects you want publicly available to users at this package level
@@ -1,8 +1,12 @@
+from azure.core.pipeline.transport import AsyncioRequestsTransport
 import pytest
 
 from finance_clue.opendart import OpenDartClient
+from finance_clue.opendart.aio import OpenDartClient as AioOpenDartClient
 from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
 from finance_clue.openkrx._patch import OpenKrxClient
+from finance_clue.openkrx.aio import OpenKrxClient as AioOpenKrxClient
 
 
 @pytest.fixture(scope="module")
@@ -39,3 +43,34 @@ def mock_openkrx_client_url() -> str:
 def mock_openkrx_client(mock_openkrx_client_url: str) -> OpenKrxClient:
     """Returns a mocked OpenKrxClient"""
     return OpenKrxClient("", endpoint=mock_openkrx_client_url)
+
+
+@pytest.fixture
+def mock_openkis_aio_client(mock_openkis_client_url: str, tmp_path) -> AioOpenKisClient:
+    """Returns a mocked async OpenKisClient
+
+    AsyncioRequestsTransport sends requests through `requests`, so `responses` can mock them.
+    """
+    return AioOpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        token_path=str(tmp_path / "finance_clue.json"),
+        transport=AsyncioRequestsTransport(),
+    )
+
+
+@pytest.fixture
+def mock_opendart_aio_client(mock_opendart_client_url: str) -> AioOpenDartClient:
+    """Returns a mocked async OpenDartClient"""
+    return AioOpenDartClient(
+        "", endpoint=mock_opendart_client_url, transport=AsyncioRequestsTransport()
+    )
+
+
+@pytest.fixture
+def mock_openkrx_aio_client(mock_openkrx_client_url: str) -> AioOpenKrxClient:
+    """Returns a mocked async OpenKrxClient"""
+    return AioOpenKrxClient(
+        "", endpoint=mock_openkrx_client_url, transport=AsyncioRequestsTransport()
+    )
@@ -0,0 +1,106 @@
+"""pytest tests for the fast pipeline profile"""
+
+import asyncio
+
+from azure.core.pipeline.transport import AsyncioRequestsTransport
+from azure.core.rest import HttpRequest
+import pytest
+import responses
+
+from finance_clue.opendart import OpenDartClient
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+from finance_clue.openkrx import OpenKrxClient
+
+PRICE_URL = "/uapi/domestic-stock/v1/quotations/inquire-price"
+
+
+@responses.activate
+def test_openkis_fast_profile(mock_openkis_client_url: str):
+    responses.add(
+        responses.GET, f"{mock_openkis_client_url}{PRICE_URL}", status=503, json={}
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_openkis_client_url}{PRICE_URL}",
+        json={"output": {"stck_prpr": "75700"}, "rt_cd": "0"},
+    )
+    client = OpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        rate_limiter=TokenBucket(10000),
+        profile="fast",
+        retry_backoff_factor=0,
+    )
+
+    resp = client.get_domestic_stock_price(fid_input_iscd="005930")
+
+    assert resp["output"]["stck_prpr"] == "75700"
+    # 재시도와 인증, rate limit은 그대로 동작한다.
+    assert len(responses.calls) == 2
+    assert client.rate_limiter.metrics.acquired == 2
+    headers = responses.calls[1].request.headers
+    assert headers["appkey"] == "key"
+    # request id, user agent policy는 거치지 않는다.
+    assert "x-ms-client-request-id" not in headers
+    assert "azsdk" not in headers.get("User-Agent", "")
+
+
+@responses.activate
+def test_fast_profile_send_request_keeps_caller_request(mock_opendart_client_url: str):
+    responses.add(
+        responses.GET, f"{mock_opendart_client_url}/list.json", json={"status": "000"}
+    )
+    client = OpenDartClient("token", endpoint=mock_opendart_client_url, profile="fast")
+    request = HttpRequest("GET", "/list.json", params={"corp_code": "00126380"})
+
+    response = client.send_request(request)
+    # 같은 요청을 다시 보내도 crtfc_key가 두 번 붙지 않는다.
+    client.send_request(request)
+
+    assert response.json() == {"status": "000"}
+    assert request.url == "/list.json?corp_code=00126380"
+    assert dict(request.headers) == {}
+    for call in responses.calls:
+        assert call.request.url.startswith(f"{mock_opendart_client_url}/list.json?")
+        assert call.request.url.count("crtfc_key=token") == 1
+
+
+@responses.activate
+def test_openkrx_and_aio_fast_profile(
+    mock_openkrx_client_url: str, mock_openkis_client_url: str, tmp_path
+):
+    responses.add(
+        responses.GET,
+        f"{mock_openkrx_client_url}/svc/apis/idx/krx_dd_trd",
+        json={"OutBlock_1": []},
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_openkis_client_url}{PRICE_URL}",
+        json={"output": {"stck_prpr": "75700"}, "rt_cd": "0"},
+    )
+    krx = OpenKrxClient("token", endpoint=mock_openkrx_client_url, profile="fast")
+    assert krx.get_krx_daily_index(bas_dd="20240514") == {"OutBlock_1": []}
+    assert responses.calls[0].request.headers["Authorization"] == "Bearer token"
+
+    async def run():
+        async with AioOpenKisClient(
+            "key",
+            "secret",
+            endpoint=mock_openkis_client_url,
+            token_path=str(tmp_path / "finance_clue.json"),
+            rate_limiter=TokenBucket(10000),
+            transport=AsyncioRequestsTransport(),
+            profile="fast",
+        ) as client:
+            return await client.get_domestic_stock_price(fid_input_iscd="005930")
+
+    assert asyncio.run(run())["output"]["stck_prpr"] == "75700"
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        OpenDartClient("token", profile="turbo")
@@ -0,0 +1,29 @@
+"""mocked test for async OpenDartClient"""
+
+import asyncio
+
+import responses
+
+from finance_clue.opendart.aio import OpenDartClient
+
+
+@responses.activate
+def test_aio_list_disclosure(
+    mock_opendart_aio_client: OpenDartClient, mock_opendart_client_url: str
+):
+    expected = {"status": "000", "message": "정상", "page_no": 1, "list": []}
+    responses.add(
+        responses.GET,
+        f"{mock_opendart_client_url}/list.json",
+        json=expected,
+        status=200,
+    )
+
+    async def run():
+        async with mock_opendart_aio_client as client:
+            return await client.list_disclosure_info(
+                bgn_de="20210101", end_de="20210131", page_no="1", page_count="10"
+            )
+
+    assert asyncio.run(run()) == expected
+    assert "crtfc_key=" in responses.calls[0].request.url
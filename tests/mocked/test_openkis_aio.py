@@ -0,0 +1,50 @@
+"""pytest tests for async openkis client"""
+
+import asyncio
+
+import responses
+
+from finance_clue.openkis.aio import OpenKisClient
+
+
+@responses.activate
+def test_aio_init_and_concurrent_price(
+    mock_openkis_aio_client: OpenKisClient,
+    mock_openkis_client_url: str,
+    tmp_path,
+):
+    responses.add(
+        responses.POST,
+        f"{mock_openkis_client_url}/oauth2/tokenP",
+        json={
+            "access_token": "token",
+            "access_token_token_expired": "2099-12-22 08:16:59",
+            "token_type": "Bearer",
+            "expires_in": 86400,
+        },
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_openkis_client_url}/uapi/domestic-stock/v1/quotations/inquire-price",
+        json={"output": {"stck_prpr": "75700"}, "rt_cd": "0"},
+        status=200,
+    )
+
+    async def run():
+        async with mock_openkis_aio_client as client:
+            await client.init()
+            return await asyncio.gather(
+                *[
+                    client.get_domestic_stock_price(fid_input_iscd=code)
+                    for code in ["005930", "000660", "035420"]
+                ]
+            )
+
+    results = asyncio.run(run())
+
+    assert [x["output"]["stck_prpr"] for x in results] == ["75700"] * 3
+    assert (tmp_path / "finance_clue.json").exists()
+    for call in responses.calls[1:]:
+        assert call.request.headers["authorization"] == "Bearer token"
+        assert call.request.headers["appkey"] == "key"
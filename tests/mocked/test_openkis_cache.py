@@ -0,0 +1,165 @@
+"""pytest tests for openkis response cache"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import time
+
+import responses
+
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import ResponseCache
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis import iter_tr_cont_pages
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+
+RATIO_URL = "/uapi/domestic-stock/v1/finance/financial-ratio"
+PRICE_URL = "/uapi/domestic-stock/v1/quotations/inquire-price"
+
+
+def _ratio(request):
+    # 동시에 들어온 요청이 겹치도록 잠시 기다렸다가 응답한다.
+    time.sleep(0.05)
+    body = {"output": [{"stac_yymm": "202312", "grs": "-14.33"}], "rt_cd": "0"}
+    return 200, {"tr_cont": "D"}, json.dumps(body)
+
+
+def _client(url: str, cache: ResponseCache) -> OpenKisClient:
+    return OpenKisClient(
+        "key", "secret", endpoint=url, rate_limiter=TokenBucket(10000), cache=cache
+    )
+
+
+@responses.activate
+def test_cache_coalesces_and_reuses(mock_openkis_client_url: str, tmp_path):
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{RATIO_URL}", callback=_ratio
+    )
+    cache = ResponseCache(disk_path=str(tmp_path / "cache"))
+    client = _client(mock_openkis_client_url, cache)
+
+    def get_ratio(_):
+        return client.get_financial_ratio(fid_input_iscd="005930", fid_div_cls_code="0")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(get_ratio, range(4)))
+    results.append(get_ratio(None))
+
+    assert len(responses.calls) == 1
+    assert all(r["output"][0]["grs"] == "-14.33" for r in results)
+    metrics = cache.metrics
+    assert metrics.misses == 1
+    assert metrics.hits + metrics.coalesced == 4
+
+    # 다른 parameter는 다른 cache key
+    client.get_financial_ratio(fid_input_iscd="005930", fid_div_cls_code="1")
+    assert len(responses.calls) == 2
+
+    # disk에 저장한 응답은 새 cache에서도 재사용한다.
+    other = _client(mock_openkis_client_url, ResponseCache(disk_path=cache.disk_path))
+    assert other.get_financial_ratio(fid_input_iscd="005930", fid_div_cls_code="0") == (
+        results[0]
+    )
+    assert len(responses.calls) == 2
+
+
+def _ratio_pages():
+    """연속조회 mock. 첫 page 뒤로 202212, 202112를 차례로 반환한다."""
+    follow_ups = []
+
+    def callback(request):
+        if request.headers.get("tr_cont"):
+            follow_ups.append(request)
+            yymm = ["202212", "202112"][(len(follow_ups) - 1) % 2]
+        else:
+            yymm = "202312"
+        body = {"output": [{"stac_yymm": yymm}], "rt_cd": "0"}
+        return 200, {"tr_cont": "D" if yymm == "202112" else "M"}, json.dumps(body)
+
+    return callback
+
+
+@responses.activate
+def test_cache_pages_through_cached_tr_id(mock_openkis_client_url: str):
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{RATIO_URL}", callback=_ratio_pages()
+    )
+    cache = ResponseCache()
+    client = _client(mock_openkis_client_url, cache)
+
+    def pages():
+        return [
+            page["output"][0]["stac_yymm"]
+            for page in iter_tr_cont_pages(
+                client.get_financial_ratio,
+                fid_input_iscd="005930",
+                fid_div_cls_code="0",
+                max_pages=5,
+            )
+        ]
+
+    assert pages() == ["202312", "202212", "202112"]
+    assert len(responses.calls) == 3
+
+    # 첫 page만 cache에서 응답하고, 다음 page는 다시 보낸다.
+    responses.calls.reset()
+    assert pages() == ["202312", "202212", "202112"]
+    assert len(responses.calls) == 2
+    assert cache.metrics.hits == 1
+
+
+@responses.activate
+def test_cache_skips_uncached_and_failed(mock_openkis_client_url: str):
+    responses.add(
+        responses.GET,
+        f"{mock_openkis_client_url}{RATIO_URL}",
+        json={"rt_cd": "1", "msg_cd": "OPSQ0002", "msg1": "없는 서비스 코드 입니다"},
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_openkis_client_url}{PRICE_URL}",
+        json={"output": {"stck_prpr": "75700"}, "rt_cd": "0"},
+    )
+    client = _client(mock_openkis_client_url, ResponseCache())
+
+    for _ in range(2):
+        client.get_financial_ratio(fid_input_iscd="005930", fid_div_cls_code="0")
+        # TTL이 없는 tr_id는 cache하지 않는다.
+        client.get_domestic_stock_price(fid_input_iscd="005930")
+
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_async_cache_coalesces(
+    mock_openkis_client_url: str, mock_openkis_aio_client: AioOpenKisClient
+):
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{RATIO_URL}", callback=_ratio
+    )
+    cache = ResponseCache()
+    client = AioOpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        rate_limiter=TokenBucket(10000),
+        cache=cache,
+        transport=mock_openkis_aio_client._client._pipeline._transport,
+    )
+
+    async def run():
+        async with client:
+            return await asyncio.gather(
+                *[
+                    client.get_financial_ratio(
+                        fid_input_iscd="005930", fid_div_cls_code="0"
+                    )
+                    for _ in range(3)
+                ]
+            )
+
+    results = asyncio.run(run())
+
+    assert len(responses.calls) == 1
+    assert [r["output"][0]["stac_yymm"] for r in results] == ["202312"] * 3
+    assert cache.metrics.coalesced == 2
@@ -0,0 +1,168 @@
+"""pytest tests for openkis trading calendar"""
+
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+import json
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+import responses
+
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import TradingCalendar
+from finance_clue.openkis import split_date_windows
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+
+HOLIDAY_URL = "/uapi/domestic-stock/v1/quotations/chk-holiday"
+HOLIDAYS = {"20250101", "20250128", "20250129", "20250130"}
+
+
+def _add_holiday(url: str, last_day: str = "99991231"):
+    """
+    연속조회키부터 10일씩 반환하는 mock. 주말과 HOLIDAYS는 휴장일이다.
+
+    last_day 이후의 날짜는 반환하지 않는다.
+    """
+
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        key = (query.get("ctx_area_nk") or query["bass_dt"])[0].strip()
+        day = datetime.strptime(key, "%Y%m%d")
+        rows = []
+        for i in range(10):
+            d = day + timedelta(days=i)
+            bass_dt = d.strftime("%Y%m%d")
+            if bass_dt > last_day:
+                break
+            is_open = d.weekday() < 5 and bass_dt not in HOLIDAYS
+            rows.append({"bass_dt": bass_dt, "opnd_yn": "Y" if is_open else "N"})
+        next_key = (day + timedelta(days=10)).strftime("%Y%m%d")
+        tr_cont = "M" if next_key <= last_day else "D"
+        body = {
+            "ctx_area_nk": next_key,
+            "ctx_area_fk": key,
+            "output": rows,
+            "rt_cd": "0",
+        }
+        return 200, {"tr_cont": tr_cont}, json.dumps(body)
+
+    responses.add_callback(responses.GET, f"{url}{HOLIDAY_URL}", callback=callback)
+
+
+@responses.activate
+def test_trading_calendar_queries(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    _add_holiday(mock_openkis_client_url)
+
+    calendar = TradingCalendar.fetch(mock_openkis_client, "20250101", "20250215")
+
+    assert len(responses.calls) == 5
+    assert (calendar.first, calendar.last) == ("20250101", "20250219")
+    assert not calendar.is_open("20250101")
+    assert calendar.is_open("20250102")
+    assert calendar.previous("20250131") == "20250127"
+    assert calendar.next("20250127") == "20250131"
+    assert calendar.shift("20250125", 0) == "20250127"
+    assert calendar.shift("20250125", 1) == "20250127"
+    assert calendar.shift("20250125", -1) == "20250124"
+    assert calendar.shift("20250131", -5) == "20250121"
+    assert calendar.range("20250124", "20250204") == [
+        "20250124",
+        "20250127",
+        "20250131",
+        "20250203",
+        "20250204",
+    ]
+    assert calendar.count("20250101", "20250131") == 19
+    with pytest.raises(ValueError):
+        calendar.is_open("20241231")
+    with pytest.raises(ValueError):
+        calendar.shift("20250102", -1)
+
+    windows = split_date_windows(
+        "20250101", "20250131", trading_days=calendar.open_days, max_rows=10
+    )
+    assert windows == [("20250102", "20250115"), ("20250116", "20250131")]
+
+
+@responses.activate
+def test_trading_calendar_load_persists(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str, tmp_path
+):
+    _add_holiday(mock_openkis_client_url)
+    path = str(tmp_path / "calendar.json")
+
+    TradingCalendar.load(mock_openkis_client, "20250110", "20250125", path)
+    assert len(responses.calls) == 2
+
+    # 저장된 기간 안의 조회는 API를 호출하지 않는다.
+    calendar = TradingCalendar.load(mock_openkis_client, "20250112", "20250128", path)
+    assert len(responses.calls) == 2
+    assert calendar.is_open("20250113")
+
+    # 저장된 기간 앞뒤로 없는 기간만 조회해서 합친다.
+    calendar = TradingCalendar.load(mock_openkis_client, "20250101", "20250205", path)
+    assert (calendar.first, calendar.last) == ("20250101", "20250208")
+    assert calendar.count("20250101", "20250205") == 22
+    assert TradingCalendar.from_file(path).open_days == calendar.open_days
+
+
+@responses.activate
+def test_trading_calendar_load_past_available_data(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str, tmp_path
+):
+    _add_holiday(mock_openkis_client_url, last_day="20250115")
+    path = str(tmp_path / "calendar.json")
+
+    # check_domestic_holiday가 반환한 날까지만 담는다.
+    calendar = TradingCalendar.load(
+        mock_openkis_client, "20250101", "20250131", path, today="20250102"
+    )
+    assert len(responses.calls) == 2
+    assert calendar.last == "20250115"
+    assert not calendar.covers("20250101", "20250131")
+
+    # 같은 날에는 받을 수 없는 기간을 다시 조회하지 않는다.
+    calendar = TradingCalendar.load(
+        mock_openkis_client, "20250105", "20250131", path, today="20250102"
+    )
+    assert len(responses.calls) == 2
+    assert calendar.range("20250113", "20250115") == [
+        "20250113",
+        "20250114",
+        "20250115",
+    ]
+
+    # 다음 날에는 남은 기간을 다시 조회하고, 여전히 없으면 오류 없이 기록만 바꾼다.
+    calendar = TradingCalendar.load(
+        mock_openkis_client, "20250101", "20250131", path, today="20250103"
+    )
+    assert len(responses.calls) == 3
+    assert calendar.last == "20250115"
+    assert TradingCalendar.from_file(path).checked_on == "20250103"
+
+
+@responses.activate
+def test_trading_calendar_aload(
+    mock_openkis_aio_client: AioOpenKisClient, mock_openkis_client_url: str
+):
+    _add_holiday(mock_openkis_client_url)
+
+    async def run():
+        async with mock_openkis_aio_client as client:
+            return await TradingCalendar.aload(client, "20250101", "20250110")
+
+    calendar = asyncio.run(run())
+
+    assert calendar.range("20250101", "20250110") == [
+        "20250102",
+        "20250103",
+        "20250106",
+        "20250107",
+        "20250108",
+        "20250109",
+        "20250110",
+    ]
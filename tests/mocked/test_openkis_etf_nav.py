@@ -0,0 +1,50 @@
+"""pytest tests for openkis ETF NAV engine"""
+
+import json
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+import responses
+
+from finance_clue.openkis import EtfNavEngine
+from finance_clue.openkis import OpenKisClient
+
+COMPONENT_URL = "/uapi/etfetn/v1/quotations/inquire-component-stock-price"
+
+
+def _component(request):
+    # 069500: 005930 10주 + 000660 2주, 현금 1,000 / CU 100주. 999999는 오류로 응답한다.
+    etf = parse_qs(urlparse(request.url).query)["fid_input_iscd"][0]
+    if etf == "999999":
+        return 400, {}, json.dumps({"rt_cd": "1"})
+    body = {
+        "output1": {"nav": "1310.00", "etf_cu_unit_scrt_cnt": "100"},
+        "output2": [
+            {"stck_shrn_iscd": "005930", "stck_prpr": "8000", "etf_vltn_amt": "80000"},
+            {"stck_shrn_iscd": "000660", "stck_prpr": "25000", "etf_vltn_amt": "50000"},
+        ],
+        "rt_cd": "0",
+    }
+    return 200, {}, json.dumps(body)
+
+
+@responses.activate
+def test_etf_nav_engine_load_baskets(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{COMPONENT_URL}", callback=_component
+    )
+    engine = EtfNavEngine()
+
+    assert engine.load_baskets(mock_openkis_client, ["069500", "999999"]) == ["069500"]
+    assert list(engine.errors) == ["999999"]
+
+    basket = engine.baskets["069500"]
+    assert basket.quantities == {"005930": 10.0, "000660": 2.0}
+    assert basket.cash == pytest.approx(1000.0)
+    assert engine.nav[0] == pytest.approx(1310.0)
+
+    engine.update_prices({"005930": 9000})
+    assert engine.nav[0] == pytest.approx(1410.0)
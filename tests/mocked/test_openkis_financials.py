@@ -0,0 +1,86 @@
+"""pytest tests for openkis financial statement warehouse"""
+
+import json
+import math
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import responses
+
+from finance_clue.openkis import FinancialWarehouse
+from finance_clue.openkis import OpenKisClient
+
+FINANCE_URL = "/uapi/domestic-stock/v1/finance/"
+PATHS = [
+    "balance-sheet",
+    "income-statement",
+    "financial-ratio",
+    "profit-ratio",
+    "stability-ratio",
+    "growth-ratio",
+    "other-major-ratios",
+]
+
+
+def _add_finance(url: str, latest_by_symbol):
+    """
+    종목코드를 값으로, 최신 결산년월부터 두 분기를 반환하는 mock. 999999는 오류로 응답한다.
+
+    latest_by_symbol은 종목별 최신 결산년월이고, test가 바꾸면 다음 응답에 반영된다.
+    """
+
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        symbol = query["fid_input_iscd"][0]
+        if symbol == "999999" and "balance-sheet" in request.url:
+            return 400, {}, json.dumps({"rt_cd": "1"})
+        latest = latest_by_symbol[symbol]
+        previous = "202312" if latest == "202403" else "202403"
+        output = [
+            {"stac_yymm": latest, "roe_val": str(int(symbol)), "eps": "975.00"},
+            {"stac_yymm": previous, "roe_val": "1.5", "eps": ""},
+        ]
+        return 200, {}, json.dumps({"output": output, "rt_cd": "0"})
+
+    for path in PATHS:
+        responses.add_callback(
+            responses.GET, f"{url}{FINANCE_URL}{path}", callback=callback
+        )
+
+
+@responses.activate
+def test_financial_warehouse_refresh(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str, tmp_path
+):
+    latest = {"000001": "202403", "000002": "202403", "999999": "202403"}
+    _add_finance(mock_openkis_client_url, latest)
+    path = str(tmp_path / "financials")
+    warehouse = FinancialWarehouse(path, max_workers=4)
+
+    changed = warehouse.refresh(mock_openkis_client, ["000001", "000002", "999999"])
+
+    assert changed == ["000001", "000002", "999999"]
+    assert len(responses.calls) == 3 * 7
+    assert list(warehouse.errors) == [("999999", "balance_sheet")]
+    assert "999999" not in warehouse.latest
+
+    section = warehouse.cross_section("ratio", "202403", ["roe_val"])
+    assert section["symbol"].tolist() == ["000001", "000002", "999999"]
+    assert section["roe_val"].tolist() == [1.0, 2.0, 999999.0]
+    history = warehouse.history("income_statement", "000002")
+    assert history["stac_yymm"].tolist() == ["202312", "202403"]
+    assert math.isnan(history["eps"][0])
+
+    # 최신 결산년월이 바뀐 종목과 실패했던 종목만 다시 받는다.
+    latest["000002"] = "202406"
+    warehouse = FinancialWarehouse(path, max_workers=4)
+    changed = warehouse.refresh(mock_openkis_client, ["000001", "000002", "999999"])
+
+    assert sorted(changed) == ["000002", "999999"]
+    assert len(responses.calls) == 3 * 7 + 3 + 2 * 6
+    # 응답에서 빠진 202312는 남기고, 다시 받은 202403은 새 값으로 바꾼다.
+    history = warehouse.history("ratio", "000002", ["roe_val"])
+    assert history["stac_yymm"].tolist() == ["202312", "202403", "202406"]
+    assert history["roe_val"].tolist() == [1.5, 1.5, 2.0]
+    assert warehouse.cross_section("ratio", "202406")["symbol"].tolist() == ["000002"]
+    assert len(warehouse.history("ratio", "000001")["stac_yymm"]) == 2
@@ -0,0 +1,91 @@
+"""pytest tests for openkis period price history loader"""
+
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+import json
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import responses
+
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import PeriodPriceLoader
+from finance_clue.openkis import split_date_windows
+
+PERIOD_URL = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+
+
+def _period_price(request):
+    # 조회 기간의 평일 일봉을 날짜 내림차순으로 반환하고, 시작일 전날 일봉을 하나 더 붙이는 mock
+    query = parse_qs(urlparse(request.url).query)
+    if query["fid_input_iscd"][0] == "999999":
+        return 400, {}, json.dumps({"rt_cd": "1"})
+
+    start = datetime.strptime(query["fid_input_date_1"][0], "%Y%m%d").date()
+    end = datetime.strptime(query["fid_input_date_2"][0], "%Y%m%d").date()
+    rows = []
+    day = end
+    while day >= start - timedelta(days=1):
+        if day.weekday() < 5:
+            rows.append(
+                {
+                    "stck_bsop_date": day.strftime("%Y%m%d"),
+                    "stck_oprc": "100",
+                    "stck_hgpr": "110",
+                    "stck_lwpr": "90",
+                    "stck_clpr": str(day.toordinal()),
+                    "acml_vol": "1000",
+                    "acml_tr_pbmn": "100000",
+                }
+            )
+        day -= timedelta(days=1)
+    assert len(rows) <= 101
+    return 200, {}, json.dumps({"output1": {}, "output2": rows, "rt_cd": "0"})
+
+
+def test_split_date_windows():
+    windows = split_date_windows("20240101", "20241231", "D")
+
+    # 2024년 평일 262일
+    assert len(windows) == 3
+    assert windows[0] == ("20240101", "20240517")
+    assert windows[-1][1] == "20241231"
+
+    trading_days = ["20240102", "20240103", "20240105"]
+    assert split_date_windows(
+        "20240101", "20240104", "D", trading_days, max_rows=1
+    ) == [("20240102", "20240102"), ("20240103", "20240103")]
+
+    assert split_date_windows("20000101", "20241231", "M") == [
+        ("20000101", "20080430"),
+        ("20080501", "20160831"),
+        ("20160901", "20241231"),
+    ]
+    weeks = split_date_windows("20240103", "20271231", "W")
+    assert weeks[0] == ("20240103", "20251130")
+    assert weeks[1][0] == "20251201"
+
+
+@responses.activate
+def test_period_price_loader(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{PERIOD_URL}", callback=_period_price
+    )
+
+    loader = PeriodPriceLoader(mock_openkis_client, max_workers=4)
+    histories = loader.load_many(["005930", "000660", "999999"], "20230101", "20241231")
+
+    assert sorted(histories) == ["000660", "005930"]
+    assert "999999" in loader.errors
+
+    history = histories["005930"]
+    assert len(history) == 522
+    assert str(history.date[0]) == "2023-01-02"
+    assert str(history.date[-1]) == "2024-12-31"
+    # 겹치는 날짜 없이 이어져 있다.
+    assert (history.date[1:] > history.date[:-1]).all()
+    assert history.close[0] == date(2023, 1, 2).toordinal()
+    assert history.volume.dtype.name == "int64"
@@ -0,0 +1,154 @@
+"""pytest tests for openkis index history loader"""
+
+from datetime import date
+from datetime import timedelta
+import json
+import math
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import numpy as np
+import responses
+
+from finance_clue.openkis import IndexLoader
+from finance_clue.openkis import OpenKisClient
+
+QUOTATIONS_URL = "/uapi/domestic-stock/v1/quotations/"
+# 2024년 평일. 1002 지수는 20240102가 없다.
+DAYS = [
+    (date(2024, 1, 1) + timedelta(days=i)).strftime("%Y%m%d")
+    for i in range(366)
+    if (date(2024, 1, 1) + timedelta(days=i)).weekday() < 5
+]
+
+
+def _query(request) -> dict:
+    return {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+
+
+def _index_row(code: str, day: str) -> dict:
+    return {
+        "stck_bsop_date": day,
+        "bstp_nmix_prpr": f"{int(code)}.{day[-2:]}",
+        "bstp_nmix_oprc": "1.00",
+        "acml_vol": "",
+    }
+
+
+def _days(code: str) -> list:
+    return [day for day in DAYS if not (code == "1002" and day == "20240102")]
+
+
+def _category(request):
+    codes = {"K": ["0001", "0002"], "Q": ["1001", "1002"], "K2": ["0001"]}
+    market = _query(request)["fid_mrkt_cls_code"]
+    output = [{"bstp_cls_code": c, "hts_kor_isnm": f"업종{c}"} for c in codes[market]]
+    return 200, {}, json.dumps({"output2": output, "rt_cd": "0"})
+
+
+def _daily(request):
+    # fid_input_date_1 이전 100건을 최신순으로 반환한다.
+    query = _query(request)
+    code, cursor = query["fid_input_iscd"], query["fid_input_date_1"]
+    days = [day for day in reversed(_days(code)) if day <= cursor][:100]
+    output = [_index_row(code, day) for day in days]
+    return 200, {}, json.dumps({"output2": output, "rt_cd": "0"})
+
+
+def _chart(request):
+    query = _query(request)
+    code = query["fid_input_iscd"]
+    if code == "9999":
+        return 400, {}, json.dumps({"rt_cd": "1"})
+    first, last = query["fid_input_date_1"], query["fid_input_date_2"]
+    days = [day for day in reversed(_days(code)) if first <= day <= last]
+    assert len(days) <= 50
+    output = [_index_row(code, day) for day in days]
+    return 200, {}, json.dumps({"output2": output, "rt_cd": "0"})
+
+
+def _minute(request):
+    # 첫 page는 15:30부터, 다음 page는 14:00부터 90개 분봉을 거슬러 반환한다.
+    page = 1 if request.headers.get("tr_cont") == "N" else 0
+    start = 15 * 60 + 30 - 90 * page
+    output = [
+        {
+            "stck_bsop_date": "20240620",
+            "stck_cntg_hour": f"{(start - i) // 60:02d}{(start - i) % 60:02d}00",
+            "bstp_nmix_prpr": "2800.00",
+            "cntg_vol": str(i),
+        }
+        for i in range(90)
+    ]
+    headers = {"tr_cont": "M" if page == 0 else "D"}
+    return 200, headers, json.dumps({"output2": output, "rt_cd": "0"})
+
+
+@responses.activate
+def test_index_loader_history(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    url = f"{mock_openkis_client_url}{QUOTATIONS_URL}"
+    responses.add_callback(
+        responses.GET, f"{url}inquire-index-category-price", callback=_category
+    )
+    responses.add_callback(
+        responses.GET, f"{url}inquire-index-daily-price", callback=_daily
+    )
+    responses.add_callback(
+        responses.GET, f"{url}inquire-daily-indexchartprice", callback=_chart
+    )
+    loader = IndexLoader(mock_openkis_client, max_workers=4)
+
+    codes = loader.discover()
+    assert codes == ["0001", "0002", "1001", "1002"]
+    assert loader.names["1002"] == "업종1002"
+    responses.calls.reset()
+
+    panel = loader.history(["0001", "1002"], "20240101", "20240930")
+
+    # 20240101부터 20240930까지 197 평일을 100건씩 거슬러 받는다.
+    assert len(responses.calls) == 2 * 2
+    assert panel.codes == ["0001", "1002"]
+    assert panel.index[0] == np.datetime64("2024-01-01")
+    assert panel.index[-1] == np.datetime64("2024-09-30")
+    assert panel["close"].shape == (len(panel), 2)
+    assert panel.series("1002")[0] == 1002.01
+    assert math.isnan(panel.series("1002")[1])
+    assert panel.series("0001")[1] == 1.02
+    assert np.isnan(panel["volume"]).all()
+
+    # 50건씩 나눠서 받아도 같은 배열이 나온다.
+    responses.calls.reset()
+    chart = loader.history(
+        ["0001", "1002", "9999"], "20240101", "20240930", source="chart"
+    )
+    assert list(loader.errors) == ["9999"]
+    assert chart.codes == ["0001", "1002"]
+    np.testing.assert_array_equal(chart.index, panel.index)
+    np.testing.assert_array_equal(chart["close"], panel["close"])
+
+
+@responses.activate
+def test_index_loader_intraday(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    responses.add_callback(
+        responses.GET,
+        f"{mock_openkis_client_url}{QUOTATIONS_URL}inquire-time-indexchartprice",
+        callback=_minute,
+    )
+    loader = IndexLoader(mock_openkis_client)
+
+    panel = loader.intraday(["0001"], since="20240620130000")
+
+    assert len(responses.calls) == 2
+    assert panel.index[0] == np.datetime64("2024-06-20T13:00:00")
+    assert panel.index[-1] == np.datetime64("2024-06-20T15:30:00")
+    assert len(panel) == 151
+    assert panel.series("0001", "volume")[-1] == 0.0
+
+    responses.calls.reset()
+    panel = loader.intraday(["0001"], max_pages=1)
+    assert len(responses.calls) == 1
+    assert len(panel) == 90
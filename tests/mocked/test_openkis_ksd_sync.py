@@ -0,0 +1,102 @@
+"""pytest tests for openkis KSD event sync"""
+
+import json
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+import responses
+
+from finance_clue.openkis import KsdEventSync
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis._ksd_sync import split_date_range
+
+KSD_URL = "/uapi/domestic-stock/v1/ksdinfo/"
+
+
+def _dividend_mock(dividends, fail_dates):
+    """
+    조회 기간의 배당 일정을 반환하는 mock
+
+    dividends는 기준일 -> 현금배당금, fail_dates의 날짜가 들어간 기간은 오류로 응답한다.
+    test가 넘긴 dict, set을 바꾸면 다음 응답에 반영된다.
+    """
+
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        f_dt, t_dt = query["f_dt"][0], query["t_dt"][0]
+        if any(f_dt <= day <= t_dt for day in fail_dates):
+            return 400, {}, json.dumps({"rt_cd": "1"})
+        output = [
+            {
+                "record_date": day,
+                "sht_cd": "005930",
+                "divi_kind": "결산",
+                "stk_kind": "보통",
+                "per_sto_divi_amt": amount,
+                "rt_cd": "0",
+            }
+            for day, amount in sorted(dividends.items())
+            if f_dt <= day <= t_dt
+        ]
+        return 200, {}, json.dumps({"output1": output, "rt_cd": "0"})
+
+    return callback
+
+
+def test_split_date_range():
+    assert split_date_range("20240101", "20240110", 4) == [
+        ("20240101", "20240104"),
+        ("20240105", "20240108"),
+        ("20240109", "20240110"),
+    ]
+    assert split_date_range("20240110", "20240101", 4) == []
+    with pytest.raises(ValueError):
+        split_date_range("20240101", "20240110", 0)
+
+
+@responses.activate
+def test_ksd_event_sync(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str, tmp_path
+):
+    dividends = {"20231231": "361", "20240331": "361", "20240630": "361"}
+    fail_dates = set()
+    responses.add_callback(
+        responses.GET,
+        f"{mock_openkis_client_url}{KSD_URL}dividend",
+        callback=_dividend_mock(dividends, fail_dates),
+    )
+    path = str(tmp_path / "ksd")
+    ksd = KsdEventSync(path, events=["dividend"], chunk_days=30, max_workers=4)
+
+    with pytest.raises(ValueError):
+        ksd.sync(mock_openkis_client, today="20240415")
+
+    changed = ksd.sync(mock_openkis_client, start="20231201", today="20240415")
+
+    # 20231201 ~ 20240716(today + 92일)을 30일씩 나눈 8개 구간
+    assert len(responses.calls) == 8
+    assert "cts=&" in responses.calls[0].request.url
+    assert changed == {"dividend": 3}
+    assert ksd.high_water_marks == {"dividend": "20240415"}
+    rows = ksd.events("dividend", sht_cd="005930", end="20240401")
+    assert [row["record_date"] for row in rows] == ["20231231", "20240331"]
+    assert "rt_cd" not in rows[0]
+
+    # high-water mark 7일 전부터만 받고, 바뀐 row만 센다.
+    dividends["20240630"] = "400"
+    ksd = KsdEventSync(path, events=["dividend"], chunk_days=30, max_workers=4)
+    assert len(ksd.events("dividend")) == 3
+    changed = ksd.sync(mock_openkis_client, today="20240416")
+
+    assert len(responses.calls) == 8 + 4
+    assert changed == {"dividend": 1}
+    assert ksd.events("dividend", start="20240601")[0]["per_sto_divi_amt"] == "400"
+    assert ksd.high_water_marks == {"dividend": "20240416"}
+
+    # 실패한 구간이 있으면 high-water mark를 옮기지 않는다.
+    fail_dates.add("20240301")
+    changed = ksd.sync(mock_openkis_client, start="20240201", today="20240420")
+
+    assert list(ksd.errors) == [("dividend", "20240201", "20240301")]
+    assert ksd.high_water_marks == {"dividend": "20240416"}
@@ -0,0 +1,96 @@
+"""pytest tests for openkis minute bar backfill"""
+
+from datetime import datetime
+from datetime import timedelta
+import json
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import responses
+
+from finance_clue.openkis import MinuteBarBackfill
+from finance_clue.openkis import OpenKisClient
+
+MINUTE_URL = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
+
+
+def _minute_bars(request):
+    # fid_input_hour1 이하 1분봉 30건을 시간 내림차순으로 반환하는 mock
+    query = parse_qs(urlparse(request.url).query)
+    symbol = query["fid_input_iscd"][0]
+    if symbol == "999999":
+        return 400, {}, json.dumps({"rt_cd": "1"})
+
+    hour = datetime.strptime(query["fid_input_hour_1"][0], "%H%M%S")
+    start = datetime.strptime("090000", "%H%M%S")
+    bars = []
+    for i in range(30):
+        t = hour - timedelta(minutes=i)
+        if t < start:
+            break
+        # 겹치는 분봉이 와도 제거되는지 확인하려고 마지막 분봉을 한 번 더 넣는다.
+        bars.append(
+            {
+                "stck_bsop_date": "20240510",
+                "stck_cntg_hour": t.strftime("%H%M%S"),
+                "stck_prpr": str(t.hour * 100 + t.minute),
+                "stck_oprc": "1",
+                "stck_hgpr": "2",
+                "stck_lwpr": "0",
+                "cntg_vol": "10",
+            }
+        )
+    bars.append(bars[-1])
+    return 200, {}, json.dumps({"output1": {}, "output2": bars, "rt_cd": "0"})
+
+
+@responses.activate
+def test_minute_bar_backfill(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str, tmp_path
+):
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{MINUTE_URL}", callback=_minute_bars
+    )
+    checkpoint_path = str(tmp_path / "minute.json")
+
+    backfill = MinuteBarBackfill(
+        mock_openkis_client,
+        max_workers=4,
+        checkpoint_path=checkpoint_path,
+        session_date="20240510",
+    )
+    result = backfill.run(["005930", "000660", "999999"])
+
+    assert sorted(result) == ["000660", "005930"]
+    assert "999999" in backfill.errors
+
+    bars = result["005930"]
+    # 09:00 ~ 15:30 1분봉 391개
+    assert len(bars) == 391
+    assert bars.date == "20240510"
+    assert bars.time[0] == 90000 and bars.time[-1] == 153000
+    assert bars.close[0] == 900 and bars.close[-1] == 1530
+    assert (bars.volume == 10).all()
+    assert bars.time.dtype == "int32" and bars.close.dtype == "int64"
+    # 종목당 14번 호출 + 실패한 종목
+    assert len(responses.calls) == 14 * 2 + 1
+
+    # 이미 끝난 종목은 checkpoint에서 읽고 다시 조회하지 않는다.
+    responses.calls.reset()
+    resumed = MinuteBarBackfill(
+        mock_openkis_client, checkpoint_path=checkpoint_path, session_date="20240510"
+    )
+    result = resumed.run(["005930"])
+
+    assert len(result["005930"]) == 391
+    assert len(responses.calls) == 0
+
+    # 다음 영업일에는 이전 checkpoint를 버리고 다시 조회한다.
+    next_day = MinuteBarBackfill(
+        mock_openkis_client, checkpoint_path=checkpoint_path, session_date="20240513"
+    )
+    next_day.run(["005930"])
+
+    assert len(responses.calls) == 14
+    with open(checkpoint_path) as f:
+        assert json.load(f)["date"] == "20240513"
@@ -0,0 +1,180 @@
+"""pytest tests for openkis tr_cont paging"""
+
+import asyncio
+
+import responses
+
+from finance_clue.openkis import CursorIterator
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import iter_tr_cont_pages
+from finance_clue.openkis import iter_tr_cont_rows
+from finance_clue.openkis.aio import AsyncCursorIterator
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+from finance_clue.openkis.aio import aiter_tr_cont_rows
+
+
+def _add_investor_pages(url: str):
+    for tr_cont, dates in [("M", ["20240510", "20240509"]), ("D", ["20240508"])]:
+        responses.add(
+            responses.GET,
+            f"{url}/uapi/domestic-stock/v1/quotations/inquire-investor",
+            json={
+                "output": [{"stck_bsop_date": date} for date in dates],
+                "rt_cd": "0",
+            },
+            headers={"tr_cont": tr_cont},
+            status=200,
+        )
+
+
+@responses.activate
+def test_iter_tr_cont_pages(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    _add_investor_pages(mock_openkis_client_url)
+
+    pages = list(
+        iter_tr_cont_pages(
+            mock_openkis_client.get_domestic_stock_investor, fid_input_iscd="005930"
+        )
+    )
+
+    assert len(pages) == 2
+    assert [x.request.headers["tr_cont"] for x in responses.calls] == ["", "N"]
+
+
+@responses.activate
+def test_iter_tr_cont_rows_max_pages(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    _add_investor_pages(mock_openkis_client_url)
+
+    rows = list(
+        iter_tr_cont_rows(
+            mock_openkis_client.get_domestic_stock_investor,
+            fid_input_iscd="005930",
+            max_pages=1,
+        )
+    )
+
+    assert [x["stck_bsop_date"] for x in rows] == ["20240510", "20240509"]
+    assert len(responses.calls) == 1
+
+
+def test_iter_tr_cont_rows_params():
+    calls = []
+
+    def operation(**kwargs):
+        calls.append(kwargs)
+        return {"output": [{"max_pages": kwargs["max_pages"]}]}, {"tr_cont": "M"}
+
+    # params는 이름이 iter_tr_cont_rows의 인자와 겹쳐도 operation에 넘어간다.
+    rows = list(
+        iter_tr_cont_rows(
+            operation, params={"max_pages": "9", "f_dt": "20240101"}, max_pages=2
+        )
+    )
+
+    assert rows == [{"max_pages": "9"}] * 2
+    assert calls[0]["f_dt"] == "20240101" and calls[0]["tr_cont"] == ""
+    assert calls[1]["tr_cont"] == "N"
+
+
+@responses.activate
+def test_aiter_tr_cont_rows(
+    mock_openkis_aio_client: AioOpenKisClient, mock_openkis_client_url: str
+):
+    _add_investor_pages(mock_openkis_client_url)
+
+    async def run():
+        async with mock_openkis_aio_client as client:
+            return [
+                row
+                async for row in aiter_tr_cont_rows(
+                    client.get_domestic_stock_investor, fid_input_iscd="005930"
+                )
+            ]
+
+    rows = asyncio.run(run())
+
+    assert [x["stck_bsop_date"] for x in rows] == ["20240510", "20240509", "20240508"]
+
+
+def _add_holiday_pages(url: str):
+    pages = [
+        ("M", "20240103", ["20240101", "20240102"]),
+        ("M", "20240105", ["20240103", "20240104"]),
+        ("D", "", ["20240105"]),
+    ]
+    for tr_cont, next_key, dates in pages:
+        responses.add(
+            responses.GET,
+            f"{url}/uapi/domestic-stock/v1/quotations/chk-holiday",
+            json={
+                "ctx_area_nk": next_key,
+                "ctx_area_fk": next_key,
+                "output": [{"bass_dt": date, "opnd_yn": "Y"} for date in dates],
+                "rt_cd": "0",
+            },
+            headers={"tr_cont": tr_cont},
+            status=200,
+        )
+
+
+@responses.activate
+def test_cursor_iterator(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    _add_holiday_pages(mock_openkis_client_url)
+
+    rows = list(
+        CursorIterator(mock_openkis_client.check_domestic_holiday, bass_dt="20240101")
+    )
+
+    assert [x["bass_dt"] for x in rows] == [
+        "20240101",
+        "20240102",
+        "20240103",
+        "20240104",
+        "20240105",
+    ]
+    second = responses.calls[1].request
+    assert second.headers["tr_cont"] == "N"
+    assert "ctx_area_nk=20240103" in second.url
+
+
+@responses.activate
+def test_cursor_iterator_until(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    _add_holiday_pages(mock_openkis_client_url)
+
+    rows = list(
+        CursorIterator(
+            mock_openkis_client.check_domestic_holiday,
+            bass_dt="20240101",
+            until=lambda row: row["bass_dt"] >= "20240102",
+        )
+    )
+
+    assert [x["bass_dt"] for x in rows] == ["20240101", "20240102"]
+    # 조건을 만족한 뒤에는 다음 page를 요청하지 않는다.
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_async_cursor_iterator(
+    mock_openkis_aio_client: AioOpenKisClient, mock_openkis_client_url: str
+):
+    _add_holiday_pages(mock_openkis_client_url)
+
+    async def run():
+        async with mock_openkis_aio_client as client:
+            return [
+                row
+                async for row in AsyncCursorIterator(
+                    client.check_domestic_holiday, bass_dt="20240101"
+                )
+            ]
+
+    assert len(asyncio.run(run())) == 5
@@ -0,0 +1,80 @@
+"""pytest tests for openkis ranking snapshot recorder"""
+
+import json
+import threading
+
+import responses
+
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import RankingQuery
+from finance_clue.openkis import RankingRecorder
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis._ranking_recorder import DEFAULT_RANKINGS
+
+RANKING_URL = "/uapi/domestic-stock/v1"
+
+
+def _volume_mock(prices):
+    """종목코드 -> 현재가 순서대로 거래량 순위를 반환하는 mock. test가 prices를 바꾸면 반영된다."""
+
+    def callback(request):
+        output = [
+            {"mksc_shrn_iscd": symbol, "data_rank": str(rank), "stck_prpr": price}
+            for rank, (symbol, price) in enumerate(prices.items(), start=1)
+        ]
+        return 200, {}, json.dumps({"output": output, "rt_cd": "0"})
+
+    return callback
+
+
+@responses.activate
+def test_ranking_recorder(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str, tmp_path
+):
+    prices = {"000001": "100", "000002": "200"}
+    responses.add_callback(
+        responses.GET,
+        f"{mock_openkis_client_url}{RANKING_URL}/quotations/volume-rank",
+        callback=_volume_mock(prices),
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_openkis_client_url}{RANKING_URL}/ranking/market-cap",
+        json={"rt_cd": "1"},
+        status=400,
+    )
+    queries = {name: DEFAULT_RANKINGS[name] for name in ("volume", "market_cap")}
+    recorder = RankingRecorder(queries, path=str(tmp_path / "ranking"))
+
+    assert recorder.poll(mock_openkis_client, timestamp=1.0) == {"volume": 2}
+    assert list(recorder.errors) == ["market_cap"]
+    prices["000002"] = "210"
+    assert recorder.poll(mock_openkis_client, timestamp=2.0) == {"volume": 1}
+
+    lines = (tmp_path / "ranking" / "volume.jsonl").read_text().splitlines()
+    assert json.loads(lines[1]) == {"t": 2.0, "set": {"000002": {"stck_prpr": "210"}}}
+
+    # 기록을 다시 읽어서 복원한다.
+    recorder = RankingRecorder(queries, path=str(tmp_path / "ranking"))
+    assert [row["stck_prpr"] for row in recorder.board("volume", 1.5)] == [
+        "100",
+        "200",
+    ]
+    assert recorder.board("volume", 2.0)[1]["stck_prpr"] == "210"
+
+
+def test_ranking_recorder_interval(mock_openkis_client_url: str):
+    client = OpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        rate_limiter=TokenBucket(20),
+    )
+    recorder = RankingRecorder(budget=0.5)
+    # 4개 순위표를 초당 20건의 절반으로 기록한다.
+    assert recorder.min_interval(client) == 0.4
+
+    stop = threading.Event()
+    stop.set()
+    assert recorder.run(client, interval=1, stop=stop) == 0
+    assert RankingQuery("get_ranking_volume").symbol_field == "mksc_shrn_iscd"
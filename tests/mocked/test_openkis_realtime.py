@@ -0,0 +1,70 @@
+"""pytest tests for openkis realtime approval key"""
+
+import asyncio
+import json
+
+import responses
+
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import RealtimeSubscriber
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+
+
+@responses.activate
+def test_get_approval_key(mock_openkis_client_url: str, tmp_path):
+    responses.add(
+        responses.POST,
+        f"{mock_openkis_client_url}/oauth2/Approval",
+        json={"approval_key": "a2585daf-8c09-4587-9fce-8ab893a6e3c7"},
+    )
+    client = OpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        token_path=str(tmp_path / "finance_clue.json"),
+        rate_limiter=TokenBucket(10000),
+    )
+
+    assert client.get_approval_key() == "a2585daf-8c09-4587-9fce-8ab893a6e3c7"
+    # 저장된 접속키를 재사용한다.
+    assert client.get_approval_key() == "a2585daf-8c09-4587-9fce-8ab893a6e3c7"
+    assert len(responses.calls) == 1
+    assert json.loads(responses.calls[0].request.body) == {
+        "grant_type": "client_credentials",
+        "appkey": "key",
+        "secretkey": "secret",
+    }
+    with open(tmp_path / "finance_clue.json") as f:
+        assert "open_kis_approval" in json.load(f)
+
+    subscriber = RealtimeSubscriber.from_client(client)
+    assert subscriber.url == "ws://ops.koreainvestment.com:21000"
+    assert asyncio.run(subscriber._approval_key()) == (
+        "a2585daf-8c09-4587-9fce-8ab893a6e3c7"
+    )
+
+
+@responses.activate
+def test_get_approval_key_aio(
+    mock_openkis_aio_client: AioOpenKisClient, mock_openkis_client_url: str
+):
+    responses.add(
+        responses.POST,
+        f"{mock_openkis_client_url}/oauth2/Approval",
+        json={"approval_key": "approval"},
+    )
+
+    async def run():
+        async with mock_openkis_aio_client:
+            subscriber = RealtimeSubscriber.from_client(mock_openkis_aio_client)
+            return await subscriber._approval_key(), await asyncio.gather(
+                mock_openkis_aio_client.get_approval_key(),
+                mock_openkis_aio_client.get_approval_key(),
+            )
+
+    key, keys = asyncio.run(run())
+
+    assert key == "approval"
+    assert keys == ["approval", "approval"]
+    assert len(responses.calls) == 1
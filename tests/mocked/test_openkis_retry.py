@@ -0,0 +1,157 @@
+"""pytest tests for openkis business error retry"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline.transport import AsyncioRequestsTransport
+import pytest
+import responses
+
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+
+PRICE_URL = "/uapi/domestic-stock/v1/quotations/inquire-price"
+THROTTLED = {
+    "rt_cd": "1",
+    "msg_cd": "EGW00201",
+    "msg1": "초당 거래건수를 초과하였습니다.",
+}
+EXPIRED = {"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "기간이 만료된 token 입니다."}
+PRICE = {"output": {"stck_prpr": "75700"}, "rt_cd": "0"}
+NEW_TOKEN = {
+    "access_token": "new",
+    "access_token_token_expired": "2099-12-22 08:16:59",
+    "token_type": "Bearer",
+    "expires_in": 86400,
+}
+KIS_RETRY = {"backoff_factor": 0.001}
+
+
+def _client(url: str, tmp_path) -> OpenKisClient:
+    return OpenKisClient(
+        "key",
+        "secret",
+        endpoint=url,
+        token_path=str(tmp_path / "finance_clue.json"),
+        rate_limiter=TokenBucket(10000),
+        kis_retry=KIS_RETRY,
+    )
+
+
+def _with_token(request):
+    # 새 토큰으로 보낸 요청에만 응답한다. 만료 응답은 HTTP 500으로 온다.
+    if request.headers["authorization"] == "Bearer new":
+        return 200, {}, json.dumps(PRICE)
+    return 500, {}, json.dumps(EXPIRED)
+
+
+@responses.activate
+def test_throttled_response_is_retried(mock_openkis_client_url: str, tmp_path):
+    url = f"{mock_openkis_client_url}{PRICE_URL}"
+    responses.add(responses.GET, url, json=THROTTLED, status=200)
+    responses.add(responses.GET, url, json=THROTTLED, status=500)
+    responses.add(responses.GET, url, json=PRICE, status=200)
+    client = _client(mock_openkis_client_url, tmp_path)
+
+    result = client.get_domestic_stock_price(fid_input_iscd="005930")
+
+    assert result["output"]["stck_prpr"] == "75700"
+    assert len(responses.calls) == 3
+    assert client.error_policy.stats["throttled"] == 2
+
+
+@responses.activate
+def test_retry_limits(mock_openkis_client_url: str, tmp_path):
+    url = f"{mock_openkis_client_url}{PRICE_URL}"
+    responses.add(responses.GET, url, json=THROTTLED, status=200)
+    client = OpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        rate_limiter=TokenBucket(10000),
+        kis_retry={"max_throttle_retries": 2, "backoff_factor": 0.001},
+    )
+
+    # 재시도 횟수를 넘기면 마지막 응답을 그대로 돌려준다.
+    result = client.get_domestic_stock_price(fid_input_iscd="005930")
+    assert result["msg_cd"] == "EGW00201"
+    assert len(responses.calls) == 3
+
+    # 다시 보내도 같은 업무 오류는 500이어도 azure RetryPolicy가 재시도하지 않는다.
+    responses.calls.reset()
+    responses.replace(
+        responses.GET, url, json={"rt_cd": "1", "msg_cd": "OPSQ0002"}, status=500
+    )
+    with pytest.raises(HttpResponseError):
+        client.get_domestic_stock_price(fid_input_iscd="005930")
+    assert len(responses.calls) == 1
+    assert client.error_policy.stats["permanent"] == 1
+
+
+@responses.activate
+def test_expired_token_is_refreshed_once(mock_openkis_client_url: str, tmp_path):
+    responses.add(
+        responses.POST,
+        f"{mock_openkis_client_url}/oauth2/tokenP",
+        json=NEW_TOKEN,
+        status=200,
+    )
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{PRICE_URL}", callback=_with_token
+    )
+    client = _client(mock_openkis_client_url, tmp_path)
+    client._credential.update_token(**{**NEW_TOKEN, "access_token": "old"})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda code: client.get_domestic_stock_price(fid_input_iscd=code),
+                ["005930", "000660", "035420", "005380"],
+            )
+        )
+
+    assert [x["output"]["stck_prpr"] for x in results] == ["75700"] * 4
+    token_calls = [c for c in responses.calls if c.request.url.endswith("/tokenP")]
+    assert len(token_calls) == 1
+    assert client._credential.access_token == "new"
+
+
+@responses.activate
+def test_aio_expired_token_is_refreshed_once(mock_openkis_client_url: str, tmp_path):
+    responses.add(
+        responses.POST,
+        f"{mock_openkis_client_url}/oauth2/tokenP",
+        json=NEW_TOKEN,
+        status=200,
+    )
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{PRICE_URL}", callback=_with_token
+    )
+    client = AioOpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        token_path=str(tmp_path / "finance_clue.json"),
+        rate_limiter=TokenBucket(10000),
+        kis_retry=KIS_RETRY,
+        transport=AsyncioRequestsTransport(),
+    )
+    client._credential.update_token(**{**NEW_TOKEN, "access_token": "old"})
+
+    async def run():
+        async with client:
+            return await asyncio.gather(
+                *[
+                    client.get_domestic_stock_price(fid_input_iscd=code)
+                    for code in ["005930", "000660", "035420"]
+                ]
+            )
+
+    results = asyncio.run(run())
+
+    assert [x["output"]["stck_prpr"] for x in results] == ["75700"] * 3
+    token_calls = [c for c in responses.calls if c.request.url.endswith("/tokenP")]
+    assert len(token_calls) == 1
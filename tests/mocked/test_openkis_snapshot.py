@@ -0,0 +1,89 @@
+"""pytest tests for openkis batch quote snapshot"""
+
+import asyncio
+import json
+import math
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import responses
+
+from finance_clue.error import KisApiError
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import snapshot_quotes
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+from finance_clue.openkis.aio import asnapshot_quotes
+
+PRICE_URL = "/uapi/domestic-stock/v1/quotations/inquire-price"
+FIELDS = {
+    "stck_prpr": "i8",
+    "prdy_ctrt": "f8",
+    "iscd_stat_cls_code": "U",
+    "ssts_yn": "?",
+}
+
+
+def _price(request):
+    # 종목코드를 현재가로 반환하고, 999999는 HTTP 오류, 999998은 HTTP 200에 rt_cd 오류로 응답하는 mock
+    symbol = parse_qs(urlparse(request.url).query)["fid_input_iscd"][0]
+    if symbol == "999999":
+        return 400, {}, json.dumps({"rt_cd": "1"})
+    if symbol == "999998":
+        body = {"rt_cd": "1", "msg_cd": "APBK0919", "msg1": "조회할 자료가 없습니다."}
+        return 200, {}, json.dumps(body)
+    output = {"stck_prpr": str(int(symbol)), "prdy_ctrt": "-2.07", "ssts_yn": "Y"}
+    if symbol == "000002":
+        output = {"stck_prpr": "N/A", "prdy_ctrt": "", "iscd_stat_cls_code": "58"}
+    return 200, {}, json.dumps({"output": output, "rt_cd": "0"})
+
+
+@responses.activate
+def test_snapshot_quotes(
+    mock_openkis_client: OpenKisClient, mock_openkis_client_url: str
+):
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{PRICE_URL}", callback=_price
+    )
+    symbols = [f"{i:06d}" for i in range(3, 103)] + ["999999", "000002", "999998"]
+
+    snapshot = snapshot_quotes(mock_openkis_client, symbols, FIELDS, max_workers=8)
+
+    assert len(snapshot) == 103
+    assert snapshot.symbols == symbols
+    assert snapshot["stck_prpr"].dtype.name == "int64"
+    assert snapshot["stck_prpr"][:100].tolist() == list(range(3, 103))
+    assert snapshot["ssts_yn"][:100].all()
+    assert snapshot.ok.sum() == 100
+    assert sorted(snapshot.failed) == ["000002", "999998", "999999"]
+    # 실패한 칸은 기본값으로 채운다.
+    assert snapshot["stck_prpr"][100] == 0
+    assert math.isnan(snapshot["prdy_ctrt"][100])
+    assert not snapshot["ssts_yn"][100]
+    assert snapshot.row("000002")["iscd_stat_cls_code"] == "58"
+    # HTTP 200이어도 rt_cd가 0이 아니면 실패한 종목이다.
+    error = snapshot.failed["999998"]
+    assert isinstance(error, KisApiError)
+    assert error.msg_cd == "APBK0919"
+    assert snapshot["stck_prpr"][102] == 0
+
+
+@responses.activate
+def test_asnapshot_quotes(
+    mock_openkis_aio_client: AioOpenKisClient, mock_openkis_client_url: str
+):
+    responses.add_callback(
+        responses.GET, f"{mock_openkis_client_url}{PRICE_URL}", callback=_price
+    )
+
+    async def run():
+        async with mock_openkis_aio_client as client:
+            return await asnapshot_quotes(
+                client, ["000005", "999999", "000007", "999998"], FIELDS, concurrency=2
+            )
+
+    snapshot = asyncio.run(run())
+
+    assert snapshot["stck_prpr"].tolist() == [5, 0, 7, 0]
+    assert snapshot["prdy_ctrt"][0] == -2.07
+    assert snapshot.ok.tolist() == [True, False, True, False]
+    assert isinstance(snapshot.errors[3], KisApiError)
@@ -0,0 +1,242 @@
+"""pytest tests for openkis token broker"""
+
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+import time
+from urllib.error import HTTPError
+
+from azure.core.pipeline.transport import AsyncioRequestsTransport
+import pytest
+import responses
+
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import TokenBroker
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis._patch import _update_credential
+from finance_clue.openkis._token_broker import fetch_broker_token
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+
+
+def _token(access_token: str, expires_in: timedelta) -> dict:
+    expired = datetime.now() + expires_in
+    return {
+        "access_token": access_token,
+        "access_token_token_expired": expired.strftime("%Y-%m-%d %H:%M:%S"),
+        "token_type": "Bearer",
+        "expires_in": int(expires_in.total_seconds()),
+    }
+
+
+def _client(url: str, tmp_path, name: str, **kwargs) -> OpenKisClient:
+    return OpenKisClient(
+        "key",
+        "secret",
+        endpoint=url,
+        token_path=str(tmp_path / name),
+        rate_limiter=TokenBucket(10000),
+        **kwargs,
+    )
+
+
+@responses.activate
+def test_client_uses_broker_token(mock_openkis_client_url: str, tmp_path):
+    responses.add(
+        responses.POST,
+        f"{mock_openkis_client_url}/oauth2/tokenP",
+        json=_token("broker-token", timedelta(hours=24)),
+    )
+    broker_client = _client(
+        mock_openkis_client_url, tmp_path, "broker.json", token_broker=""
+    )
+
+    with TokenBroker(broker_client) as broker:
+        client = _client(
+            mock_openkis_client_url, tmp_path, "worker.json", token_broker=broker.url
+        )
+        client.init()
+        assert client._credential.access_token == "broker-token"
+
+        # 만료가 가까워지면 broker의 토큰을 다시 받는다.
+        client._credential.access_token = "old-token"
+        client._credential.access_token_token_expired = datetime.now()
+        info = client._credential.get_credential_info()
+        assert info.access_token == "broker-token"
+
+        with pytest.raises(HTTPError):
+            fetch_broker_token(broker.url, "other-key")
+
+        aio_client = AioOpenKisClient(
+            "key",
+            "secret",
+            endpoint=mock_openkis_client_url,
+            token_path=str(tmp_path / "worker.json"),
+            token_broker=broker.url,
+            transport=AsyncioRequestsTransport(),
+        )
+        asyncio.run(aio_client.init())
+        assert aio_client._credential.access_token == "broker-token"
+
+    # 토큰은 broker만 발급했다.
+    assert len(responses.calls) == 1
+    assert not (tmp_path / "worker.json").exists()
+
+
+@responses.activate
+def test_client_falls_back_without_broker(mock_openkis_client_url: str, tmp_path):
+    responses.add(
+        responses.POST,
+        f"{mock_openkis_client_url}/oauth2/tokenP",
+        json=_token("file-token", timedelta(hours=24)),
+    )
+    client = _client(
+        mock_openkis_client_url,
+        tmp_path,
+        "worker.json",
+        token_broker="http://127.0.0.1:9",
+    )
+
+    client.init()
+
+    assert client._credential.access_token == "file-token"
+    assert (tmp_path / "worker.json").exists()
+
+
+def test_broker_refresh_schedule(monkeypatch, mock_openkis_client_url: str, tmp_path):
+    monkeypatch.setenv("FINANCE_CLUE_TOKEN_BROKER", "http://127.0.0.1:9")
+    client = _client(mock_openkis_client_url, tmp_path, "broker.json")
+    assert client._credential.token_broker == "http://127.0.0.1:9"
+
+    broker = TokenBroker(
+        _client(mock_openkis_client_url, tmp_path, "broker.json", token_broker=""),
+        refresh_before=600,
+    )
+    try:
+        assert broker._seconds_until_refresh() == 0
+        broker.token_obj = _token("token", timedelta(hours=1))
+        assert 2900 < broker._seconds_until_refresh() <= 3000
+        broker.token_obj = _token("token", timedelta(minutes=5))
+        assert broker._seconds_until_refresh() == 1
+    finally:
+        broker._server.server_close()
+
+
+def test_broker_attempts_are_rate_limited(
+    monkeypatch, mock_openkis_client_url, tmp_path
+):
+    attempts = []
+
+    def unreachable(url, app_key, timeout=5.0):
+        attempts.append(url)
+        raise OSError("connection refused")
+
+    monkeypatch.setattr("finance_clue.openkis._patch.fetch_broker_token", unreachable)
+    client = _client(
+        mock_openkis_client_url,
+        tmp_path,
+        "worker.json",
+        token_broker="http://127.0.0.1:9",
+    )
+    _update_credential(client._credential, _token("old-token", timedelta(seconds=60)))
+
+    # broker에 연결할 수 없으면 broker_retry_interval 동안 요청마다 다시 묻지 않는다.
+    for _ in range(5):
+        assert client._credential.get_credential_info().access_token == "old-token"
+    assert len(attempts) == 1
+
+    client._credential._broker_next_attempt = 0.0
+    client._credential.get_credential_info()
+    assert len(attempts) == 2
+
+
+@responses.activate
+def test_aio_broker_refresh_does_not_block_loop(
+    monkeypatch, mock_openkis_client_url, tmp_path
+):
+    def slow_broker(url, app_key, timeout=5.0):
+        time.sleep(0.3)
+        return _token("broker-token", timedelta(hours=24))
+
+    monkeypatch.setattr("finance_clue.openkis._patch.fetch_broker_token", slow_broker)
+    responses.add(
+        responses.GET,
+        f"{mock_openkis_client_url}/uapi/domestic-stock/v1/quotations/inquire-price",
+        json={"output": {"stck_prpr": "75700"}, "rt_cd": "0"},
+    )
+    client = AioOpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        token_path=str(tmp_path / "worker.json"),
+        rate_limiter=TokenBucket(10000),
+        token_broker="http://127.0.0.1:9",
+        transport=AsyncioRequestsTransport(),
+    )
+    ticks = []
+
+    async def ticker():
+        for _ in range(20):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async def price():
+        await asyncio.sleep(0.05)
+        return await client.get_domestic_stock_price(fid_input_iscd="005930")
+
+    async def run():
+        async with client:
+            _, result = await asyncio.gather(ticker(), price())
+            return result
+
+    result = asyncio.run(run())
+
+    assert result["output"]["stck_prpr"] == "75700"
+    assert responses.calls[0].request.headers["authorization"] == "Bearer broker-token"
+    # broker를 기다리는 0.3초 동안에도 event loop가 돌았다.
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.2
+
+
+@responses.activate
+def test_expired_token_is_refreshed_by_broker(mock_openkis_client_url: str, tmp_path):
+    token_url = f"{mock_openkis_client_url}/oauth2/tokenP"
+    responses.add(responses.POST, token_url, json=_token("first", timedelta(hours=24)))
+    responses.add(responses.POST, token_url, json=_token("second", timedelta(hours=24)))
+
+    def price(request):
+        # 서버가 first 토큰을 만료되었다고 응답한다.
+        if request.headers["authorization"] == "Bearer second":
+            return 200, {}, '{"output": {"stck_prpr": "75700"}, "rt_cd": "0"}'
+        return 500, {}, '{"rt_cd": "1", "msg_cd": "EGW00123"}'
+
+    responses.add_callback(
+        responses.GET,
+        f"{mock_openkis_client_url}/uapi/domestic-stock/v1/quotations/inquire-price",
+        callback=price,
+    )
+    broker_client = _client(
+        mock_openkis_client_url, tmp_path, "broker.json", token_broker=""
+    )
+
+    with TokenBroker(broker_client) as broker:
+        client = _client(
+            mock_openkis_client_url,
+            tmp_path,
+            "worker.json",
+            token_broker=broker.url,
+            kis_retry={"backoff_factor": 0.001},
+        )
+        client.init()
+        result = client.get_domestic_stock_price(fid_input_iscd="005930")
+
+        assert result["output"]["stck_prpr"] == "75700"
+        assert client._credential.access_token == "second"
+        assert broker.token()["access_token"] == "second"
+        # 같은 토큰으로 다시 요청해도 broker는 한 번만 발급한다.
+        assert fetch_broker_token(broker.url, "key", stale_token="first") == (
+            broker.token()
+        )
+
+    token_calls = [c for c in responses.calls if c.request.url == token_url]
+    assert len(token_calls) == 2
+    # worker는 토큰을 직접 발급하지 않는다.
+    assert not (tmp_path / "worker.json").exists()
@@ -0,0 +1,35 @@
+"""mocked test for async OpenKrxClient"""
+
+import asyncio
+
+import responses
+
+from finance_clue.openkrx.aio import OpenKrxClient
+
+
+@responses.activate
+def test_aio_krx_daily_index_concurrent(
+    mock_openkrx_aio_client: OpenKrxClient, mock_openkrx_client_url: str
+):
+    expected = {"OutBlock_1": [{"BAS_DD": "20240514", "IDX_NM": "KRX 300"}]}
+    responses.add(
+        responses.GET,
+        f"{mock_openkrx_client_url}/svc/apis/idx/krx_dd_trd",
+        json=expected,
+        status=200,
+    )
+
+    async def run():
+        async with mock_openkrx_aio_client as client:
+            return await asyncio.gather(
+                *[
+                    client.get_krx_daily_index(bas_dd=bas_dd)
+                    for bas_dd in ["20240513", "20240514"]
+                ]
+            )
+
+    assert asyncio.run(run()) == [expected, expected]
+    assert sorted(x.request.params["basDd"] for x in responses.calls) == [
+        "20240513",
+        "20240514",
+    ]
@@ -0,0 +1,48 @@
+"""pytest tests for pooled client transports"""
+
+import asyncio
+
+import responses
+
+from finance_clue._transport import PooledAsyncioRequestsTransport
+from finance_clue._transport import TransportConfig
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis.aio import OpenKisClient as AioOpenKisClient
+
+PRICE_URL = "/uapi/domestic-stock/v1/quotations/inquire-price"
+
+
+@responses.activate
+def test_pooled_transport_clients(mock_openkis_client_url: str):
+    responses.add(
+        responses.GET,
+        f"{mock_openkis_client_url}{PRICE_URL}",
+        json={"output": {"stck_prpr": "75700"}, "rt_cd": "0"},
+    )
+    config = TransportConfig(per_host_limit=64)
+    client = OpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        rate_limiter=TokenBucket(10000),
+        transport_config=config,
+    )
+    aio_client = AioOpenKisClient(
+        "key",
+        "secret",
+        endpoint=mock_openkis_client_url,
+        rate_limiter=TokenBucket(10000),
+        transport=PooledAsyncioRequestsTransport(config),
+    )
+
+    async def run():
+        async with aio_client:
+            return await aio_client.get_domestic_stock_price(fid_input_iscd="005930")
+
+    resp = client.get_domestic_stock_price(fid_input_iscd="005930")
+    aio_resp = asyncio.run(run())
+
+    assert resp["output"]["stck_prpr"] == "75700"
+    assert aio_resp["output"]["stck_prpr"] == "75700"
+    assert len(responses.calls) == 2
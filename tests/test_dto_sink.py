@@ -0,0 +1,109 @@
+import sqlite3
+
+import pytest
+
+from finance_clue.dartscrap.dart_scrap_dto import DividendDecisionOnCash
+from finance_clue.dartscrap.dart_scrap_dto import PreliminaryEstimateDto
+from finance_clue.dartscrap.dto_sink import DtoSink
+from finance_clue.dartscrap.dto_sink import ParquetDtoSink
+from finance_clue.dartscrap.dto_sink import SQLiteDtoSink
+from finance_clue.dartscrap.dto_sink import dto_columns
+
+
+def _dividend(amount: int) -> DividendDecisionOnCash:
+    return DividendDecisionOnCash(
+        dividend_classification="분기배당",
+        dividend_kind="현금배당",
+        dividend_amount=amount,
+        dividend_rate=0.5,
+        total_dividend_amount=amount * 1000,
+        dividend_date="2023-12-31",
+    )
+
+
+def test_dto_columns():
+    columns = dict(dto_columns(PreliminaryEstimateDto))
+
+    assert columns["unit"] is str
+    assert columns["revenue_current_quarter"] is int
+    # List 타입은 json 문자열로 저장
+    assert columns["etc_info"] is str
+
+
+def test_sqlite_sink_upsert(tmp_path):
+    path = str(tmp_path / "dart.db")
+
+    with SQLiteDtoSink(path, DividendDecisionOnCash, batch_size=2) as sink:
+        sink.add("20231101000001", _dividend(100))
+        sink.add("20231101000002", _dividend(200))
+        assert len(sink) == 0
+        sink.add("20231101000001", _dividend(300))
+
+    conn = sqlite3.connect(path)
+    rows = conn.execute(
+        "SELECT rcp_no, dividend_amount FROM dividend_decision_on_cash ORDER BY rcp_no"
+    ).fetchall()
+    conn.close()
+
+    assert rows == [("20231101000001", 300), ("20231101000002", 200)]
+
+
+def test_sqlite_sink_json_column():
+    conn = sqlite3.connect(":memory:")
+    sink = SQLiteDtoSink(conn, PreliminaryEstimateDto)
+    sink.add("20231101000001", PreliminaryEstimateDto(unit="억원", etc_info=[["a"]]))
+    sink.close()
+
+    assert conn.execute(
+        "SELECT unit, etc_info FROM preliminary_estimate_dto"
+    ).fetchall() == [("억원", '[["a"]]')]
+
+
+def test_parquet_sink_upsert(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "dividend.parquet")
+
+    with ParquetDtoSink(path, DividendDecisionOnCash) as sink:
+        sink.add("20231101000001", _dividend(100))
+        sink.add("20231101000002", _dividend(200))
+    with ParquetDtoSink(path, DividendDecisionOnCash) as sink:
+        sink.add("20231101000001", _dividend(300))
+
+    table = pq.read_table(path).sort_by("rcp_no")
+
+    assert table["rcp_no"].to_pylist() == ["20231101000001", "20231101000002"]
+    assert table["dividend_amount"].to_pylist() == [300, 200]
+
+
+def test_dto_sink_is_abstract():
+    with pytest.raises(TypeError):
+        DtoSink(DividendDecisionOnCash)
+
+
+def test_parquet_sink_appends_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "dividend.parquet")
+
+    with ParquetDtoSink(path, DividendDecisionOnCash, batch_size=2) as sink:
+        sink.add("20231101000001", _dividend(100))
+        sink.add("20231101000002", _dividend(200))
+        sink.add("20231101000003", _dividend(300))
+        sink.add("20231101000001", _dividend(400))
+        # flush 한 row는 close() 전까지 tmp 파일에만 쓴다.
+        assert not (tmp_path / "dividend.parquet").exists()
+    assert pq.ParquetFile(path).metadata.num_rows == 3
+
+    with ParquetDtoSink(path, DividendDecisionOnCash, batch_size=1) as sink:
+        sink.add("20231101000002", _dividend(500))
+        sink.add("20231101000004", _dividend(600))
+        sink.add("20231101000004", _dividend(700))
+
+    table = pq.read_table(path)
+    assert table["rcp_no"].to_pylist() == [
+        "20231101000003",
+        "20231101000001",
+        "20231101000002",
+        "20231101000004",
+    ]
+    assert table["dividend_amount"].to_pylist() == [300, 400, 500, 700]
+    assert not (tmp_path / "dividend.parquet.tmp").exists()
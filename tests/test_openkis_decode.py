@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pytest
+
+from finance_clue.openkis import decode_response
+from finance_clue.openkis import decode_rows
+
+
+def test_decode_rows():
+    rows = [
+        {"stck_bsop_date": "20240510", "stck_clpr": "75700", "prdy_ctrt": "-2.07"},
+        {"stck_bsop_date": "20240509", "stck_clpr": "", "prdy_ctrt": "1.5"},
+        {"stck_bsop_date": "", "stck_clpr": "1,200", "prdy_ctrt": "N/A"},
+    ]
+    schema = {"stck_bsop_date": "date", "stck_clpr": "i8", "prdy_ctrt": "f8"}
+
+    columns = decode_rows(rows, schema)
+
+    assert columns["stck_bsop_date"].dtype == np.dtype("datetime64[D]")
+    assert str(columns["stck_bsop_date"][0]) == "2024-05-10"
+    assert np.isnat(columns["stck_bsop_date"][2])
+    assert columns["stck_clpr"].tolist() == [75700, 0, 1200]
+    assert columns["prdy_ctrt"][0] == -2.07
+    assert math.isnan(columns["prdy_ctrt"][2])
+
+
+def test_decode_rows_bool():
+    columns = decode_rows(
+        [{"flag": "Y"}, {"flag": "N"}, {"flag": "1"}, {"flag": "0"}, {}],
+        {"flag": "?"},
+    )
+
+    assert columns["flag"].dtype == np.dtype(bool)
+    assert columns["flag"].tolist() == [True, False, True, False, False]
+
+
+def test_decode_rows_structured():
+    array = decode_rows(
+        {"stck_prpr": "75700", "iscd_stat_cls_code": "55"},
+        {"stck_prpr": "i8", "iscd_stat_cls_code": "U"},
+        structured=True,
+    )
+
+    assert array.dtype.names == ("stck_prpr", "iscd_stat_cls_code")
+    assert array["stck_prpr"][0] == 75700
+    assert array["iscd_stat_cls_code"][0] == "55"
+
+
+def test_decode_response():
+    body = {
+        "output1": {},
+        "output2": [
+            {"stck_bsop_date": "20240510", "bstp_nmix_prpr": "2727.63"},
+            {"stck_bsop_date": "20240509", "bstp_nmix_prpr": "2712.14"},
+        ],
+        "rt_cd": "0",
+    }
+
+    columns = decode_response("get_index_daily_price", body)
+
+    assert columns["bstp_nmix_prpr"].tolist() == [2727.63, 2712.14]
+    assert columns["acml_vol"].tolist() == [0, 0]
+    assert len(decode_response("get_index_daily_price", {})["stck_bsop_date"]) == 0
+    with pytest.raises(KeyError):
+        decode_response("unknown", body)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from finance_clue.openkis import EtfBasket
+from finance_clue.openkis import EtfNavEngine
+
+
+def _dense_nav(engine: EtfNavEngine, prices: dict) -> np.ndarray:
+    nav = []
+    for etf in engine.etfs:
+        basket = engine.baskets[etf]
+        value = sum(q * prices[s] for s, q in basket.quantities.items())
+        nav.append((value + basket.cash) / basket.cu_units)
+    return np.array(nav)
+
+
+def test_etf_nav_engine_incremental_matches_dense():
+    rng = np.random.default_rng(0)
+    symbols = [f"{i:06d}" for i in range(200)]
+    engine = EtfNavEngine()
+    for k in range(30):
+        members = rng.choice(symbols, size=rng.integers(5, 60), replace=False)
+        engine.set_basket(
+            EtfBasket(
+                etf=f"E{k:05d}",
+                quantities={s: float(rng.integers(1, 1000)) for s in members},
+                cu_units=float(rng.choice([10000, 50000])),
+                cash=float(rng.integers(0, 10**6)),
+            )
+        )
+    prices = {s: float(rng.integers(1000, 100000)) for s in symbols}
+    engine.update_prices(prices)
+    np.testing.assert_allclose(engine.nav, _dense_nav(engine, prices))
+
+    for _ in range(50):
+        batch = {
+            s: float(rng.integers(1000, 100000))
+            for s in rng.choice(symbols, size=10, replace=False)
+        }
+        changed = engine.update_prices(batch)
+        prices.update(batch)
+        assert set(changed) == {
+            etf
+            for etf, basket in engine.baskets.items()
+            if set(basket.quantities) & set(batch)
+        }
+    np.testing.assert_allclose(engine.nav, _dense_nav(engine, prices))
+    np.testing.assert_allclose(engine.recompute(), _dense_nav(engine, prices))
+
+    assert engine.update_prices({"999999": 1.0}) == []
+    assert engine.update_prices({symbols[0]: prices[symbols[0]]}) == []
+
+
+def test_etf_nav_engine_premium_and_missing_prices():
+    engine = EtfNavEngine()
+    engine.set_basket(EtfBasket("A", {"X": 2.0, "Y": 1.0}, cu_units=10.0, cash=5.0))
+    engine.set_basket(EtfBasket("B", {"Y": 4.0}, cu_units=2.0))
+
+    engine.update_prices({"Y": 10.0})
+    nav = engine.nav
+    assert np.isnan(nav[0])
+    assert nav[1] == 20.0
+
+    assert engine.update_prices({"X": 100.0}) == ["A"]
+    assert engine.nav[0] == pytest.approx((200.0 + 10.0 + 5.0) / 10.0)
+
+    engine.update_etf_prices({"A": 22.0})
+    snapshot = engine.snapshot()
+    assert snapshot["etf"].tolist() == ["A", "B"]
+    assert snapshot["premium"][0] == pytest.approx(22.0 / 21.5 - 1)
+    assert np.isnan(snapshot["premium"][1])
+
+    # basket을 바꾸면 알고 있던 가격으로 다시 계산한다.
+    engine.remove_basket("A")
+    assert engine.etfs == ["A", "B"]
+    assert engine.nav.tolist() == [20.0]
+    assert engine.etfs == ["B"]
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+_CHECK = """
+import sys
+import finance_clue.openkis
+import finance_clue.openkis.aio
+
+groups = ["auth", "etf", "financial", "index", "ksd", "quote", "ranking", "technical"]
+loaded = [g for g in groups if f"finance_clue.openkis._operations._{g}" in sys.modules]
+assert loaded == [], loaded
+
+client = finance_clue.openkis.OpenKisClient("key", "secret", token_path="unused.json")
+assert callable(client.get_index_daily_price)
+loaded = [g for g in groups if f"finance_clue.openkis._operations._{g}" in sys.modules]
+assert loaded == ["index"], loaded
+assert "finance_clue.openkis.aio._operations._index" not in sys.modules
+"""
+
+
+def test_operation_groups_load_lazily():
+    # 이미 import된 module의 영향을 받지 않도록 새 interpreter에서 확인한다.
+    subprocess.run([sys.executable, "-c", _CHECK], check=True)
+
+
+def test_lazy_operation_is_replaced_after_first_access():
+    from finance_clue.openkis._operations import GenOpenKisClientOperationsMixin
+    from finance_clue.openkis._operations._ksd import GenOpenKisClientKsdOperationsMixin
+
+    func = GenOpenKisClientOperationsMixin.get_ksd_dividend_info
+
+    assert func is GenOpenKisClientKsdOperationsMixin.__dict__["get_ksd_dividend_info"]
+    assert GenOpenKisClientOperationsMixin.__dict__["get_ksd_dividend_info"] is func
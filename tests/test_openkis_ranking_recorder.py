@@ -0,0 +1,63 @@
+import json
+import random
+
+import pytest
+
+from finance_clue.openkis import RankingBoard
+
+
+def _rows(prices: dict) -> list:
+    return [
+        {"mksc_shrn_iscd": symbol, "data_rank": str(rank), "stck_prpr": str(price)}
+        for rank, (symbol, price) in enumerate(
+            sorted(prices.items(), key=lambda item: -item[1]), start=1
+        )
+    ]
+
+
+def test_ranking_board_delta_encoding():
+    board = RankingBoard(keyframe_every=3)
+
+    first = board.append(1.0, _rows({"000001": 300, "000002": 200, "000003": 100}))
+    assert set(first) == {"t", "order", "rows"}
+
+    # 값이 바뀐 종목의 바뀐 field만 남긴다.
+    second = board.append(2.0, _rows({"000001": 300, "000002": 200, "000003": 150}))
+    assert second == {"t": 2.0, "set": {"000003": {"stck_prpr": "150"}}}
+
+    third = board.append(3.0, _rows({"000001": 300, "000003": 250, "000004": 50}))
+    assert third["drop"] == ["000002"]
+    assert third["order"] == ["000001", "000003", "000004"]
+    assert third["set"]["000004"]["stck_prpr"] == "50"
+    assert "000001" not in third["set"]
+
+    assert "rows" in board.append(4.0, _rows({"000001": 1}))
+
+    assert board.at(0.5) == []
+    assert board.at(2.5) == _rows({"000001": 300, "000002": 200, "000003": 150})
+    assert board.at(3.0) == _rows({"000001": 300, "000003": 250, "000004": 50})
+    assert board.at(10.0) == _rows({"000001": 1})
+
+    with pytest.raises(ValueError):
+        board.append(3.5, [])
+
+
+def test_ranking_board_reconstructs_every_snapshot(tmp_path):
+    rng = random.Random(0)
+    board = RankingBoard(keyframe_every=7)
+    symbols = [f"{i:06d}" for i in range(40)]
+    expected = []
+    for t in range(50):
+        prices = {s: rng.randint(1, 20) for s in rng.sample(symbols, 30)}
+        board.append(float(t), _rows(prices))
+        expected.append(_rows(prices))
+
+    for t, rows in enumerate(expected):
+        assert board.at(t + 0.5) == rows
+
+    path = tmp_path / "board.jsonl"
+    path.write_text("".join(json.dumps(s) + "\n" for s in board.snapshots))
+    loaded = RankingBoard(keyframe_every=7)
+    loaded.load(str(path))
+    assert loaded.at(20.0) == expected[20]
+    assert loaded.at(100.0) == expected[-1]
@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import pytest
+import responses
+
+from finance_clue.openkis import FileTokenBucket
+from finance_clue.openkis import OpenKisClient
+from finance_clue.openkis import RateLimitPolicy
+from finance_clue.openkis import TokenBucket
+from finance_clue.openkis import get_token_bucket
+
+
+def test_token_bucket_paces_requests():
+    bucket = TokenBucket(100)
+
+    start = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.09
+    metrics = bucket.metrics
+    assert metrics.acquired == 11
+    assert metrics.delayed == 10
+    assert metrics.max_wait <= 0.011
+
+
+def test_token_bucket_capacity_allows_burst():
+    bucket = TokenBucket(1, capacity=5)
+
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+    assert bucket.reserve() > 0
+
+
+def test_token_bucket_shared_across_threads():
+    bucket = TokenBucket(200)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        delays = sorted(executor.map(lambda _: bucket.reserve(), range(20)))
+
+    # 예약 시점이 겹치지 않고 1/rate 간격으로 나뉜다.
+    assert delays[-1] == pytest.approx(19 / 200, abs=0.005)
+
+
+def test_file_token_bucket_shares_state(tmp_path):
+    path = str(tmp_path / "kis.rate")
+    bucket1 = FileTokenBucket(path, 10)
+    bucket2 = FileTokenBucket(path, 10)
+
+    assert bucket1.reserve() == 0.0
+    assert bucket2.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_account_rate(tmp_path):
+    assert (
+        TokenBucket.for_account(is_sandbox=True).rate < TokenBucket.for_account().rate
+    )
+    path = str(tmp_path / "kis.rate")
+    assert FileTokenBucket.for_account_file(path).rate == TokenBucket.for_account().rate
+
+
+def test_get_token_bucket_shared_per_app_key():
+    assert get_token_bucket("key") is get_token_bucket("key")
+    assert get_token_bucket("key") is not get_token_bucket("key", is_sandbox=True)
+
+
+@responses.activate
+def test_client_rate_limit_policy():
+    bucket = TokenBucket(10000)
+    client = OpenKisClient(
+        "key", "secret", endpoint="https://mocked.local", rate_limiter=bucket
+    )
+    responses.add(
+        responses.GET,
+        "https://mocked.local/uapi/domestic-stock/v1/quotations/inquire-price",
+        json={"rt_cd": "0"},
+        status=200,
+    )
+
+    client.get_domestic_stock_price(fid_input_iscd="005930")
+    client.get_domestic_stock_price(fid_input_iscd="000660")
+
+    assert bucket.metrics.acquired == 2
+
+
+def test_client_without_rate_limiter():
+    client = OpenKisClient("key", "secret", endpoint="https://mocked.local")
+
+    assert client.rate_limiter is None
+    assert not any(
+        isinstance(policy, RateLimitPolicy)
+        for policy in client._client._pipeline._impl_policies
+    )
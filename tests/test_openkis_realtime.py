@@ -0,0 +1,202 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from finance_clue.openkis import RealtimeBuffer
+from finance_clue.openkis import RealtimeSubscriber
+from finance_clue.openkis import parse_frame
+from finance_clue.openkis._realtime import ORDERBOOK
+from finance_clue.openkis._realtime import REALTIME_FIELDS
+from finance_clue.openkis._realtime import TRADE
+from finance_clue.openkis._realtime_replay import RealtimeReplayServer
+from finance_clue.openkis._realtime_replay import synthetic_frames
+
+
+def _trade_values(symbol: str, hour: str, price: int) -> list:
+    values = ["0"] * len(REALTIME_FIELDS[TRADE])
+    values[0], values[1], values[2] = symbol, hour, str(price)
+    values[5] = "-1.25"
+    return values
+
+
+def test_parse_frame():
+    frame = parse_frame("0|H0STCNT0|002|a^b^c")
+
+    assert frame.tr_id == TRADE
+    assert frame.count == 2
+    assert frame.payload == "a^b^c"
+    assert not frame.encrypted
+    assert parse_frame("1|H0STCNI0|001|xyz").encrypted
+    assert parse_frame('{"header": {"tr_id": "PINGPONG"}}') is None
+
+
+def test_realtime_buffer_wraps():
+    buffer = RealtimeBuffer(TRADE, capacity=4)
+    values = []
+    for i in range(3):
+        values += _trade_values("005930", f"0900{i:02d}", 70000 + i)
+        values += _trade_values("000660", f"0900{i:02d}", 180000 + i)
+
+    buffer.append("^".join(values), 6)
+    columns = buffer.columns()
+
+    assert len(buffer) == 4
+    assert buffer.total == 6
+    assert columns["mksc_shrn_iscd"].tolist() == ["005930", "000660"] * 2
+    assert columns["stck_prpr"].tolist() == [70001, 180001, 70002, 180002]
+    assert columns["stck_cntg_hour"].dtype == np.int32
+    assert columns["prdy_ctrt"][0] == -1.25
+
+
+def test_realtime_buffer_fills_bad_values():
+    buffer = RealtimeBuffer(TRADE, schema={"stck_prpr": "i8", "prdy_ctrt": "f8"})
+    values = _trade_values("005930", "090000", 0)
+    values[2], values[5] = "", "N/A"
+
+    buffer.append("^".join(values), 1)
+
+    assert buffer.columns()["stck_prpr"].tolist() == [0]
+    assert np.isnan(buffer.columns()["prdy_ctrt"][0])
+    with pytest.raises(ValueError):
+        buffer.append("005930^090000", 1)
+
+
+def test_subscriber_receives_replayed_frames():
+    pytest.importorskip("websockets")
+    frames = list(synthetic_frames(TRADE, ["005930", "000660"], 200, 2))
+    frames += list(synthetic_frames(ORDERBOOK, ["005930"], 50))
+
+    async def run():
+        async with RealtimeReplayServer(
+            frames, approval_key="approval", ping_interval=0.01
+        ) as server:
+            subscriber = RealtimeSubscriber("approval", url=server.url)
+            await subscriber.subscribe(TRADE, "005930")
+            await subscriber.subscribe(ORDERBOOK, "005930")
+            task = asyncio.ensure_future(subscriber.run())
+            while subscriber.metrics.records < 250 or subscriber.metrics.pingpongs < 1:
+                await asyncio.sleep(0.01)
+            await subscriber.stop()
+            await task
+            return subscriber, server
+
+    subscriber, server = asyncio.run(asyncio.wait_for(run(), 10))
+
+    trades = subscriber.buffers[TRADE].columns()
+    assert len(trades["stck_prpr"]) == 200
+    assert set(trades["mksc_shrn_iscd"]) == {"005930"}
+    assert len(subscriber.buffers[ORDERBOOK]) == 50
+    assert subscriber.buffers[ORDERBOOK].columns()["askp1"][0] > 0
+    assert subscriber.errors == {}
+    assert server.pongs >= 1
+
+
+def test_subscriber_reconnects_and_resubscribes():
+    pytest.importorskip("websockets")
+    frames = list(synthetic_frames(TRADE, ["005930"], 30))
+    received = []
+
+    async def run():
+        async with RealtimeReplayServer(frames, drop_after=10) as server:
+            subscriber = RealtimeSubscriber(
+                "approval",
+                url=server.url,
+                on_frame=received.append,
+                reconnect_delay=0.01,
+            )
+            await subscriber.subscribe(TRADE, "005930")
+            task = asyncio.ensure_future(subscriber.run())
+            while subscriber.metrics.frames < 40:
+                await asyncio.sleep(0.01)
+            await subscriber.stop()
+            await task
+            return subscriber, server
+
+    subscriber, server = asyncio.run(asyncio.wait_for(run(), 10))
+
+    assert server.connections == 2
+    assert server.requests == [("1", TRADE, "005930")] * 2
+    assert subscriber.metrics.connects == 2
+    assert len(received) == 40
+
+
+def test_subscriber_records_rejected_subscription():
+    pytest.importorskip("websockets")
+
+    async def run():
+        async with RealtimeReplayServer([], approval_key="approval") as server:
+
+            async def approval_key():
+                return "wrong"
+
+            subscriber = RealtimeSubscriber(approval_key, url=server.url)
+            await subscriber.subscribe(TRADE, "005930")
+            task = asyncio.ensure_future(subscriber.run())
+            while not subscriber.errors:
+                await asyncio.sleep(0.01)
+            await subscriber.unsubscribe(TRADE, "005930")
+            await subscriber.stop()
+            await task
+            return subscriber, server
+
+    subscriber, server = asyncio.run(asyncio.wait_for(run(), 10))
+
+    assert subscriber.errors == {(TRADE, "005930"): "invalid approval : NOT FOUND"}
+    assert server.requests[:2] == [("1", TRADE, "005930"), ("2", TRADE, "005930")]
+
+
+def test_subscriber_sends_subscriptions_added_while_connecting():
+    pytest.importorskip("websockets")
+    frames = list(synthetic_frames(TRADE, ["005930", "000660"], 20))
+
+    class Subscriber(RealtimeSubscriber):
+        def _request(self, tr_id, tr_key, tr_type):
+            # 등록 요청을 보내는 사이에 다른 종목이 구독된 경우
+            self.subscriptions.add((TRADE, "000660"))
+            return super()._request(tr_id, tr_key, tr_type)
+
+    async def run():
+        async with RealtimeReplayServer(frames) as server:
+            subscriber = Subscriber("approval", url=server.url)
+            await subscriber.subscribe(TRADE, "005930")
+            task = asyncio.ensure_future(subscriber.run())
+            while subscriber.metrics.frames < 20:
+                await asyncio.sleep(0.01)
+            await subscriber.stop()
+            await task
+            return subscriber, server
+
+    subscriber, server = asyncio.run(asyncio.wait_for(run(), 10))
+
+    assert server.requests == [("1", TRADE, "005930"), ("1", TRADE, "000660")]
+    assert set(subscriber.buffers[TRADE].columns()["mksc_shrn_iscd"]) == {
+        "005930",
+        "000660",
+    }
+
+
+def test_subscriber_closes_socket_when_subscribe_fails():
+    pytest.importorskip("websockets")
+    from websockets.protocol import State
+
+    opened = []
+
+    class Subscriber(RealtimeSubscriber):
+        def _request(self, tr_id, tr_key, tr_type):
+            opened.append(self._websocket)
+            raise OSError("send failed")
+
+    async def run():
+        async with RealtimeReplayServer([]) as server:
+            subscriber = Subscriber("approval", url=server.url, max_reconnects=0)
+            await subscriber.subscribe(TRADE, "005930")
+            with pytest.raises(OSError):
+                await subscriber.run()
+            return subscriber
+
+    subscriber = asyncio.run(asyncio.wait_for(run(), 10))
+
+    assert len(opened) == 1
+    assert opened[0].state is State.CLOSED
+    assert not subscriber.connected
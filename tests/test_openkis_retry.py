@@ -0,0 +1,26 @@
+from finance_clue.openkis import KisErrorPolicy
+from finance_clue.openkis import classify_kis_error
+
+
+def test_classify_kis_error():
+    assert classify_kis_error({"rt_cd": "0", "msg_cd": "MCA00000"}) is None
+    assert classify_kis_error({"access_token": "token"}) is None
+    assert classify_kis_error([]) is None
+    assert classify_kis_error({"rt_cd": "1", "msg_cd": "EGW00201"}) == "throttled"
+    assert (
+        classify_kis_error({"rt_cd": "1", "msg1": "초당 거래건수를 초과하였습니다."})
+        == "throttled"
+    )
+    assert classify_kis_error({"rt_cd": "1", "msg_cd": "EGW00123"}) == "token_expired"
+    assert classify_kis_error({"rt_cd": "1", "msg_cd": "EGW00121"}) == "token_expired"
+    assert classify_kis_error({"rt_cd": "7", "msg_cd": "OPSQ0002"}) == "permanent"
+    assert classify_kis_error({"error_code": "EGW00133"}) == "permanent"
+
+
+def test_backoff_is_jittered_and_bounded():
+    policy = KisErrorPolicy(None, lambda token: None, backoff_factor=0.1, backoff_max=1)
+
+    delays = [policy.backoff(0) for _ in range(100)]
+    assert all(0.05 <= d <= 0.1 for d in delays)
+    assert len(set(delays)) > 1
+    assert all(0.5 <= policy.backoff(10) <= 1 for _ in range(100))
@@ -0,0 +1,112 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import threading
+import time
+
+from finance_clue.openkis import TokenStore
+
+
+def _issue_token(counter_path: str):
+    # 발급 횟수를 파일에 기록한다. 발급은 lock 안에서만 일어나므로 경합이 없다.
+    with open(counter_path, "a") as f:
+        f.write("1")
+    return {
+        "access_token": "token",
+        "access_token_token_expired": "2099-12-22 08:16:59",
+        "token_type": "Bearer",
+        "expires_in": 86400,
+    }
+
+
+def _get_token(token_path: str, counter_path: str):
+    store = TokenStore(token_path)
+    return store.get_or_issue(lambda: _issue_token(counter_path))["access_token"]
+
+
+def test_token_store_issues_once_across_processes(tmp_path):
+    token_path = str(tmp_path / "finance_clue.json")
+    counter_path = str(tmp_path / "counter")
+
+    with ProcessPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(_get_token, token_path, counter_path) for _ in range(16)
+        ]
+        tokens = [f.result() for f in futures]
+
+    assert tokens == ["token"] * 16
+    with open(counter_path) as f:
+        assert f.read() == "1"
+
+
+def test_token_store_reissues_expired_token(tmp_path):
+    store = TokenStore(str(tmp_path / "finance_clue.json"))
+    store.write({"access_token": "old", "access_token_token_expired": "2000-01-01"})
+
+    token_obj = store.get_or_issue(lambda: _issue_token(str(tmp_path / "counter")))
+
+    assert token_obj["access_token"] == "token"
+    assert store.read() == token_obj
+
+
+def test_token_store_keeps_other_keys(tmp_path):
+    path = str(tmp_path / "finance_clue.json")
+    with open(path, "w") as f:
+        json.dump({"other": {"value": 1}}, f)
+    store = TokenStore(path)
+
+    store.write({"access_token": "token"})
+    store.clear()
+
+    with open(path) as f:
+        assert json.load(f) == {"other": {"value": 1}}
+    assert store.read() is None
+
+
+def test_token_store_clear_removes_file(tmp_path):
+    store = TokenStore(str(tmp_path / "finance_clue.json"))
+    store.write({"access_token": "token"})
+
+    store.clear()
+
+    assert not os.path.exists(store.path)
+
+
+def test_token_store_async_waits_without_blocking_loop(tmp_path):
+    token_path = str(tmp_path / "finance_clue.json")
+    counter_path = str(tmp_path / "counter")
+    store = TokenStore(token_path)
+    # 다른 process처럼 별도의 TokenStore가 파일 lock을 잡고 토큰을 발급한다.
+    other = TokenStore(token_path)
+    locked = threading.Event()
+
+    def issue_slowly():
+        with other.lock():
+            locked.set()
+            time.sleep(0.3)
+            other._write_unlocked(_issue_token(counter_path))
+
+    ticks = []
+
+    async def ticker():
+        for _ in range(20):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async def issue():
+        return _issue_token(counter_path)
+
+    async def run():
+        thread = threading.Thread(target=issue_slowly)
+        thread.start()
+        await asyncio.get_running_loop().run_in_executor(None, locked.wait)
+        _, token_obj = await asyncio.gather(ticker(), store.aget_or_issue(issue))
+        thread.join()
+        return token_obj
+
+    assert asyncio.run(run())["access_token"] == "token"
+    # lock을 기다리는 동안에도 event loop가 돌았고, 발급은 한 번만 일어났다.
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.2
+    with open(counter_path) as f:
+        assert f.read() == "1"
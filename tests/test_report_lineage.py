@@ -0,0 +1,89 @@
+from finance_clue.dartscrap.dart_scrap_dto import DisclosureInfoDto
+from finance_clue.dartscrap.report_lineage import ReportLineageIndex
+from finance_clue.dartscrap.report_lineage import extract_rcp_no
+from finance_clue.dartscrap.report_lineage import split_report_name
+
+
+def _disclosure(company_name: str, report_name: str, rcp_no: str):
+    return DisclosureInfoDto(
+        market_name="유가증권시장",
+        company_name=company_name,
+        report_name=report_name,
+        report_date=f"{rcp_no[:4]}.{rcp_no[4:6]}.{rcp_no[6:8]}",
+        report_time="16:00",
+        report_url=f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcp_no}",
+    )
+
+
+def test_split_report_name():
+    assert split_report_name("단일판매ㆍ공급계약체결") == (
+        "단일판매ㆍ공급계약체결",
+        False,
+    )
+    assert split_report_name("[기재정정]단일판매ㆍ공급계약체결") == (
+        "단일판매ㆍ공급계약체결",
+        True,
+    )
+    assert split_report_name("[첨부추가]신규시설투자등") == ("신규시설투자등", False)
+
+
+def test_extract_rcp_no():
+    assert (
+        extract_rcp_no("https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20231114000123")
+        == "20231114000123"
+    )
+
+
+def test_lineage_links_corrections():
+    index = ReportLineageIndex()
+    disclosures = [
+        _disclosure("삼성전자", "[기재정정]단일판매ㆍ공급계약체결", "20231120000010"),
+        _disclosure("삼성전자", "단일판매ㆍ공급계약체결", "20231101000001"),
+        _disclosure("삼성전자", "신규시설투자등", "20231101000002"),
+        _disclosure("삼성전자", "[기재정정]단일판매ㆍ공급계약체결", "20231201000003"),
+        _disclosure("SK하이닉스", "단일판매ㆍ공급계약체결", "20231105000004"),
+    ]
+    index.add_disclosures(disclosures)
+
+    assert len(index) == 3
+    assert index.latest("20231101000001") == "20231201000003"
+    assert index.is_superseded("20231120000010")
+    assert not index.is_superseded("20231201000003")
+    assert not index.is_superseded("20231105000004")
+    assert [
+        extract_rcp_no(x.report_url) for x in index.effective_disclosures(disclosures)
+    ] == [
+        "20231101000002",
+        "20231201000003",
+        "20231105000004",
+    ]
+
+    parsed = {"20231101000001": "original", "20231201000003": "amended"}
+    assert index.keep_latest(parsed) == {"20231101000001": "amended"}
+
+
+def test_lineage_correction_submit_date():
+    index = ReportLineageIndex()
+    index.add_original("삼성전자", "신규시설투자등", "20231101000001")
+    index.add_original("삼성전자", "신규시설투자등", "20231110000002")
+
+    lineage = index.add_correction(
+        "삼성전자", "신규시설투자등", "20231120000003", "2023-11-01"
+    )
+
+    assert lineage.original_rcp_no == "20231101000001"
+    assert index.latest("20231110000002") == "20231110000002"
+
+
+def test_lineage_save_and_load(tmp_path):
+    path = str(tmp_path / "lineage.json")
+    index = ReportLineageIndex()
+    index.add_original("삼성전자", "신규시설투자등", "20231101000001")
+    index.add_correction("삼성전자", "신규시설투자등", "20231120000003")
+    index.save(path)
+
+    loaded = ReportLineageIndex.load(path)
+
+    assert loaded.latest("20231101000001") == "20231120000003"
+    assert loaded.lineages == index.lineages
+    assert len(ReportLineageIndex.load(str(tmp_path / "none.json"))) == 0
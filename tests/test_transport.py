@@ -0,0 +1,81 @@
+import asyncio
+
+from azure.core.pipeline.transport import RequestsTransport
+import pytest
+
+from finance_clue._transport import PooledAsyncioRequestsTransport
+from finance_clue._transport import PooledRequestsTransport
+from finance_clue._transport import TransportConfig
+from finance_clue._transport import aiohttp_transport
+from finance_clue._transport import apply_transport
+from finance_clue.opendart import OpenDartClient
+from finance_clue.openkrx import OpenKrxClient
+
+
+def test_pooled_requests_transport():
+    config = TransportConfig(pool_size=128, per_host_limit=64, read_timeout=5)
+    client = OpenDartClient("token", transport_config=config)
+    transport = client._client._pipeline._transport
+    assert isinstance(transport, PooledRequestsTransport)
+    assert transport.connection_config.read_timeout == 5
+
+    with transport:
+        adapter = transport.session.get_adapter("https://opendart.fss.or.kr")
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_connections == 2
+        assert transport.session.headers["Connection"] == "keep-alive"
+
+    transport = PooledRequestsTransport(TransportConfig(keep_alive=False))
+    with transport:
+        assert transport.session.headers["Connection"] == "close"
+
+
+def test_apply_transport_keeps_explicit_transport():
+    transport = RequestsTransport()
+    kwargs = {"transport": transport}
+    apply_transport(kwargs, TransportConfig())
+    assert kwargs["transport"] is transport
+
+    kwargs = {}
+    apply_transport(kwargs, None)
+    assert kwargs == {}
+
+    client = OpenKrxClient("token", transport_config=TransportConfig())
+    assert isinstance(client._client._pipeline._transport, PooledRequestsTransport)
+
+
+def test_aiohttp_transport():
+    pytest.importorskip("aiohttp")
+    config = TransportConfig(pool_size=200, per_host_limit=50)
+
+    async def run():
+        transport = aiohttp_transport(config)
+        session = transport.session
+        async with transport:
+            assert transport.session is session
+        return session
+
+    # transport를 닫으면 미리 만든 session도 닫힌다.
+    session = asyncio.run(run())
+    assert session.closed
+
+
+def test_apply_transport_async():
+    config = TransportConfig(pool_size=200, per_host_limit=50)
+    kwargs = {}
+    # event loop 밖에서는 aiohttp session을 만들 수 없다.
+    apply_transport(kwargs, config, is_async=True)
+    assert isinstance(kwargs["transport"], PooledAsyncioRequestsTransport)
+
+    pytest.importorskip("aiohttp")
+    from azure.core.pipeline.transport import AioHttpTransport
+
+    async def run():
+        kwargs = {}
+        apply_transport(kwargs, config, is_async=True)
+        async with kwargs["transport"] as transport:
+            return transport, transport.session.connector.limit_per_host
+
+    transport, limit_per_host = asyncio.run(run())
+    assert isinstance(transport, AioHttpTransport)
+    assert limit_per_host == 50
@@ -0,0 +1,169 @@
+"""autorest로 생성한 openkis operation module을 group별 module로 나눈다.
+
+생성된 _operations.py는 operation 100여개와 docstring을 한 파일에 담고 있어서
+import할 때마다 전부 compile하고 메모리에 올린다. 이 script는 operation을 group별 module
+(_quote.py, _etf.py, ...)로 옮기고, _operations.py에는 처음 접근할 때 group module을
+import하는 GenOpenKisClientOperationsMixin만 남긴다.
+
+make generate-openkis에서 autorest 다음에 실행한다.
+
+    python tools/split_kis_operations.py
+"""
+
+import ast
+import os
+import re
+import sys
+from typing import Dict, List, Set, Tuple
+
+PACKAGE_DIR = os.path.join(os.path.dirname(__file__), "..", "finance_clue", "openkis")
+
+# operation 이름 prefix -> group. 어디에도 맞지 않으면 quote group
+GROUP_PREFIXES = [
+    ("get_etf_n_etn_", "etf"),
+    ("get_index_", "index"),
+    ("get_financial_", "financial"),
+    ("get_ksd_", "ksd"),
+    ("get_technical_", "technical"),
+    ("get_ranking_", "ranking"),
+]
+AUTH_OPERATIONS = {"get_access_token", "revoke_access_token", "get_hash_key"}
+MIXIN = "GenOpenKisClientOperationsMixin"
+BUILD_FUNCTION = re.compile(r"build_gen_open_kis_\w+_request")
+
+SPLIT_HEADER = """\
+# coding=utf-8
+# --------------------------------------------------------------------------
+# Code generated by Microsoft (R) AutoRest Code Generator (autorest: 3.10.2, generator: @autorest/python@6.13.15)
+# Split into operation group modules by tools/split_kis_operations.py.
+# Changes may cause incorrect behavior and will be lost if the code is regenerated.
+# --------------------------------------------------------------------------
+"""
+
+
+def operation_group(name: str) -> str:
+    if name in AUTH_OPERATIONS:
+        return "auth"
+    for prefix, group in GROUP_PREFIXES:
+        if name.startswith(prefix):
+            return group
+    return "quote"
+
+
+def group_class(group: str) -> str:
+    return f"GenOpenKisClient{group.capitalize()}OperationsMixin"
+
+
+def _segment(lines: List[str], node: ast.stmt) -> str:
+    start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+    return "".join(lines[start - 1 : node.end_lineno])
+
+
+def split(path: str, is_async: bool) -> None:
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    lines = source.splitlines(keepends=True)
+    tree = ast.parse(source)
+
+    mixin = next(
+        (n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == MIXIN),
+        None,
+    )
+    if mixin is None or not any(
+        isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)) for n in mixin.body
+    ):
+        print(f"{path}: already split")
+        return
+
+    first_def = next(
+        n for n in tree.body if isinstance(n, (ast.FunctionDef, ast.ClassDef))
+    )
+    # 다른 module에서 가져오는 build 함수 import는 group별로 다시 만든다.
+    excluded: Set[int] = set()
+    for node in tree.body[: tree.body.index(first_def)]:
+        if isinstance(node, ast.ImportFrom) and (node.module or "").endswith(
+            "_operations._operations"
+        ):
+            excluded.update(range(node.lineno, (node.end_lineno or node.lineno) + 1))
+    header = "".join(
+        line
+        for i, line in enumerate(lines[: first_def.lineno - 1], start=1)
+        if i not in excluded
+    )
+
+    builders: Dict[str, List[str]] = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and BUILD_FUNCTION.fullmatch(node.name):
+            name = node.name[len("build_gen_open_kis_") : -len("_request")]
+            builders.setdefault(operation_group(name), []).append(_segment(lines, node))
+
+    methods: Dict[str, List[Tuple[str, str]]] = {}
+    for node in mixin.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            methods.setdefault(operation_group(node.name), []).append(
+                (node.name, _segment(lines, node))
+            )
+
+    package = "finance_clue.openkis" + (".aio" if is_async else "")
+    directory = os.path.dirname(path)
+    operations: Dict[str, str] = {}
+    for group, group_methods in methods.items():
+        body = "".join(segment + "\n" for _, segment in group_methods)
+        imports = ""
+        if is_async:
+            names = sorted(set(BUILD_FUNCTION.findall(body)))
+            imports = "".join(
+                f"from ..._operations._{group} import {name}\n" for name in names
+            )
+        content = (
+            header.replace("from .._vendor", imports + "from .._vendor", 1)
+            + "\n\n"
+            + "\n\n".join(builders.get(group, []))
+            + "\n\n"
+            + f"class {group_class(group)}(GenOpenKisClientMixinABC):\n"
+            + body
+        )
+        with open(os.path.join(directory, f"_{group}.py"), "w", encoding="utf-8") as f:
+            f.write(content)
+        for name, _ in group_methods:
+            operations.setdefault(name, group)
+
+    groups = sorted(methods)
+    lazy = [
+        SPLIT_HEADER,
+        "from typing import TYPE_CHECKING\n\n",
+        "from finance_clue.openkis._lazy import LazyOperation\n\n",
+        "from .._vendor import GenOpenKisClientMixinABC\n\n",
+        *[
+            f'_{g.upper()} = ("{package}._operations._{g}", "{group_class(g)}")\n'
+            for g in groups
+        ],
+        "\n",
+        "if TYPE_CHECKING:\n",
+        *[f"    from ._{g} import {group_class(g)}\n" for g in groups],
+        f"\n    class {MIXIN}(\n",
+        *[f"        {group_class(g)},\n" for g in groups],
+        "    ):\n",
+        "        pass\n\n",
+        "else:\n\n",
+        f"    class {MIXIN}(\n",
+        "        GenOpenKisClientMixinABC\n",
+        "    ):  # pylint: disable=too-many-public-methods\n",
+        *[
+            f"        {name} = LazyOperation(*_{group.upper()})\n"
+            for name, group in operations.items()
+        ],
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(lazy))
+    print(f"{path}: split into {', '.join(groups)}")
+
+
+def main() -> int:
+    split(os.path.join(PACKAGE_DIR, "_operations", "_operations.py"), False)
+    split(os.path.join(PACKAGE_DIR, "aio", "_operations", "_operations.py"), True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())